@@ -4,13 +4,15 @@ import json
 import urllib.parse
 from pathlib import Path
 import time
+from typing import Optional
 from rich.console import Console
 from rich.table import Table
 
 from ..core import get_database_manager
+from ..core.graph_schema import SCHEMA_LABEL
+from ..core.result_cache import bump_generation
 from ..core.jobs import JobManager
 from ..tools.code_finder import CodeFinder
-from ..tools.graph_builder import GraphBuilder
 from ..tools.package_resolver import get_local_package_path
 
 console = Console()
@@ -39,14 +41,27 @@ def _initialize_services():
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
-    graph_builder = GraphBuilder(db_manager, JobManager(), loop)
-    code_finder = CodeFinder(db_manager)
+    # Imported here so the tree-sitter stack only loads for commands that use it.
+    from ..tools.graph_builder import GraphBuilder
+
+    if db_manager.get_backend_type() == 'sqlite':
+        from ..tools.sqlite_graph import SQLiteCodeFinder, SQLiteGraphBuilder
+        graph_builder = SQLiteGraphBuilder(db_manager, JobManager(), loop)
+        code_finder = SQLiteCodeFinder(db_manager)
+    else:
+        graph_builder = GraphBuilder(db_manager, JobManager(), loop)
+        code_finder = CodeFinder(db_manager)
     console.print("[dim]Services initialized.[/dim]")
     return db_manager, graph_builder, code_finder
 
 
-def index_helper(path: str):
-    """Synchronously indexes a repository."""
+def index_helper(path: str, since_commit: Optional[str] = None):
+    """
+    Synchronously indexes a repository.
+
+    If it is already indexed at a known git commit (or `since_commit` is given),
+    only the files changed since then are re-indexed.
+    """
     time_start = time.time()
     services = _initialize_services()
     if not all(services):
@@ -75,10 +90,17 @@ def index_helper(path: str):
                 file_count = record["file_count"] if record else 0
                 
                 if file_count > 0:
-                    console.print(f"[yellow]Repository '{path}' is already indexed with {file_count} files. Skipping.[/yellow]")
-                    console.print("[dim]💡 Tip: Use 'cgc index --force' to re-index[/dim]")
-                    db_manager.close_driver()
-                    return
+                    if _update_from_git(graph_builder, path_obj, since_commit):
+                        db_manager.close_driver()
+                        return
+                    if since_commit:
+                        console.print(f"[yellow]Could not determine changes since {since_commit} from git. Re-indexing fully...[/yellow]")
+                        graph_builder.delete_repository_from_graph(str(path_obj))
+                    else:
+                        console.print(f"[yellow]Repository '{path}' is already indexed with {file_count} files. Skipping.[/yellow]")
+                        console.print("[dim]💡 Tip: Use 'cgc index --force' to re-index[/dim]")
+                        db_manager.close_driver()
+                        return
                 else:
                     console.print(f"[yellow]Repository '{path}' exists but has no files (likely interrupted). Re-indexing...[/yellow]")
         except Exception as e:
@@ -114,6 +136,22 @@ def index_helper(path: str):
         db_manager.close_driver()
 
 
+def _update_from_git(graph_builder, path_obj: Path, since_commit: Optional[str]) -> bool:
+    """Re-indexes only the files git reports as changed. Returns False if a full index is needed."""
+    if not path_obj.is_dir():
+        return False
+    time_start = time.time()
+    summary = graph_builder.update_repository_from_git(path_obj, since_commit)
+    if summary is None:
+        return False
+    elapsed = time.time() - time_start
+    console.print(
+        f"[green]Updated {summary['changed_files']} changed file(s) since commit {summary['since_commit'][:12]} "
+        f"(re-linked {summary['relinked_files']}) in {elapsed:.2f} seconds[/green]"
+    )
+    return True
+
+
 def add_package_helper(package_name: str, language: str):
     """Synchronously indexes a package."""
     services = _initialize_services()
@@ -273,6 +311,10 @@ def visualize_helper(query: str):
     # Check if FalkorDB
     if "FalkorDB" in db_manager.__class__.__name__:
         _visualize_falkordb(db_manager)
+    elif db_manager.get_backend_type() == 'sqlite':
+        console.print("[bold red]Graph visualization is not supported by the SQLite backend.[/bold red]")
+        console.print("Use 'cgc config db falkordb' or 'cgc config db neo4j' for this command.")
+        db_manager.close_driver()
     else:
         try:
             encoded_query = urllib.parse.quote(query)
@@ -466,9 +508,9 @@ def clean_helper():
             while True:
                 if is_falkordb:
                     # FalkorDB-compatible query using OPTIONAL MATCH
-                    query = """
+                    query = f"""
                     MATCH (n)
-                    WHERE NOT (n:Repository)
+                    WHERE NOT (n:Repository) AND NOT (n:{SCHEMA_LABEL})
                     OPTIONAL MATCH path = (n)-[*..10]-(r:Repository)
                     WITH n, path
                     WHERE path IS NULL
@@ -479,12 +521,12 @@ def clean_helper():
                 else:
                     # Neo4j optimized query using NOT EXISTS with bounded path
                     # This is much faster than OPTIONAL MATCH with variable-length paths
-                    query = """
+                    query = f"""
                     MATCH (n)
-                    WHERE NOT (n:Repository)
-                      AND NOT EXISTS {
+                    WHERE NOT (n:Repository) AND NOT (n:{SCHEMA_LABEL})
+                      AND NOT EXISTS {{
                         MATCH (n)-[*..10]-(r:Repository)
-                      }
+                      }}
                     WITH n LIMIT $batch_size
                     DETACH DELETE n
                     RETURN count(n) as deleted
@@ -497,6 +539,7 @@ def clean_helper():
                 
                 if deleted_count == 0:
                     break
+                bump_generation()
                     
                 console.print(f"[dim]Deleted {deleted_count} orphaned nodes (batch)...[/dim]")
             
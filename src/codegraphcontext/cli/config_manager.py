@@ -23,6 +23,26 @@ DEFAULT_CONFIG = {
     "DEFAULT_DATABASE": "falkordb",
     "FALKORDB_PATH": str(CONFIG_DIR / "falkordb.db"),
     "FALKORDB_SOCKET_PATH": str(CONFIG_DIR / "falkordb.sock"),
+    "FALKORDB_READ_POOL_SIZE": "8",
+    "FALKORDB_WRITE_POOL_SIZE": "2",
+    "FALKORDB_POOL_TIMEOUT": "30",
+    "FALKORDB_THREAD_COUNT": "default",
+    "FALKORDB_CACHE_SIZE": "default",
+    "FALKORDB_QUERY_MEM_CAPACITY": "default",
+    "FALKORDB_TIMEOUT_DEFAULT": "default",
+    "FALKORDB_TIMEOUT_MAX": "default",
+    "FALKORDB_NODE_CREATION_BUFFER": "default",
+    "FALKORDB_DELTA_MAX_PENDING_CHANGES": "default",
+    "FALKORDB_PERSISTENCE": "rdb",
+    "FALKORDB_BULK_LOAD": "true",
+    "SQLITE_PATH": str(CONFIG_DIR / "graph.sqlite"),
+    "QUERY_PROFILING": "false",
+    "SLOW_QUERY_MS": "500",
+    "SLOW_QUERY_LOG": str(CONFIG_DIR / "logs" / "slow_queries.log"),
+    "PROFILE_SLOW_QUERIES": "false",
+    "CODE_FINDER_CACHE_SIZE": "256",
+    "CODE_FINDER_CACHE_TTL": "300",
+    "CALL_GRAPH_SNAPSHOT": "auto",
     "INDEX_VARIABLES": "true",
     "ALLOW_DB_DELETION": "false",
     "DEBUG_LOGS": "false",
@@ -43,9 +63,29 @@ DEFAULT_CONFIG = {
 
 # Configuration key descriptions
 CONFIG_DESCRIPTIONS = {
-    "DEFAULT_DATABASE": "Default database backend (neo4j|falkordb)",
+    "DEFAULT_DATABASE": "Default database backend (neo4j|falkordb|sqlite)",
     "FALKORDB_PATH": "Path to FalkorDB database file",
     "FALKORDB_SOCKET_PATH": "Path to FalkorDB Unix socket",
+    "FALKORDB_READ_POOL_SIZE": "Maximum concurrent FalkorDB connections for read queries",
+    "FALKORDB_WRITE_POOL_SIZE": "Maximum concurrent FalkorDB connections for write queries",
+    "FALKORDB_POOL_TIMEOUT": "Seconds to wait for a free FalkorDB connection before failing",
+    "FALKORDB_THREAD_COUNT": "FalkorDB query threads (default: one per CPU core)",
+    "FALKORDB_CACHE_SIZE": "Compiled query plans cached per FalkorDB thread",
+    "FALKORDB_QUERY_MEM_CAPACITY": "Maximum memory in bytes a single FalkorDB query may use (0 = unlimited)",
+    "FALKORDB_TIMEOUT_DEFAULT": "Default FalkorDB query timeout in milliseconds (0 = none)",
+    "FALKORDB_TIMEOUT_MAX": "Maximum FalkorDB query timeout in milliseconds (0 = none)",
+    "FALKORDB_NODE_CREATION_BUFFER": "Node slots FalkorDB allocates ahead of node creation",
+    "FALKORDB_DELTA_MAX_PENDING_CHANGES": "Pending node/edge changes FalkorDB buffers before flushing them",
+    "FALKORDB_PERSISTENCE": "FalkorDB persistence policy (rdb|aof|rdb+aof|none)",
+    "FALKORDB_BULK_LOAD": "Suspend FalkorDB persistence during indexing and bundle imports, then snapshot once",
+    "SQLITE_PATH": "Path to the embedded SQLite graph database file",
+    "QUERY_PROFILING": "Record per-statement query latency and row counts (see 'cgc doctor --queries')",
+    "SLOW_QUERY_MS": "Queries slower than this many milliseconds are written to the slow-query log",
+    "SLOW_QUERY_LOG": "Path to the slow-query log",
+    "PROFILE_SLOW_QUERIES": "Capture the PROFILE/EXPLAIN plan of each slow statement in the slow-query log",
+    "CODE_FINDER_CACHE_SIZE": "Number of query results kept in memory between graph writes (0 disables the cache)",
+    "CODE_FINDER_CACHE_TTL": "Seconds a cached query result is served for, bounding staleness when another process writes (0 disables the cache)",
+    "CALL_GRAPH_SNAPSHOT": "Answer dead-code and transitive caller/callee queries from an in-memory graph snapshot (auto: only in the MCP server)",
     "INDEX_VARIABLES": "Index variable nodes in the graph (lighter graph if false)",
     "ALLOW_DB_DELETION": "Allow full database deletion commands",
     "DEBUG_LOGS": "Enable debug logging (for development/troubleshooting)",
@@ -66,7 +106,7 @@ CONFIG_DESCRIPTIONS = {
 
 # Valid values for each config key
 CONFIG_VALIDATORS = {
-    "DEFAULT_DATABASE": ["neo4j", "falkordb"],
+    "DEFAULT_DATABASE": ["neo4j", "falkordb", "sqlite"],
     "INDEX_VARIABLES": ["true", "false"],
     "ALLOW_DB_DELETION": ["true", "false"],
     "DEBUG_LOGS": ["true", "false"],
@@ -76,6 +116,11 @@ CONFIG_VALIDATORS = {
     "ENABLE_AUTO_WATCH": ["true", "false"],
     "CACHE_ENABLED": ["true", "false"],
     "INDEX_SOURCE": ["true", "false"],
+    "FALKORDB_PERSISTENCE": ["rdb", "aof", "rdb+aof", "none"],
+    "FALKORDB_BULK_LOAD": ["true", "false"],
+    "QUERY_PROFILING": ["true", "false"],
+    "PROFILE_SLOW_QUERIES": ["true", "false"],
+    "CALL_GRAPH_SNAPSHOT": ["auto", "true", "false"],
 }
 
 
@@ -255,7 +300,23 @@ def validate_config_value(key: str, value: str) -> tuple[bool, Optional[str]]:
                 return False, "PARALLEL_WORKERS must be between 1 and 32"
         except ValueError:
             return False, "PARALLEL_WORKERS must be a number"
-    
+
+    if key in ("FALKORDB_READ_POOL_SIZE", "FALKORDB_WRITE_POOL_SIZE", "FALKORDB_POOL_TIMEOUT"):
+        try:
+            number = float(value) if key == "FALKORDB_POOL_TIMEOUT" else int(value)
+            if number <= 0:
+                return False, f"{key} must be a positive number"
+        except ValueError:
+            return False, f"{key} must be a number"
+
+    if key.startswith("FALKORDB_") and DEFAULT_CONFIG[key] == "default":
+        if value.lower() != "default":
+            try:
+                if int(value) < 0:
+                    return False, f"{key} must be 'default' or a non-negative number"
+            except ValueError:
+                return False, f"{key} must be 'default' or a number"
+
     if key == "MAX_DEPTH":
         if value.lower() != "unlimited":
             try:
@@ -265,7 +326,15 @@ def validate_config_value(key: str, value: str) -> tuple[bool, Optional[str]]:
             except ValueError:
                 return False, "MAX_DEPTH must be 'unlimited' or a number"
     
-    if key in ("LOG_FILE_PATH", "DEBUG_LOG_PATH"):
+    if key in ("SLOW_QUERY_MS", "CODE_FINDER_CACHE_SIZE", "CODE_FINDER_CACHE_TTL"):
+        try:
+            number = int(value) if key == "CODE_FINDER_CACHE_SIZE" else float(value)
+            if number < 0:
+                return False, f"{key} must be a non-negative number"
+        except ValueError:
+            return False, f"{key} must be a number"
+
+    if key in ("LOG_FILE_PATH", "DEBUG_LOG_PATH", "SLOW_QUERY_LOG"):
         # Validate path is writable
         log_path = Path(value)
         try:
@@ -273,7 +342,7 @@ def validate_config_value(key: str, value: str) -> tuple[bool, Optional[str]]:
         except Exception as e:
             return False, f"Cannot create log directory: {e}"
     
-    if key in ("FALKORDB_PATH", "FALKORDB_SOCKET_PATH"):
+    if key in ("FALKORDB_PATH", "FALKORDB_SOCKET_PATH", "SQLITE_PATH"):
         # Validate path is writable
         db_path = Path(value)
         try:
@@ -15,18 +15,21 @@ from rich.table import Table
 from rich import box
 from typing import Optional
 import asyncio
+import contextlib
 import logging
 import json
+import sys
 import os
 from pathlib import Path
 from dotenv import load_dotenv, find_dotenv, set_key
 from importlib.metadata import version as pkg_version, PackageNotFoundError
 
-from codegraphcontext.server import MCPServer
-from codegraphcontext.core.database import DatabaseManager
-from .setup_wizard import run_neo4j_setup_wizard, configure_mcp_client
+# Heavy modules (the MCP server, database drivers, the setup wizard and the
+# parsing stack) are imported inside the commands that need them, so that
+# lightweight commands like `cgc --help` or `cgc version` start quickly.
 from . import config_manager
-# Import the new helper functions
+from ..tools.pagination import InvalidCursorError, combined_pages
+# Import the new helper functions (cli_helpers defers its own heavy imports)
 from .cli_helpers import (
     index_helper,
     add_package_helper,
@@ -102,6 +105,7 @@ def mcp_setup():
     """
     console.print("\n[bold cyan]MCP Client Setup[/bold cyan]")
     console.print("Configure your IDE or CLI tool to use CodeGraphContext.\n")
+    from .setup_wizard import configure_mcp_client
     configure_mcp_client()
 
 @mcp_app.command("start")
@@ -114,6 +118,7 @@ def mcp_start():
     """
     console.print("[bold green]Starting CodeGraphContext Server...[/bold green]")
     _load_credentials()
+    from codegraphcontext.server import MCPServer
 
     server = None
     loop = asyncio.new_event_loop()
@@ -145,6 +150,7 @@ def mcp_tools():
     _load_credentials()
     console.print("[bold green]Available MCP Tools:[/bold green]")
     try:
+        from codegraphcontext.server import MCPServer
         # Instantiate the server to access the tool definitions.
         server = MCPServer()
         tools = server.tools.values()
@@ -190,6 +196,7 @@ def neo4j_setup():
     """
     console.print("\n[bold cyan]Neo4j Database Setup[/bold cyan]")
     console.print("Configure Neo4j database connection for CodeGraphContext.\n")
+    from .setup_wizard import run_neo4j_setup_wizard
     run_neo4j_setup_wizard()
 
 # Abbreviation for neo4j setup
@@ -284,6 +291,8 @@ def _load_credentials():
             console.print("[cyan]Using database: Neo4j[/cyan]")
         else:
             console.print("[yellow]⚠ DEFAULT_DATABASE=neo4j but credentials not found. Falling back to FalkorDB.[/yellow]")
+    elif default_db == "sqlite":
+        console.print("[cyan]Using database: SQLite[/cyan]")
     else:
         console.print("[cyan]Using database: FalkorDB[/cyan]")
 
@@ -336,7 +345,7 @@ def config_reset():
         console.print("[yellow]Reset cancelled[/yellow]")
 
 @config_app.command("db")
-def config_db(backend: str = typer.Argument(..., help="Database backend: 'neo4j' or 'falkordb'")):
+def config_db(backend: str = typer.Argument(..., help="Database backend: 'neo4j', 'falkordb' or 'sqlite'")):
     """
     Quickly switch the default database backend.
     
@@ -345,11 +354,12 @@ def config_db(backend: str = typer.Argument(..., help="Database backend: 'neo4j'
     Examples:
         cgc config db neo4j
         cgc config db falkordb
+        cgc config db sqlite
     """
     backend = backend.lower()
-    if backend not in ['falkordb', 'neo4j']:
+    if backend not in ['falkordb', 'neo4j', 'sqlite']:
         console.print(f"[bold red]Invalid backend: {backend}[/bold red]")
-        console.print("Must be 'falkordb' or 'neo4j'")
+        console.print("Must be 'falkordb', 'neo4j' or 'sqlite'")
         raise typer.Exit(code=1)
     
     config_manager.set_config_value("DEFAULT_DATABASE", backend)
@@ -635,8 +645,69 @@ def registry_request(
 # DOCTOR DIAGNOSTIC COMMAND
 # ============================================================================
 
+def _report_falkordb_settings(config: dict):
+    """Prints the FalkorDB worker settings, and the values the running worker actually uses."""
+    from codegraphcontext.core.falkor_worker import MODULE_SETTINGS, module_settings
+
+    configured = module_settings(config)
+    live = {}
+    socket_path = config.get("FALKORDB_SOCKET_PATH")
+    if socket_path and os.path.exists(socket_path):
+        try:
+            from falkordb import FalkorDB
+            client = FalkorDB(unix_socket_path=socket_path)
+            live = {name: client.config_get(name) for name in MODULE_SETTINGS.values()}
+        except Exception as e:
+            console.print(f"   [yellow]⚠[/yellow] Could not read settings from the running FalkorDB worker: {e}")
+
+    console.print(f"   Persistence policy: {config.get('FALKORDB_PERSISTENCE') or 'rdb'}")
+    for name in MODULE_SETTINGS.values():
+        line = f"   {name}: {configured.get(name, 'default')}"
+        if name in live:
+            line += f" (running: {live[name]})"
+            if name in configured and str(live[name]) != configured[name]:
+                line += " [yellow]- restart the worker to apply[/yellow]"
+        console.print(line)
+
+
+def _report_query_stats(limit: int = 10):
+    """Prints the statements that took the most total time, as recorded by the query profiler."""
+    from codegraphcontext.core.query_profiler import STATS_FILE, load_stats, top_statements
+
+    stats = load_stats(STATS_FILE)
+    if not stats:
+        console.print("[yellow]No query statistics recorded yet.[/yellow]")
+        console.print("[dim]Statistics are collected while QUERY_PROFILING is true and saved when each command exits.[/dim]")
+        console.print("[dim]Enable profiling with: cgc config set QUERY_PROFILING true[/dim]")
+        return
+
+    table = Table(show_header=True, header_style="bold magenta", box=box.ROUNDED)
+    table.add_column("Total ms", justify="right")
+    table.add_column("Calls", justify="right")
+    table.add_column("Avg ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    table.add_column("Rows", justify="right")
+    table.add_column("Slow", justify="right")
+    table.add_column("Statement", overflow="fold")
+    table.add_column("Top call site", style="dim", overflow="fold")
+    for query, entry in top_statements(stats, limit):
+        top_site = entry.call_sites.most_common(1)[0][0] if entry.call_sites else ""
+        table.add_row(
+            f"{entry.total_ms:.1f}", str(entry.count), f"{entry.total_ms / max(entry.count, 1):.2f}",
+            f"{entry.max_ms:.1f}", str(entry.rows), str(entry.slow),
+            query if len(query) <= 200 else query[:200] + "...", top_site,
+        )
+    console.print(f"[bold]Top {min(limit, len(stats))} of {len(stats)} statements by total time[/bold] ({STATS_FILE})")
+    console.print(table)
+    slow_log = config_manager.get_config_value("SLOW_QUERY_LOG")
+    if slow_log:
+        console.print(f"[dim]Slow queries (over {config_manager.get_config_value('SLOW_QUERY_MS')} ms) are logged to {slow_log}[/dim]")
+
+
 @app.command()
-def doctor():
+def doctor(
+    queries: bool = typer.Option(False, "--queries", help="Summarize the database statements that took the most total time"),
+):
     """
     Run diagnostics to check system health and configuration.
     
@@ -646,7 +717,13 @@ def doctor():
     - Tree-sitter installation
     - Required dependencies
     - File permissions
+
+    With --queries, summarizes the recorded query statistics instead.
     """
+    if queries:
+        _report_query_stats()
+        return
+
     console.print("[bold cyan]🏥 Running CodeGraphContext Diagnostics...[/bold cyan]\n")
     
     all_checks_passed = True
@@ -689,6 +766,7 @@ def doctor():
             
             if uri and username and password:
                 console.print(f"   [cyan]Testing Neo4j connection to {uri}...[/cyan]")
+                from codegraphcontext.core.database import DatabaseManager
                 is_connected, error_msg = DatabaseManager.test_connection(uri, username, password)
                 if is_connected:
                     console.print(f"   [green]✓[/green] Neo4j connection successful")
@@ -697,6 +775,15 @@ def doctor():
                     all_checks_passed = False
             else:
                 console.print(f"   [yellow]⚠[/yellow] Neo4j credentials not set. Run 'cgc neo4j setup'")
+        elif default_db == "sqlite":
+            from codegraphcontext.core.database_sqlite import SQLiteManager
+            is_connected, error_msg = SQLiteManager.test_connection()
+            if is_connected:
+                console.print(f"   [green]✓[/green] SQLite supports the embedded backend")
+                console.print(f"   Database file: {config.get('SQLITE_PATH')}")
+            else:
+                console.print(f"   [red]✗[/red] {error_msg}")
+                all_checks_passed = False
         else:
             # FalkorDB
             try:
@@ -705,6 +792,7 @@ def doctor():
             except ImportError:
                 console.print(f"   [yellow]⚠[/yellow] FalkorDB Lite not installed (Python 3.12+ only)")
                 console.print(f"       Run: pip install falkordblite")
+            _report_falkordb_settings(config)
     except Exception as e:
         console.print(f"   [red]✗[/red] Database check error: {e}")
         all_checks_passed = False
@@ -792,12 +880,15 @@ def start():
 @app.command()
 def index(
     path: Optional[str] = typer.Argument(None, help="Path to the directory or file to index. Defaults to the current directory."),
-    force: bool = typer.Option(False, "--force", "-f", help="Force re-index (delete existing and rebuild)")
+    force: bool = typer.Option(False, "--force", "-f", help="Force re-index (delete existing and rebuild)"),
+    since_commit: Optional[str] = typer.Option(None, "--since-commit", help="Only re-index files changed since this git commit")
 ):
     """
     Indexes a directory or file by adding it to the code graph.
     If no path is provided, it indexes the current directory.
     
+    A git repository that is already indexed is updated incrementally: only
+    files changed since the indexed commit (or --since-commit) are re-indexed.
     Use --force to delete the existing index and rebuild from scratch.
     """
     _load_credentials()
@@ -808,7 +899,7 @@ def index(
         console.print("[yellow]Force re-indexing (--force flag detected)[/yellow]")
         reindex_helper(path)
     else:
-        index_helper(path)
+        index_helper(path, since_commit=since_commit)
 
 @app.command()
 def clean():
@@ -1014,11 +1105,18 @@ def watching():
 find_app = typer.Typer(help="Find and search code elements")
 app.add_typer(find_app, name="find")
 
+def _print_next_cursor(cursor: Optional[str]):
+    """Tells how to fetch the page after the results just printed."""
+    if cursor:
+        console.print(f"[dim]More results: --cursor {cursor}[/dim]")
+
 @find_app.command("name")
 def find_by_name(
     ctx: typer.Context,
     name: str = typer.Argument(..., help="Exact name to search for"),
     type: Optional[str] = typer.Option(None, "--type", "-t", help="Filter by type (function, class, file, module)"),
+    limit: int = typer.Option(20, "--limit", "-l", min=1, help="Results per page (of each type)"),
+    cursor: Optional[str] = typer.Option(None, "--cursor", help="Resume after a previous page (its next cursor)"),
     visual: bool = typer.Option(False, "--visual", "--viz", "-V", help="Show results as interactive graph visualization")
 ):
     """
@@ -1037,14 +1135,17 @@ def find_by_name(
     
     try:
         results = []
+        next_cursor = None
         
         # Search based on type filter
         if type is None or type.lower() == 'all':
-            funcs = code_finder.find_by_function_name(name, fuzzy_search=False)
-            classes = code_finder.find_by_class_name(name, fuzzy_search=False)
-            variables = code_finder.find_by_variable_name(name)
-            modules = code_finder.find_by_module_name(name)
-            imports = code_finder.find_imports(name)
+            (funcs, classes, variables, modules, imports), next_cursor = combined_pages([
+                lambda c: code_finder.find_by_function_name(name, False, limit, c),
+                lambda c: code_finder.find_by_class_name(name, False, limit, c),
+                lambda c: code_finder.find_by_variable_name(name, limit, c),
+                lambda c: code_finder.find_by_module_name(name, limit, c),
+                lambda c: code_finder.find_imports(name, limit, c),
+            ], cursor)
 
             for f in funcs: f['type'] = 'Function'
             for c in classes: c['type'] = 'Class'
@@ -1061,29 +1162,31 @@ def find_by_name(
             results.extend(imports)
         
         elif type.lower() == 'function':
-            results = code_finder.find_by_function_name(name, fuzzy_search=False)
+            results = code_finder.find_by_function_name(name, False, limit, cursor)
+            next_cursor = results.next_cursor
             for r in results: r['type'] = 'Function'
             
         elif type.lower() == 'class':
-            results = code_finder.find_by_class_name(name, fuzzy_search=False)
+            results = code_finder.find_by_class_name(name, False, limit, cursor)
+            next_cursor = results.next_cursor
             for r in results: r['type'] = 'Class'
             
         elif type.lower() == 'variable':
-            results = code_finder.find_by_variable_name(name)
+            results = code_finder.find_by_variable_name(name, limit, cursor)
+            next_cursor = results.next_cursor
             for r in results: r['type'] = 'Variable'
 
         elif type.lower() == 'module':
-            results = code_finder.find_by_module_name(name)
+            results = code_finder.find_by_module_name(name, limit, cursor)
+            next_cursor = results.next_cursor
             for r in results: 
                 r['type'] = 'Module'
                 r['file_path'] = r.get('name')
             
         elif type.lower() == 'file':
-            # Quick query for file
-            with db_manager.get_driver().session() as session:
-                res = session.run("MATCH (n:File) WHERE n.name = $name RETURN n.name as name, n.path as file_path, n.is_dependency as is_dependency", name=name)
-                results = [dict(record) for record in res]
-                for r in results: r['type'] = 'File'
+            results = code_finder.find_files_by_name(name, limit, cursor)
+            next_cursor = results.next_cursor
+            for r in results: r['type'] = 'File'
         
         if not results:
             console.print(f"[yellow]No code elements found with name '{name}'[/yellow]")
@@ -1112,6 +1215,10 @@ def find_by_name(
             
         console.print(f"[cyan]Found {len(results)} matches for '{name}':[/cyan]")
         console.print(table)
+        _print_next_cursor(next_cursor)
+    except InvalidCursorError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(code=1)
     finally:
         db_manager.close_driver()
 
@@ -1120,6 +1227,8 @@ def find_by_pattern(
     ctx: typer.Context,
     pattern: str = typer.Argument(..., help="Substring pattern to search (fuzzy search fallback)"),
     case_sensitive: bool = typer.Option(False, "--case-sensitive", "-c", help="Case-sensitive search"),
+    limit: int = typer.Option(50, "--limit", "-l", min=1, help="Results per page"),
+    cursor: Optional[str] = typer.Option(None, "--cursor", help="Resume after a previous page (its next cursor)"),
     visual: bool = typer.Option(False, "--visual", "--viz", "-V", help="Show results as interactive graph visualization")
 ):
     """
@@ -1137,40 +1246,9 @@ def find_by_pattern(
     db_manager, graph_builder, code_finder = services
     
     try:
-        with db_manager.get_driver().session() as session:
-            # Search Functions, Classes, and Modules
-            # Note: FalkorDB Lite might not support regex, using CONTAINS
-            
-            if not case_sensitive:
-                query = """
-                    MATCH (n)
-                    WHERE (n:Function OR n:Class OR n:Module OR n:Variable) AND toLower(n.name) CONTAINS toLower($pattern)
-                    RETURN 
-                        labels(n)[0] as type,
-                        n.name as name,
-                        n.file_path as file_path,
-                        n.line_number as line_number,
-                        n.is_dependency as is_dependency
-                    ORDER BY n.is_dependency ASC, n.name
-                    LIMIT 50
-                """
-            else:
-                 query = """
-                    MATCH (n)
-                    WHERE (n:Function OR n:Class OR n:Module OR n:Variable) AND n.name CONTAINS $pattern
-                    RETURN 
-                        labels(n)[0] as type,
-                        n.name as name,
-                        n.file_path as file_path,
-                        n.line_number as line_number,
-                        n.is_dependency as is_dependency
-                    ORDER BY n.is_dependency ASC, n.name
-                    LIMIT 50
-                """
-            
-            result = session.run(query, pattern=pattern)
-            
-            results = [dict(record) for record in result]
+        # Search Functions, Classes, Modules and Variables
+        # Note: FalkorDB Lite might not support regex, using CONTAINS
+        results = code_finder.find_by_name_pattern(pattern, case_sensitive, limit, cursor)
         
         if not results:
             console.print(f"[yellow]No matches found for pattern '{pattern}'[/yellow]")
@@ -1204,6 +1282,10 @@ def find_by_pattern(
             
         console.print(f"[cyan]Found {len(results)} matches for pattern '{pattern}':[/cyan]")
         console.print(table)
+        _print_next_cursor(results.next_cursor)
+    except InvalidCursorError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(code=1)
     finally:
         db_manager.close_driver()
 
@@ -1211,7 +1293,8 @@ def find_by_pattern(
 def find_by_type(
     ctx: typer.Context,
     element_type: str = typer.Argument(..., help="Type to search for (function, class, file, module)"),
-    limit: int = typer.Option(50, "--limit", "-l", help="Maximum results to return"),
+    limit: int = typer.Option(50, "--limit", "-l", min=1, help="Results per page"),
+    cursor: Optional[str] = typer.Option(None, "--cursor", help="Resume after a previous page (its next cursor)"),
     visual: bool = typer.Option(False, "--visual", "--viz", "-V", help="Show results as interactive graph visualization")
 ):
     """
@@ -1229,7 +1312,7 @@ def find_by_type(
     db_manager, graph_builder, code_finder = services
     
     try:
-        results = code_finder.find_by_type(element_type, limit)
+        results = code_finder.find_by_type(element_type, limit, cursor)
         
         if not results:
             console.print(f"[yellow]No elements found of type '{element_type}'[/yellow]")
@@ -1262,12 +1345,18 @@ def find_by_type(
             
         console.print(f"[cyan]Found {len(results)} {element_type}s:[/cyan]")
         console.print(table)
+        _print_next_cursor(results.next_cursor)
+    except InvalidCursorError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(code=1)
     finally:
         db_manager.close_driver()
 
 @find_app.command("variable")
 def find_by_variable(
-    name: str = typer.Argument(..., help="Variable name to search for")
+    name: str = typer.Argument(..., help="Variable name to search for"),
+    limit: int = typer.Option(20, "--limit", "-l", min=1, help="Results per page"),
+    cursor: Optional[str] = typer.Option(None, "--cursor", help="Resume after a previous page (its next cursor)")
 ):
     """
     Find variables by name.
@@ -1283,7 +1372,7 @@ def find_by_variable(
     db_manager, graph_builder, code_finder = services
     
     try:
-        results = code_finder.find_by_variable_name(name)
+        results = code_finder.find_by_variable_name(name, limit, cursor)
         
         if not results:
             console.print(f"[yellow]No variables found with name '{name}'[/yellow]")
@@ -1307,12 +1396,18 @@ def find_by_variable(
             
         console.print(f"[cyan]Found {len(results)} variable(s) named '{name}':[/cyan]")
         console.print(table)
+        _print_next_cursor(results.next_cursor)
+    except InvalidCursorError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(code=1)
     finally:
         db_manager.close_driver()
 
 @find_app.command("content")
 def find_by_content_search(
-    query: str = typer.Argument(..., help="Text to search for in source code and docstrings")
+    query: str = typer.Argument(..., help="Text to search for in source code and docstrings"),
+    limit: int = typer.Option(20, "--limit", "-l", min=1, help="Results per page"),
+    cursor: Optional[str] = typer.Option(None, "--cursor", help="Resume after a previous page (its next cursor)")
 ):
     """
     Search code content (source and docstrings) using full-text index.
@@ -1329,14 +1424,14 @@ def find_by_content_search(
     
     try:
         try:
-            results = code_finder.find_by_content(query)
+            results = code_finder.find_by_content(query, limit, cursor)
         except Exception as e:
             error_msg = str(e).lower()
             if 'fulltext' in error_msg or 'db.index.fulltext' in error_msg:
-                console.print("\n[bold red]❌ Full-text search is not supported on FalkorDB[/bold red]\n")
+                console.print("\n[bold red]❌ The full-text search index is not available[/bold red]\n")
                 console.print("[yellow]💡 You have two options:[/yellow]\n")
-                console.print("  1. [cyan]Switch to Neo4j:[/cyan]")
-                console.print(f"     [dim]cgc --database neo4j find content \"{query}\"[/dim]\n")
+                console.print("  1. [cyan]Re-index to create the index:[/cyan]")
+                console.print(f"     [dim]cgc index --force <path>[/dim]\n")
                 console.print("  2. [cyan]Use pattern search instead:[/cyan]")
                 console.print(f"     [dim]cgc find pattern \"{query}\"[/dim]")
                 console.print("     [dim](searches in names only, not source code)[/dim]\n")
@@ -1367,13 +1462,19 @@ def find_by_content_search(
             
         console.print(f"[cyan]Found {len(results)} content match(es) for '{query}':[/cyan]")
         console.print(table)
+        _print_next_cursor(results.next_cursor)
+    except InvalidCursorError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(code=1)
     finally:
         db_manager.close_driver()
 
 @find_app.command("decorator")
 def find_by_decorator_search(
     decorator: str = typer.Argument(..., help="Decorator name to search for"),
-    file: Optional[str] = typer.Option(None, "--file", "-f", help="Specific file path")
+    file: Optional[str] = typer.Option(None, "--file", "-f", help="Specific file path"),
+    limit: int = typer.Option(20, "--limit", "-l", min=1, help="Results per page"),
+    cursor: Optional[str] = typer.Option(None, "--cursor", help="Resume after a previous page (its next cursor)")
 ):
     """
     Find functions with a specific decorator.
@@ -1389,7 +1490,7 @@ def find_by_decorator_search(
     db_manager, graph_builder, code_finder = services
     
     try:
-        results = code_finder.find_functions_by_decorator(decorator, file)
+        results = code_finder.find_functions_by_decorator(decorator, file, limit, cursor)
         
         if not results:
             console.print(f"[yellow]No functions found with decorator '@{decorator}'[/yellow]")
@@ -1414,13 +1515,19 @@ def find_by_decorator_search(
             
         console.print(f"[cyan]Found {len(results)} function(s) with decorator '@{decorator}':[/cyan]")
         console.print(table)
+        _print_next_cursor(results.next_cursor)
+    except InvalidCursorError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(code=1)
     finally:
         db_manager.close_driver()
 
 @find_app.command("argument")
 def find_by_argument_search(
     argument: str = typer.Argument(..., help="Argument/parameter name to search for"),
-    file: Optional[str] = typer.Option(None, "--file", "-f", help="Specific file path")
+    file: Optional[str] = typer.Option(None, "--file", "-f", help="Specific file path"),
+    limit: int = typer.Option(20, "--limit", "-l", min=1, help="Results per page"),
+    cursor: Optional[str] = typer.Option(None, "--cursor", help="Resume after a previous page (its next cursor)")
 ):
     """
     Find functions that take a specific argument/parameter.
@@ -1436,7 +1543,7 @@ def find_by_argument_search(
     db_manager, graph_builder, code_finder = services
     
     try:
-        results = code_finder.find_functions_by_argument(argument, file)
+        results = code_finder.find_functions_by_argument(argument, file, limit, cursor)
         
         if not results:
             console.print(f"[yellow]No functions found with argument '{argument}'[/yellow]")
@@ -1458,6 +1565,10 @@ def find_by_argument_search(
             
         console.print(f"[cyan]Found {len(results)} function(s) with argument '{argument}':[/cyan]")
         console.print(table)
+        _print_next_cursor(results.next_cursor)
+    except InvalidCursorError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(code=1)
     finally:
         db_manager.close_driver()
 
@@ -1838,7 +1949,11 @@ def analyze_complexity(
 @analyze_app.command("dead-code")
 def analyze_dead_code(
     path: Optional[str] = typer.Argument(None, help="Path to analyze (not yet implemented)"),
-    exclude_decorators: Optional[str] = typer.Option(None, "--exclude", "-e", help="Comma-separated decorators to exclude")
+    exclude_decorators: Optional[str] = typer.Option(None, "--exclude", "-e", help="Comma-separated decorators to exclude"),
+    limit: int = typer.Option(50, "--limit", "-l", min=1, help="Functions per page"),
+    cursor: Optional[str] = typer.Option(None, "--cursor", help="Resume after a previous page (its next cursor)"),
+    all_pages: bool = typer.Option(False, "--all", "-a", help="Fetch every page instead of the first"),
+    output_format: str = typer.Option("table", "--format", "-f", help="Output format: table, json or jsonl")
 ):
     """
     Find potentially unused functions and classes.
@@ -1846,19 +1961,45 @@ def analyze_dead_code(
     Example:
         cgc analyze dead-code
         cgc analyze dead-code --exclude route,task,api
+        cgc analyze dead-code --all --format jsonl > dead_code.jsonl
     """
+    if output_format not in ("table", "json", "jsonl"):
+        console.print(f"[bold red]Unknown format '{output_format}'. Use table, json or jsonl.[/bold red]")
+        raise typer.Exit(code=1)
     _load_credentials()
-    services = _initialize_services()
+    # Keep stdout to the results themselves when they are meant for another program
+    with contextlib.redirect_stdout(sys.stderr if output_format != "table" else sys.stdout):
+        services = _initialize_services()
     if not all(services):
         return
     db_manager, graph_builder, code_finder = services
     
     try:
         exclude_list = exclude_decorators.split(',') if exclude_decorators else []
-        results = code_finder.find_dead_code(exclude_list)
-        
-        unused_funcs = results.get('potentially_unused_functions', [])
-        
+        unused_funcs = []
+        while True:
+            results = code_finder.find_dead_code(exclude_list, limit=limit, cursor=cursor)
+            page = results.get('potentially_unused_functions', [])
+            cursor = results.get('next_cursor')
+            if output_format == "jsonl":
+                # Streamed page by page, so exporting a large repository needs no more memory than one page
+                for func in page:
+                    print(json.dumps(func, default=str), flush=True)
+            else:
+                unused_funcs.extend(page)
+            if not (all_pages and cursor):
+                break
+
+        if output_format == "jsonl":
+            return
+        if output_format == "json":
+            print(json.dumps({
+                "potentially_unused_functions": unused_funcs,
+                "next_cursor": cursor,
+                "note": results.get('note', ''),
+            }, indent=2, default=str))
+            return
+
         if not unused_funcs:
             console.print("[green]✓ No dead code found![/green]")
             return
@@ -1880,7 +2021,12 @@ def analyze_dead_code(
         console.print(f"\n[bold yellow]⚠️  Potentially Unused Functions:[/bold yellow]")
         console.print(table)
         console.print(f"\n[dim]Total: {len(unused_funcs)} function(s)[/dim]")
+        if cursor:
+            console.print(f"[dim]More results: --cursor {cursor}, or --all for every page[/dim]")
         console.print(f"[dim]Note: {results.get('note', '')}[/dim]")
+    except InvalidCursorError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(code=1)
     finally:
         db_manager.close_driver()
 
@@ -2099,7 +2245,7 @@ def main(
         None, 
         "--database", 
         "-db", 
-        help="[Global] Temporarily override database backend (falkordb or neo4j) for any command"
+        help="[Global] Temporarily override database backend (falkordb, neo4j or sqlite) for any command"
     ),
     visual: bool = typer.Option(
         False,
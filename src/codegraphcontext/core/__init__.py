@@ -2,17 +2,24 @@
 """
 Core database management module.
 
-Supports both Neo4j and FalkorDB Lite backends.
+Supports Neo4j, FalkorDB Lite and embedded SQLite backends.
 Use DATABASE_TYPE environment variable to switch:
 - DATABASE_TYPE=falkordb - Uses embedded FalkorDB Lite (recommended for lite-version)
 - DATABASE_TYPE=neo4j - Uses Neo4j server
+- DATABASE_TYPE=sqlite - Uses an in-process SQLite database (no server process)
 - If not set, auto-detects based on what's available
 """
 import os
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
+import importlib
 import importlib.util
 
+if TYPE_CHECKING:
+    from .database import DatabaseManager
+    from .database_falkordb import FalkorDBManager
+    from .database_sqlite import SQLiteManager
+
 def _is_falkordb_available() -> bool:
     """Check if FalkorDB Lite is installed (without importing native modules)."""
     import sys
@@ -32,7 +39,12 @@ def _is_neo4j_configured() -> bool:
         os.getenv('NEO4J_PASSWORD')
     ])
 
-def get_database_manager() -> Union['DatabaseManager', 'FalkorDBManager']:
+def _is_sqlite_available() -> bool:
+    """Check if this Python's SQLite supports the embedded backend (FTS5 and JSON)."""
+    from .database_sqlite import SQLiteManager
+    return SQLiteManager.test_connection()[0]
+
+def get_database_manager() -> Union['DatabaseManager', 'FalkorDBManager', 'SQLiteManager']:
     """
     Factory function to get the appropriate database manager based on configuration.
     
@@ -42,6 +54,7 @@ def get_database_manager() -> Union['DatabaseManager', 'FalkorDBManager']:
     3. Legacy Env Var: 'DATABASE_TYPE'
     4. Implicit Default: FalkorDB (if available)
     5. Fallback: Neo4j (if configured)
+    6. Last resort: embedded SQLite
     """
     from codegraphcontext.utils.debug_log import info_logger
     
@@ -67,8 +80,15 @@ def get_database_manager() -> Union['DatabaseManager', 'FalkorDBManager']:
             from .database import DatabaseManager
             info_logger("Using Neo4j Server (explicit)")
             return DatabaseManager()
+
+        elif db_type == 'sqlite':
+            if not _is_sqlite_available():
+                 raise ValueError("Database set to 'sqlite' but this Python's SQLite lacks FTS5 or JSON support.")
+            from .database_sqlite import SQLiteManager
+            info_logger("Using embedded SQLite (explicit)")
+            return SQLiteManager()
         else:
-            raise ValueError(f"Unknown database type: '{db_type}'. Use 'falkordb' or 'neo4j'.")
+            raise ValueError(f"Unknown database type: '{db_type}'. Use 'falkordb', 'neo4j' or 'sqlite'.")
 
     # 4. Implicit Default -> FalkorDB (Zero Config)
     if _is_falkordb_available():
@@ -82,6 +102,12 @@ def get_database_manager() -> Union['DatabaseManager', 'FalkorDBManager']:
         info_logger("Using Neo4j Server (auto-detected)")
         return DatabaseManager()
 
+    # 6. Last resort: the in-process SQLite store needs nothing but the standard library
+    if _is_sqlite_available():
+        from .database_sqlite import SQLiteManager
+        info_logger("Using embedded SQLite (fallback)")
+        return SQLiteManager()
+
     import sys
     error_msg = "No database backend available.\n"
     
@@ -100,8 +126,22 @@ def get_database_manager() -> Union['DatabaseManager', 'FalkorDBManager']:
             
     raise ValueError(error_msg)
 
-# For backward compatibility, export DatabaseManager
-from .database import DatabaseManager
-from .database_falkordb import FalkorDBManager
+# For backward compatibility, export DatabaseManager and FalkorDBManager (and SQLiteManager).
+# They are resolved lazily so that importing this package does not pull in
+# the neo4j driver (or FalkorDB client) until a backend is actually used.
+_LAZY_EXPORTS = {
+    'DatabaseManager': '.database',
+    'FalkorDBManager': '.database_falkordb',
+    'SQLiteManager': '.database_sqlite',
+}
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
 
-__all__ = ['DatabaseManager', 'FalkorDBManager', 'get_database_manager']
+__all__ = ['DatabaseManager', 'FalkorDBManager', 'SQLiteManager', 'get_database_manager']
@@ -27,9 +27,21 @@ from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import subprocess
 
+from codegraphcontext.core.graph_schema import SCHEMA_LABEL
+from codegraphcontext.core.result_cache import bump_generation
 from codegraphcontext.utils.debug_log import debug_log, info_logger, error_logger, warning_logger
 
 
+def _iter_rows(result):
+    """
+    Yields each row of a query result as a tuple in RETURN order. FalkorDB
+    results hand out their raw rows, so no per-row record dict is built.
+    """
+    if hasattr(result, 'tuples'):
+        return result.tuples()
+    return (tuple(record.values()) for record in result)
+
+
 class CGCBundle:
     """Handles creation and loading of .cgc bundle files."""
     
@@ -179,22 +191,28 @@ class CGCBundle:
                 info_logger(f"Loading bundle: {metadata.get('repo', 'unknown')}")
                 info_logger(f"Bundle version: {metadata.get('cgc_version', 'unknown')}")
                 
-                # Step 4: Clear existing data if requested
-                if clear_existing:
-                    info_logger("Clearing existing graph data...")
-                    self._clear_graph()
-                
-                # Step 5: Create schema
-                info_logger("Creating schema...")
-                self._import_schema(temp_path / "schema.json")
-                
-                # Step 6: Import nodes
-                info_logger("Importing nodes...")
-                node_count = self._import_nodes(temp_path / "nodes.jsonl")
-                
-                # Step 7: Import edges
-                info_logger("Importing edges...")
-                edge_count = self._import_edges(temp_path / "edges.jsonl")
+                try:
+                    # Persistence is suspended for steps 4-7, then snapshotted once
+                    with self.db_manager.bulk_load():
+                        # Step 4: Clear existing data if requested
+                        if clear_existing:
+                            info_logger("Clearing existing graph data...")
+                            self._clear_graph()
+
+                        # Step 5: Create schema
+                        info_logger("Creating schema...")
+                        self._import_schema(temp_path / "schema.json")
+
+                        # Step 6: Import nodes
+                        info_logger("Importing nodes...")
+                        node_count = self._import_nodes(temp_path / "nodes.jsonl")
+
+                        # Step 7: Import edges
+                        info_logger("Importing edges...")
+                        edge_count = self._import_edges(temp_path / "edges.jsonl")
+                finally:
+                    # Cached query results predate whatever was written
+                    bump_generation()
             
             success_msg = f"✅ Successfully imported {bundle_path.name}\n"
             success_msg += f"   Repository: {metadata.get('repo', 'unknown')}\n"
@@ -356,7 +374,7 @@ class CGCBundle:
                 """
                 params = {"repo_path": str(repo_path.resolve())}
             else:
-                query = "MATCH (n) RETURN n, labels(n) as labels"
+                query = f"MATCH (n) WHERE NOT n:{SCHEMA_LABEL} RETURN n, labels(n) as labels"
                 params = {}
             
             # Run query with proper parameter handling for both Neo4j and FalkorDB
@@ -367,9 +385,7 @@ class CGCBundle:
                 result = session.run(query)
             
             with open(output_file, 'w') as f:
-                for record in result:
-                    node = record['n']
-                    labels = record['labels']
+                for node, labels in _iter_rows(result):
                     
                     # Convert node to dict (handle both Neo4j and FalkorDB)
                     try:
@@ -421,11 +437,7 @@ class CGCBundle:
                 result = session.run(query)
             
             with open(output_file, 'w') as f:
-                for record in result:
-                    source = record['n']
-                    target = record['m']
-                    rel = record['r']
-                    rel_type = record['rel_type']
+                for source, rel, target, rel_type in _iter_rows(result):
                     
                     # Get source and target IDs (handle both Neo4j and FalkorDB)
                     if hasattr(source, 'element_id'):
@@ -475,8 +487,9 @@ class CGCBundle:
         
         with self.db_manager.get_driver().session() as session:
             # Count by node type
-            result = session.run("""
+            result = session.run(f"""
                 MATCH (n)
+                WHERE NOT n:{SCHEMA_LABEL}
                 RETURN labels(n)[0] as label, count(*) as count
                 ORDER BY count DESC
             """)
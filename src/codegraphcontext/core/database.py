@@ -2,13 +2,16 @@
 """
 This module provides a thread-safe singleton manager for the Neo4j database connection.
 """
+import json
 import os
 import re
 import threading
+from contextlib import contextmanager
 from typing import Optional, Tuple
 from neo4j import GraphDatabase, Driver
 
 from codegraphcontext.utils.debug_log import debug_log, info_logger, error_logger, warning_logger
+from codegraphcontext.core.query_profiler import instrument, is_write_query
 
 class DatabaseManager:
     """
@@ -79,10 +82,10 @@ class DatabaseManager:
                         raise ValueError(validation_error)
 
                     info_logger(f"Creating Neo4j driver connection to {self.neo4j_uri}")
-                    self._driver = GraphDatabase.driver(
+                    self._driver = instrument(GraphDatabase.driver(
                         self.neo4j_uri,
                         auth=(self.neo4j_username, self.neo4j_password)
-                    )
+                    ), self._explain_query)
                     # Test the connection immediately to fail fast if credentials are wrong.
                     try:
                         with self._driver.session() as session:
@@ -126,6 +129,21 @@ class DatabaseManager:
         """Returns the database backend type."""
         return 'neo4j'
 
+    def _explain_query(self, query: str, parameters: dict) -> str:
+        """
+        The plan of a slow query for the slow-query log: PROFILE for reads,
+        EXPLAIN for writes, which must not be executed twice.
+        """
+        prefix = "EXPLAIN" if is_write_query(query) else "PROFILE"
+        with self._driver.session() as session:
+            summary = session.run(f"{prefix} {query}", parameters).consume()
+        return json.dumps(summary.profile or summary.plan, default=str)
+
+    @contextmanager
+    def bulk_load(self):
+        """Neo4j checkpoints on its own schedule, so bulk loads need no special handling."""
+        yield
+
 
     @staticmethod
     def validate_config(uri: str, username: str, password: str) -> Tuple[bool, Optional[str]]:
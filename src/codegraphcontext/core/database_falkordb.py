@@ -5,15 +5,24 @@ FalkorDB Lite is an embedded graph database that requires no external server set
 """
 import os
 import sys
+import select
 import subprocess
-import time
 import atexit
 import threading
 import re
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
 from codegraphcontext.utils.debug_log import debug_log, info_logger, error_logger, warning_logger
+from codegraphcontext.core.query_profiler import instrument, is_write_query
+
+# Seconds to wait for a new worker to report that FalkorDB is loaded
+WORKER_START_TIMEOUT = 20
+
+# What the worker writes to its readiness pipe once it accepts queries
+READY = "READY"
 
 class FalkorDBManager:
     """
@@ -25,6 +34,7 @@ class FalkorDBManager:
     _driver = None
     _graph = None
     _lock = threading.Lock()
+    _bulk_lock = threading.Lock()
 
     def __new__(cls):
         """Standard singleton pattern implementation."""
@@ -52,10 +62,16 @@ class FalkorDBManager:
             from codegraphcontext.cli.config_manager import get_config_value
             config_db_path = get_config_value('FALKORDB_PATH')
             config_socket_path = get_config_value('FALKORDB_SOCKET_PATH')
+            config_read_pool = get_config_value('FALKORDB_READ_POOL_SIZE')
+            config_write_pool = get_config_value('FALKORDB_WRITE_POOL_SIZE')
+            config_pool_timeout = get_config_value('FALKORDB_POOL_TIMEOUT')
+            config_bulk_load = get_config_value('FALKORDB_BULK_LOAD')
         except Exception:
             # Config manager not available or error loading
             config_db_path = None
             config_socket_path = None
+            config_read_pool = config_write_pool = config_pool_timeout = None
+            config_bulk_load = None
         
         # Database path with fallback chain
         self.db_path = os.getenv(
@@ -70,6 +86,16 @@ class FalkorDBManager:
         )
         
         self.graph_name = os.getenv('FALKORDB_GRAPH_NAME', 'codegraph')
+
+        # Reads and writes get separate bounded pools, so long-running index
+        # writes never starve concurrent lookups of connections.
+        self.read_pool_size = int(os.getenv('FALKORDB_READ_POOL_SIZE', config_read_pool or 8))
+        self.write_pool_size = int(os.getenv('FALKORDB_WRITE_POOL_SIZE', config_write_pool or 2))
+        self.pool_timeout = float(os.getenv('FALKORDB_POOL_TIMEOUT', config_pool_timeout or 30))
+        self.bulk_load_enabled = os.getenv('FALKORDB_BULK_LOAD', config_bulk_load or 'true').lower() == 'true'
+        self._bulk_depth = 0
+        self._bulk_saved = None
+        self._bulk_failed = False
         self._initialized = True
         
         # Register cleanup on exit
@@ -106,24 +132,20 @@ class FalkorDBManager:
                             sys.path.pop(0)
 
                     try:
-                        self._ensure_server_running()
-                        
-                        # Use Official FalkorDB Client to connect to the socket
-                        from falkordb import FalkorDB
-                        
                         info_logger(f"Connecting to FalkorDB Lite at {self.socket_path}")
-                        self._driver = FalkorDB(unix_socket_path=self.socket_path)
-                        self._graph = self._driver.select_graph(self.graph_name)
-                        
-                        # Test the connection
-                        try:
-                            # Graph creation is lazy in some clients, force a query
-                            self._graph.query("RETURN 1")
-                            info_logger(f"FalkorDB Lite connection established successfully")
-                            info_logger(f"Graph name: {self.graph_name}")
-                        except Exception as e:
-                            info_logger(f"Initial ping check: {e}")
-                            
+                        # Pools connect lazily, so they can be built before the worker is up.
+                        driver = FalkorDBDriverWrapper(
+                            write_pool=FalkorDBConnectionPool(
+                                self.socket_path, self.graph_name, self.write_pool_size, self.pool_timeout),
+                            read_pool=FalkorDBConnectionPool(
+                                self.socket_path, self.graph_name, self.read_pool_size, self.pool_timeout),
+                        )
+                        self._ensure_server_running(driver.write_pool)
+                        self._driver = instrument(driver, self._explain_query)
+                        self._graph = driver.write_pool.graph()
+                        info_logger(f"FalkorDB Lite connection established successfully")
+                        info_logger(f"Graph name: {self.graph_name}")
+
                     except ImportError as e:
                         error_logger(
                             "FalkorDB client is not installed. Install it with:\n"
@@ -134,11 +156,14 @@ class FalkorDBManager:
                         error_logger(f"Failed to initialize FalkorDB: {e}")
                         raise
 
-        # Return a wrapper that provides Neo4j-like session interface
-        return FalkorDBDriverWrapper(self._graph)
+        # The wrapper provides a Neo4j-like session interface
+        return self._driver
 
-    def _ensure_server_running(self):
-        """Starts the FalkorDB worker subprocess if not reachable."""
+    def _ensure_server_running(self, pool: "FalkorDBConnectionPool"):
+        """
+        Makes sure a FalkorDB worker answers on the socket, starting one if
+        necessary, and checks it through `pool`.
+        """
         import platform
         
         if platform.system() == "Windows":
@@ -149,27 +174,47 @@ class FalkorDBManager:
         
         # 1. Try to connect first (maybe running from previous session or other process)
         if os.path.exists(self.socket_path):
-            try:
-                from falkordb import FalkorDB
-                d = FalkorDB(unix_socket_path=self.socket_path)
-                try:
-                    d.execute_command("PING")
-                except AttributeError:
-                    pass
+            if self._check_server(pool):
                 info_logger("Connected to existing FalkorDB Lite process.")
                 return
-            except Exception:
-                # Stale socket or unresponsive
-                info_logger("Found stale socket, cleaning up...")
-                try:
-                    os.remove(self.socket_path)
-                except OSError:
-                    pass
+            # Stale socket or unresponsive
+            info_logger("Found stale socket, cleaning up...")
+            pool.close()
+            try:
+                os.remove(self.socket_path)
+            except OSError:
+                pass
+
+        # 2. Start the worker and wait for it to report that FalkorDB is loaded
+        self._start_worker()
+
+        # 3. Check that it really answers queries
+        if not self._check_server(pool):
+            raise RuntimeError("FalkorDB worker reported ready but does not answer queries.")
 
-        # 2. Start Subprocess
+    @staticmethod
+    def _check_server(pool: "FalkorDBConnectionPool") -> bool:
+        """Whether the server behind `pool` answers a PING and a graph query."""
+        try:
+            pool.redis.ping()
+            # Graph creation is lazy in some clients, force a query
+            pool.graph().query("RETURN 1")
+            return True
+        except Exception as e:
+            debug_log(f"FalkorDB health check failed: {e}")
+            return False
+
+    def _start_worker(self):
+        """
+        Starts the FalkorDB worker subprocess and blocks until it reports
+        readiness on a pipe (see `falkor_worker.signal_ready`), exits, or
+        WORKER_START_TIMEOUT passes.
+        """
+        read_fd, write_fd = os.pipe()
         env = os.environ.copy()
         env['FALKORDB_PATH'] = self.db_path
         env['FALKORDB_SOCKET_PATH'] = self.socket_path
+        env['FALKORDB_READY_FD'] = str(write_fd)
         
         # Determine python executable
         python_exe = sys.executable
@@ -178,32 +223,117 @@ class FalkorDBManager:
         cmd = [python_exe, '-m', 'codegraphcontext.core.falkor_worker']
         
         info_logger("Starting FalkorDB Lite worker subprocess...")
-        self._process = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        # 3. Wait for Readiness
-        start_time = time.time()
-        timeout = 20 # seconds
-        
-        while time.time() - start_time < timeout:
-            if os.path.exists(self.socket_path):
-                # Socket created!
-                # Give it a tiny sleep to ensure listening
-                time.sleep(0.2)
-                return
-            
-            # Check if process died
-            if self._process.poll() is not None:
-                out, err = self._process.communicate()
-                raise RuntimeError(f"FalkorDB worker failed to start (Exit Code {self._process.returncode}):\nSTDOUT: {out.decode()}\nSTDERR: {err.decode()}")
-            
-            time.sleep(0.5)
-            
-        raise RuntimeError("Timed out waiting for FalkorDB Lite to start.")
+        try:
+            self._process = subprocess.Popen(
+                cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, pass_fds=(write_fd,)
+            )
+        finally:
+            # Only the worker holds the write end now, so its exit shows up as EOF.
+            os.close(write_fd)
+
+        with os.fdopen(read_fd, 'rb') as ready:
+            readable, _, _ = select.select([ready], [], [], WORKER_START_TIMEOUT)
+            if not readable:
+                raise RuntimeError("Timed out waiting for FalkorDB Lite to start.")
+            status = ready.readline().decode(errors='replace').strip()
+
+        if status == READY:
+            return
+        if self._process.poll() is None:
+            # The worker reported an error and is about to exit
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        out, err = self._process.communicate()
+        raise RuntimeError(
+            f"FalkorDB worker failed to start (Exit Code {self._process.returncode}): {status or 'no response'}\n"
+            f"STDOUT: {out.decode()}\nSTDERR: {err.decode()}"
+        )
+
+    def _explain_query(self, query: str, parameters: dict) -> str:
+        """
+        The plan of a slow query for the slow-query log: GRAPH.PROFILE for
+        reads, GRAPH.EXPLAIN for writes, which must not be executed twice.
+        """
+        graph = self._driver.write_pool.graph()
+        if is_write_query(query):
+            return str(graph.explain(query, parameters))
+        return str(graph.profile(query, parameters))
+
+    @contextmanager
+    def bulk_load(self):
+        """
+        Suspends RDB snapshots and AOF writes while a bulk index or bundle
+        import runs, so the embedded redis does not stall the load with
+        repeated snapshots.
+
+        When the outermost bulk load ends, the previous persistence policy is
+        restored. If every load succeeded, a single snapshot is taken first;
+        after a failure the policy is restored without one.
+        """
+        if not self.bulk_load_enabled:
+            yield
+            return
+
+        self.get_driver()
+        client = self._driver.write_pool.redis
+        with self._bulk_lock:
+            if self._bulk_depth == 0:
+                self._bulk_saved = self._suspend_persistence(client)
+                self._bulk_failed = False
+            self._bulk_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._bulk_failed = True
+            raise
+        finally:
+            with self._bulk_lock:
+                self._bulk_depth -= 1
+                if self._bulk_depth == 0 and self._bulk_saved is not None:
+                    self._restore_persistence(client, self._bulk_saved, snapshot=not self._bulk_failed)
+                    self._bulk_saved = None
+
+    @staticmethod
+    def _suspend_persistence(client) -> Optional[dict]:
+        """Turns off snapshots and AOF, returning the settings to restore (None if it failed)."""
+        try:
+            saved = {
+                'save': client.config_get('save').get('save', ''),
+                'appendonly': client.config_get('appendonly').get('appendonly', 'no'),
+            }
+            client.config_set('save', '')
+            if saved['appendonly'] == 'yes':
+                client.config_set('appendonly', 'no')
+            info_logger("Bulk load: FalkorDB persistence suspended.")
+            return saved
+        except Exception as e:
+            warning_logger(f"Could not suspend FalkorDB persistence for bulk load: {e}")
+            return None
+
+    @staticmethod
+    def _restore_persistence(client, saved: dict, snapshot: bool):
+        """Restores the settings from `_suspend_persistence`, snapshotting first if asked to."""
+        try:
+            if snapshot:
+                client.save()
+            client.config_set('save', saved['save'])
+            # Re-enabling AOF rewrites it from the current dataset.
+            if saved['appendonly'] == 'yes':
+                client.config_set('appendonly', 'yes')
+            info_logger("Bulk load: FalkorDB persistence restored" + (" after snapshot." if snapshot else "."))
+        except Exception as e:
+            error_logger(f"Failed to restore FalkorDB persistence settings {saved}: {e}")
 
     def close_driver(self):
-        """Closes the connection."""
-        self._driver = None
-        self._graph = None
+        """Closes the connection pools."""
+        if self._driver is not None:
+            with self._lock:
+                if self._driver is not None:
+                    self._driver.close()
+                    self._driver = None
+                    self._graph = None
 
     def shutdown(self):
         """Kills the subprocess on exit."""
@@ -266,88 +396,161 @@ class FalkorDBManager:
             )
 
 
+class FalkorDBConnectionPool:
+    """
+    A bounded pool of connections to the FalkorDB Lite socket.
+
+    When all `max_connections` connections are checked out, callers block for
+    up to `timeout` seconds instead of opening more. Each thread gets its own
+    graph handle, so the client's per-graph schema caches are never shared
+    between threads.
+    """
+
+    def __init__(self, socket_path: str, graph_name: str, max_connections: int, timeout: float):
+        import redis
+        from falkordb import FalkorDB
+
+        self.graph_name = graph_name
+        self.max_connections = max_connections
+        self._pool = redis.BlockingConnectionPool(
+            connection_class=redis.UnixDomainSocketConnection,
+            path=socket_path,
+            max_connections=max_connections,
+            timeout=timeout,
+            decode_responses=True,
+        )
+        self._client = FalkorDB(connection_pool=self._pool)
+        # The underlying redis client, for server commands such as CONFIG
+        self.redis = self._client.connection
+        self._local = threading.local()
+
+    def graph(self):
+        """The calling thread's handle to the graph."""
+        graph = getattr(self._local, 'graph', None)
+        if graph is None:
+            graph = self._local.graph = self._client.select_graph(self.graph_name)
+        return graph
+
+    def close(self):
+        """Disconnects every pooled connection."""
+        self._pool.disconnect()
+
+
 class FalkorDBDriverWrapper:
     """
     Wrapper class to provide Neo4j driver-like interface for FalkorDB Lite.
     This allows existing code to work with minimal changes.
     """
     
-    def __init__(self, graph):
-        self.graph = graph
+    def __init__(self, write_pool: FalkorDBConnectionPool, read_pool: Optional[FalkorDBConnectionPool] = None):
+        self.write_pool = write_pool
+        self.read_pool = read_pool
     
     def session(self):
         """Returns a session-like object for FalkorDB."""
-        return FalkorDBSessionWrapper(self.graph)
+        read_graph = self.read_pool.graph() if self.read_pool is not None else None
+        return FalkorDBSessionWrapper(self.write_pool.graph(), read_graph)
     
     def close(self):
-        """FalkorDB Lite doesn't need explicit close for sessions."""
-        pass
+        """Disconnects both connection pools."""
+        for pool in (self.write_pool, self.read_pool):
+            if pool is not None:
+                pool.close()
+
+
+# Only schema statements need translating; everything else is passed through
+# without being uppercased or scanned by the regexes below.
+_DDL_PREFIX = re.compile(r'\s*CREATE\s+(?:FULLTEXT\s+INDEX|CONSTRAINT|INDEX)\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def translate_schema_query(query: str) -> str:
+    """Translate a Neo4j schema query to FalkorDB/RedisGraph syntax. Results are cached by query text."""
+    q_upper = query.upper()
+    
+    # Handle Fulltext Indexes (Not supported in same syntax, skip for now)
+    if "CREATE FULLTEXT INDEX" in q_upper:
+        return "RETURN 1"
+        
+    # Handle Constraints
+    if "CREATE CONSTRAINT" in q_upper:
+        # Remove "IF NOT EXISTS"
+        query = re.sub(r'\s+IF NOT EXISTS', '', query, flags=re.IGNORECASE)
+        
+        # Handle composite keys: (n.p1, n.p2) -> downgrade to INDEX
+        if "," in query:
+            match_node = re.search(r'FOR\s+(\([^)]+\))', query, flags=re.IGNORECASE)
+            match_props = re.search(r'REQUIRE\s+(\([^)]+\))\s+IS UNIQUE', query, flags=re.IGNORECASE)
+            
+            if match_node and match_props:
+                return f"CREATE INDEX FOR {match_node.group(1)} ON {match_props.group(1)}"
+
+        # Handle simple uniqueness: CREATE CONSTRAINT name FOR (n:Label) REQUIRE n.prop IS UNIQUE
+        # TO: CREATE CONSTRAINT ON (n:Label) ASSERT n.prop IS UNIQUE
+        
+        # Remove constraint name
+        query = re.sub(r'CREATE CONSTRAINT\s+\w+\s+', 'CREATE CONSTRAINT ', query, flags=re.IGNORECASE)
+        query = re.sub(r'\s+FOR\s+', ' ON ', query, flags=re.IGNORECASE)
+        query = re.sub(r'\s+REQUIRE\s+', ' ASSERT ', query, flags=re.IGNORECASE)
+        
+    # Handle Regular Indexes
+    elif "CREATE INDEX" in q_upper:
+        # Remove "IF NOT EXISTS"
+        query = re.sub(r'\s+IF NOT EXISTS', '', query, flags=re.IGNORECASE)
+        # Remove Index Name: CREATE INDEX name FOR -> CREATE INDEX FOR
+        query = re.sub(r'CREATE INDEX\s+\w+\s+FOR', 'CREATE INDEX FOR', query, flags=re.IGNORECASE)
+        
+    return query
 
 
 class FalkorDBSessionWrapper:
     """
     Wrapper class to provide Neo4j session-like interface for FalkorDB Lite.
+
+    Queries that may write go to `graph`; read-only queries go to `read_graph`
+    (when given) as read-only queries.
     """
     
-    def __init__(self, graph):
+    def __init__(self, graph, read_graph=None):
         self.graph = graph
+        self.read_graph = read_graph
     
     def run(self, query, **parameters):
         """
         Execute a Cypher query on FalkorDB.
         """
         # Translate Neo4j schema queries to FalkorDB syntax
-        query = self._translate_schema_query(query)
+        if _DDL_PREFIX.match(query):
+            query = translate_schema_query(query)
         
         try:
-            result = self.graph.query(query, parameters)
+            if self.read_graph is not None and not is_write_query(query):
+                result = self._run_read(query, parameters)
+            else:
+                result = self.graph.query(query, parameters)
             return FalkorDBResultWrapper(result)
         except Exception as e:
             # Ignore errors about existing constraints/indexes
             error_msg = str(e).lower()
-            if "already exists" in error_msg or "already created" in error_msg:
+            if "already exists" in error_msg or "already created" in error_msg or "already indexed" in error_msg:
                 return FalkorDBResultWrapper(None)
                 
             error_logger(f"FalkorDB query failed: {query[:100]}... Error: {e}")
             raise
 
+    def _run_read(self, query, parameters):
+        try:
+            return self.read_graph.ro_query(query, parameters)
+        except Exception as e:
+            # A write the classifier missed (e.g. via a procedure); run it as one.
+            if "read-only" not in str(e).lower():
+                raise
+            debug_log(f"Retrying query on the write connection: {query[:100]}")
+            return self.graph.query(query, parameters)
+
     def _translate_schema_query(self, query: str) -> str:
         """Translate Neo4j schema queries to FalkorDB/RedisGraph syntax."""
-        q_upper = query.upper()
-        
-        # Handle Fulltext Indexes (Not supported in same syntax, skip for now)
-        if "CREATE FULLTEXT INDEX" in q_upper:
-            return "RETURN 1"
-            
-        # Handle Constraints
-        if "CREATE CONSTRAINT" in q_upper:
-            # Remove "IF NOT EXISTS"
-            query = re.sub(r'\s+IF NOT EXISTS', '', query, flags=re.IGNORECASE)
-            
-            # Handle composite keys: (n.p1, n.p2) -> downgrade to INDEX
-            if "," in query:
-                match_node = re.search(r'FOR\s+(\([^)]+\))', query, flags=re.IGNORECASE)
-                match_props = re.search(r'REQUIRE\s+(\([^)]+\))\s+IS UNIQUE', query, flags=re.IGNORECASE)
-                
-                if match_node and match_props:
-                    return f"CREATE INDEX FOR {match_node.group(1)} ON {match_props.group(1)}"
-
-            # Handle simple uniqueness: CREATE CONSTRAINT name FOR (n:Label) REQUIRE n.prop IS UNIQUE
-            # TO: CREATE CONSTRAINT ON (n:Label) ASSERT n.prop IS UNIQUE
-            
-            # Remove constraint name
-            query = re.sub(r'CREATE CONSTRAINT\s+\w+\s+', 'CREATE CONSTRAINT ', query, flags=re.IGNORECASE)
-            query = re.sub(r'\s+FOR\s+', ' ON ', query, flags=re.IGNORECASE)
-            query = re.sub(r'\s+REQUIRE\s+', ' ASSERT ', query, flags=re.IGNORECASE)
-            
-        # Handle Regular Indexes
-        elif "CREATE INDEX" in q_upper:
-            # Remove "IF NOT EXISTS"
-            query = re.sub(r'\s+IF NOT EXISTS', '', query, flags=re.IGNORECASE)
-            # Remove Index Name: CREATE INDEX name FOR -> CREATE INDEX FOR
-            query = re.sub(r'CREATE INDEX\s+\w+\s+FOR', 'CREATE INDEX FOR', query, flags=re.IGNORECASE)
-            
-        return query
+        return translate_schema_query(query) if _DDL_PREFIX.match(query) else query
     
     def __enter__(self):
         return self
@@ -366,55 +569,61 @@ class FalkorDBRecord(dict):
 class FalkorDBResultWrapper:
     """
     Wrapper class to provide Neo4j result-like interface for FalkorDB results.
+
+    Column names are decoded once per result and records are built lazily
+    while iterating, so walking a large result never holds a second copy of
+    it. Bulk consumers can skip records entirely with `tuples()`.
     """
     
     def __init__(self, result):
         self.result = result
         self._consumed = False
+        self._keys = None
     
     def consume(self):
         """Mark result as consumed (for compatibility)."""
         self._consumed = True
         return self
+
+    def keys(self) -> list:
+        """The column names of the result, in RETURN order."""
+        if self._keys is None:
+            keys = []
+            for header in getattr(self.result, 'header', None) or []:
+                # FalkorDB headers are [column_type, column_name] pairs
+                # Extract the column name (index 1) and decode if bytes
+                if isinstance(header, (list, tuple)) and len(header) > 1:
+                    header_name = header[1]
+                    if isinstance(header_name, bytes):
+                        header_name = header_name.decode('utf-8')
+                else:
+                    header_name = str(header)
+                keys.append(header_name)
+            self._keys = keys
+        return self._keys
+
+    def tuples(self):
+        """Iterate over the raw rows, as returned by FalkorDB, in `keys()` order."""
+        return iter(getattr(self.result, 'result_set', None) or ())
     
     def single(self):
-        """Return single result record as a FalkorDBRecord."""
-        data = self.data()
-        return data[0] if data else None
+        """Return the first result record as a FalkorDBRecord, or None. Later rows are not converted."""
+        return next(iter(self), None)
     
     def data(self):
         """Return all results as list of FalkorDBRecord objects."""
-        if not hasattr(self.result, 'result_set'):
-            return []
-        
-        # Convert result_set to list of dicts (wrapped in FalkorDBRecord)
-        results = []
-        if hasattr(self.result, 'header') and self.result.header:
-            headers = self.result.header
-            for row in self.result.result_set:
-                row_dict = FalkorDBRecord()
-                for i, header in enumerate(headers):
-                    if i < len(row):
-                        # FalkorDB headers are [column_type, column_name] pairs
-                        # Extract the column name (index 1) and decode if bytes
-                        if isinstance(header, (list, tuple)) and len(header) > 1:
-                            header_name = header[1]
-                            if isinstance(header_name, bytes):
-                                header_name = header_name.decode('utf-8')
-                        else:
-                            header_name = str(header)
-                        row_dict[header_name] = row[i]
-                results.append(row_dict)
-        elif hasattr(self.result, 'result_set'):
+        return list(self)
+    
+    def __iter__(self):
+        """Iterate over results as FalkorDBRecord objects, building each one on demand."""
+        keys = self.keys()
+        if keys:
+            for row in self.tuples():
+                yield FalkorDBRecord(zip(keys, row))
+        else:
             # Fallback if no header
-            for row in self.result.result_set:
+            for row in self.tuples():
                 if isinstance(row, (list, tuple)) and len(row) == 1:
-                    results.append(FalkorDBRecord({'value': row[0]}))
+                    yield FalkorDBRecord({'value': row[0]})
                 else:
-                    results.append(FalkorDBRecord({'value': row}))
-        
-        return results
-    
-    def __iter__(self):
-        """Iterate over results as FalkorDBRecord objects."""
-        return iter(self.data())
+                    yield FalkorDBRecord({'value': row})
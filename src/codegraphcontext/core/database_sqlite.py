@@ -0,0 +1,675 @@
+# src/codegraphcontext/core/database_sqlite.py
+"""
+This module provides an embedded, in-process graph store on SQLite, and a
+thread-safe singleton manager for it.
+
+Unlike Neo4j and FalkorDB Lite it needs no server process, so it starts in
+milliseconds and runs wherever Python does. It does not execute Cypher: it
+implements the operations `SQLiteGraphBuilder` and `SQLiteCodeFinder` (see
+tools/sqlite_graph.py) are written against, i.e. batched upserts, neighbor
+lookups, bounded traversals and name/full-text search.
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from codegraphcontext.utils.debug_log import info_logger, error_logger
+
+# Labels whose nodes are keyed by their path, or by their name alone; all
+# other nodes are keyed by (name, file_path, line_number) like the Neo4j constraints.
+PATH_KEYED_LABELS = ("Repository", "Directory", "File")
+NAME_KEYED_LABELS = ("Module",)
+
+# The labels kept in the full-text index, and the properties indexed
+FULLTEXT_LABELS = ("Function", "Class", "Variable")
+FULLTEXT_FIELDS = ("name", "source", "docstring")
+
+# Node ids per statement when expanding a set of nodes (well below SQLite's variable limit)
+_CHUNK_SIZE = 500
+
+# Recorded in the database's user_version; bump it when _SCHEMA changes.
+SCHEMA_VERSION = 2
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    label TEXT NOT NULL,
+    key TEXT NOT NULL,
+    name TEXT,
+    file_path TEXT,
+    line_number INTEGER,
+    is_dependency INTEGER NOT NULL DEFAULT 0,
+    props TEXT NOT NULL DEFAULT '{{}}',
+    UNIQUE (label, key)
+);
+CREATE INDEX IF NOT EXISTS nodes_name ON nodes (name, file_path);
+CREATE INDEX IF NOT EXISTS nodes_file_path ON nodes (file_path);
+CREATE INDEX IF NOT EXISTS nodes_unused_functions ON nodes (file_path, line_number, name)
+WHERE label = 'Function' AND is_dependency = 0 AND json_extract(props, '$.internal_caller_count') = 0;
+
+CREATE TABLE IF NOT EXISTS edges (
+    src INTEGER NOT NULL REFERENCES nodes (id) ON DELETE CASCADE,
+    type TEXT NOT NULL,
+    dst INTEGER NOT NULL REFERENCES nodes (id) ON DELETE CASCADE,
+    key TEXT NOT NULL DEFAULT '',
+    props TEXT NOT NULL DEFAULT '{{}}',
+    PRIMARY KEY (src, type, dst, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS edges_dst ON edges (dst, type);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS nodes_fts USING fts5 ({', '.join(FULLTEXT_FIELDS)});
+
+CREATE TRIGGER IF NOT EXISTS nodes_fts_insert AFTER INSERT ON nodes
+WHEN new.label IN {FULLTEXT_LABELS} BEGIN
+    INSERT INTO nodes_fts (rowid, name, source, docstring)
+    VALUES (new.id, new.name, json_extract(new.props, '$.source'), json_extract(new.props, '$.docstring'));
+END;
+CREATE TRIGGER IF NOT EXISTS nodes_fts_update AFTER UPDATE ON nodes
+WHEN new.label IN {FULLTEXT_LABELS} BEGIN
+    DELETE FROM nodes_fts WHERE rowid = old.id;
+    INSERT INTO nodes_fts (rowid, name, source, docstring)
+    VALUES (new.id, new.name, json_extract(new.props, '$.source'), json_extract(new.props, '$.docstring'));
+END;
+CREATE TRIGGER IF NOT EXISTS nodes_fts_delete AFTER DELETE ON nodes
+WHEN old.label IN {FULLTEXT_LABELS} BEGIN
+    DELETE FROM nodes_fts WHERE rowid = old.id;
+END;
+"""
+
+_UPSERT_NODE = """
+    INSERT INTO nodes (label, key, name, file_path, line_number, is_dependency, props)
+    VALUES (:label, :key, :name, :file_path, :line_number, :is_dependency, :props)
+    ON CONFLICT (label, key) DO UPDATE SET
+        name = coalesce(excluded.name, name),
+        file_path = coalesce(excluded.file_path, file_path),
+        line_number = coalesce(excluded.line_number, line_number),
+        is_dependency = excluded.is_dependency,
+        props = json_patch(props, excluded.props)
+"""
+
+# Edges name their endpoints by (label, key), so a batch can be written
+# without first looking up the node ids.
+_UPSERT_EDGE = """
+    INSERT INTO edges (src, type, dst, key, props)
+    SELECT s.id, :type, d.id, :key, :props
+    FROM nodes s JOIN nodes d ON d.label = :dst_label AND d.key = :dst_key
+    WHERE s.label = :src_label AND s.key = :src_key
+    ON CONFLICT (src, type, dst, key) DO UPDATE SET props = json_patch(props, excluded.props)
+"""
+
+# Recounts the callers of Function nodes, like graph_schema.SET_CALLER_COUNTS.
+# Only nodes whose counts changed are written, sparing their full-text rows.
+_UPDATE_CALLER_COUNTS = """
+    WITH counts AS (
+        SELECT f.id,
+            (SELECT count(DISTINCT e.src) FROM edges e WHERE e.dst = f.id AND e.type = 'CALLS') AS callers,
+            (SELECT count(DISTINCT e.src) FROM edges e JOIN nodes c ON c.id = e.src
+             WHERE e.dst = f.id AND e.type = 'CALLS' AND c.label = 'Function' AND c.is_dependency = 0) AS internal
+        FROM nodes f WHERE f.label = 'Function' {scope}
+    )
+    UPDATE nodes SET props = json_set(props, '$.caller_count', counts.callers, '$.internal_caller_count', counts.internal)
+    FROM counts
+    WHERE nodes.id = counts.id
+      AND (json_extract(nodes.props, '$.caller_count') IS NOT counts.callers
+           OR json_extract(nodes.props, '$.internal_caller_count') IS NOT counts.internal)
+"""
+
+
+class Node(NamedTuple):
+    """A node as stored: its row id, label and properties."""
+    id: int
+    label: str
+    props: Dict[str, Any]
+
+
+class Edge(NamedTuple):
+    """A relationship between two node ids, with its properties."""
+    src: int
+    dst: int
+    props: Dict[str, Any]
+
+
+NodeRef = Tuple[str, str]
+
+
+def node_key(label: str, props: Dict[str, Any]) -> str:
+    """The unique key of a node with `label` and `props` within its label."""
+    if label in PATH_KEYED_LABELS:
+        return props["path"]
+    if label in NAME_KEYED_LABELS:
+        return props["name"]
+    if label == "Parameter":
+        return json.dumps([props["name"], props["file_path"], props["function_line_number"]])
+    return json.dumps([props["name"], props["file_path"], props["line_number"]])
+
+
+def node_ref(label: str, props: Dict[str, Any]) -> NodeRef:
+    """A (label, key) reference to a node, as `upsert_edges` takes them."""
+    return label, node_key(label, props)
+
+
+# The columns `find_nodes` orders by for each `order_by`, null-free so they can
+# be compared with a cursor's keys. See `node_sort_keys`.
+_NODE_ORDER = {
+    "location": ("is_dependency", "coalesce(file_path, '')", "coalesce(line_number, 0)", "key", "id"),
+    "name": ("is_dependency", "coalesce(name, '')", "coalesce(file_path, '')", "coalesce(line_number, 0)", "id"),
+}
+
+
+def node_sort_keys(node: "Node", order_by: str = "location") -> List[Any]:
+    """The keys `find_nodes` sorted `node` by, to pass back as its `after` argument."""
+    props = node.props
+    dependency = 1 if props.get("is_dependency") else 0
+    path, line = props.get("file_path") or "", props.get("line_number") or 0
+    if order_by == "name":
+        return [dependency, props.get("name") or "", path, line, node.id]
+    return [dependency, path, line, node_key(node.label, props), node.id]
+
+
+def _dumps(props: Dict[str, Any]) -> str:
+    return json.dumps(props, default=str)
+
+
+def _node(row) -> Node:
+    return Node(row[0], row[1], json.loads(row[2]))
+
+
+def _chunks(items: Sequence, size: int = _CHUNK_SIZE) -> Iterator[Sequence]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+_TERM = re.compile(r'^(?:(\w+):)?(.+?)(~\d*)?$')
+
+
+def to_fts5_query(query: str) -> str:
+    """
+    Translates the Lucene syntax CodeFinder builds full-text queries with
+    (`field:term`, `term~N`, terms OR-ed together) to an FTS5 query. FTS5 has
+    no edit-distance matching, so a fuzzy term becomes a prefix match.
+    """
+    terms = []
+    for token in query.split():
+        field, term, fuzzy = _TERM.match(token).groups()
+        if field and field not in FULLTEXT_FIELDS:
+            field, term = None, f"{field}:{term}"
+        phrase = '"' + term.replace('"', '""') + '"' + ("*" if fuzzy else "")
+        terms.append(f"{field} : {phrase}" if field else phrase)
+    return " OR ".join(terms)
+
+
+class SQLiteGraphStore:
+    """
+    A property graph in one SQLite database file.
+
+    Nodes are unique per (label, key) (see `node_key`); edges are unique per
+    (source, type, target, key), where the key is empty unless the edge was
+    written with `keyed=True`. Each thread gets its own connection, and the
+    database runs in WAL mode so reads proceed while an index is written.
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 30.0):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connection()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            conn.executescript(_SCHEMA)
+            if version == 1:
+                self.update_caller_counts()  # indexed before caller counts were kept
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """
+        Runs the enclosed writes in one transaction on this thread's connection.
+        Nested transactions join the outermost one, which commits or rolls back.
+        """
+        conn = self._connection()
+        if self._local.depth == 0:
+            conn.execute("BEGIN IMMEDIATE")
+        self._local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.execute("ROLLBACK")
+            raise
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            conn.execute("COMMIT")
+
+    def close(self):
+        """Closes the connections of all threads."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    # --- Writes -----------------------------------------------------------
+
+    def upsert_nodes(self, label: str, items: Iterable[Dict[str, Any]]):
+        """Creates or updates nodes; the properties of an existing node are merged into."""
+        rows = [{
+            "label": label,
+            "key": node_key(label, props),
+            "name": props.get("name"),
+            "file_path": props.get("file_path"),
+            "line_number": props.get("line_number"),
+            "is_dependency": bool(props.get("is_dependency")),
+            "props": _dumps(props),
+        } for props in items]
+        with self.transaction() as conn:
+            conn.executemany(_UPSERT_NODE, rows)
+
+    def upsert_edges(self, edge_type: str, edges: Iterable[Tuple[NodeRef, NodeRef, Dict[str, Any]]],
+                     keyed: bool = False):
+        """
+        Creates or updates `edge_type` edges given as (source ref, target ref,
+        properties). An edge whose endpoints do not exist is skipped. With
+        `keyed`, edges that differ in their properties are kept apart (like
+        several calls from one function to another) instead of merged.
+        """
+        rows = [{
+            "type": edge_type,
+            "src_label": src[0], "src_key": src[1],
+            "dst_label": dst[0], "dst_key": dst[1],
+            "key": json.dumps(props, sort_keys=True, default=str) if keyed else "",
+            "props": _dumps(props),
+        } for src, dst, props in edges]
+        with self.transaction() as conn:
+            conn.executemany(_UPSERT_EDGE, rows)
+
+    def update_node(self, label: str, key: str, props: Dict[str, Any]) -> bool:
+        """Merges `props` into an existing node. Returns False if there is no such node."""
+        with self.transaction() as conn:
+            cursor = conn.execute("UPDATE nodes SET props = json_patch(props, ?) WHERE label = ? AND key = ?",
+                                  (_dumps(props), label, key))
+        return cursor.rowcount > 0
+
+    def delete_nodes(self, ids: Iterable[int]):
+        """Deletes nodes and, through the foreign keys, their edges."""
+        ids = list(ids)
+        with self.transaction() as conn:
+            for chunk in _chunks(ids):
+                conn.execute(f"DELETE FROM nodes WHERE id IN ({','.join('?' * len(chunk))})", chunk)
+
+    def delete_edges(self, src_ids: Iterable[int], edge_types: Sequence[str]):
+        """Deletes the outgoing `edge_types` edges of the given nodes."""
+        src_ids = list(src_ids)
+        types = ",".join("?" * len(edge_types))
+        with self.transaction() as conn:
+            for chunk in _chunks(src_ids):
+                conn.execute(
+                    f"DELETE FROM edges WHERE type IN ({types}) AND src IN ({','.join('?' * len(chunk))})",
+                    [*edge_types, *chunk])
+
+    def update_caller_counts(self, ids: Optional[Iterable[int]] = None):
+        """
+        Recomputes the `caller_count` (all callers) and `internal_caller_count`
+        (callers that are project functions) properties of the Function nodes
+        with the given ids, or of every Function node.
+        """
+        with self.transaction() as conn:
+            if ids is None:
+                conn.execute(_UPDATE_CALLER_COUNTS.format(scope=""))
+                return
+            for chunk in _chunks(list(ids)):
+                conn.execute(_UPDATE_CALLER_COUNTS.format(scope=f"AND f.id IN ({','.join('?' * len(chunk))})"), chunk)
+
+    # --- Reads ------------------------------------------------------------
+
+    def get_node(self, label: str, key: str) -> Optional[Node]:
+        row = self._connection().execute(
+            "SELECT id, label, props FROM nodes WHERE label = ? AND key = ?", (label, key)).fetchone()
+        return _node(row) if row else None
+
+    def get_nodes(self, ids: Iterable[int]) -> Dict[int, Node]:
+        """The nodes with the given ids, by id."""
+        ids = list(ids)
+        nodes = {}
+        for chunk in _chunks(ids):
+            rows = self._connection().execute(
+                f"SELECT id, label, props FROM nodes WHERE id IN ({','.join('?' * len(chunk))})", chunk)
+            nodes.update((row[0], _node(row)) for row in rows)
+        return nodes
+
+    def find_nodes(self, labels: Sequence[str], name: Optional[str] = None, file_path: Optional[str] = None,
+                   line_number: Optional[int] = None, name_contains: Optional[str] = None,
+                   list_contains: Optional[Tuple[str, Any]] = None, is_dependency: Optional[bool] = None,
+                   order_by: str = "location", after: Optional[Sequence[Any]] = None,
+                   limit: Optional[int] = None, case_sensitive: bool = True) -> List[Node]:
+        """
+        The nodes with one of `labels` that match every given filter.
+        `name_contains` is a substring, matched ignoring case unless
+        `case_sensitive`; `list_contains` is a (property, value) pair for list
+        properties such as decorators.
+        Results put project code before dependencies, then sort by `order_by`
+        ("location" or "name"), starting after the `node_sort_keys` `after`.
+        """
+        clauses = [f"label IN ({','.join('?' * len(labels))})"]
+        params: List[Any] = list(labels)
+        for column, value in (("name", name), ("file_path", file_path), ("line_number", line_number)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if name_contains is not None:
+            clauses.append("instr(name, ?) > 0" if case_sensitive else "instr(lower(name), lower(?)) > 0")
+            params.append(name_contains)
+        if list_contains is not None:
+            clauses.append("EXISTS (SELECT 1 FROM json_each(props, ?) WHERE value = ?)")
+            params.extend((f"$.{list_contains[0]}", list_contains[1]))
+        if is_dependency is not None:
+            clauses.append("is_dependency = ?")
+            params.append(bool(is_dependency))
+        order = ", ".join(_NODE_ORDER[order_by])
+        if after is not None:
+            clauses.append(f"({order}) > ({', '.join('?' * len(after))})")
+            params.extend(after)
+        sql = f"SELECT id, label, props FROM nodes WHERE {' AND '.join(clauses)} ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [_node(row) for row in self._connection().execute(sql, params)]
+
+    def find_unused_functions(self, excluded_names: Sequence[str] = (), excluded_decorators: Sequence[str] = (),
+                              after: Optional[Sequence[Any]] = None, limit: Optional[int] = None) -> List[Node]:
+        """
+        Project functions that no project function calls (see
+        `update_caller_counts`), other than those named in `excluded_names`,
+        test functions and those with one of `excluded_decorators`. They are
+        ordered by (file_path, line_number, name), starting after `after`.
+        """
+        # Without ANALYZE statistics the planner prefers the (label, key) index
+        sql = f"""
+            SELECT id, label, props FROM nodes INDEXED BY nodes_unused_functions
+            WHERE label = 'Function' AND is_dependency = 0 AND json_extract(props, '$.internal_caller_count') = 0
+              AND name NOT IN ({','.join('?' * len(excluded_names))})
+              AND substr(name, 1, 5) NOT IN ('_test', 'test_')
+              AND NOT EXISTS (SELECT 1 FROM json_each(props, '$.decorators')
+                              WHERE value IN ({','.join('?' * len(excluded_decorators))}))
+        """
+        params: List[Any] = [*excluded_names, *excluded_decorators]
+        if after is not None:
+            sql += " AND (file_path, line_number, name) > (?, ?, ?)"
+            params.extend(after)
+        sql += " ORDER BY file_path, line_number, name"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [_node(row) for row in self._connection().execute(sql, params)]
+
+    def scan_nodes(self) -> Iterator[Tuple]:
+        """
+        Every node except parameters, as (id, label, name, path, line_number,
+        is_dependency, decorators JSON) rows, where path is the file path of
+        symbols and the path of files, directories and repositories.
+        """
+        return self._connection().execute("""
+            SELECT id, label, name, coalesce(file_path, json_extract(props, '$.path')), line_number,
+                is_dependency, json_extract(props, '$.decorators')
+            FROM nodes WHERE label != 'Parameter'
+        """)
+
+    def scan_edges(self, edge_types: Sequence[str]) -> Iterator[Tuple[int, str, int]]:
+        """Every edge of the given types, as (source id, type, target id) rows."""
+        return self._connection().execute(
+            f"SELECT src, type, dst FROM edges WHERE type IN ({','.join('?' * len(edge_types))})", list(edge_types))
+
+    def find_edges(self, edge_type: str, **props) -> List[Edge]:
+        """The `edge_type` edges whose properties include all of `props`."""
+        clauses = ["type = ?"]
+        params: List[Any] = [edge_type]
+        for prop, value in props.items():
+            clauses.append("json_extract(props, ?) = ?")
+            params.extend((f"$.{prop}", value))
+        rows = self._connection().execute(
+            f"SELECT src, dst, props FROM edges WHERE {' AND '.join(clauses)}", params)
+        return [Edge(row[0], row[1], json.loads(row[2])) for row in rows]
+
+    def neighbors(self, ids: Iterable[int], edge_type: str, direction: str = "out") -> List[Edge]:
+        """
+        The `edge_type` edges leaving (`direction="out"`) or entering
+        (`direction="in"`) any of the given nodes.
+        """
+        ids = list(ids)
+        column = "src" if direction == "out" else "dst"
+        edges = []
+        for chunk in _chunks(ids):
+            rows = self._connection().execute(
+                f"SELECT src, dst, props FROM edges WHERE type = ? AND {column} IN ({','.join('?' * len(chunk))})",
+                [edge_type, *chunk])
+            edges.extend(Edge(row[0], row[1], json.loads(row[2])) for row in rows)
+        return edges
+
+    def traverse(self, start_ids: Iterable[int], edge_type: str, direction: str = "out",
+                 max_depth: Optional[int] = None) -> Dict[int, int]:
+        """
+        Breadth-first traversal along `edge_type` edges, one query per level.
+        Returns the depth at which each reachable node was first reached
+        (a start node appears only if a cycle leads back to it).
+        """
+        depths: Dict[int, int] = {}
+        frontier = set(start_ids)
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            edges = self.neighbors(frontier, edge_type, direction)
+            reached = {edge.dst if direction == "out" else edge.src for edge in edges}
+            frontier = {node_id for node_id in reached if node_id not in depths}
+            for node_id in frontier:
+                depths[node_id] = depth
+        return depths
+
+    def search_text(self, query: str, labels: Sequence[str] = FULLTEXT_LABELS, limit: int = 20,
+                    after: Optional[Tuple[float, int]] = None) -> List[Tuple[Node, float]]:
+        """
+        Full-text search over the name, source and docstring of the nodes in
+        FULLTEXT_LABELS. `query` uses Lucene syntax (see `to_fts5_query`).
+        Returns (node, score) pairs, best match first, starting after the
+        (score, id) pair `after`.
+        """
+        fts_query = to_fts5_query(query)
+        if not fts_query:
+            return []
+        # bm25 scores are negative, lower is better
+        keyset = "WHERE (score, id) > (-?, ?)" if after is not None else ""
+        rows = self._connection().execute(f"""
+            SELECT * FROM (
+                SELECT n.id, n.label, n.props, bm25(nodes_fts) AS score
+                FROM nodes_fts JOIN nodes n ON n.id = nodes_fts.rowid
+                WHERE nodes_fts MATCH ? AND n.label IN ({','.join('?' * len(labels))})
+            ) {keyset}
+            ORDER BY score, id
+            LIMIT ?
+        """, [fts_query, *labels, *(after or ()), limit])
+        return [(_node(row), -row[3]) for row in rows]
+
+
+class SQLiteDriverWrapper:
+    """
+    Gives the store the driver interface the managers share. Sessions exist
+    so callers can open and close them, but the store does not run Cypher:
+    code that needs more than `GraphBuilder` and `CodeFinder` report this
+    backend as unsupported.
+    """
+
+    def __init__(self, store: SQLiteGraphStore):
+        self.store = store
+
+    def session(self):
+        return SQLiteSession()
+
+    def close(self):
+        self.store.close()
+
+
+class SQLiteSession:
+    """A session that rejects Cypher queries."""
+
+    def run(self, query, **parameters):
+        raise NotImplementedError(
+            "Cypher queries are not supported by the SQLite backend. "
+            "Use 'cgc config db falkordb' or 'cgc config db neo4j' for this command."
+        )
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SQLiteManager:
+    """
+    Manages the embedded SQLite graph store as a singleton.
+    The database is opened in-process, so there is no server to start.
+    """
+    _instance = None
+    _driver = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        """Standard singleton pattern implementation."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(SQLiteManager, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """
+        Initializes the manager with the configured database path.
+        The `_initialized` flag prevents re-initialization on subsequent calls.
+        """
+        if hasattr(self, '_initialized'):
+            return
+
+        try:
+            from codegraphcontext.cli.config_manager import get_config_value
+            config_db_path = get_config_value('SQLITE_PATH')
+        except Exception:
+            config_db_path = None
+
+        self.db_path = os.getenv(
+            'SQLITE_PATH',
+            config_db_path or str(Path.home() / '.codegraphcontext' / 'graph.sqlite')
+        )
+        self._initialized = True
+
+    def get_driver(self) -> SQLiteDriverWrapper:
+        """
+        Gets the driver, opening the database (and creating its schema) if
+        necessary. This method is thread-safe.
+        """
+        if self._driver is None:
+            with self._lock:
+                if self._driver is None:
+                    is_valid, validation_error = self.validate_config(self.db_path)
+                    if not is_valid:
+                        error_logger(f"Configuration validation failed: {validation_error}")
+                        raise ValueError(validation_error)
+                    info_logger(f"Opening SQLite graph database at {self.db_path}")
+                    self._driver = SQLiteDriverWrapper(SQLiteGraphStore(self.db_path))
+        return self._driver
+
+    @property
+    def store(self) -> SQLiteGraphStore:
+        return self.get_driver().store
+
+    def close_driver(self):
+        """Closes the database connections if they are open."""
+        if self._driver is not None:
+            with self._lock:
+                if self._driver is not None:
+                    info_logger("Closing SQLite graph database")
+                    self._driver.close()
+                    self._driver = None
+
+    def is_connected(self) -> bool:
+        """Checks if the database is currently open."""
+        if self._driver is None:
+            return False
+        try:
+            self._driver.store._connection().execute("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    def get_backend_type(self) -> str:
+        """Returns the database backend type."""
+        return 'sqlite'
+
+    @contextmanager
+    def bulk_load(self):
+        """Writes a bulk index or bundle import in one transaction, committed at the end."""
+        with self.store.transaction():
+            yield
+
+    @staticmethod
+    def validate_config(db_path: str = None) -> Tuple[bool, Optional[str]]:
+        """
+        Validates the SQLite database path.
+
+        Returns:
+            Tuple[bool, Optional[str]]: (is_valid, error_message)
+        """
+        if db_path == ":memory:" or (db_path or "").startswith("file::memory:"):
+            # Each thread's connection would open its own empty database
+            return False, (
+                "An in-memory SQLite database cannot be shared between threads.\n"
+                "Please set SQLITE_PATH to a file path."
+            )
+        if db_path:
+            db_dir = Path(db_path).parent
+            if db_dir.exists() and not os.access(db_dir, os.W_OK):
+                return False, (
+                    f"Cannot write to directory: {db_dir}\n"
+                    "Please ensure you have write permissions."
+                )
+        return True, None
+
+    @staticmethod
+    def test_connection(db_path: str = None) -> Tuple[bool, Optional[str]]:
+        """
+        Tests that this Python's SQLite has what the store needs (FTS5 and JSON functions).
+        """
+        try:
+            conn = sqlite3.connect(":memory:")
+            try:
+                conn.execute("CREATE VIRTUAL TABLE t USING fts5 (x)")
+                conn.execute("SELECT json_patch('{}', '{}')")
+            finally:
+                conn.close()
+            return True, None
+        except sqlite3.Error as e:
+            return False, f"SQLite {sqlite3.sqlite_version} lacks FTS5 or JSON support: {e}"
@@ -3,8 +3,11 @@ import os
 import time
 import signal
 from pathlib import Path
+from typing import Dict, List, Mapping
 import logging
 
+from codegraphcontext.core.database_falkordb import READY
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("falkor_worker")
@@ -12,6 +15,82 @@ logger = logging.getLogger("falkor_worker")
 # Global to handle shutdown
 db_instance = None
 
+# FalkorDB module settings that can be tuned from the config, keyed by config
+# key. They are passed as module arguments when the worker loads FalkorDB, so
+# changes take effect when the worker is restarted.
+MODULE_SETTINGS = {
+    "FALKORDB_THREAD_COUNT": "THREAD_COUNT",
+    "FALKORDB_CACHE_SIZE": "CACHE_SIZE",
+    "FALKORDB_QUERY_MEM_CAPACITY": "QUERY_MEM_CAPACITY",
+    "FALKORDB_TIMEOUT_DEFAULT": "TIMEOUT_DEFAULT",
+    "FALKORDB_TIMEOUT_MAX": "TIMEOUT_MAX",
+    "FALKORDB_NODE_CREATION_BUFFER": "NODE_CREATION_BUFFER",
+    "FALKORDB_DELTA_MAX_PENDING_CHANGES": "DELTA_MAX_PENDING_CHANGES",
+}
+
+# Redis persistence settings for each FALKORDB_PERSISTENCE policy. A quoted
+# empty `save` disables RDB snapshots (leaving it out would restore the defaults).
+PERSISTENCE_POLICIES = {
+    "rdb": {"appendonly": "no"},
+    "aof": {"save": '""', "appendonly": "yes"},
+    "rdb+aof": {"appendonly": "yes"},
+    "none": {"save": '""', "appendonly": "no"},
+}
+
+
+def module_settings(config: Mapping[str, str]) -> Dict[str, str]:
+    """
+    The FalkorDB module settings given in `config`, by module setting name.
+    Settings left at "default" (or empty) keep FalkorDB's own default.
+    """
+    settings = {}
+    for key, name in MODULE_SETTINGS.items():
+        value = str(config.get(key) or "").strip()
+        if value and value.lower() != "default":
+            settings[name] = value
+    return settings
+
+
+def module_args(settings: Mapping[str, str]) -> List[str]:
+    """The `loadmodule` arguments for `settings`."""
+    args = []
+    for name, value in settings.items():
+        args.extend([name, value])
+    return args
+
+
+def persistence_config(policy: str) -> Dict[str, str]:
+    """The redis server settings for a FALKORDB_PERSISTENCE policy."""
+    try:
+        return dict(PERSISTENCE_POLICIES[(policy or "rdb").lower()])
+    except KeyError:
+        logger.warning(f"Unknown persistence policy '{policy}', using 'rdb'.")
+        return dict(PERSISTENCE_POLICIES["rdb"])
+
+
+def _load_config() -> Dict[str, str]:
+    try:
+        from codegraphcontext.cli.config_manager import load_config
+        return load_config()
+    except Exception as e:
+        # Fall back to the environment (which overrides the config anyway)
+        logger.warning(f"Could not load configuration, using environment only: {e}")
+        return dict(os.environ)
+
+def signal_ready(status: str):
+    """
+    Reports `status` (READY, or an error) to the parent on the pipe it passed
+    in FALKORDB_READY_FD. Only the first report is sent.
+    """
+    fd = os.environ.pop('FALKORDB_READY_FD', None)
+    if not fd:
+        return
+    try:
+        os.write(int(fd), (status.replace("\n", " ") + "\n").encode())
+        os.close(int(fd))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not report readiness: {e}")
+
 def handle_signal(signum, frame):
     logger.info(f"Received signal {signum}. Stopping FalkorDB worker...")
     sys.exit(0)
@@ -25,6 +104,7 @@ def run_worker():
     
     if not db_path or not socket_path:
         logger.error("Missing configuration. FALKORDB_PATH and FALKORDB_SOCKET_PATH must be set.")
+        signal_ready("ERROR Missing FALKORDB_PATH or FALKORDB_SOCKET_PATH")
         sys.exit(1)
         
     # Ensure dir exists
@@ -43,7 +123,23 @@ def run_worker():
                 "Please run the project using WSL or Docker."
             )
         
+        import redislite.client
         from redislite.falkordb_client import FalkorDB
+
+        config = _load_config()
+        serverconfig = persistence_config(config.get("FALKORDB_PERSISTENCE"))
+        settings = module_settings(config)
+        logger.info(f"Persistence: {config.get('FALKORDB_PERSISTENCE') or 'rdb'}")
+        if settings:
+            logger.info(f"Module settings: {settings}")
+            # redislite loads the module from the command line, which takes no
+            # arguments; load it from the config file instead.
+            module_path = getattr(redislite.client, "__falkordb_module__", None)
+            if module_path:
+                serverconfig["loadmodule"] = " ".join([module_path, *module_args(settings)])
+                redislite.client.__falkordb_module__ = ""
+            else:
+                logger.warning("FalkorDB module path unknown; module settings are ignored.")
         
         # Start Embedded DB
         # Note: redislite might raise error if socket is in use/locked.
@@ -54,8 +150,11 @@ def run_worker():
             except OSError:
                 pass
 
-        db_instance = FalkorDB(db_path, unix_socket_path=socket_path)
+        db_instance = FalkorDB(db_path, unix_socket_path=socket_path, serverconfig=serverconfig)
+        # Fails with "unknown command" if the FalkorDB module did not load
+        db_instance.execute_command("GRAPH.LIST")
         logger.info("FalkorDB Lite is running.")
+        signal_ready(READY)
         
         # Keep alive loop
         while True:
@@ -63,9 +162,11 @@ def run_worker():
             
     except ImportError:
         logger.error("Failed to import redislite.falkordb_client. Is falkordblite installed?")
+        signal_ready("ERROR falkordblite is not installed")
         sys.exit(1)
     except Exception as e:
         logger.error(f"FalkorDB Worker Critical Failure: {e}")
+        signal_ready(f"ERROR {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
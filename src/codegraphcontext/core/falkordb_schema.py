@@ -0,0 +1,79 @@
+# src/codegraphcontext/core/falkordb_schema.py
+"""
+Schema for the FalkorDB backend.
+
+The Neo4j statements in `graph_schema.NEO4J_MIGRATIONS` do not carry over:
+FalkorDB has no Cypher syntax for uniqueness constraints, and it keeps one
+full-text index per label, queried with its own procedure. Instead, every
+property that `GraphBuilder` and `CodeFinder` look nodes up by gets a range
+index, and the searchable labels get full-text indexes. `graph_schema` runs
+these statements as FalkorDB's first migration.
+"""
+import re
+from typing import Dict, List, Tuple
+
+# Definition nodes are merged and matched on these
+_DEFINITION_KEYS = ("name", "file_path", "line_number")
+
+RANGE_INDEXES: Dict[str, Tuple[str, ...]] = {
+    "Repository": ("path", "name"),
+    "Directory": ("path",),
+    "File": ("path", "name"),
+    "Module": ("name",),
+    "Function": _DEFINITION_KEYS + ("lang", "is_dependency", "internal_caller_count"),
+    "Class": _DEFINITION_KEYS + ("lang",),
+    "Trait": _DEFINITION_KEYS,
+    "Interface": _DEFINITION_KEYS,
+    "Macro": _DEFINITION_KEYS,
+    "Variable": _DEFINITION_KEYS,
+    "Struct": _DEFINITION_KEYS,
+    "Enum": _DEFINITION_KEYS,
+    "Union": _DEFINITION_KEYS,
+    "Annotation": _DEFINITION_KEYS + ("lang",),
+    "Record": _DEFINITION_KEYS,
+    "Property": _DEFINITION_KEYS,
+    "Parameter": ("name", "file_path", "function_line_number"),
+}
+
+# The labels searched by CodeFinder's full-text queries, and their indexed fields
+FULLTEXT_INDEXES: Dict[str, Tuple[str, ...]] = {
+    "Function": ("name", "source", "docstring"),
+    "Class": ("name", "source", "docstring"),
+    "Variable": ("name", "source", "docstring"),
+}
+
+
+def schema_statements() -> List[str]:
+    """
+    The statements that create the FalkorDB schema, one index per statement so
+    that an index which already exists does not stop its neighbours being created.
+    """
+    statements = [
+        f"CREATE INDEX FOR (n:{label}) ON (n.{prop})"
+        for label, props in RANGE_INDEXES.items()
+        for prop in props
+    ]
+    statements.extend(
+        f"CALL db.idx.fulltext.createNodeIndex('{label}', {', '.join(repr(f) for f in fields)})"
+        for label, fields in FULLTEXT_INDEXES.items()
+    )
+    return statements
+
+
+_FIELD = re.compile(r'(?<![\w@])(\w+):(?=\S)')
+_FUZZY = re.compile(r'(?<![\w%])(\w+)~(\d)?')
+
+
+def to_fulltext_query(query: str) -> str:
+    """
+    Translates the Lucene syntax CodeFinder builds full-text queries with
+    (`field:term`, `term~N`) to the RediSearch syntax FalkorDB expects
+    (`@field:term`, `%term%`, with at most three `%` for the edit distance).
+    """
+    query = _FIELD.sub(r'@\1:', query)
+
+    def fuzzy(match):
+        distance = min(max(int(match.group(2) or 2), 1), 3)
+        return "%" * distance + match.group(1) + "%" * distance
+
+    return _FUZZY.sub(fuzzy, query)
@@ -0,0 +1,134 @@
+# src/codegraphcontext/core/graph_schema.py
+"""
+Versioned schema bootstrap for the Cypher backends.
+
+Sending every constraint and index statement on each startup costs a round
+trip per statement (and, on FalkorDB, an error for each index that already
+exists). Instead the graph records the schema version it was migrated to on a
+single `SchemaVersion` node, startup reads it with one query, and only the
+migrations past it are run.
+
+To change the schema, append a migration (a list of statements) to the
+backend's list below; never edit one that has shipped. For FalkorDB also add
+the property to `falkordb_schema.RANGE_INDEXES`, which fresh databases are
+created from.
+"""
+from typing import Dict, List
+
+from .falkordb_schema import schema_statements
+from ..utils.debug_log import debug_log, info_logger, warning_logger
+
+SCHEMA_LABEL = "SchemaVersion"
+
+# Recounts the callers of each `fn` in scope. `internal_caller_count` counts
+# only callers that are project functions, so find_dead_code looks up
+# functions with none instead of aggregating CALLS edges on every query.
+SET_CALLER_COUNTS = """
+    OPTIONAL MATCH (caller)-[:CALLS]->(fn)
+    WITH fn, count(DISTINCT caller) AS callers,
+         count(DISTINCT CASE WHEN caller:Function AND caller.is_dependency = false THEN caller END) AS internal
+    SET fn.caller_count = callers, fn.internal_caller_count = internal
+"""
+
+_READ_VERSION = f"MATCH (s:{SCHEMA_LABEL} {{name: 'cgc'}}) RETURN s.version AS version"
+_WRITE_VERSION = f"MERGE (s:{SCHEMA_LABEL} {{name: 'cgc'}}) SET s.version = $version"
+
+NEO4J_MIGRATIONS: List[List[str]] = [
+    # 1: uniqueness constraints for every merged label, language indexes and code search
+    [
+        "CREATE CONSTRAINT repository_path IF NOT EXISTS FOR (r:Repository) REQUIRE r.path IS UNIQUE",
+        "CREATE CONSTRAINT file_path IF NOT EXISTS FOR (f:File) REQUIRE f.path IS UNIQUE",
+        "CREATE CONSTRAINT directory_path IF NOT EXISTS FOR (d:Directory) REQUIRE d.path IS UNIQUE",
+        "CREATE CONSTRAINT function_unique IF NOT EXISTS FOR (f:Function) REQUIRE (f.name, f.file_path, f.line_number) IS UNIQUE",
+        "CREATE CONSTRAINT class_unique IF NOT EXISTS FOR (c:Class) REQUIRE (c.name, c.file_path, c.line_number) IS UNIQUE",
+        "CREATE CONSTRAINT trait_unique IF NOT EXISTS FOR (t:Trait) REQUIRE (t.name, t.file_path, t.line_number) IS UNIQUE",
+        "CREATE CONSTRAINT interface_unique IF NOT EXISTS FOR (i:Interface) REQUIRE (i.name, i.file_path, i.line_number) IS UNIQUE",
+        "CREATE CONSTRAINT macro_unique IF NOT EXISTS FOR (m:Macro) REQUIRE (m.name, m.file_path, m.line_number) IS UNIQUE",
+        "CREATE CONSTRAINT variable_unique IF NOT EXISTS FOR (v:Variable) REQUIRE (v.name, v.file_path, v.line_number) IS UNIQUE",
+        "CREATE CONSTRAINT module_name IF NOT EXISTS FOR (m:Module) REQUIRE m.name IS UNIQUE",
+        "CREATE CONSTRAINT struct_cpp IF NOT EXISTS FOR (cstruct: Struct) REQUIRE (cstruct.name, cstruct.file_path, cstruct.line_number) IS UNIQUE",
+        "CREATE CONSTRAINT enum_cpp IF NOT EXISTS FOR (cenum: Enum) REQUIRE (cenum.name, cenum.file_path, cenum.line_number) IS UNIQUE",
+        "CREATE CONSTRAINT union_cpp IF NOT EXISTS FOR (cunion: Union) REQUIRE (cunion.name, cunion.file_path, cunion.line_number) IS UNIQUE",
+        "CREATE CONSTRAINT annotation_unique IF NOT EXISTS FOR (a:Annotation) REQUIRE (a.name, a.file_path, a.line_number) IS UNIQUE",
+        "CREATE CONSTRAINT record_unique IF NOT EXISTS FOR (r:Record) REQUIRE (r.name, r.file_path, r.line_number) IS UNIQUE",
+        "CREATE CONSTRAINT property_unique IF NOT EXISTS FOR (p:Property) REQUIRE (p.name, p.file_path, p.line_number) IS UNIQUE",
+        "CREATE INDEX function_lang IF NOT EXISTS FOR (f:Function) ON (f.lang)",
+        "CREATE INDEX class_lang IF NOT EXISTS FOR (c:Class) ON (c.lang)",
+        "CREATE INDEX annotation_lang IF NOT EXISTS FOR (a:Annotation) ON (a.lang)",
+        """
+        CREATE FULLTEXT INDEX code_search_index IF NOT EXISTS
+        FOR (n:Function|Class|Variable)
+        ON EACH [n.name, coalesce(n.source, ''), coalesce(n.docstring, '')]
+        """,
+    ],
+    # 2: caller counts on functions, for dead-code lookups
+    [
+        "CREATE INDEX function_internal_callers IF NOT EXISTS FOR (f:Function) ON (f.internal_caller_count)",
+        "MATCH (fn:Function)" + SET_CALLER_COUNTS,
+    ],
+]
+
+FALKORDB_MIGRATIONS: List[List[str]] = [
+    # 1: range indexes on every lookup key, full-text indexes on the searchable labels
+    schema_statements(),
+    # 2: caller counts on functions, for dead-code lookups
+    [
+        "CREATE INDEX FOR (n:Function) ON (n.internal_caller_count)",
+        "MATCH (fn:Function)" + SET_CALLER_COUNTS,
+    ],
+]
+
+_MIGRATIONS: Dict[str, List[List[str]]] = {
+    "neo4j": NEO4J_MIGRATIONS,
+    "falkordb": FALKORDB_MIGRATIONS,
+}
+
+
+def _already_exists(error: Exception) -> bool:
+    # Databases created before the schema was versioned already have some of
+    # these indexes, which FalkorDB (having no IF NOT EXISTS) reports as errors.
+    message = str(error).lower()
+    return "already" in message or "equivalent" in message
+
+
+def read_schema_version(session) -> int:
+    """The version recorded in the graph, 0 if it has never been migrated."""
+    record = session.run(_READ_VERSION).single()
+    return (record["version"] or 0) if record else 0
+
+
+def ensure_schema(driver, backend: str) -> int:
+    """
+    Brings the graph's schema up to date, running only the migrations past the
+    version it records. A migration with a failed statement is not recorded,
+    so it is retried on the next startup. Returns the version the graph is at.
+    """
+    migrations = _MIGRATIONS.get(backend, NEO4J_MIGRATIONS)
+    with driver.session() as session:
+        try:
+            current = read_schema_version(session)
+        except Exception as e:
+            warning_logger(f"Could not read the schema version, recreating the schema: {e}")
+            current = 0
+        if current >= len(migrations):
+            debug_log(f"Database schema is at version {current}")
+            return current
+
+        for version, statements in enumerate(migrations[current:], start=current + 1):
+            failures = 0
+            for statement in statements:
+                try:
+                    session.run(statement)
+                except Exception as e:
+                    if _already_exists(e):
+                        debug_log(f"Schema statement skipped, already applied: {e}")
+                    else:
+                        failures += 1
+                        warning_logger(f"Schema creation warning: {e}")
+            if failures:
+                return current
+            session.run(_WRITE_VERSION, version=version)
+            current = version
+    info_logger(f"Database schema migrated to version {current}")
+    return current
+
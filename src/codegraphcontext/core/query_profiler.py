@@ -0,0 +1,410 @@
+# src/codegraphcontext/core/query_profiler.py
+"""
+Query instrumentation shared by the database managers.
+
+`instrument` wraps a backend driver so every statement run through its
+sessions is timed and counted per normalized query (literals replaced by `?`),
+along with the call sites it was run from. Statements slower than
+SLOW_QUERY_MS are appended to the slow-query log; with PROFILE_SLOW_QUERIES
+enabled, the first slow run of each statement also captures its plan
+(PROFILE for reads, EXPLAIN for writes, which must not run twice).
+
+The statistics are merged into a file in the config directory when the
+process exits, under a lock so concurrent processes do not lose each other's
+counts, and `cgc doctor --queries` summarizes them. Profiling is off unless
+QUERY_PROFILING is true.
+"""
+import atexit
+import contextlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from codegraphcontext.cli.config_manager import CONFIG_DIR
+from codegraphcontext.utils.debug_log import debug_log, warning_logger
+
+STATS_FILE = CONFIG_DIR / "query_stats.json"
+
+# Call sites kept per statement, most frequent first
+_MAX_CALL_SITES = 5
+
+# Frames in these files are the database layer, not the caller being profiled
+_DB_LAYER = re.compile(r'[\\/]codegraphcontext[\\/]core[\\/](?:database\w*|query_profiler)\.py$')
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r'(?<![\w$.])-?\d+(?:\.\d+)?\b')
+_WHITESPACE = re.compile(r'\s+')
+
+# Clauses and procedures that modify the graph. Writes are EXPLAINed rather
+# than PROFILEd, and FalkorDB runs anything else as a concurrent GRAPH.RO_QUERY.
+_WRITE_CLAUSE = re.compile(
+    r'\b(?:CREATE|MERGE|DELETE|DETACH|SET|REMOVE|DROP)\b|\bdb\.idx\.\w+\.(?:create|drop)', re.IGNORECASE
+)
+
+Explain = Callable[[str, dict], str]
+
+
+@lru_cache(maxsize=1024)
+def normalize_query(query: str) -> str:
+    """The statement with whitespace collapsed and literals replaced by `?`. Results are cached by query text."""
+    query = _STRING_LITERAL.sub('?', query)
+    query = _NUMBER_LITERAL.sub('?', query)
+    return _WHITESPACE.sub(' ', query).strip()
+
+
+@lru_cache(maxsize=1024)
+def is_write_query(query: str) -> bool:
+    """Whether `query` may modify the graph. Results are cached by query text."""
+    return _WRITE_CLAUSE.search(query) is not None
+
+
+def call_site() -> str:
+    """`file:line in function` of the nearest frame outside the database layer."""
+    frame = sys._getframe(1)
+    while frame is not None and _DB_LAYER.search(frame.f_code.co_filename):
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+    path = frame.f_code.co_filename
+    marker = path.rfind("codegraphcontext")
+    return f"{path[marker:] if marker >= 0 else path}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+
+class QueryStats:
+    """Aggregated measurements for one normalized statement."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.slow = 0
+        self.call_sites = Counter()
+        self.plan: Optional[str] = None
+
+    def add(self, elapsed_ms: float, rows: int, site: str, slow: bool):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += rows
+        self.slow += slow
+        self.call_sites[site] += 1
+
+    def merge(self, other: "QueryStats"):
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        self.rows += other.rows
+        self.slow += other.slow
+        self.call_sites.update(other.call_sites)
+        self.plan = other.plan or self.plan
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count, "total_ms": round(self.total_ms, 3), "max_ms": round(self.max_ms, 3),
+            "rows": self.rows, "slow": self.slow,
+            "call_sites": dict(self.call_sites.most_common(_MAX_CALL_SITES)), "plan": self.plan,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "QueryStats":
+        stats = cls()
+        stats.count = data.get("count", 0)
+        stats.total_ms = data.get("total_ms", 0.0)
+        stats.max_ms = data.get("max_ms", 0.0)
+        stats.rows = data.get("rows", 0)
+        stats.slow = data.get("slow", 0)
+        stats.call_sites = Counter(data.get("call_sites") or {})
+        stats.plan = data.get("plan")
+        return stats
+
+
+class QueryProfiler:
+    """Collects per-statement statistics and writes the slow-query log."""
+
+    def __init__(self, slow_query_ms: float = 500, log_path: Optional[str] = None,
+                 capture_plans: bool = False, stats_path: Optional[Path] = None):
+        self.slow_query_ms = slow_query_ms
+        self.log_path = log_path
+        self.capture_plans = capture_plans
+        self.stats_path = stats_path
+        self.stats: Dict[str, QueryStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def capturing_plan(self) -> bool:
+        """Whether this thread is capturing a plan, whose own queries are not recorded."""
+        return getattr(self._local, "capturing", False)
+
+    def record(self, query: str, parameters: dict, elapsed_ms: float, rows: int, site: str,
+               explain: Optional[Explain] = None):
+        """Adds one execution of `query`, logging it (and capturing its plan) if it was slow."""
+        normalized = normalize_query(query)
+        slow = elapsed_ms >= self.slow_query_ms
+        with self._lock:
+            stats = self.stats.get(normalized)
+            if stats is None:
+                stats = self.stats[normalized] = QueryStats()
+            stats.add(elapsed_ms, rows, site, slow)
+            capture = slow and self.capture_plans and explain is not None and stats.plan is None
+            if capture:
+                stats.plan = ""  # claimed, so concurrent slow runs do not profile it again
+        if not slow:
+            return
+
+        plan = None
+        if capture:
+            self._local.capturing = True
+            try:
+                plan = stats.plan = explain(query, parameters)
+            except Exception as e:
+                warning_logger(f"Could not capture the plan of a slow query: {e}")
+            finally:
+                self._local.capturing = False
+        self._log_slow(query, normalized, elapsed_ms, rows, site, plan)
+
+    def _log_slow(self, query: str, normalized: str, elapsed_ms: float, rows: int, site: str, plan: Optional[str]):
+        debug_log(f"Slow query ({elapsed_ms:.1f} ms, {rows} rows) from {site}: {normalized[:200]}")
+        if not self.log_path:
+            return
+        entry = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "elapsed_ms": round(elapsed_ms, 3), "rows": rows, "call_site": site,
+            "query": normalized, "plan": plan,
+        }
+        try:
+            Path(self.log_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as log:
+                log.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            warning_logger(f"Could not write the slow-query log {self.log_path}: {e}")
+
+    def flush(self):
+        """Merges the statistics collected so far into `stats_path` and clears them."""
+        with self._lock:
+            collected, self.stats = self.stats, {}
+        if not collected or not self.stats_path:
+            return
+        try:
+            # Held from reading the saved statistics to replacing them, so no other process's merge is lost
+            with _file_lock(self.stats_path.with_suffix(".lock")):
+                merged = load_stats(self.stats_path)
+                for query, stats in collected.items():
+                    merged.setdefault(query, QueryStats()).merge(stats)
+                tmp_path = self.stats_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps({q: s.to_dict() for q, s in merged.items()}))
+                os.replace(tmp_path, self.stats_path)
+        except OSError as e:
+            warning_logger(f"Could not save query statistics to {self.stats_path}: {e}")
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path):
+    """Holds an exclusive lock on `path`, created if missing, shared with other processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as handle:
+        if os.name == "nt":
+            import msvcrt
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def load_stats(path: Path = STATS_FILE) -> Dict[str, QueryStats]:
+    """The statistics saved by earlier processes, by normalized statement."""
+    try:
+        data = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    return {query: QueryStats.from_dict(stats) for query, stats in data.items()}
+
+
+def top_statements(stats: Dict[str, QueryStats], limit: int = 10) -> List[Tuple[str, QueryStats]]:
+    """The (statement, stats) pairs with the most total time."""
+    return sorted(stats.items(), key=lambda item: item[1].total_ms, reverse=True)[:limit]
+
+
+class InstrumentedResult:
+    """
+    Passes a result through, adding the time spent reading it to the time
+    the statement took, and recording the statement once it has been read.
+    """
+
+    def __init__(self, result, session: "InstrumentedSession", query: str, parameters: dict,
+                 elapsed: float, site: str):
+        self._result = result
+        self._session = session
+        self._query = query
+        self._parameters = parameters
+        self._elapsed = elapsed
+        self._site = site
+        self._rows = 0
+        self._recorded = False
+
+    def _timed(self, method, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return getattr(self._result, method)(*args, **kwargs)
+        finally:
+            self._elapsed += time.perf_counter() - start
+
+    def data(self, *args, **kwargs):
+        records = self._timed("data", *args, **kwargs)
+        self._rows += len(records)
+        self._record()
+        return records
+
+    def single(self, *args, **kwargs):
+        record = self._timed("single", *args, **kwargs)
+        self._rows += record is not None
+        self._record()
+        return record
+
+    def consume(self):
+        summary = self._timed("consume")
+        self._record()
+        return summary
+
+    def __iter__(self):
+        iterator = iter(self._result)
+        while True:
+            start = time.perf_counter()
+            try:
+                record = next(iterator)
+            except StopIteration:
+                self._elapsed += time.perf_counter() - start
+                self._record()
+                return
+            self._elapsed += time.perf_counter() - start
+            self._rows += 1
+            yield record
+
+    def __getattr__(self, name):
+        return getattr(self._result, name)
+
+    def _record(self):
+        if not self._recorded:
+            self._recorded = True
+            self._session._record(self)
+
+
+class InstrumentedSession:
+    """Passes a session through, timing each `run` and the reading of its result."""
+
+    def __init__(self, session, profiler: QueryProfiler, explain: Optional[Explain]):
+        self._session = session
+        self._profiler = profiler
+        self._explain = explain
+        self._pending = set()
+
+    def run(self, query, *args, **kwargs):
+        if self._profiler.capturing_plan:
+            return self._session.run(query, *args, **kwargs)
+        site = call_site()
+        start = time.perf_counter()
+        result = self._session.run(query, *args, **kwargs)
+        elapsed = time.perf_counter() - start
+        parameters = {**(args[0] if args and isinstance(args[0], dict) else {}), **kwargs}
+        instrumented = InstrumentedResult(result, self, query, parameters, elapsed, site)
+        self._pending.add(instrumented)
+        return instrumented
+
+    def _record(self, result: InstrumentedResult):
+        self._pending.discard(result)
+        self._profiler.record(result._query, result._parameters, result._elapsed * 1000,
+                              result._rows, result._site, self._explain)
+
+    def _record_pending(self):
+        # Results that were never read still count, with the rows read so far.
+        for result in list(self._pending):
+            result._record()
+
+    def close(self):
+        self._record_pending()
+        self._session.close()
+
+    def __enter__(self):
+        self._session.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._record_pending()
+        return self._session.__exit__(exc_type, exc_val, exc_tb)
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+
+class InstrumentedDriver:
+    """Passes a driver through, instrumenting the sessions it opens."""
+
+    def __init__(self, driver, profiler: QueryProfiler, explain: Optional[Explain] = None):
+        self._driver = driver
+        self._profiler = profiler
+        self._explain = explain
+
+    def session(self, *args, **kwargs):
+        return InstrumentedSession(self._driver.session(*args, **kwargs), self._profiler, self._explain)
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+_profiler: Optional[QueryProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler() -> Optional[QueryProfiler]:
+    """
+    The process-wide profiler, configured from QUERY_PROFILING, SLOW_QUERY_MS,
+    SLOW_QUERY_LOG and PROFILE_SLOW_QUERIES; None if profiling is disabled.
+    """
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                try:
+                    from codegraphcontext.cli.config_manager import get_config_value
+                    config = {key: get_config_value(key) for key in
+                              ('QUERY_PROFILING', 'SLOW_QUERY_MS', 'SLOW_QUERY_LOG', 'PROFILE_SLOW_QUERIES')}
+                except Exception:
+                    config = {}
+                if os.getenv('QUERY_PROFILING', config.get('QUERY_PROFILING') or 'false').lower() != 'true':
+                    return None
+                _profiler = QueryProfiler(
+                    slow_query_ms=float(os.getenv('SLOW_QUERY_MS', config.get('SLOW_QUERY_MS') or 500)),
+                    log_path=os.getenv('SLOW_QUERY_LOG', config.get('SLOW_QUERY_LOG') or
+                                       str(CONFIG_DIR / 'logs' / 'slow_queries.log')),
+                    capture_plans=os.getenv('PROFILE_SLOW_QUERIES', config.get('PROFILE_SLOW_QUERIES') or 'false').lower() == 'true',
+                    stats_path=STATS_FILE,
+                )
+                atexit.register(_profiler.flush)
+    return _profiler
+
+
+def instrument(driver, explain: Optional[Explain] = None):
+    """`driver` with instrumented sessions, or unchanged if profiling is disabled."""
+    profiler = get_profiler()
+    if profiler is None:
+        return driver
+    return InstrumentedDriver(driver, profiler, explain)
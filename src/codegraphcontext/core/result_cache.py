@@ -0,0 +1,133 @@
+# src/codegraphcontext/core/result_cache.py
+"""
+A process-wide graph generation counter, and the bounded result cache
+`CodeFinder` keeps on top of it.
+
+Every write path (`GraphBuilder`'s indexing, watcher updates and deletes, and
+bundle imports) bumps the generation once its write has completed. Cached
+results are keyed by the generation they were computed at, so a write makes
+every earlier entry unreachable and a cached answer is never older than the
+last write made by this process. The TTL bounds how stale an answer can be
+when another process (e.g. a `cgc index` run beside the MCP server) writes to
+the same database.
+"""
+import copy
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+DEFAULT_RESULT_CACHE_SIZE = 256
+DEFAULT_RESULT_CACHE_TTL = 300.0  # seconds
+
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def graph_generation() -> int:
+    """The number of graph writes this process has completed."""
+    return _generation
+
+
+def bump_generation() -> int:
+    """Records that the graph changed, invalidating every cached result."""
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        return _generation
+
+
+def bumps_generation(method: Callable) -> Callable:
+    """Wraps a write method so the generation is bumped once it returns (or fails part-way)."""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        finally:
+            bump_generation()
+    return wrapper
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = tuple(_freeze(v) for v in value)
+        return tuple(sorted(items, key=repr)) if isinstance(value, (set, frozenset)) else items
+    return value
+
+
+class ResultCache:
+    """
+    A bounded, thread-safe LRU of query results with a time-to-live, keyed by
+    (method, arguments, graph generation). Results are copied in and out, so
+    callers that edit what they get back cannot change what later callers see.
+    A cache with `max_entries` or `ttl` of 0 caches nothing.
+    """
+    def __init__(self, max_entries: int = DEFAULT_RESULT_CACHE_SIZE, ttl: float = DEFAULT_RESULT_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    def key(self, name: str, args: tuple, kwargs: dict) -> Optional[Hashable]:
+        """The cache key of a call, or None if its arguments cannot be hashed."""
+        key = (name, _freeze(args), _freeze(kwargs), graph_generation())
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """(True, result) for a live entry, (False, None) otherwise."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            result = entry[1]
+        return True, copy.deepcopy(result)
+
+    def put(self, key: Hashable, result: Any):
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def wrap(self, name: str, method: Callable) -> Callable:
+        """`method` (a bound method called `name`), answered from the cache when possible."""
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            key = self.key(name, args, kwargs) if self.enabled else None
+            if key is None:
+                return method(*args, **kwargs)
+            hit, result = self.get(key)
+            if hit:
+                return result
+            result = method(*args, **kwargs)
+            # Failures reported in the result (e.g. a lost connection) are not kept
+            if not (isinstance(result, dict) and "error" in result):
+                self.put(key, result)
+            return result
+        return wrapper
+
+    def __len__(self) -> int:
+        return len(self._entries)
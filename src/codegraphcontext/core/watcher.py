@@ -3,7 +3,14 @@
 This module implements the live file-watching functionality using the `watchdog` library.
 It observes directories for changes and triggers updates to the code graph.
 """
+import hashlib
+import json
+import os
+import queue
 import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 import typing
 from watchdog.observers import Observer
@@ -12,9 +19,255 @@ from watchdog.events import FileSystemEventHandler
 if typing.TYPE_CHECKING:
     from codegraphcontext.tools.graph_builder import GraphBuilder
     from codegraphcontext.core.jobs import JobManager
+    from codegraphcontext.utils.tree_sitter_manager import ParseSnapshot
 
+from codegraphcontext.tools.ignore_rules import IgnoreRules
+from codegraphcontext.tools.symbol_diff import SYMBOL_LABELS, diff_file_symbols
+from codegraphcontext.tools.symbol_table import SymbolTable, referenced_names
 from codegraphcontext.utils.debug_log import debug_log, info_logger, error_logger, warning_logger
 
+# How many files' parse trees each watched repository keeps for incremental reparsing.
+DEFAULT_PARSE_CACHE_SIZE = 512
+
+# How many file events may wait for the worker before the observer is made to wait.
+DEFAULT_EVENT_QUEUE_SIZE = 10000
+
+# A batch is processed at the latest this many seconds after its first event,
+# even if events keep arriving.
+DEFAULT_MAX_BATCH_DELAY = 30.0
+
+# Kinds of change recorded for a path in a pending batch. Moves are recorded
+# as a deletion of the source and a creation of the destination.
+CREATED, MODIFIED, DELETED = "created", "modified", "deleted"
+
+
+@dataclass
+class CachedParse:
+    """The last parse of a watched file."""
+    stat_key: typing.Tuple[int, int]  # (mtime_ns, size) when it was parsed
+    digest: str  # hash of the file contents that were parsed
+    file_data: dict
+    snapshot: typing.Optional["ParseSnapshot"]
+
+
+class ParseCache:
+    """
+    A bounded, thread-safe LRU of `CachedParse` entries keyed by file path.
+
+    Holding on to the tree-sitter tree and source bytes lets a modified file be
+    reparsed incrementally, and unchanged files skip parsing entirely.
+    """
+    def __init__(self, max_entries: int = DEFAULT_PARSE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedParse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> typing.Optional[CachedParse]:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                self._entries.move_to_end(path)
+            return entry
+
+    def put(self, path: str, entry: CachedParse):
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, path: str) -> typing.Optional[CachedParse]:
+        with self._lock:
+            return self._entries.pop(path, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _stat_key(path: Path) -> typing.Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def _symbol_names(file_data: dict) -> typing.Set[str]:
+    return {item['name'] for key, _ in SYMBOL_LABELS for item in file_data.get(key, [])}
+
+
+def coalesce_change(previous: typing.Optional[str], kind: str) -> typing.Optional[str]:
+    """
+    Folds a new event for a path into the change already pending for it.
+    Returns None if the two cancel out (a file created and deleted again).
+    """
+    if previous is None:
+        return kind
+    if previous == CREATED:
+        return None if kind == DELETED else CREATED
+    if previous == DELETED:
+        return DELETED if kind == DELETED else MODIFIED
+    return DELETED if kind == DELETED else MODIFIED
+
+
+def plan_watches(directory: Path, rules: IgnoreRules) -> typing.List[typing.Tuple[Path, bool]]:
+    """
+    Decides which directories to register with the observer, and whether
+    recursively, so that no watch is placed inside an ignored directory.
+
+    A subtree without ignored directories gets a single recursive watch. A
+    directory that contains ignored subdirectories gets a watch of its own and
+    its remaining subdirectories are planned in turn.
+    """
+    def plan(current: Path) -> typing.Tuple[bool, list]:
+        try:
+            children = sorted(Path(entry.path) for entry in os.scandir(current)
+                              if entry.is_dir(follow_symlinks=False))
+        except OSError:
+            children = []
+        clean = True
+        child_watches = []
+        for child in children:
+            if rules.is_ignored_dir(child):
+                clean = False
+                continue
+            child_clean, watches = plan(child)
+            clean = clean and child_clean
+            child_watches.extend(watches)
+        if clean:
+            return True, [(current, True)]
+        return False, [(current, False)] + child_watches
+
+    return plan(directory)[1]
+
+
+# (mtime_ns, size, digest) of a file as last written to the graph; digest may be None.
+ManifestEntry = typing.Tuple[int, int, typing.Optional[str]]
+
+
+class WatchStateStore:
+    """
+    Persists the watcher's state across restarts under ~/.codegraphcontext/watch:
+    the list of watched paths, and per repository a manifest of every file's
+    (mtime_ns, size, digest) as last reflected in the graph.
+    """
+    VERSION = 1
+
+    def __init__(self, directory: typing.Optional[Path] = None):
+        if directory is None:
+            from codegraphcontext.cli.config_manager import CONFIG_DIR
+            directory = CONFIG_DIR / "watch"
+        self.directory = Path(directory)
+
+    def _read(self, path: Path) -> typing.Optional[dict]:
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            warning_logger(f"Ignoring unreadable watcher state {path}: {e}")
+            return None
+        return data if data.get("version") == self.VERSION else None
+
+    def _write(self, path: Path, data: dict):
+        data["version"] = self.VERSION
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            warning_logger(f"Could not save watcher state {path}: {e}")
+
+    def load_paths(self) -> typing.List[str]:
+        data = self._read(self.directory / "paths.json")
+        return list(data.get("paths", [])) if data else []
+
+    def save_paths(self, paths: typing.Iterable[str]):
+        self._write(self.directory / "paths.json", {"paths": sorted(paths)})
+
+    def manifest_path(self, repo_path: Path) -> Path:
+        repo_key = hashlib.sha1(str(Path(repo_path).resolve()).encode("utf-8")).hexdigest()[:16]
+        return self.directory / f"{repo_key}.json"
+
+    def load_manifest(self, repo_path: Path) -> typing.Optional[typing.Dict[str, ManifestEntry]]:
+        data = self._read(self.manifest_path(repo_path))
+        if not data or data.get("repo_path") != str(Path(repo_path).resolve()):
+            return None
+        return {path: tuple(entry) for path, entry in data.get("files", {}).items()}
+
+    def save_manifest(self, repo_path: Path, manifest: typing.Dict[str, ManifestEntry]):
+        self._write(self.manifest_path(repo_path), {
+            "repo_path": str(Path(repo_path).resolve()),
+            "files": {path: list(entry) for path, entry in manifest.items()},
+        })
+
+
+_STOP = object()
+
+
+class ChangeBatcher:
+    """
+    Collects the file events of one repository into batches.
+
+    Events are handed to a single worker thread through a bounded queue. The
+    worker folds them into one pending changeset ({path: kind}) and calls
+    `process` with it once no event has arrived for `quiet_period` seconds,
+    so a checkout touching thousands of files is handled as one batch.
+    """
+    def __init__(self, process: typing.Callable[[typing.Dict[str, str]], None], quiet_period: float,
+                 max_queue_size: int = DEFAULT_EVENT_QUEUE_SIZE, max_delay: float = DEFAULT_MAX_BATCH_DELAY):
+        self.process = process
+        self.quiet_period = quiet_period
+        self.max_delay = max_delay
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._worker = threading.Thread(target=self._run, name="cgc-watcher", daemon=True)
+        self._worker.start()
+
+    def add(self, path: str, kind: str):
+        """Records an event. Blocks while the queue is full."""
+        self._queue.put((path, kind))
+
+    def stop(self, timeout: typing.Optional[float] = None):
+        """Stops the worker once the batch it is processing (if any) is done. Pending events are dropped."""
+        self._queue.put(_STOP)
+        self._worker.join(timeout)
+
+    def _run(self):
+        pending: typing.Dict[str, str] = {}
+        started = deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                batch, pending, started, deadline = pending, {}, None, None
+                if batch:
+                    self._process(batch)
+                continue
+            if item is _STOP:
+                return
+
+            path, kind = item
+            merged = coalesce_change(pending.get(path), kind)
+            if merged is None:
+                pending.pop(path, None)
+            else:
+                pending[path] = merged
+            now = time.monotonic()
+            if started is None:
+                started = now
+            deadline = min(now + self.quiet_period, started + self.max_delay)
+
+    def _process(self, batch: typing.Dict[str, str]):
+        try:
+            self.process(batch)
+        except Exception as e:
+            error_logger(f"Failed to process {len(batch)} changed file(s): {e}")
+
 class RepositoryEventHandler(FileSystemEventHandler):
     """
     A dedicated event handler for a single repository being watched.
@@ -23,120 +276,344 @@ class RepositoryEventHandler(FileSystemEventHandler):
     to build a baseline and then uses this cached state to perform efficient
     updates when files are changed, created, or deleted.
     """
-    def __init__(self, graph_builder: "GraphBuilder", repo_path: Path, debounce_interval=2.0, perform_initial_scan: bool = True):
+    def __init__(self, graph_builder: "GraphBuilder", repo_path: Path, debounce_interval=2.0, perform_initial_scan: bool = True,
+                 parse_cache_size: int = DEFAULT_PARSE_CACHE_SIZE, max_queue_size: int = DEFAULT_EVENT_QUEUE_SIZE,
+                 state_store: typing.Optional[WatchStateStore] = None):
         """
         Initializes the event handler.
 
         Args:
             graph_builder: An instance of the GraphBuilder to perform graph operations.
             repo_path: The absolute path to the repository directory to watch.
-            debounce_interval: The time in seconds to wait for more changes before processing an event.
+            debounce_interval: The quiet period in seconds to wait for more changes before processing a batch.
             perform_initial_scan: Whether to perform an initial scan of the repository.
+            parse_cache_size: How many files' parse trees to keep for incremental reparsing.
+            max_queue_size: How many file events may wait for processing before the observer blocks.
+            state_store: Where to persist the file manifest used to catch up on changes made while
+                nobody was watching. Without one, nothing is persisted.
         """
         super().__init__()
         self.graph_builder = graph_builder
         self.repo_path = repo_path
         self.debounce_interval = debounce_interval
-        self.timers = {} # A dictionary to manage debounce timers for file paths.
         
         # Caches for the repository's state.
         self.all_file_data = []
-        self.imports_map = {}
+        self.symbol_table = SymbolTable()
+        self._symbol_table_loaded = False
+        self.parse_cache = ParseCache(parse_cache_size)
+        self.state_store = state_store
+        self.ignore_rules = IgnoreRules.for_path(repo_path)
+        # Set by CodeWatcher, to register watches for directories created after the watch started.
+        self.on_new_directory: typing.Optional[typing.Callable[[Path], None]] = None
+        self.manifest: typing.Dict[str, ManifestEntry] = {}
+        if state_store is not None:
+            self.manifest = state_store.load_manifest(repo_path) or {}
         
         # Perform the initial scan and linking when the watcher is created.
         if perform_initial_scan:
             self._initial_scan()
 
+        # Events are coalesced per repository and processed by a single worker.
+        self.batcher = ChangeBatcher(self._process_changes, debounce_interval, max_queue_size)
+
+    def stop(self):
+        """Stops the worker thread that processes this repository's changes."""
+        self.batcher.stop()
+
+    def _list_files(self, start: typing.Optional[Path] = None) -> list:
+        """The files to index under `start` (default: the repository), honoring IGNORE_DIRS and .cgcignore."""
+        return list(self.ignore_rules.iter_files(self.graph_builder.parsers.keys(), start))
+
+    def is_relevant(self, path: Path) -> bool:
+        """Whether changes to the file at `path` can affect the graph."""
+        return path.suffix in self.graph_builder.parsers and not self.ignore_rules.is_ignored(path)
+
     def _initial_scan(self):
         """Scans the entire repository, parses all files, and builds the initial graph."""
         info_logger(f"Performing initial scan for watcher: {self.repo_path}")
-        supported_extensions = self.graph_builder.parsers.keys()
-        all_files = [f for f in self.repo_path.rglob("*") if f.is_file() and f.suffix in supported_extensions]
+        all_files = self._list_files()
         
-        # 1. Pre-scan all files to get a global map of where every symbol is defined.
-        self.imports_map = self.graph_builder._pre_scan_for_imports(all_files)
+        # 1. Load the global table of where every symbol is defined. Only files
+        # changed since it was last persisted are pre-scanned.
+        self._load_symbol_table(all_files)
         
-        # 2. Parse all files in detail and cache the parsed data.
-        for f in all_files:
-            parsed_data = self.graph_builder.parse_file(self.repo_path, f)
-            if "error" not in parsed_data:
-                self.all_file_data.append(parsed_data)
+        # 2. Parse all files in detail and cache the parsed data. This also
+        # records which names each file refers to.
+        self.all_file_data = self._parse_all(all_files)
+        self.graph_builder.symbol_store.save(self.repo_path, self.symbol_table)
+        self._save_manifest()
         
         # 3. After all files are parsed, create the relationships (e.g., function calls) between them.
-        self.graph_builder._create_all_function_calls(self.all_file_data, self.imports_map)
-        self.graph_builder._create_all_inheritance_links(self.all_file_data, self.imports_map)
+        self.graph_builder._create_all_function_calls(self.all_file_data, self.symbol_table)
+        self.graph_builder._create_all_inheritance_links(self.all_file_data, self.symbol_table)
         info_logger(f"Initial scan and graph linking complete for: {self.repo_path}")
 
-    def _debounce(self, event_path, action):
+    def _record(self, path_str: str, stat_key: typing.Tuple[int, int], digest: typing.Optional[str]):
+        """Notes the version of a file that the graph now reflects."""
+        if self.state_store is not None:
+            self.manifest[path_str] = (stat_key[0], stat_key[1], digest)
+
+    def _save_manifest(self):
+        if self.state_store is not None:
+            self.state_store.save_manifest(self.repo_path, self.manifest)
+
+    def _is_stale(self, file_path: Path) -> bool:
+        """Whether a file changed on disk since the graph last reflected it."""
+        path_str = str(file_path)
+        entry = self.parse_cache.get(path_str)
+        recorded = entry.stat_key if entry is not None else self.manifest.get(path_str, (None, None))[:2]
+        if recorded[0] is None:
+            return False
+        try:
+            return _stat_key(file_path) != tuple(recorded)
+        except OSError:
+            return True
+
+    def catch_up(self) -> int:
         """
-        Schedules an action to run after a debounce interval.
-        This prevents the handler from firing on every single file save event in rapid
-        succession, which is common in IDEs. It waits for a quiet period before processing.
+        Finds the files that changed while nobody was watching, using only stat()
+        (and a hash for files whose stat changed), and queues them for the usual
+        incremental update. Returns how many files were queued.
         """
-        # If a timer already exists for this path, cancel it.
-        if event_path in self.timers:
-            self.timers[event_path].cancel()
-        # Create and start a new timer.
-        timer = threading.Timer(self.debounce_interval, action)
-        timer.start()
-        self.timers[event_path] = timer
+        if self.state_store is None:
+            return 0
+        files = self._list_files()
+        if not self.manifest:
+            # Nothing to compare against yet; start from the files as they are now.
+            for f in files:
+                try:
+                    self._record(str(f), _stat_key(f), None)
+                except OSError:
+                    continue
+            self._save_manifest()
+            return 0
 
-    def _handle_modification(self, event_path_str: str):
+        changes = {}
+        seen = set()
+        for f in files:
+            path_str = str(f)
+            seen.add(path_str)
+            try:
+                stat_key = _stat_key(f)
+                recorded = self.manifest.get(path_str)
+                if recorded is None:
+                    changes[path_str] = CREATED
+                elif tuple(recorded[:2]) != stat_key:
+                    if recorded[2] is not None and recorded[2] == _file_digest(f):
+                        self._record(path_str, stat_key, recorded[2])  # touched, not edited
+                    else:
+                        changes[path_str] = MODIFIED
+            except OSError:
+                continue
+        for path_str in self.manifest.keys() - seen:
+            if Path(path_str).exists():
+                self.manifest.pop(path_str)  # Still there, but ignored now.
+            else:
+                changes[path_str] = DELETED
+
+        for path_str, kind in changes.items():
+            self.batcher.add(path_str, kind)
+        info_logger(f"Catch-up for {self.repo_path}: {len(changes)} of {len(files)} file(s) changed since last watched.")
+        return len(changes)
+
+    def _load_symbol_table(self, all_files: list, symbol_table: typing.Optional[SymbolTable] = None):
+        self.symbol_table = self.graph_builder.load_symbol_table(self.repo_path, all_files, symbol_table)
+        self._symbol_table_loaded = True
+
+    def _parse_cached(self, file_path: Path) -> typing.Optional[dict]:
+        """Returns the parsed data for a file, reusing the cached parse if the file is unchanged."""
+        path_str = str(file_path)
+        try:
+            stat_key = _stat_key(file_path)
+            entry = self.parse_cache.get(path_str)
+            if entry is not None and entry.stat_key == stat_key:
+                return entry.file_data
+            digest = _file_digest(file_path)
+        except OSError:
+            self.parse_cache.pop(path_str)
+            return None
+
+        if entry is not None and entry.digest == digest:
+            # Touched but not edited (e.g. a save without changes or a checkout).
+            entry.stat_key = stat_key
+            self._record(path_str, stat_key, digest)
+            return entry.file_data
+
+        file_data, snapshot = self.graph_builder.reparse_file(
+            self.repo_path, file_path, entry.snapshot if entry else None
+        )
+        if "error" in file_data:
+            self.parse_cache.pop(path_str)
+            return None
+        self.parse_cache.put(path_str, CachedParse(stat_key, digest, file_data, snapshot))
+        self.symbol_table.set_references(str(file_path.resolve()), referenced_names(file_data))
+        self._record(path_str, stat_key, digest)
+        return file_data
+
+    def _parse_all(self, files: list) -> list:
+        all_file_data = []
+        for f in files:
+            parsed_data = self._parse_cached(f)
+            if parsed_data is not None:
+                all_file_data.append(parsed_data)
+        return all_file_data
+
+    def _refresh_file(self, file_path: Path) -> typing.Optional[typing.Set[str]]:
         """
-        Orchestrates the complete update cycle for a modified or created file.
-        This involves re-scanning the entire repo to update cross-file relationships.
+        Brings a single file's nodes in the graph up to date.
+
+        The file is reparsed incrementally against its cached tree and only the
+        symbols that differ from the cached parse are rewritten. Returns the
+        names of the symbols whose nodes were rewritten or removed, or None if
+        nothing in the graph had to change.
         """
-        info_logger(f"File change detected, starting full repository refresh for: {event_path_str}")
-        modified_path = Path(event_path_str)
+        path_str = str(file_path)
+        entry = self.parse_cache.pop(path_str)
 
-        # 1. Get all supported files in the repository.
-        supported_extensions = self.graph_builder.parsers.keys()
-        all_files = [f for f in self.repo_path.rglob("*") if f.is_file() and f.suffix in supported_extensions]
+        try:
+            stat_key = _stat_key(file_path)
+            digest = _file_digest(file_path)
+        except OSError:
+            # Deleted, possibly after the event was queued (e.g. an editor saving via rename)
+            self.graph_builder.delete_file_from_graph(path_str)
+            self.manifest.pop(path_str, None)
+            return _symbol_names(entry.file_data) if entry else set()
 
-        # 2. Re-scan all files to get a fresh, global map of all symbols.
-        self.imports_map = self.graph_builder._pre_scan_for_imports(all_files)
-        info_logger("Refreshed global imports map.")
+        if entry is not None and entry.digest == digest:
+            entry.stat_key = stat_key
+            self.parse_cache.put(path_str, entry)
+            self._record(path_str, stat_key, digest)
+            return None
 
-        # 3. Update the specific file that changed in the graph.
-        # This deletes old nodes and adds new ones for the single file.
-        self.graph_builder.update_file_in_graph(
-            modified_path, self.repo_path, self.imports_map
+        file_data, snapshot = self.graph_builder.reparse_file(
+            self.repo_path, file_path, entry.snapshot if entry else None
         )
+        if "error" in file_data:
+            error_logger(f"Skipping graph update for {path_str} due to parsing error: {file_data['error']}")
+            return None
 
-        # 4. Re-parse all files to have a complete, in-memory representation for the linking pass.
-        # This is necessary because a change in one file can affect relationships in others.
-        self.all_file_data = []
-        for f in all_files:
-            parsed_data = self.graph_builder.parse_file(self.repo_path, f)
-            if "error" not in parsed_data:
-                self.all_file_data.append(parsed_data)
-        info_logger("Refreshed in-memory cache of all file data.")
-
-        # 5. CRITICAL: Re-link the entire graph using the fully updated cache and imports map.
-        info_logger("Re-linking the entire graph for calls and inheritance...")
-        self.graph_builder._create_all_function_calls(self.all_file_data, self.imports_map)
-        self.graph_builder._create_all_inheritance_links(self.all_file_data, self.imports_map)
-        info_logger(f"Graph refresh for change in {event_path_str} complete! ✅")
+        self.parse_cache.put(path_str, CachedParse(stat_key, digest, file_data, snapshot))
+        self.symbol_table.set_references(str(file_path.resolve()), referenced_names(file_data))
+        self._record(path_str, stat_key, digest)
+        if entry is None:
+            self.graph_builder.update_file_in_graph(file_path, self.repo_path, self.symbol_table, file_data=file_data)
+            return _symbol_names(file_data)
+
+        diff = diff_file_symbols(entry.file_data, file_data,
+                                 snapshot.affected_rows if snapshot else None)
+        if diff.requires_full_update:
+            self.graph_builder.update_file_in_graph(file_path, self.repo_path, self.symbol_table, file_data=file_data)
+            return _symbol_names(entry.file_data) | _symbol_names(file_data)
+        if not diff:
+            return None
+        self.graph_builder.apply_symbol_diff(file_data, diff)
+        info_logger(f"Rewrote {len(diff.added)} and removed {len(diff.removed)} symbols in {path_str}")
+        return diff.rewritten_names()
+
+    def _handle_modification(self, event_path_str: str):
+        """Brings the graph up to date for a single modified, created or deleted file."""
+        self._process_changes({event_path_str: MODIFIED})
+
+    def _process_changes(self, changes: typing.Dict[str, str]):
+        """
+        Orchestrates the update cycle for a batch of changed files.
+
+        Each file is updated incrementally. The symbol table is then saved once,
+        and cross-file relationships are re-linked once per affected file: the
+        changed files plus every file that refers to a symbol whose node was
+        rewritten, found through the symbol table's reverse index.
+        """
+        info_logger(f"Refreshing graph for {len(changes)} changed file(s) in {self.repo_path}")
+        paths = [Path(p) for p in changes]
+        table_paths = {p: str(p.resolve()) for p in paths}
+
+        # 1. Make sure the symbol table is loaded and note what each file used to define.
+        if self._symbol_table_loaded:
+            old_names = {p: self.symbol_table.names_in(table_paths[p]) for p in paths}
+        else:
+            # Watching without an initial scan: start from the persisted table,
+            # pre-scanning only files changed since it was saved.
+            persisted = self.graph_builder.symbol_store.load(self.repo_path)
+            old_names = {p: persisted.names_in(table_paths[p]) if persisted else set() for p in paths}
+            self._load_symbol_table(self._list_files(), persisted)
+
+        # 2. Reparse each file against its cached tree and write only the symbols that changed.
+        updated = []
+        affected_names = set()
+        for file_path in paths:
+            changed_names = self._refresh_file(file_path)
+            if changed_names is not None:
+                updated.append(file_path)
+                affected_names |= changed_names
+        if not updated:
+            self._save_manifest()
+            info_logger(f"No symbol changes in {len(changes)} changed file(s); graph is up to date.")
+            return
+
+        # 3. Update the symbol table for the changed files only, and persist it.
+        self.graph_builder.update_symbol_table(self.symbol_table, updated)
+        self.graph_builder.symbol_store.save(self.repo_path, self.symbol_table)
+        for file_path in updated:
+            affected_names |= old_names[file_path] ^ self.symbol_table.names_in(table_paths[file_path])
+
+        # 4. Re-link the changed files and every file that refers to a name they
+        # defined, define now, or rewrote.
+        relink_paths = {p for name in affected_names for p in self.symbol_table.referrers(name)}
+        relink_paths.difference_update(table_paths[p] for p in updated)
+        relink_files = [p for p in updated if p.exists()] + [Path(p) for p in sorted(relink_paths)]
+        for file_path in relink_files:
+            if file_path not in updated and self._is_stale(file_path):
+                continue  # It has a change of its own queued, which re-links it.
+            file_data = self._parse_cached(file_path)
+            if file_data is not None:
+                self.graph_builder.relink_file(file_data, self.symbol_table)
+        self._save_manifest()
+        info_logger(f"Graph refresh for {len(updated)} changed file(s) complete! Re-linked {len(relink_files)} file(s). ✅")
+
+    def _enqueue(self, path: str, kind: str):
+        if self.is_relevant(Path(path)):
+            self.batcher.add(path, kind)
+
+    def _directory_added(self, directory: Path):
+        if self.on_new_directory is not None:
+            self.on_new_directory(directory)
+        if not self.ignore_rules.is_ignored_tree(directory):
+            # Files may have been written before a watch covered the directory.
+            for file_path in self._list_files(directory):
+                self.batcher.add(str(file_path), CREATED)
+
+    def _directory_removed(self, directory: Path):
+        prefix = str(directory) + os.sep
+        known = set(self.manifest) | set(self.symbol_table.scanned_files())
+        for path_str in known:
+            if path_str.startswith(prefix):
+                self.batcher.add(path_str, DELETED)
 
     # The following methods are called by the watchdog observer when a file event occurs.
     def on_created(self, event):
-        if not event.is_directory and Path(event.src_path).suffix in self.graph_builder.parsers:
-            self._debounce(event.src_path, lambda: self._handle_modification(event.src_path))
+        if event.is_directory:
+            self._directory_added(Path(event.src_path))
+        else:
+            self._enqueue(event.src_path, CREATED)
 
     def on_modified(self, event):
-        if not event.is_directory and Path(event.src_path).suffix in self.graph_builder.parsers:
-            self._debounce(event.src_path, lambda: self._handle_modification(event.src_path))
+        if not event.is_directory:
+            self._enqueue(event.src_path, MODIFIED)
 
     def on_deleted(self, event):
-        if not event.is_directory and Path(event.src_path).suffix in self.graph_builder.parsers:
-            self._debounce(event.src_path, lambda: self._handle_modification(event.src_path))
+        if event.is_directory:
+            self._directory_removed(Path(event.src_path))
+        else:
+            self._enqueue(event.src_path, DELETED)
 
     def on_moved(self, event):
-        if not event.is_directory:
-            if Path(event.src_path).suffix in self.graph_builder.parsers:
-                self._debounce(event.src_path, lambda: self._handle_modification(event.src_path))
-            if Path(event.dest_path).suffix in self.graph_builder.parsers:
-                self._debounce(event.dest_path, lambda: self._handle_modification(event.dest_path))
+        if event.is_directory:
+            self._directory_removed(Path(event.src_path))
+            self._directory_added(Path(event.dest_path))
+        else:
+            self._enqueue(event.src_path, DELETED)
+            self._enqueue(event.dest_path, CREATED)
 
 
 class CodeWatcher:
@@ -144,11 +621,42 @@ class CodeWatcher:
     Manages the file system observer thread. It can watch multiple directories,
     assigning a separate `RepositoryEventHandler` to each one.
     """
-    def __init__(self, graph_builder: "GraphBuilder", job_manager= "JobManager"):
+    def __init__(self, graph_builder: "GraphBuilder", job_manager= "JobManager", state_store: typing.Optional[WatchStateStore] = None):
         self.graph_builder = graph_builder
+        self.state_store = state_store # Persists watched paths and file manifests, if given
         self.observer = Observer()
         self.watched_paths = set() # Keep track of paths already being watched.
-        self.watches = {} # Store watch objects to allow unscheduling
+        self.watches = {} # Store each repository's watch objects to allow unscheduling
+        self.handlers = {} # Event handlers, so their worker threads can be stopped
+        self._lock = threading.RLock() # Watches also change from the observer thread
+
+    def _schedule(self, path_str: str, handler: RepositoryEventHandler, directory: Path):
+        """Registers watches for `directory` that skip its ignored subdirectories."""
+        for watch_dir, recursive in plan_watches(directory, handler.ignore_rules):
+            self.watches[path_str].append(self.observer.schedule(handler, str(watch_dir), recursive=recursive))
+
+    def _unschedule(self, watch):
+        try:
+            self.observer.unschedule(watch)
+        except KeyError:
+            pass  # Its directory is gone and the emitter with it.
+
+    def _on_new_directory(self, path_str: str, handler: RepositoryEventHandler, directory: Path):
+        """Keeps a repository's watches covering new directories and skipping new ignored ones."""
+        with self._lock:
+            watches = self.watches.get(path_str)
+            if watches is None:
+                return
+            covering = next((w for w in watches if w.is_recursive and directory.is_relative_to(w.path)), None)
+            if covering is None:
+                if not handler.ignore_rules.is_ignored_tree(directory):
+                    self._schedule(path_str, handler, directory)
+            elif handler.ignore_rules.is_ignored_tree(directory) or plan_watches(directory, handler.ignore_rules) != [(directory, True)]:
+                # An ignored directory appeared inside a recursive watch (e.g. `npm install`
+                # created node_modules): split that watch so it is no longer covered.
+                watches.remove(covering)
+                self._unschedule(covering)
+                self._schedule(path_str, handler, Path(covering.path))
 
     def watch_directory(self, path: str, perform_initial_scan: bool = True):
         """Schedules a directory to be watched for changes."""
@@ -160,12 +668,23 @@ class CodeWatcher:
             return {"message": f"Path already being watched: {path_str}"}
         
         # Create a new, dedicated event handler for this specific repository path.
-        event_handler = RepositoryEventHandler(self.graph_builder, path_obj, perform_initial_scan=perform_initial_scan)
+        event_handler = RepositoryEventHandler(self.graph_builder, path_obj, perform_initial_scan=perform_initial_scan,
+                                               state_store=self.state_store)
+        event_handler.on_new_directory = lambda directory: self._on_new_directory(path_str, event_handler, directory)
         
-        watch = self.observer.schedule(event_handler, path_str, recursive=True)
-        self.watches[path_str] = watch
+        # Watch the repository directory by directory, so that ignored trees
+        # such as node_modules or build output never get OS-level watches.
+        with self._lock:
+            self.watches[path_str] = []
+            self._schedule(path_str, event_handler, path_obj)
+        self.handlers[path_str] = event_handler
         self.watched_paths.add(path_str)
-        info_logger(f"Started watching for code changes in: {path_str}")
+        if self.state_store is not None:
+            self.state_store.save_paths(self.watched_paths)
+            if not perform_initial_scan:
+                # Pick up edits made since this repository was last watched.
+                event_handler.catch_up()
+        info_logger(f"Started watching for code changes in: {path_str} ({len(self.watches[path_str])} watches)")
         
         return {"message": f"Started watching {path_str}."}
     def unwatch_directory(self, path: str):
@@ -177,14 +696,37 @@ class CodeWatcher:
             warning_logger(f"Attempted to unwatch a path that is not being watched: {path_str}")
             return {"error": f"Path not currently being watched: {path_str}"}
 
-        watch = self.watches.pop(path_str, None)
-        if watch:
-            self.observer.unschedule(watch)
+        with self._lock:
+            for watch in self.watches.pop(path_str, []):
+                self._unschedule(watch)
+        handler = self.handlers.pop(path_str, None)
+        if handler:
+            handler.stop()
         
         self.watched_paths.discard(path_str)
+        if self.state_store is not None:
+            self.state_store.save_paths(self.watched_paths)
         info_logger(f"Stopped watching for code changes in: {path_str}")
         return {"message": f"Stopped watching {path_str}."}
 
+    def restore(self) -> list:
+        """
+        Re-arms the watches persisted by a previous run. Each repository is
+        caught up on the files that changed while it was not being watched.
+        """
+        if self.state_store is None:
+            return []
+        restored = []
+        for path in self.state_store.load_paths():
+            if not Path(path).is_dir():
+                warning_logger(f"Not restoring watch for missing directory: {path}")
+                continue
+            self.watch_directory(path, perform_initial_scan=False)
+            restored.append(path)
+        if restored:
+            info_logger(f"Restored {len(restored)} watched path(s).")
+        return restored
+
     def list_watched_paths(self) -> list:
         """Returns a list of all currently watched directory paths."""
         return list(self.watched_paths)
@@ -201,3 +743,6 @@ class CodeWatcher:
             self.observer.stop()
             self.observer.join() # Wait for the thread to terminate.
             info_logger("Code watcher observer thread stopped.")
+        while self.handlers:
+            _, handler = self.handlers.popitem()
+            handler.stop()
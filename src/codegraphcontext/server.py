@@ -3,7 +3,6 @@ import urllib.parse
 import asyncio
 import json
 import importlib
-import stdlibs
 import sys
 import traceback
 import os
@@ -17,7 +16,7 @@ from typing import Any, Dict, Coroutine, Optional, List
 from .prompts import LLM_SYSTEM_PROMPT
 from .core import get_database_manager
 from .core.jobs import JobManager, JobStatus
-from .core.watcher import CodeWatcher
+from .core.watcher import CodeWatcher, WatchStateStore
 from .tools.graph_builder import GraphBuilder
 from .tools.code_finder import CodeFinder
 from .tools.package_resolver import get_local_package_path
@@ -77,9 +76,14 @@ class MCPServer:
         self.loop = loop
 
         # Initialize all the tool handlers, passing them the necessary managers and the event loop.
-        self.graph_builder = GraphBuilder(self.db_manager, self.job_manager, loop)
-        self.code_finder = CodeFinder(self.db_manager)
-        self.code_watcher = CodeWatcher(self.graph_builder, self.job_manager)
+        if self.db_manager.get_backend_type() == 'sqlite':
+            from .tools.sqlite_graph import SQLiteCodeFinder, SQLiteGraphBuilder
+            self.graph_builder = SQLiteGraphBuilder(self.db_manager, self.job_manager, loop)
+            self.code_finder = SQLiteCodeFinder(self.db_manager, long_running=True)
+        else:
+            self.graph_builder = GraphBuilder(self.db_manager, self.job_manager, loop)
+            self.code_finder = CodeFinder(self.db_manager, long_running=True)
+        self.code_watcher = CodeWatcher(self.graph_builder, self.job_manager, state_store=WatchStateStore())
         
         # Define the tool manifest that will be exposed to the AI assistant.
         self._init_tools()
@@ -214,6 +218,11 @@ class MCPServer:
         # info_logger("MCP Server is running. Waiting for requests...")
         print("MCP Server is running. Waiting for requests...", file=sys.stderr, flush=True)
         self.code_watcher.start()
+        # Re-arm the directories that were being watched before the server restarted.
+        try:
+            self.code_watcher.restore()
+        except Exception as e:
+            error_logger(f"Failed to restore watched directories: {e}")
         
         loop = asyncio.get_event_loop()
         while True:
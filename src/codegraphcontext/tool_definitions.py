@@ -28,22 +28,25 @@ TOOLS = {
     },
     "find_code": {
         "name": "find_code",
-        "description": "Find relevant code snippets related to a keyword (e.g., function name, class name, or content).",
+        "description": "Find relevant code snippets related to a keyword (e.g., function name, class name, or content). Results are paginated: when 'next_cursor' is set, pass it back as 'cursor' to fetch the next page.",
         "inputSchema": {
             "type": "object",
-            "properties": { "query": {"type": "string", "description": "Keyword or phrase to search for"}, "fuzzy_search": {"type": "boolean", "description": "Whether to use fuzzy search", "default": False}, "edit_distance": {"type": "number", "description": "Edit distance for fuzzy search (between 0-2)", "default": 2}}, 
+            "properties": { "query": {"type": "string", "description": "Keyword or phrase to search for"}, "fuzzy_search": {"type": "boolean", "description": "Whether to use fuzzy search", "default": False}, "edit_distance": {"type": "number", "description": "Edit distance for fuzzy search (between 0-2)", "default": 2}, "limit": {"type": "integer", "description": "Optional: The maximum number of results per search strategy and page.", "default": 20, "minimum": 1}, "cursor": {"type": "string", "description": "Optional: The 'next_cursor' of the previous page, to fetch the page after it."}}, 
             "required": ["query"]
         }
     },
     "analyze_code_relationships": {
         "name": "analyze_code_relationships",
-        "description": "Analyze code relationships like 'who calls this function' or 'class hierarchy'. Supported query types include: find_callers, find_callees, find_all_callers, find_all_callees, find_importers, who_modifies, class_hierarchy, overrides, dead_code, call_chain, module_deps, variable_scope, find_complexity, find_functions_by_argument, find_functions_by_decorator.",
+        "description": "Analyze code relationships like 'who calls this function' or 'class hierarchy'. Supported query types include: find_callers, find_callees, find_all_callers, find_all_callees, find_importers, who_modifies, class_hierarchy, overrides, dead_code, call_chain, module_deps, variable_scope, find_complexity, find_functions_by_argument, find_functions_by_decorator. Listings (callers, callees, importers, who_modifies, overrides, dead_code, find_functions_by_*) are paginated: when 'next_cursor' is set, pass it back as 'cursor' to fetch the next page.",
         "inputSchema": {
             "type": "object",
             "properties": {
                 "query_type": {"type": "string", "description": "Type of relationship query to run.", "enum": ["find_callers", "find_callees", "find_all_callers", "find_all_callees", "find_importers", "who_modifies", "class_hierarchy", "overrides", "dead_code", "call_chain", "module_deps", "variable_scope", "find_complexity", "find_functions_by_argument", "find_functions_by_decorator"]},
                 "target": {"type": "string", "description": "The function, class, or module to analyze."},
-                "context": {"type": "string", "description": "Optional: specific file path for precise results."} 
+                "context": {"type": "string", "description": "Optional: specific file path for precise results."},
+                "max_depth": {"type": "integer", "description": "Optional: how many calls away find_all_callers, find_all_callees and call_chain look (default 10, or 5 for call_chain)."},
+                "limit": {"type": "integer", "description": "Optional: The maximum number of results per page of a paginated listing (default 20, or 50 for dead_code).", "minimum": 1},
+                "cursor": {"type": "string", "description": "Optional: The 'next_cursor' of the previous page, to fetch the page after it."}
             },
             "required": ["query_type", "target"]
         }
@@ -81,11 +84,13 @@ TOOLS = {
     },
     "find_dead_code": {
         "name": "find_dead_code",
-        "description": "Find potentially unused functions (dead code) across the entire indexed codebase, optionally excluding functions with specific decorators.",
+        "description": "Find potentially unused functions (dead code) across the entire indexed codebase, optionally excluding functions with specific decorators. Results are paginated: when 'next_cursor' is set, pass it back as 'cursor' to fetch the next page.",
         "inputSchema": {
             "type": "object",
             "properties": {
-                "exclude_decorated_with": {"type": "array", "items": {"type": "string"}, "description": "Optional: A list of decorator names (e.g., '@app.route') to exclude from dead code detection.", "default": []}
+                "exclude_decorated_with": {"type": "array", "items": {"type": "string"}, "description": "Optional: A list of decorator names (e.g., '@app.route') to exclude from dead code detection.", "default": []},
+                "limit": {"type": "integer", "description": "Optional: The maximum number of functions per page.", "default": 50, "minimum": 1},
+                "cursor": {"type": "string", "description": "Optional: The 'next_cursor' of the previous page, to fetch the page after it."}
             }
         }
     },
@@ -0,0 +1,137 @@
+# src/codegraphcontext/tools/call_chains.py
+"""
+Bidirectional search for the shortest call chains between two sets of functions.
+
+Matching `(start)-[:CALLS*1..depth]->(end)` enumerates every path out of the
+start functions before any is discarded, which grows exponentially with depth.
+Instead, a BFS from the starts (along calls) and one from the ends (along
+callers) grow towards each other, each step expanding whichever frontier is
+smaller with one batched edge lookup. The distances they record bound how far
+any function is from either side, so chains are then enumerated by increasing
+length following only calls that can still reach an end within the length
+being enumerated, and the search stops as soon as `limit` chains are found.
+
+The backends differ only in how they fetch edges: `fetch_edges(ids, direction)`
+returns the CALLS edges leaving (`"out"`) or entering (`"in"`) the given nodes
+as (caller id, callee id, call properties) tuples.
+"""
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Sequence, Tuple
+
+CallEdge = Tuple[Hashable, Hashable, Dict[str, Any]]
+EdgeFetcher = Callable[[List[Hashable], str], Iterable[CallEdge]]
+
+# Partial chains kept per step while enumerating one length. Every kept chain
+# can still reach an end, so this only bounds memory on very dense graphs.
+MAX_PARTIAL_CHAINS = 1000
+
+
+class _Ball:
+    """One side of the bidirectional BFS: the distance of each node it has reached."""
+
+    def __init__(self, roots: Iterable[Hashable], direction: str):
+        self.direction = direction
+        self.distance = {root: 0 for root in roots}
+        self.frontier = list(self.distance)
+        self.depth = 0
+
+    @property
+    def radius(self) -> float:
+        """How far the ball is known to be complete; unbounded once nothing is left to expand."""
+        return self.depth if self.frontier else float("inf")
+
+    def expand(self, fetch_edges: EdgeFetcher, out_edges: Dict[Hashable, List[CallEdge]]):
+        self.depth += 1
+        edges = list(fetch_edges(self.frontier, self.direction))
+        if self.direction == "out":
+            # The forward side fetches every call made by its frontier; keep them for enumeration
+            fresh = {node_id for node_id in self.frontier if node_id not in out_edges}
+            for node_id in fresh:
+                out_edges[node_id] = []
+            for edge in edges:
+                if edge[0] in fresh:
+                    out_edges[edge[0]].append(edge)
+        reached = dict.fromkeys(edge[1] if self.direction == "out" else edge[0] for edge in edges)
+        self.frontier = [node_id for node_id in reached if node_id not in self.distance]
+        for node_id in self.frontier:
+            self.distance[node_id] = self.depth
+
+
+def call_detail(props: Dict[str, Any]) -> Dict[str, Any]:
+    """The `call_details` entry of a chain for the CALLS edge with `props`."""
+    return {
+        "call_line": props.get("line_number"),
+        "args": props.get("args"),
+        "full_call_name": props.get("full_call_name"),
+    }
+
+
+def shortest_call_chains(starts: Sequence[Hashable], ends: Iterable[Hashable], fetch_edges: EdgeFetcher,
+                         max_depth: int, limit: int = 20) -> List[Tuple[List[Hashable], List[Dict[str, Any]]]]:
+    """
+    Up to `limit` chains of calls from a start to an end, shortest first, each
+    at most `max_depth` calls long and visiting no function twice. Returns
+    (node ids, call properties) pairs.
+    """
+    starts = list(dict.fromkeys(starts))
+    ends = set(ends)
+    if not starts or not ends:
+        return []
+
+    forward, backward = _Ball(starts, "out"), _Ball(ends, "in")
+    out_edges: Dict[Hashable, List[CallEdge]] = {}
+    chains = []
+    for length in range(1, max_depth + 1):
+        # Grow the balls until they span `length`: every chain of that length
+        # then passes through a node both of them have reached.
+        while forward.depth + backward.depth < length and forward.frontier and backward.frontier:
+            smaller = min(forward, backward, key=lambda ball: (len(ball.frontier), ball.depth))
+            smaller.expand(fetch_edges, out_edges)
+        meeting = forward.distance.keys() & backward.distance.keys()
+        if not any(forward.distance[n] + backward.distance[n] <= length for n in meeting):
+            if not meeting and not (forward.frontier and backward.frontier):
+                break  # one side is exhausted without meeting the other: there is no chain
+            continue
+        chains.extend(_chains_of_length(starts, ends, length, forward, backward, out_edges, fetch_edges,
+                                        limit - len(chains)))
+        if len(chains) >= limit:
+            break
+    return chains
+
+
+def _chains_of_length(starts, ends, length, forward: _Ball, backward: _Ball,
+                      out_edges: Dict[Hashable, List[CallEdge]], fetch_edges: EdgeFetcher, limit: int):
+    # A node the backward ball has not reached is more than its radius from any end.
+    unreached = backward.radius + 1
+
+    def can_finish(node_id, position):
+        to_end = backward.distance.get(node_id)
+        if to_end is not None:
+            return position + to_end <= length
+        return position + unreached <= length and position <= forward.radius
+
+    chains = []
+    partial = [([start], []) for start in starts]
+    for position in range(1, length + 1):
+        missing = list(dict.fromkeys(nodes[-1] for nodes, _ in partial if nodes[-1] not in out_edges))
+        if missing:
+            for node_id in missing:
+                out_edges[node_id] = []
+            for edge in fetch_edges(missing, "out"):
+                out_edges[edge[0]].append(edge)
+
+        extended = []
+        for nodes, calls in partial:
+            for _, callee, props in out_edges[nodes[-1]]:
+                if callee in nodes:
+                    continue
+                if position == length:
+                    if callee in ends:
+                        chains.append((nodes + [callee], calls + [props]))
+                        if len(chains) >= limit:
+                            return chains
+                elif can_finish(callee, position):
+                    extended.append((nodes + [callee], calls + [props]))
+        partial = extended[:MAX_PARTIAL_CHAINS]
+        if not partial:
+            break
+    return chains
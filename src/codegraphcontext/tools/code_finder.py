@@ -1,145 +1,357 @@
 # src/codegraphcontext/tools/code_finder.py
+import heapq
 import logging
 import re
-from typing import Any, Dict, List, Literal, Optional
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 from pathlib import Path
 
-from ..core.database import DatabaseManager
+from ..cli.config_manager import get_config_value
+from ..core.graph_schema import SCHEMA_LABEL
+from ..core.result_cache import DEFAULT_RESULT_CACHE_SIZE, DEFAULT_RESULT_CACHE_TTL, ResultCache, graph_generation
+from .call_chains import call_detail, shortest_call_chains
+from .graph_snapshot import SNAPSHOT_RELATIONSHIPS, GraphSnapshot, SnapshotBuilder
+from .pagination import (Page, check_limit, combined_pages, decode_cursor, keyset_condition, keyset_order,
+                         keyset_page, next_cursor)
+
+if TYPE_CHECKING:
+    from ..core.database import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# Read methods whose results are cached, keyed by their arguments and the graph generation
+CACHED_METHODS = (
+    'find_by_function_name', 'find_by_class_name', 'find_by_variable_name', 'find_by_content',
+    'find_by_module_name', 'find_imports', 'find_related_code', 'find_functions_by_argument',
+    'find_functions_by_decorator', 'who_calls_function', 'what_does_function_call',
+    'who_imports_module', 'who_modifies_variable', 'find_class_hierarchy', 'find_function_overrides',
+    'find_dead_code', 'find_all_callers', 'find_all_callees', 'find_function_call_chain',
+    'find_by_type', 'find_files_by_name', 'find_by_name_pattern', 'find_module_dependencies', 'find_variable_usage_scope',
+    'analyze_code_relationships', 'get_cyclomatic_complexity', 'find_most_complex_functions',
+    'list_indexed_repositories',
+)
+
+
+# How many calls away find_all_callers/find_all_callees look by default
+DEFAULT_TRAVERSAL_DEPTH = 10
+
+# Entry points and hooks that find_dead_code never reports
+DEAD_CODE_EXCLUDED_NAMES = ('main', '__init__', '__main__', 'setup', 'run', '__new__', '__del__')
+DEAD_CODE_NOTE = "These functions might be unused, but could be entry points, callbacks, or called dynamically"
+DEAD_CODE_PAGE_SIZE = 50
+
+# Results per page of the find and relationship queries
+PAGE_SIZE = 20
+
+# Full-text hits are paged best score first, then by location, name and type
+FULLTEXT_KEY_COUNT = 5
+
+
+def _config_number(key: str, default: float) -> float:
+    try:
+        return float(get_config_value(key) or default)
+    except ValueError:
+        return default
+
+
+# The `sort_keys` of a function `f` in the function listings: project code first, then location
+_FUNCTION_SORT_KEYS = ("[CASE WHEN f.is_dependency THEN 1 ELSE 0 END, coalesce(f.file_path, ''), "
+                       "coalesce(f.line_number, 0), f.name]")
+
+# who_calls_function's query, after the clause matching the `target` functions
+_CALLERS_QUERY = """
+    MATCH (caller:Function)-[call:CALLS]->(target)
+    WITH DISTINCT caller, call.line_number AS call_line_number, call.args AS call_args,
+         call.full_call_name AS full_call_name, target.file_path AS target_file_path
+    WITH caller, call_line_number, call_args, full_call_name, target_file_path,
+         [CASE WHEN caller.is_dependency THEN 1 ELSE 0 END, coalesce(caller.file_path, ''),
+          coalesce(caller.line_number, 0), caller.name, coalesce(call_line_number, 0),
+          coalesce(full_call_name, ''), coalesce(target_file_path, '')] AS sort_keys
+    WHERE {keyset}
+    RETURN
+        caller.name as caller_function,
+        caller.file_path as caller_file_path,
+        caller.line_number as caller_line_number,
+        caller.docstring as caller_docstring,
+        caller.is_dependency as caller_is_dependency,
+        call_line_number,
+        call_args,
+        full_call_name,
+        target_file_path,
+        sort_keys
+    ORDER BY {order}
+    LIMIT $page_size
+"""
+
+
+def _fill_keyset(query: str, key_count: int) -> str:
+    """Fills in the `{keyset}` condition and `{order}` expressions of a paginated query."""
+    return query.replace("{keyset}", keyset_condition(key_count)).replace("{order}", keyset_order(key_count))
+
+
+def _fulltext_sort_keys(type_expression: str) -> str:
+    """The `sort_keys` of a full-text hit (`node` and `score`) whose type is `type_expression`."""
+    return (f"[-score, coalesce(node.file_path, ''), coalesce(node.line_number, 0), coalesce(node.name, ''), "
+            f"{type_expression}]")
+
+
+def _dead_code_keys(row: Dict[str, Any]) -> Tuple:
+    """The sort keys dead-code results are paged by."""
+    return row["file_path"], row["line_number"], row["function_name"]
+
+
 class CodeFinder:
     """Module for finding relevant code snippets and analyzing relationships."""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: "DatabaseManager", long_running: bool = False):
         self.db_manager = db_manager
         self.driver = self.db_manager.get_driver()
+        self.is_falkordb = self.db_manager.get_backend_type() == 'falkordb'
+
+        # Whole-graph analytics run on an in-memory snapshot (see graph_snapshot.py).
+        # Loading it pays off across many queries, so by default only long-running
+        # processes such as the MCP server use it.
+        snapshot_mode = (get_config_value("CALL_GRAPH_SNAPSHOT") or "auto").lower()
+        self.use_snapshot = snapshot_mode == "true" or (snapshot_mode == "auto" and long_running)
+        self._snapshot: Optional[Tuple[int, float, GraphSnapshot]] = None
+        self._snapshot_lock = threading.Lock()
+
+        # Agents repeat the same lookups within a session; answer them from memory
+        # until the graph is written to (see core/result_cache.py). Wrapping the
+        # bound methods covers backend subclasses that override them.
+        self.result_cache = ResultCache(
+            int(_config_number("CODE_FINDER_CACHE_SIZE", DEFAULT_RESULT_CACHE_SIZE)),
+            _config_number("CODE_FINDER_CACHE_TTL", DEFAULT_RESULT_CACHE_TTL),
+        )
+        for name in CACHED_METHODS:
+            setattr(self, name, self.result_cache.wrap(name, getattr(self, name)))
+
+    def graph_snapshot(self) -> GraphSnapshot:
+        """
+        The CSR snapshot of the graph. It is loaded once per graph generation,
+        and reloaded after the result cache's TTL in case another process has
+        written to the graph.
+        """
+        generation = graph_generation()
+        with self._snapshot_lock:
+            cached = self._snapshot
+            if cached and cached[0] == generation and cached[1] > time.monotonic():
+                return cached[2]
+            start = time.perf_counter()
+            snapshot = self._load_snapshot()
+            logger.debug(f"Loaded graph snapshot of {len(snapshot)} nodes and {snapshot.edge_count} edges "
+                         f"in {time.perf_counter() - start:.2f}s")
+            self._snapshot = (generation, time.monotonic() + self.result_cache.ttl, snapshot)
+            return snapshot
+
+    def _load_snapshot(self) -> GraphSnapshot:
+        id_function = self._id_function()
+        builder = SnapshotBuilder()
+        with self.driver.session() as session:
+            for record in session.run(f"""
+                MATCH (n) WHERE NOT n:Parameter AND NOT n:{SCHEMA_LABEL}
+                RETURN {id_function}(n) AS node_id, labels(n)[0] AS label, n.name AS name,
+                    coalesce(n.file_path, n.path) AS path, n.line_number AS line_number,
+                    n.is_dependency AS is_dependency, n.decorators AS decorators
+            """):
+                builder.add_node(record["node_id"], record["label"], record["name"], record["path"],
+                                 record["line_number"], record["is_dependency"], record["decorators"])
+            for record in session.run(f"""
+                MATCH (a)-[r:{'|'.join(SNAPSHOT_RELATIONSHIPS)}]->(b)
+                RETURN {id_function}(a) AS source, type(r) AS rel, {id_function}(b) AS target
+            """):
+                builder.add_edge(record["rel"], record["source"], record["target"])
+        return builder.build()
+
+    def _run_page(self, session, query: str, key_count: int, limit: int, cursor: Optional[str], **params) -> Page:
+        """
+        Runs a paginated query for the page after `cursor`. The query computes
+        each row's `sort_keys` list of `key_count` keys, filters on `{keyset}`,
+        orders by `{order}` (both filled in here) and is limited to `$page_size`.
+        """
+        check_limit(limit)
+        rows = session.run(_fill_keyset(query, key_count), after=decode_cursor(cursor, key_count), page_size=limit + 1, **params).data()
+        return keyset_page(rows, limit)
+
+    def _falkordb_fulltext(self, session, labels: List[str], search_term: str, with_type: bool = False,
+                           limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+        """
+        Full-text search on FalkorDB, which keeps one index per label (see
+        falkordb_schema): queries each label's index for its next page and
+        merges the hits by score. `search_term` uses the same Lucene syntax as
+        the Neo4j queries.
+        """
+        from ..core.falkordb_schema import to_fulltext_query
+
+        check_limit(limit)
+        after = decode_cursor(cursor, FULLTEXT_KEY_COUNT)
+        rows = []
+        for label in labels:
+            query = f"""
+                CALL db.idx.fulltext.queryNodes('{label}', $search_term) YIELD node, score
+                WITH node, {_fulltext_sort_keys(f"'{label.lower()}'")} AS sort_keys
+                WHERE {{keyset}}
+                RETURN '{label.lower()}' as type, node.name as name, node.file_path as file_path,
+                    node.line_number as line_number, node.source as source,
+                    node.docstring as docstring, node.is_dependency as is_dependency, sort_keys
+                ORDER BY {{order}}
+                LIMIT $page_size
+            """
+            rows.extend(session.run(_fill_keyset(query, FULLTEXT_KEY_COUNT), search_term=to_fulltext_query(search_term),
+                                    after=after, page_size=limit + 1).data())
+        # Each label's page starts after the cursor, so the best of them all is the merged page
+        rows.sort(key=lambda row: row["sort_keys"])
+        page = keyset_page(rows[:limit + 1], limit)
+        if not with_type:
+            for row in page:
+                del row["type"]
+        return page
 
     def format_query(self, find_by: Literal["Class", "Function"], fuzzy_search:bool) -> str:
         """Format the search query based on the search type and fuzzy search settings."""
         return f"""
             CALL db.index.fulltext.queryNodes("code_search_index", $search_term) YIELD node, score
-                WITH node, score
+                WITH node, {_fulltext_sort_keys(f"'{find_by.lower()}'")} AS sort_keys
                 WHERE node:{find_by} {'AND node.name CONTAINS $search_term' if not fuzzy_search else ''}
+                  AND {{keyset}}
                 RETURN node.name as name, node.file_path as file_path, node.line_number as line_number,
-                    node.source as source, node.docstring as docstring, node.is_dependency as is_dependency
-                ORDER BY score DESC
-                LIMIT 20
+                    node.source as source, node.docstring as docstring, node.is_dependency as is_dependency, sort_keys
+                ORDER BY {{order}}
+                LIMIT $page_size
             """
 
-    def find_by_function_name(self, search_term: str, fuzzy_search: bool) -> List[Dict]:
+    def find_by_function_name(self, search_term: str, fuzzy_search: bool, limit: int = PAGE_SIZE,
+                              cursor: Optional[str] = None) -> Page:
         """Find functions by name matching."""
-        with self.driver.session() as session:
-            if not fuzzy_search:
-                # Use simple match for exact search to avoid fulltext index dependency
-                result = session.run("""
-                    MATCH (node:Function {name: $name})
-                    RETURN node.name as name, node.file_path as file_path, node.line_number as line_number,
-                           node.source as source, node.docstring as docstring, node.is_dependency as is_dependency
-                    LIMIT 20
-                """, name=search_term)
-                return result.data()
-            
-            # Fuzzy search using fulltext index
-            formatted_search_term = f"name:{search_term}"
-            result = session.run(self.format_query("Function", fuzzy_search), search_term=formatted_search_term)
-            return result.data()
+        return self._find_by_name("Function", search_term, fuzzy_search, limit, cursor)
 
-    def find_by_class_name(self, search_term: str, fuzzy_search: bool) -> List[Dict]:
+    def find_by_class_name(self, search_term: str, fuzzy_search: bool, limit: int = PAGE_SIZE,
+                           cursor: Optional[str] = None) -> Page:
         """Find classes by name matching."""
+        return self._find_by_name("Class", search_term, fuzzy_search, limit, cursor)
+
+    def _find_by_name(self, label: str, search_term: str, fuzzy_search: bool, limit: int,
+                      cursor: Optional[str]) -> Page:
         with self.driver.session() as session:
             if not fuzzy_search:
                 # Use simple match for exact search to avoid fulltext index dependency
-                result = session.run("""
-                    MATCH (node:Class {name: $name})
+                return self._run_page(session, f"""
+                    MATCH (node:{label} {{name: $name}})
+                    WITH node, [coalesce(node.file_path, ''), coalesce(node.line_number, 0)] AS sort_keys
+                    WHERE {{keyset}}
                     RETURN node.name as name, node.file_path as file_path, node.line_number as line_number,
-                           node.source as source, node.docstring as docstring, node.is_dependency as is_dependency
-                    LIMIT 20
-                """, name=search_term)
-                return result.data()
+                           node.source as source, node.docstring as docstring, node.is_dependency as is_dependency,
+                           sort_keys
+                    ORDER BY {{order}}
+                    LIMIT $page_size
+                """, 2, limit, cursor, name=search_term)
 
             # Fuzzy search using fulltext index
             formatted_search_term = f"name:{search_term}"
-            result = session.run(self.format_query("Class", fuzzy_search), search_term=formatted_search_term)
-            return result.data()
+            if self.is_falkordb:
+                return self._falkordb_fulltext(session, [label], formatted_search_term, limit=limit, cursor=cursor)
+            return self._run_page(session, self.format_query(label, fuzzy_search), FULLTEXT_KEY_COUNT, limit, cursor,
+                                  search_term=formatted_search_term)
 
-    def find_by_variable_name(self, search_term: str) -> List[Dict]:
+    def find_by_variable_name(self, search_term: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
         """Find variables by name matching"""
         with self.driver.session() as session:
-            result = session.run("""
+            return self._run_page(session, """
                 MATCH (v:Variable)
                 WHERE v.name CONTAINS $search_term
+                WITH v, [CASE WHEN v.is_dependency THEN 1 ELSE 0 END, v.name,
+                         coalesce(v.file_path, ''), coalesce(v.line_number, 0)] AS sort_keys
+                WHERE {keyset}
                 RETURN v.name as name, v.file_path as file_path, v.line_number as line_number,
-                       v.value as value, v.context as context, v.is_dependency as is_dependency
-                ORDER BY v.is_dependency ASC, v.name
-                LIMIT 20
-            """, search_term=search_term)
-            
-            return result.data()
+                       v.value as value, v.context as context, v.is_dependency as is_dependency, sort_keys
+                ORDER BY {order}
+                LIMIT $page_size
+            """, 4, limit, cursor, search_term=search_term)
 
-    def find_by_content(self, search_term: str) -> List[Dict]:
+    def find_by_content(self, search_term: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
         """Find code by content matching in source or docstrings using the full-text index."""
         with self.driver.session() as session:
-            result = session.run("""
+            if self.is_falkordb:
+                return self._falkordb_fulltext(session, ["Function", "Class", "Variable"], search_term, with_type=True,
+                                               limit=limit, cursor=cursor)
+            return self._run_page(session, f"""
                 CALL db.index.fulltext.queryNodes("code_search_index", $search_term) YIELD node, score
-                WITH node, score
-                WHERE node:Function OR node:Class OR node:Variable
-                RETURN
+                WITH node, score,
                     CASE 
                         WHEN node:Function THEN 'function'
                         WHEN node:Class THEN 'class'
                         ELSE 'variable' 
-                    END as type,
-                    node.name as name, node.file_path as file_path,
+                    END as type
+                WHERE node:Function OR node:Class OR node:Variable
+                WITH node, type, {_fulltext_sort_keys("type")} AS sort_keys
+                WHERE {{keyset}}
+                RETURN
+                    type, node.name as name, node.file_path as file_path,
                     node.line_number as line_number, node.source as source,
-                    node.docstring as docstring, node.is_dependency as is_dependency
-                ORDER BY score DESC
-                LIMIT 20
-            """, search_term=search_term)
-            return result.data()
+                    node.docstring as docstring, node.is_dependency as is_dependency, sort_keys
+                ORDER BY {{order}}
+                LIMIT $page_size
+            """, FULLTEXT_KEY_COUNT, limit, cursor, search_term=search_term)
     
-    def find_by_module_name(self, search_term: str) -> List[Dict]:
+    def find_by_module_name(self, search_term: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
         """Find modules by name matching"""
         with self.driver.session() as session:
-            result = session.run("""
+            return self._run_page(session, """
                 MATCH (m:Module)
                 WHERE m.name CONTAINS $search_term
-                RETURN m.name as name, m.lang as lang
-                ORDER BY m.name
-                LIMIT 20
-            """, search_term=search_term)
-            return result.data()
+                WITH m, [m.name] AS sort_keys
+                WHERE {keyset}
+                RETURN m.name as name, m.lang as lang, sort_keys
+                ORDER BY {order}
+                LIMIT $page_size
+            """, 1, limit, cursor, search_term=search_term)
 
-    def find_imports(self, search_term: str) -> List[Dict]:
+    def find_imports(self, search_term: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
         """Find imported symbols (aliases or original names)."""
         with self.driver.session() as session:
-            result = session.run("""
+            return self._run_page(session, """
                 MATCH (f:File)-[r:IMPORTS]->(m:Module)
                 WHERE r.alias = $search_term OR r.imported_name = $search_term
+                WITH f, r, m, [f.path, coalesce(r.line_number, 0), m.name,
+                               coalesce(r.imported_name, ''), coalesce(r.alias, '')] AS sort_keys
+                WHERE {keyset}
                 RETURN 
                     r.alias as alias, 
                     r.imported_name as imported_name, 
                     m.name as module_name, 
                     f.path as file_path, 
-                    r.line_number as line_number
-                ORDER BY f.path
-                LIMIT 20
-            """, search_term=search_term)
-            return result.data()
+                    r.line_number as line_number,
+                    sort_keys
+                ORDER BY {order}
+                LIMIT $page_size
+            """, 5, limit, cursor, search_term=search_term)
 
-    def find_related_code(self, user_query: str, fuzzy_search: bool, edit_distance: int) -> Dict[str, Any]:
-        """Find code related to a query using multiple search strategies"""
+    def find_related_code(self, user_query: str, fuzzy_search: bool, edit_distance: int, limit: int = PAGE_SIZE,
+                          cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Find code related to a query using multiple search strategies.
+        Each strategy returns up to `limit` results; pass the returned
+        `next_cursor` back to fetch the next page of those with more.
+        """
+        check_limit(limit)
         if fuzzy_search:
             user_query_normalized = " ".join(map(lambda x: f"{x}~{edit_distance}", user_query.split(" ")))
         else:
             user_query_normalized = user_query
 
+        (functions, classes, variables, contents), next_page = combined_pages([
+            lambda c: self.find_by_function_name(user_query_normalized, fuzzy_search, limit, c),
+            lambda c: self.find_by_class_name(user_query_normalized, fuzzy_search, limit, c),
+            lambda c: self.find_by_variable_name(user_query, limit, c),  # no fuzzy for variables as they are not using full-text index
+            lambda c: self.find_by_content(user_query_normalized, limit, c),
+        ], cursor)
         results = {
             "query": user_query_normalized,
-            "functions_by_name": self.find_by_function_name(user_query_normalized, fuzzy_search),
-            "classes_by_name": self.find_by_class_name(user_query_normalized, fuzzy_search),
-            "variables_by_name": self.find_by_variable_name(user_query),  # no fuzzy for variables as they are not using full-text index
-            "content_matches": self.find_by_content(user_query_normalized)
+            "functions_by_name": functions,
+            "classes_by_name": classes,
+            "variables_by_name": variables,
+            "content_matches": contents
         }
         
         all_results = []
@@ -168,172 +380,102 @@ class CodeFinder:
         
         results["ranked_results"] = all_results[:15]
         results["total_matches"] = len(all_results)
+        results["next_cursor"] = next_page
         
         return results
     
-    def find_functions_by_argument(self, argument_name: str, file_path: str = None) -> List[Dict]:
+    def find_functions_by_argument(self, argument_name: str, file_path: str = None, limit: int = PAGE_SIZE,
+                                   cursor: Optional[str] = None) -> Page:
         """Find functions that take a specific argument name."""
+        file_filter = " AND f.file_path = $file_path" if file_path else ""
         with self.driver.session() as session:
-            if file_path:
-                query = """
-                    MATCH (f:Function)-[:HAS_PARAMETER]->(p:Parameter)
-                    WHERE p.name = $argument_name AND f.file_path = $file_path
-                    RETURN f.name AS function_name, f.file_path AS file_path, f.line_number AS line_number,
-                           f.docstring AS docstring, f.is_dependency AS is_dependency
-                    ORDER BY f.is_dependency ASC, f.file_path, f.line_number
-                    LIMIT 20
-                """
-                result = session.run(query, argument_name=argument_name, file_path=file_path)
-            else:
-                query = """
-                    MATCH (f:Function)-[:HAS_PARAMETER]->(p:Parameter)
-                    WHERE p.name = $argument_name
-                    RETURN f.name AS function_name, f.file_path AS file_path, f.line_number AS line_number,
-                           f.docstring AS docstring, f.is_dependency AS is_dependency
-                    ORDER BY f.is_dependency ASC, f.file_path, f.line_number
-                    LIMIT 20
-                """
-                result = session.run(query, argument_name=argument_name)
-            return result.data()
+            return self._run_page(session, f"""
+                MATCH (f:Function)-[:HAS_PARAMETER]->(p:Parameter)
+                WHERE p.name = $argument_name{file_filter}
+                WITH DISTINCT f
+                WITH f, {_FUNCTION_SORT_KEYS} AS sort_keys
+                WHERE {{keyset}}
+                RETURN f.name AS function_name, f.file_path AS file_path, f.line_number AS line_number,
+                       f.docstring AS docstring, f.is_dependency AS is_dependency, sort_keys
+                ORDER BY {{order}}
+                LIMIT $page_size
+            """, 4, limit, cursor, argument_name=argument_name, file_path=file_path)
 
-    def find_functions_by_decorator(self, decorator_name: str, file_path: str = None) -> List[Dict]:
+    def find_functions_by_decorator(self, decorator_name: str, file_path: str = None, limit: int = PAGE_SIZE,
+                                    cursor: Optional[str] = None) -> Page:
         """Find functions that have a specific decorator applied to them."""
+        file_filter = "f.file_path = $file_path AND " if file_path else ""
         with self.driver.session() as session:
-            if file_path:
-                query = """
-                    MATCH (f:Function)
-                    WHERE f.file_path = $file_path AND $decorator_name IN f.decorators
-                    RETURN f.name AS function_name, f.file_path AS file_path, f.line_number AS line_number,
-                           f.docstring AS docstring, f.is_dependency AS is_dependency, f.decorators AS decorators
-                    ORDER BY f.is_dependency ASC, f.file_path, f.line_number
-                    LIMIT 20
-                """
-                result = session.run(query, decorator_name=decorator_name, file_path=file_path)
-            else:
-                query = """
-                    MATCH (f:Function)
-                    WHERE $decorator_name IN f.decorators
-                    RETURN f.name AS function_name, f.file_path AS file_path, f.line_number AS line_number,
-                           f.docstring AS docstring, f.is_dependency AS is_dependency, f.decorators AS decorators
-                    ORDER BY f.is_dependency ASC, f.file_path, f.line_number
-                    LIMIT 20
-                """
-                result = session.run(query, decorator_name=decorator_name)
-            return result.data()
+            return self._run_page(session, f"""
+                MATCH (f:Function)
+                WHERE {file_filter}$decorator_name IN f.decorators
+                WITH f, {_FUNCTION_SORT_KEYS} AS sort_keys
+                WHERE {{keyset}}
+                RETURN f.name AS function_name, f.file_path AS file_path, f.line_number AS line_number,
+                       f.docstring AS docstring, f.is_dependency AS is_dependency, f.decorators AS decorators,
+                       sort_keys
+                ORDER BY {{order}}
+                LIMIT $page_size
+            """, 4, limit, cursor, decorator_name=decorator_name, file_path=file_path)
     
-    def who_calls_function(self, function_name: str, file_path: str = None) -> List[Dict]:
+    def who_calls_function(self, function_name: str, file_path: str = None, limit: int = PAGE_SIZE,
+                           cursor: Optional[str] = None) -> Page:
         """Find what functions call a specific function using CALLS relationships with improved matching"""
         with self.driver.session() as session:
             if file_path:
-                result = session.run("""
-                    MATCH (caller:Function)-[call:CALLS]->(target:Function {name: $function_name, file_path: $file_path})
-                    OPTIONAL MATCH (caller_file:File)-[:CONTAINS]->(caller)
-                    RETURN DISTINCT
-                        caller.name as caller_function,
-                        caller.file_path as caller_file_path,
-                        caller.line_number as caller_line_number,
-                        caller.docstring as caller_docstring,
-                        caller.is_dependency as caller_is_dependency,
-                        call.line_number as call_line_number,
-                        call.args as call_args,
-                        call.full_call_name as full_call_name,
-                        target.file_path as target_file_path
-                    ORDER BY caller.is_dependency ASC, caller.file_path, caller.line_number
-                    LIMIT 20
-                """, function_name=function_name, file_path=file_path)
-                
-                results = [dict(record) for record in result]
-                if not results:
-                    result = session.run("""
-                        MATCH (target:Function {name: $function_name})
-                        MATCH (caller:Function)-[call:CALLS]->(target)
-                        OPTIONAL MATCH (caller_file:File)-[:CONTAINS]->(caller)
-                        RETURN DISTINCT
-                            caller.name as caller_function,
-                            caller.file_path as caller_file_path,
-                            caller.line_number as caller_line_number,
-                            caller.docstring as caller_docstring,
-                            caller.is_dependency as caller_is_dependency,
-                            call.line_number as call_line_number,
-                            call.args as call_args,
-                            call.full_call_name as full_call_name,
-                            target.file_path as target_file_path
-                        ORDER BY caller.is_dependency ASC, caller.file_path, caller.line_number
-                        LIMIT 20
-                    """, function_name=function_name)
-                    results = [dict(record) for record in result]
-            else:
-                result = session.run("""
-                    MATCH (target:Function {name: $function_name})
-                    MATCH (caller:Function)-[call:CALLS]->(target)
-                    OPTIONAL MATCH (caller_file:File)-[:CONTAINS]->(caller)
-                    RETURN DISTINCT
-                        caller.name as caller_function,
-                        caller.file_path as caller_file_path,
-                        caller.line_number as caller_line_number,
-                        caller.docstring as caller_docstring,
-                        caller.is_dependency as caller_is_dependency,
-                        call.line_number as call_line_number,
-                        call.args as call_args,
-                        call.full_call_name as full_call_name,
-                        target.file_path as target_file_path
-                    ORDER BY caller.is_dependency ASC, caller.file_path, caller.line_number
-                    LIMIT 20
-                """, function_name=function_name)
-                results = [dict(record) for record in result]
-            
-            return results
+                results = self._run_page(session, "MATCH (target:Function {name: $function_name, file_path: $file_path})"
+                                         + _CALLERS_QUERY, 7, limit, cursor,
+                                         function_name=function_name, file_path=file_path)
+                if results:
+                    return results
+            # Without a file, or when none of its functions are called, look at every function with the name
+            return self._run_page(session, "MATCH (target:Function {name: $function_name})" + _CALLERS_QUERY,
+                                  7, limit, cursor, function_name=function_name)
     
-    def what_does_function_call(self, function_name: str, file_path: str = None) -> List[Dict]:
+    def what_does_function_call(self, function_name: str, file_path: str = None, limit: int = PAGE_SIZE,
+                                cursor: Optional[str] = None) -> Page:
         """Find what functions a specific function calls using CALLS relationships"""
         with self.driver.session() as session:
             if file_path:
                 # Convert file_path to absolute path
                 absolute_file_path = str(Path(file_path).resolve())
-                result = session.run("""
-                    MATCH (caller:Function {name: $function_name, file_path: $absolute_file_path})
-                    MATCH (caller)-[call:CALLS]->(called:Function)
-                    OPTIONAL MATCH (called_file:File)-[:CONTAINS]->(called)
-                    RETURN DISTINCT
-                        called.name as called_function,
-                        called.file_path as called_file_path,
-                        called.line_number as called_line_number,
-                        called.docstring as called_docstring,
-                        called.is_dependency as called_is_dependency,
-                        call.line_number as call_line_number,
-                        call.args as call_args,
-                        call.full_call_name as full_call_name
-                    ORDER BY called.is_dependency ASC, called.name
-                    LIMIT 20
-                """, function_name=function_name, absolute_file_path=absolute_file_path)
+                match_clause = "MATCH (caller:Function {name: $function_name, file_path: $absolute_file_path})"
             else:
-                result = session.run("""
-                    MATCH (caller:Function {name: $function_name})
-                    MATCH (caller)-[call:CALLS]->(called:Function)
-                    OPTIONAL MATCH (called_file:File)-[:CONTAINS]->(called)
-                    RETURN DISTINCT
-                        called.name as called_function,
-                        called.file_path as called_file_path,
-                        called.line_number as called_line_number,
-                        called.docstring as called_docstring,
-                        called.is_dependency as called_is_dependency,
-                        call.line_number as call_line_number,
-                        call.args as call_args,
-                        call.full_call_name as full_call_name
-                    ORDER BY called.is_dependency ASC, called.name
-                    LIMIT 20
-                """, function_name=function_name)
-            
-            return result.data()
+                absolute_file_path = None
+                match_clause = "MATCH (caller:Function {name: $function_name})"
+            return self._run_page(session, match_clause + """
+                MATCH (caller)-[call:CALLS]->(called:Function)
+                WITH DISTINCT called, call.line_number AS call_line_number, call.args AS call_args,
+                     call.full_call_name AS full_call_name
+                WITH called, call_line_number, call_args, full_call_name,
+                     [CASE WHEN called.is_dependency THEN 1 ELSE 0 END, called.name, coalesce(called.file_path, ''),
+                      coalesce(called.line_number, 0), coalesce(call_line_number, 0),
+                      coalesce(full_call_name, '')] AS sort_keys
+                WHERE {keyset}
+                RETURN
+                    called.name as called_function,
+                    called.file_path as called_file_path,
+                    called.line_number as called_line_number,
+                    called.docstring as called_docstring,
+                    called.is_dependency as called_is_dependency,
+                    call_line_number,
+                    call_args,
+                    full_call_name,
+                    sort_keys
+                ORDER BY {order}
+                LIMIT $page_size
+            """, 6, limit, cursor, function_name=function_name, absolute_file_path=absolute_file_path)
     
-    def who_imports_module(self, module_name: str) -> List[Dict]:
+    def who_imports_module(self, module_name: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
         """Find what files import a specific module using IMPORTS relationships"""
         with self.driver.session() as session:
-            result = session.run("""
+            return self._run_page(session, """
                 MATCH (file:File)-[imp:IMPORTS]->(module:Module)
                 WHERE module.name = $module_name OR module.full_import_name CONTAINS $module_name
+                WITH file, module, [CASE WHEN file.is_dependency THEN 1 ELSE 0 END, file.path] AS sort_keys
+                WHERE {keyset}
                 OPTIONAL MATCH (repo:Repository)-[:CONTAINS]->(file)
-                WITH file, repo, COLLECT({
+                WITH file, repo, sort_keys, COLLECT({
                     imported_module: module.name,
                     import_alias: module.alias,
                     full_import_name: module.full_import_name
@@ -344,22 +486,21 @@ class CodeFinder:
                     file.relative_path AS file_relative_path,
                     file.is_dependency AS file_is_dependency,
                     repo.name AS repository_name,
-                    imports
-                ORDER BY file.is_dependency ASC, file.path
-                LIMIT 20
-            """, module_name=module_name)
-            
-            return result.data()
+                    imports,
+                    sort_keys
+                ORDER BY {order}
+                LIMIT $page_size
+            """, 2, limit, cursor, module_name=module_name)
     
-    def who_modifies_variable(self, variable_name: str) -> List[Dict]:
+    def who_modifies_variable(self, variable_name: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
         """Find what functions contain or modify a specific variable"""
         with self.driver.session() as session:
-            result = session.run("""
+            return self._run_page(session, """
                 MATCH (var:Variable {name: $variable_name})
                 MATCH (container)-[:CONTAINS]->(var)
                 WHERE container:Function OR container:Class OR container:File
                 OPTIONAL MATCH (file:File)-[:CONTAINS]->(container)
-                RETURN DISTINCT
+                WITH DISTINCT
                     CASE 
                         WHEN container:Function THEN container.name
                         WHEN container:Class THEN container.name
@@ -372,15 +513,22 @@ class CodeFinder:
                     END as container_type,
                     COALESCE(container.file_path, file.path) as file_path,
                     container.line_number as container_line_number,
+                    var.file_path as variable_file_path,
                     var.line_number as variable_line_number,
                     var.value as variable_value,
                     var.context as variable_context,
                     COALESCE(container.is_dependency, file.is_dependency, false) as is_dependency
-                ORDER BY is_dependency ASC, file_path, variable_line_number
-                LIMIT 20
-            """, variable_name=variable_name)
-            
-            return result.data()
+                WITH container_name, container_type, file_path, container_line_number, variable_line_number,
+                     variable_value, variable_context, is_dependency,
+                     [CASE WHEN is_dependency THEN 1 ELSE 0 END, coalesce(file_path, ''),
+                      coalesce(variable_line_number, 0), coalesce(variable_file_path, ''),
+                      container_type, container_name] AS sort_keys
+                WHERE {keyset}
+                RETURN container_name, container_type, file_path, container_line_number, variable_line_number,
+                       variable_value, variable_context, is_dependency, sort_keys
+                ORDER BY {order}
+                LIMIT $page_size
+            """, 6, limit, cursor, variable_name=variable_name)
     
     def find_class_hierarchy(self, class_name: str, file_path: str = None) -> Dict[str, Any]:
         """Find class inheritance relationships using INHERITS relationships"""
@@ -439,13 +587,19 @@ class CodeFinder:
                 "methods": [dict(record) for record in methods_result]
             }
     
-    def find_function_overrides(self, function_name: str) -> List[Dict]:
+    def find_function_overrides(self, function_name: str, limit: int = PAGE_SIZE,
+                                cursor: Optional[str] = None) -> Page:
         """Find all implementations of a function across different classes"""
         with self.driver.session() as session:
-            result = session.run("""
+            return self._run_page(session, """
                 MATCH (class:Class)-[:CONTAINS]->(func:Function {name: $function_name})
                 OPTIONAL MATCH (file:File)-[:CONTAINS]->(class)
-                RETURN DISTINCT
+                WITH DISTINCT class, func, file.name AS file_name
+                WITH class, func, file_name,
+                     [CASE WHEN func.is_dependency THEN 1 ELSE 0 END, class.name, coalesce(class.file_path, ''),
+                      coalesce(func.line_number, 0)] AS sort_keys
+                WHERE {keyset}
+                RETURN
                     class.name as class_name,
                     class.file_path as class_file_path,
                     func.name as function_name,
@@ -453,31 +607,42 @@ class CodeFinder:
                     func.args as function_args,
                     func.docstring as function_docstring,
                     func.is_dependency as is_dependency,
-                    file.name as file_name
-                ORDER BY func.is_dependency ASC, class.name
-                LIMIT 20
-            """, function_name=function_name)
-            
-            return result.data()
+                    file_name,
+                    sort_keys
+                ORDER BY {order}
+                LIMIT $page_size
+            """, 4, limit, cursor, function_name=function_name)
     
-    def find_dead_code(self, exclude_decorated_with: List[str] = None) -> Dict[str, Any]:
-        """Find potentially unused functions (not called by other functions in the project), optionally excluding those with specific decorators."""
+    def find_dead_code(self, exclude_decorated_with: List[str] = None, limit: int = DEAD_CODE_PAGE_SIZE,
+                       cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Find potentially unused functions (not called by other functions in the project), optionally excluding those with specific decorators.
+        Results are paged in (file, line) order: pass the returned `next_cursor` back to fetch the next page.
+        """
         if exclude_decorated_with is None:
             exclude_decorated_with = []
+        check_limit(limit)
+        after = decode_cursor(cursor, 3)
+        if self.use_snapshot:
+            return self._snapshot_dead_code(exclude_decorated_with, limit, after)
 
+        # Function nodes carry their caller counts (kept by GraphBuilder's linking
+        # pass), so this is an index lookup rather than an aggregation over CALLS.
         with self.driver.session() as session:
-            result = session.run("""
+            rows = session.run("""
                 MATCH (func:Function)
-                WHERE func.is_dependency = false
-                  AND NOT func.name IN ['main', '__init__', '__main__', 'setup', 'run', '__new__', '__del__']
+                WHERE func.internal_caller_count = 0
+                  AND func.is_dependency = false
+                  AND NOT func.name IN $excluded_names
                   AND NOT func.name STARTS WITH '_test'
                   AND NOT func.name STARTS WITH 'test_'
-                  AND ALL(decorator_name IN $exclude_decorated_with WHERE NOT decorator_name IN func.decorators)
+                  AND ALL(decorator_name IN $exclude_decorated_with WHERE NOT decorator_name IN coalesce(func.decorators, []))
+                  AND ($after IS NULL OR func.file_path > $after[0]
+                       OR (func.file_path = $after[0] AND (func.line_number > $after[1]
+                           OR (func.line_number = $after[1] AND func.name > $after[2]))))
                 WITH func
-                OPTIONAL MATCH (caller:Function)-[:CALLS]->(func)
-                WHERE caller.is_dependency = false
-                WITH func, count(caller) as caller_count
-                WHERE caller_count = 0
+                ORDER BY func.file_path, func.line_number, func.name
+                LIMIT $page_size
                 OPTIONAL MATCH (file:File)-[:CONTAINS]->(func)
                 RETURN
                     func.name as function_name,
@@ -485,104 +650,182 @@ class CodeFinder:
                     func.line_number as line_number,
                     func.docstring as docstring,
                     func.context as context,
+                    func.caller_count as caller_count,
                     file.name as file_name
-                ORDER BY func.file_path, func.line_number
-                LIMIT 50
-            """, exclude_decorated_with=exclude_decorated_with)
-            
-            return {
-                "potentially_unused_functions": [dict(record) for record in result],
-                "note": "These functions might be unused, but could be entry points, callbacks, or called dynamically"
-            }
-    
-    def find_all_callers(self, function_name: str, file_path: str = None) -> List[Dict]:
-        """Find all direct and indirect callers of a specific function."""
+                ORDER BY file_path, line_number, function_name
+            """, exclude_decorated_with=exclude_decorated_with, excluded_names=list(DEAD_CODE_EXCLUDED_NAMES),
+                after=after, page_size=limit + 1).data()
+
+        return {
+            "potentially_unused_functions": rows,
+            "next_cursor": next_cursor(rows, limit, _dead_code_keys),
+            "note": DEAD_CODE_NOTE
+        }
+
+    def _snapshot_dead_code(self, exclude_decorated_with: List[str], limit: int,
+                            after: Optional[List[Any]]) -> Dict[str, Any]:
+        """`find_dead_code` over the graph snapshot: only the reported functions' details are queried."""
+        snapshot = self.graph_snapshot()
+        labels, names, dependency, decorators = snapshot.labels, snapshot.names, snapshot.dependency, snapshot.decorators
+        excluded_decorators = set(exclude_decorated_with)
+        internal_callers = snapshot.degrees("CALLS", "in", label="Function", include_dependencies=False)
+        after = tuple(after) if after else None
+
+        def keys(node):
+            return snapshot.paths[node] or "", snapshot.lines[node], names[node] or ""
+
+        unused = [
+            node for node in range(len(snapshot))
+            if labels[node] == "Function" and not dependency[node] and not internal_callers[node]
+            and names[node] not in DEAD_CODE_EXCLUDED_NAMES
+            and not (names[node] or "").startswith(("_test", "test_"))
+            and not excluded_decorators.intersection(decorators.get(node, ()))
+            and (after is None or keys(node) > after)
+        ]
+        unused = heapq.nsmallest(limit + 1, unused, key=keys)
+        cursor = next_cursor(unused, limit, keys)
+        return {
+            "potentially_unused_functions": self._dead_code_rows([snapshot.node_ids[node] for node in unused]),
+            "next_cursor": cursor,
+            "note": DEAD_CODE_NOTE
+        }
+
+    def _dead_code_rows(self, node_ids: List[Any]) -> List[Dict]:
+        """The `find_dead_code` rows of the functions with these ids, in the same order."""
+        if not node_ids:
+            return []
+        id_function = self._id_function()
         with self.driver.session() as session:
-            if file_path:
-                # Find functions within the specified file_path that call the target function
-                query = """
-                    MATCH (f:Function)-[:CALLS*]->(target:Function {name: $function_name, file_path: $file_path})
-                    RETURN DISTINCT f.name AS caller_name, f.file_path AS caller_file_path, f.line_number AS caller_line_number, f.is_dependency AS caller_is_dependency
-                    ORDER BY f.is_dependency ASC, f.file_path, f.line_number
-                    LIMIT 50
-                """
-                result = session.run(query, function_name=function_name, file_path=file_path)
-            else:
-                # If no file_path (context) is provided, find all callers of the function by name
-                query = """
-                    MATCH (f:Function)-[:CALLS*]->(target:Function {name: $function_name})
-                    RETURN DISTINCT f.name AS caller_name, f.file_path AS caller_file_path, f.line_number AS caller_line_number, f.is_dependency AS caller_is_dependency
-                    ORDER BY f.is_dependency ASC, f.file_path, f.line_number
-                    LIMIT 50
-                """
-                result = session.run(query, function_name=function_name)
-            return result.data()
+            rows = {row.pop("node_id"): row for row in session.run(f"""
+                UNWIND $ids AS node_id
+                MATCH (func) WHERE {id_function}(func) = node_id
+                OPTIONAL MATCH (file:File)-[:CONTAINS]->(func)
+                RETURN node_id, func.name as function_name, func.file_path as file_path,
+                    func.line_number as line_number, func.docstring as docstring,
+                    func.context as context, func.caller_count as caller_count, file.name as file_name
+            """, ids=node_ids).data()}
+        return [rows[node_id] for node_id in node_ids if node_id in rows]
+
+    def _id_function(self) -> str:
+        """The Cypher function giving a node's id: Neo4j deprecates id() in favour of elementId()."""
+        return 'elementId' if self.db_manager.get_backend_type() == 'neo4j' else 'id'
+
+    def _function_ids(self, session, function_name: str, file_path: Optional[str]) -> List:
+        """The ids of the functions called `function_name`, in `file_path` if given."""
+        file_filter = ", file_path: $file_path" if file_path else ""
+        return [record["node_id"] for record in session.run(
+            f"MATCH (n:Function {{name: $function_name{file_filter}}}) RETURN {self._id_function()}(n) AS node_id",
+            function_name=function_name, file_path=file_path).data()]
+
+    def find_all_callers(self, function_name: str, file_path: str = None,
+                         max_depth: int = DEFAULT_TRAVERSAL_DEPTH, limit: int = 50) -> List[Dict]:
+        """Find the direct and indirect callers of a function, nearest first, at most `max_depth` calls away."""
+        return self._transitive_calls(function_name, file_path, "in", "caller", max_depth, limit)
+
+    def find_all_callees(self, function_name: str, file_path: str = None,
+                         max_depth: int = DEFAULT_TRAVERSAL_DEPTH, limit: int = 50) -> List[Dict]:
+        """Find the direct and indirect callees of a function, nearest first, at most `max_depth` calls away."""
+        return self._transitive_calls(function_name, file_path, "out", "callee", max_depth, limit)
 
-    def find_all_callees(self, function_name: str, file_path: str = None) -> List[Dict]:
-        """Find all direct and indirect callees of a specific function."""
+    def _transitive_calls(self, function_name: str, file_path: Optional[str], direction: str,
+                          prefix: str, max_depth: int, limit: int) -> List[Dict]:
+        """
+        Level-synchronous BFS along CALLS edges. Each level is one query that
+        fetches the unvisited neighbours of the whole frontier, so a function is
+        expanded once however many paths reach it (unlike `[:CALLS*]`, which
+        enumerates every path), and the walk stops at `max_depth` or as soon as
+        `limit` functions are found. Rows are ordered by, and carry, the `depth`
+        at which each function was first reached.
+        """
+        if self.use_snapshot:
+            return self._snapshot_transitive_calls(function_name, file_path, direction, prefix, max_depth, limit)
+        id_function = self._id_function()
+        step = "(f:Function)-[:CALLS]->(n)" if direction == "in" else "(n)-[:CALLS]->(f:Function)"
+        level_query = f"""
+            UNWIND $frontier AS node_id
+            MATCH {step}
+            WHERE {id_function}(n) = node_id AND NOT {id_function}(f) IN $seen
+            WITH DISTINCT f
+            RETURN {id_function}(f) AS node_id, f.name AS {prefix}_name, f.file_path AS {prefix}_file_path,
+                f.line_number AS {prefix}_line_number, f.is_dependency AS {prefix}_is_dependency
+            ORDER BY f.is_dependency ASC, f.file_path, f.line_number
+            LIMIT $remaining
+        """
+
+        results = []
         with self.driver.session() as session:
-            if file_path:
-                query = """
-                    MATCH (caller:Function {name: $function_name, file_path: $file_path})
-                    MATCH (caller)-[:CALLS*]->(f:Function)
-                    RETURN DISTINCT f.name AS callee_name, f.file_path AS callee_file_path, f.line_number AS callee_line_number, f.is_dependency AS callee_is_dependency
-                    ORDER BY f.is_dependency ASC, f.file_path, f.line_number
-                    LIMIT 50
-                """
-                result = session.run(query, function_name=function_name, file_path=file_path)
-            else:
-                query = """
-                    MATCH (caller:Function {name: $function_name})
-                    MATCH (caller)-[:CALLS*]->(f:Function)
-                    RETURN DISTINCT f.name AS callee_name, f.file_path AS callee_file_path, f.line_number AS callee_line_number, f.is_dependency AS callee_is_dependency
-                    ORDER BY f.is_dependency ASC, f.file_path, f.line_number
-                    LIMIT 50
-                """
-                result = session.run(query, function_name=function_name)
-            return result.data()
+            frontier = self._function_ids(session, function_name, file_path)
+            # Start functions are not marked seen: one that a cycle leads back to is its own caller.
+            seen = []
+            depth = 0
+            while frontier and depth < max_depth and len(results) < limit:
+                depth += 1
+                rows = session.run(level_query, frontier=frontier, seen=seen, remaining=limit - len(results)).data()
+                frontier = [row.pop("node_id") for row in rows]
+                seen.extend(frontier)
+                results.extend({**row, "depth": depth} for row in rows)
+        return results
+
+    def _snapshot_transitive_calls(self, function_name: str, file_path: Optional[str], direction: str,
+                                   prefix: str, max_depth: int, limit: int) -> List[Dict]:
+        """`_transitive_calls` over the graph snapshot, with the same per-level order and limit."""
+        snapshot = self.graph_snapshot()
+        starts = snapshot.find(function_name, "Function", file_path)
+        results = []
+        levels = snapshot.bfs_levels(starts, "CALLS", direction, max_depth, label="Function")
+        for depth, level in enumerate(levels, start=1):
+            if len(results) >= limit:
+                break
+            level.sort(key=snapshot.location)
+            del level[limit - len(results):]
+            results.extend({
+                f"{prefix}_name": snapshot.names[node],
+                f"{prefix}_file_path": snapshot.paths[node],
+                f"{prefix}_line_number": snapshot.lines[node] or None,
+                f"{prefix}_is_dependency": bool(snapshot.dependency[node]),
+                "depth": depth,
+            } for node in level)
+        return results
 
     def find_function_call_chain(self, start_function: str, end_function: str, max_depth: int = 5, start_file: str = None, end_file: str = None) -> List[Dict]:
-        """Find call chains between two functions"""
+        """
+        Find the shortest call chains (at most 20) between two functions, by a
+        bidirectional BFS over batched edge lookups (see call_chains.py), so
+        long depths stay cheap on large graphs.
+        """
+        id_function = self._id_function()
         with self.driver.session() as session:
-            # Build match clauses based on whether files are specified
-            start_props = "{name: $start_function" + (", file_path: $start_file}" if start_file else "}")
-            end_props = "{name: $end_function" + (", file_path: $end_file}" if end_file else "}")
+            starts = self._function_ids(session, start_function, start_file)
+            ends = self._function_ids(session, end_function, end_file)
 
-            query = f"""
-                MATCH (start:Function {start_props}), (end:Function {end_props})
-                WITH start, end
-                MATCH path = (start)-[:CALLS*1..{max_depth}]->(end)
-                WHERE path IS NOT NULL
-                WITH path, nodes(path) as func_nodes, relationships(path) as call_rels
-                RETURN 
-                    [node in func_nodes | {{
-                        name: node.name,
-                        file_path: node.file_path,
-                        line_number: node.line_number,
-                        is_dependency: node.is_dependency
-                    }}] as function_chain,
-                    [rel in call_rels | {{
-                        call_line: rel.line_number,
-                        args: rel.args,
-                        full_call_name: rel.full_call_name
-                    }}] as call_details,
-                    length(path) as chain_length
-                ORDER BY chain_length ASC
-                LIMIT 20
-            """
-            
-            # Prepare parameters
-            params = {
-                "start_function": start_function,
-                "end_function": end_function,
-                "start_file": start_file,
-                "end_file": end_file
-            }
-            
-            result = session.run(query, **params)
-            return result.data()
+            def fetch_edges(ids, direction):
+                step = "(n)-[r:CALLS]->(f:Function)" if direction == "out" else "(f:Function)-[r:CALLS]->(n)"
+                ends_of = "node_id AS src, {0}(f) AS dst" if direction == "out" else "{0}(f) AS src, node_id AS dst"
+                rows = session.run(f"""
+                    UNWIND $ids AS node_id
+                    MATCH {step}
+                    WHERE {id_function}(n) = node_id
+                    RETURN {ends_of.format(id_function)}, r.line_number AS line_number,
+                        r.args AS args, r.full_call_name AS full_call_name
+                """, ids=ids).data()
+                return [(row.pop("src"), row.pop("dst"), row) for row in rows]
+
+            chains = shortest_call_chains(starts, ends, fetch_edges, max_depth, limit=20)
+            node_ids = list({node_id for nodes, _ in chains for node_id in nodes})
+            functions = {row.pop("node_id"): row for row in session.run(f"""
+                UNWIND $ids AS node_id
+                MATCH (n) WHERE {id_function}(n) = node_id
+                RETURN node_id, n.name AS name, n.file_path AS file_path,
+                    n.line_number AS line_number, n.is_dependency AS is_dependency
+            """, ids=node_ids).data()} if node_ids else {}
+
+        return [{
+            "function_chain": [functions[node_id] for node_id in nodes],
+            "call_details": [call_detail(props) for props in calls],
+            "chain_length": len(calls),
+        } for nodes, calls in chains]
 
-    def find_by_type(self, element_type: str, limit: int = 50) -> List[Dict]:
+    def find_by_type(self, element_type: str, limit: int = 50, cursor: Optional[str] = None) -> Page:
         """Find all elements of a specific type (Function, Class, File, Module)."""
         # Map input type to node label
         type_map = {
@@ -594,33 +837,75 @@ class CodeFinder:
         label = type_map.get(element_type.lower())
         
         if not label:
-            return []
+            return Page()
             
         with self.driver.session() as session:
             if label == "File":
-                query = f"""
+                query, key_count = """
                     MATCH (n:File)
-                    RETURN n.name as name, n.path as file_path, n.is_dependency as is_dependency
-                    ORDER BY n.path
-                    LIMIT $limit
-                """
+                    WITH n, [n.path] AS sort_keys
+                    WHERE {keyset}
+                    RETURN n.name as name, n.path as file_path, n.is_dependency as is_dependency, sort_keys
+                    ORDER BY {order}
+                    LIMIT $page_size
+                """, 1
             elif label == "Module":
-                query = f"""
+                query, key_count = """
                     MATCH (n:Module)
-                    RETURN n.name as name, n.name as file_path, false as is_dependency
-                    ORDER BY n.name
-                    LIMIT $limit
-                """
+                    WITH n, [n.name] AS sort_keys
+                    WHERE {keyset}
+                    RETURN n.name as name, n.name as file_path, false as is_dependency, sort_keys
+                    ORDER BY {order}
+                    LIMIT $page_size
+                """, 1
             else:
-                query = f"""
+                query, key_count = f"""
                     MATCH (n:{label})
-                    RETURN n.name as name, n.file_path as file_path, n.line_number as line_number, n.is_dependency as is_dependency
-                    ORDER BY n.is_dependency ASC, n.name
-                    LIMIT $limit
-                """
+                    WITH n, [CASE WHEN n.is_dependency THEN 1 ELSE 0 END, n.name,
+                             coalesce(n.file_path, ''), coalesce(n.line_number, 0)] AS sort_keys
+                    WHERE {{keyset}}
+                    RETURN n.name as name, n.file_path as file_path, n.line_number as line_number, n.is_dependency as is_dependency,
+                           sort_keys
+                    ORDER BY {{order}}
+                    LIMIT $page_size
+                """, 4
             
-            result = session.run(query, limit=limit)
-            return result.data()
+            return self._run_page(session, query, key_count, limit, cursor)
+
+    def find_files_by_name(self, name: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+        """Find files by exact file name."""
+        with self.driver.session() as session:
+            return self._run_page(session, """
+                MATCH (n:File {name: $name})
+                WITH n, [CASE WHEN n.is_dependency THEN 1 ELSE 0 END, n.path] AS sort_keys
+                WHERE {keyset}
+                RETURN n.name as name, n.path as file_path, n.is_dependency as is_dependency, sort_keys
+                ORDER BY {order}
+                LIMIT $page_size
+            """, 2, limit, cursor, name=name)
+
+    def find_by_name_pattern(self, pattern: str, case_sensitive: bool = False, limit: int = 50,
+                             cursor: Optional[str] = None) -> Page:
+        """Find functions, classes, modules and variables whose name contains `pattern`."""
+        name_filter = ("toLower(n.name) CONTAINS toLower($pattern)" if not case_sensitive
+                       else "n.name CONTAINS $pattern")
+        with self.driver.session() as session:
+            return self._run_page(session, f"""
+                MATCH (n)
+                WHERE (n:Function OR n:Class OR n:Module OR n:Variable) AND {name_filter}
+                WITH n, [CASE WHEN n.is_dependency THEN 1 ELSE 0 END, n.name, coalesce(n.file_path, ''),
+                         coalesce(n.line_number, 0), labels(n)[0]] AS sort_keys
+                WHERE {{keyset}}
+                RETURN
+                    labels(n)[0] as type,
+                    n.name as name,
+                    n.file_path as file_path,
+                    n.line_number as line_number,
+                    n.is_dependency as is_dependency,
+                    sort_keys
+                ORDER BY {{order}}
+                LIMIT $page_size
+            """, 5, limit, cursor, pattern=pattern)
     
     def find_module_dependencies(self, module_name: str) -> Dict[str, Any]:
         """Find all dependencies and dependents of a module"""
@@ -717,50 +1002,64 @@ class CodeFinder:
                 "instances": [dict(record) for record in variable_instances]
             }
     
-    def analyze_code_relationships(self, query_type: str, target: str, context: str = None) -> Dict[str, Any]:
-        """Main method to analyze different types of code relationships with fixed return types"""
+    def analyze_code_relationships(self, query_type: str, target: str, context: str = None, max_depth: int = None,
+                                   limit: int = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Main method to analyze different types of code relationships with fixed return types.
+        The listing query types return up to `limit` results and a `next_cursor`
+        to pass back as `cursor` for the next page.
+        """
         query_type = query_type.lower().strip()
+        page_size = limit or PAGE_SIZE
         
         try:
+            if limit is not None:
+                check_limit(limit)
             if query_type == "find_callers":
-                results = self.who_calls_function(target, context)
+                results = self.who_calls_function(target, context, page_size, cursor)
                 return {
                     "query_type": "find_callers", "target": target, "context": context, "results": results,
+                    "next_cursor": results.next_cursor,
                     "summary": f"Found {len(results)} functions that call '{target}'"
                 }
             
             elif query_type == "find_callees":
-                results = self.what_does_function_call(target, context)
+                results = self.what_does_function_call(target, context, page_size, cursor)
                 return {
                     "query_type": "find_callees", "target": target, "context": context, "results": results,
+                    "next_cursor": results.next_cursor,
                     "summary": f"Function '{target}' calls {len(results)} other functions"
                 }
                 
             elif query_type == "find_importers":
-                results = self.who_imports_module(target)
+                results = self.who_imports_module(target, page_size, cursor)
                 return {
                     "query_type": "find_importers", "target": target, "results": results,
+                    "next_cursor": results.next_cursor,
                     "summary": f"Found {len(results)} files that import '{target}'"
                 }
                 
             elif query_type == "find_functions_by_argument":
-                results = self.find_functions_by_argument(target, context)
+                results = self.find_functions_by_argument(target, context, page_size, cursor)
                 return {
                     "query_type": "find_functions_by_argument", "target": target, "context": context, "results": results,
+                    "next_cursor": results.next_cursor,
                     "summary": f"Found {len(results)} functions that take '{target}' as an argument"
                 }
             
             elif query_type == "find_functions_by_decorator":
-                results = self.find_functions_by_decorator(target, context)
+                results = self.find_functions_by_decorator(target, context, page_size, cursor)
                 return {
                     "query_type": "find_functions_by_decorator", "target": target, "context": context, "results": results,
+                    "next_cursor": results.next_cursor,
                     "summary": f"Found {len(results)} functions decorated with '{target}'"
                 }
                 
             elif query_type in ["who_modifies", "modifies", "mutations", "changes", "variable_usage"]:
-                results = self.who_modifies_variable(target)
+                results = self.who_modifies_variable(target, page_size, cursor)
                 return {
                     "query_type": "who_modifies", "target": target, "results": results,
+                    "next_cursor": results.next_cursor,
                     "summary": f"Found {len(results)} containers that hold variable '{target}'"
                 }
             
@@ -772,16 +1071,17 @@ class CodeFinder:
                 }
             
             elif query_type in ["overrides", "implementations", "polymorphism"]:
-                results = self.find_function_overrides(target)
+                results = self.find_function_overrides(target, page_size, cursor)
                 return {
                     "query_type": "overrides", "target": target, "results": results,
+                    "next_cursor": results.next_cursor,
                     "summary": f"Found {len(results)} implementations of function '{target}'"
                 }
             
             elif query_type in ["dead_code", "unused", "unreachable"]:
-                results = self.find_dead_code()
+                results = self.find_dead_code(limit=limit or DEAD_CODE_PAGE_SIZE, cursor=cursor)
                 return {
-                    "query_type": "dead_code", "results": results,
+                    "query_type": "dead_code", "results": results, "next_cursor": results["next_cursor"],
                     "summary": f"Found {len(results['potentially_unused_functions'])} potentially unused functions"
                 }
             
@@ -794,24 +1094,27 @@ class CodeFinder:
                 }
             
             elif query_type == "find_all_callers":
-                results = self.find_all_callers(target, context)
+                depth = max_depth or DEFAULT_TRAVERSAL_DEPTH
+                results = self.find_all_callers(target, context, depth)
                 return {
                     "query_type": "find_all_callers", "target": target, "context": context, "results": results,
-                    "summary": f"Found {len(results)} direct and indirect callers of '{target}'"
+                    "summary": f"Found {len(results)} direct and indirect callers of '{target}' (max depth: {depth})"
                 }
 
             elif query_type == "find_all_callees":
-                results = self.find_all_callees(target, context)
+                depth = max_depth or DEFAULT_TRAVERSAL_DEPTH
+                results = self.find_all_callees(target, context, depth)
                 return {
                     "query_type": "find_all_callees", "target": target, "context": context, "results": results,
-                    "summary": f"Found {len(results)} direct and indirect callees of '{target}'"
+                    "summary": f"Found {len(results)} direct and indirect callees of '{target}' (max depth: {depth})"
                 }
                 
             elif query_type in ["call_chain", "path", "chain"]:
                 if '->' in target:
                     start_func, end_func = target.split('->', 1)
-                    # max_depth can be passed as context, default to 5 if not provided or invalid
-                    max_depth = int(context) if context and context.isdigit() else 5
+                    # max_depth can also be passed as context, default to 5 if not provided or invalid
+                    if not max_depth:
+                        max_depth = int(context) if context and context.isdigit() else 5
                     results = self.find_function_call_chain(start_func.strip(), end_func.strip(), max_depth)
                     return {
                         "query_type": "call_chain", "target": target, "results": results,
@@ -827,7 +1130,7 @@ class CodeFinder:
                 results = self.find_module_dependencies(target)
                 return {
                     "query_type": "module_dependencies", "target": target, "results": results,
-                    "summary": f"Module '{target}' is imported by {len(results['imported_by_files'])} files"
+                    "summary": f"Module '{target}' is imported by {len(results['importers'])} files"
                 }
             
             elif query_type in ["variable_scope", "var_scope", "variable_usage_scope"]:
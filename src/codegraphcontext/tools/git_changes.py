@@ -0,0 +1,78 @@
+# src/codegraphcontext/tools/git_changes.py
+"""
+Git-based change detection for re-indexing.
+
+When a repository is indexed, the commit it was checked out at (and the files
+that had uncommitted changes) is recorded on its Repository node. Later, git
+itself can tell which files differ from that state, so only those have to be
+parsed and re-linked, even when no filesystem watcher was running (e.g. after
+a `git pull` in CI).
+"""
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..utils.debug_log import debug_log, warning_logger
+
+ADDED, MODIFIED, DELETED = "A", "M", "D"
+
+GIT_TIMEOUT_SECONDS = 60
+
+
+def _git(repo_path: Path, *args: str) -> Optional[str]:
+    """Runs a git command in `repo_path` and returns its output, or None if it failed."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo_path), *args],
+            capture_output=True, text=True, timeout=GIT_TIMEOUT_SECONDS,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+        debug_log(f"git {' '.join(args)} failed in {repo_path}: {e}")
+        return None
+    if result.returncode != 0:
+        debug_log(f"git {' '.join(args)} failed in {repo_path}: {result.stderr.strip()}")
+        return None
+    return result.stdout
+
+
+def _split_z(output: str) -> List[str]:
+    return [part for part in output.split("\0") if part]
+
+
+def head_commit(repo_path: Path) -> Optional[str]:
+    """The SHA of the commit checked out in `repo_path`, or None if it is not a git work tree."""
+    output = _git(repo_path, "rev-parse", "--verify", "HEAD")
+    return output.strip() if output else None
+
+
+def dirty_files(repo_path: Path) -> List[str]:
+    """Paths (relative to `repo_path`) with uncommitted changes, including untracked files."""
+    changed = _git(repo_path, "diff", "--name-only", "--no-renames", "--relative", "-z", "HEAD") or ""
+    untracked = _git(repo_path, "ls-files", "--others", "--exclude-standard", "-z") or ""
+    return sorted(set(_split_z(changed)) | set(_split_z(untracked)))
+
+
+def changed_files_since(repo_path: Path, commit: str) -> Optional[Dict[Path, str]]:
+    """
+    The files under `repo_path` whose working-tree contents differ from `commit`,
+    mapped to ADDED, MODIFIED or DELETED. Renames are reported as a deletion and
+    an addition. Untracked files count as added.
+
+    Returns None if git cannot answer (not a repository, unknown commit, ...).
+    """
+    if _git(repo_path, "cat-file", "-e", f"{commit}^{{commit}}") is None:
+        warning_logger(f"Commit {commit} is not known in {repo_path}")
+        return None
+    output = _git(repo_path, "diff", "--name-status", "--no-renames", "--relative", "-z", commit)
+    untracked = _git(repo_path, "ls-files", "--others", "--exclude-standard", "-z")
+    if output is None or untracked is None:
+        return None
+
+    changes: Dict[Path, str] = {}
+    parts = _split_z(output)
+    for status, rel_path in zip(parts[0::2], parts[1::2]):
+        kind = status[0]
+        changes[repo_path / rel_path] = kind if kind in (ADDED, DELETED) else MODIFIED
+    for rel_path in _split_z(untracked):
+        changes[repo_path / rel_path] = ADDED
+    return changes
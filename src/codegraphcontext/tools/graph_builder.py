@@ -1,19 +1,29 @@
 
 # src/codegraphcontext/tools/graph_builder.py
 import asyncio
-import pathspec
+import contextlib
+import threading
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Coroutine, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, Optional, Tuple
 from datetime import datetime
 
-from ..core.database import DatabaseManager
+from ..core.graph_schema import SET_CALLER_COUNTS
 from ..core.jobs import JobManager, JobStatus
+from ..core.result_cache import bumps_generation
 from ..utils.debug_log import debug_log, info_logger, error_logger, warning_logger
 
 # New imports for tree-sitter (using tree-sitter-language-pack)
 from tree_sitter import Language, Parser
-from ..utils.tree_sitter_manager import get_tree_sitter_manager
+from ..utils.tree_sitter_manager import IncrementalParser, ParseSnapshot, get_tree_sitter_manager
 from ..cli.config_manager import get_config_value
+from .symbol_diff import SYMBOL_LABELS, FileSymbolDiff
+from .symbol_table import SymbolTable, SymbolTableStore, referenced_names
+from . import git_changes
+from .ignore_rules import IgnoreRules
+
+if TYPE_CHECKING:
+    from ..core.database import DatabaseManager
 
 
 class TreeSitterParser:
@@ -25,8 +35,9 @@ class TreeSitterParser:
         
         # Get the language (cached) and create a new parser for this instance
         self.language: Language = self.ts_manager.get_language_safe(language_name)
-        # In tree-sitter 0.25+, Parser takes language in constructor
-        self.parser = Parser(self.language)
+        # In tree-sitter 0.25+, Parser takes language in constructor.
+        # The wrapper lets the watcher reparse files incrementally.
+        self.parser = IncrementalParser(Parser(self.language))
 
         self.language_specific_parser = None
         if self.language_name == 'python':
@@ -84,85 +95,113 @@ class TreeSitterParser:
         else:
             raise NotImplementedError(f"No language-specific parser implemented for {self.language_name}")
 
+
+# Maps every supported file extension to the tree-sitter language that parses it.
+EXTENSION_LANGUAGES = {
+    '.py': 'python',
+    '.ipynb': 'python',
+    '.js': 'javascript',
+    '.jsx': 'javascript',
+    '.mjs': 'javascript',
+    '.cjs': 'javascript',
+    '.go': 'go',
+    '.ts': 'typescript',
+    '.tsx': 'typescript',
+    '.cpp': 'cpp',
+    '.h': 'cpp',
+    '.hpp': 'cpp',
+    '.rs': 'rust',
+    '.c': 'c',
+    # '.h': 'c', # Need to write an algo for distinguishing C vs C++ headers
+    '.java': 'java',
+    '.rb': 'ruby',
+    '.cs': 'c_sharp',
+    '.php': 'php',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.sc': 'scala',
+    '.swift': 'swift',
+    '.hs': 'haskell',
+}
+
+
+class ParserRegistry(Mapping):
+    """
+    Read-only mapping of file extension -> TreeSitterParser.
+
+    Parsers (and the language modules behind them) are only created the first
+    time an extension is looked up, so commands that never parse a file don't
+    pay for loading every grammar.
+    """
+
+    def __init__(self, extension_languages: Dict[str, str] = EXTENSION_LANGUAGES):
+        self._extension_languages = dict(extension_languages)
+        self._parsers: Dict[str, TreeSitterParser] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, extension: str) -> TreeSitterParser:
+        parser = self._parsers.get(extension)
+        if parser is not None:
+            return parser
+        if extension not in self._extension_languages:
+            raise KeyError(extension)
+        with self._lock:
+            if extension not in self._parsers:
+                self._parsers[extension] = TreeSitterParser(self._extension_languages[extension])
+            return self._parsers[extension]
+
+    def __contains__(self, extension) -> bool:
+        # Membership checks must not trigger parser construction.
+        return extension in self._extension_languages
+
+    def __iter__(self):
+        return iter(self._extension_languages)
+
+    def __len__(self) -> int:
+        return len(self._extension_languages)
+
+
 class GraphBuilder:
     """Module for building and managing the Neo4j code graph."""
 
-    def __init__(self, db_manager: DatabaseManager, job_manager: JobManager, loop: asyncio.AbstractEventLoop):
+    # The methods that write to the graph. Each bumps the graph generation when
+    # it returns, invalidating CodeFinder's cached results (see core/result_cache.py);
+    # the indexing, update and watcher paths all write through them.
+    WRITE_METHODS = (
+        'add_repository_to_graph', 'add_file_to_graph', 'relink_file',
+        '_create_all_function_calls', '_create_all_inheritance_links',
+        'delete_file_from_graph', 'delete_repository_from_graph',
+        'record_indexed_commit', 'apply_symbol_diff',
+    )
+
+    def __init__(self, db_manager: "DatabaseManager", job_manager: JobManager, loop: asyncio.AbstractEventLoop):
         self.db_manager = db_manager
         self.job_manager = job_manager
         self.loop = loop
         self.driver = self.db_manager.get_driver()
-        self.parsers = {
-            '.py': TreeSitterParser('python'),
-            '.ipynb': TreeSitterParser('python'),
-            '.js': TreeSitterParser('javascript'),
-            '.jsx': TreeSitterParser('javascript'),
-            '.mjs': TreeSitterParser('javascript'),
-            '.cjs': TreeSitterParser('javascript'),
-            '.go': TreeSitterParser('go'),
-            '.ts': TreeSitterParser('typescript'),
-            '.tsx': TreeSitterParser('typescript'),
-            '.cpp': TreeSitterParser('cpp'),
-            '.h': TreeSitterParser('cpp'),
-            '.hpp': TreeSitterParser('cpp'),
-            '.rs': TreeSitterParser('rust'),
-            '.c': TreeSitterParser('c'),
-            # '.h': TreeSitterParser('c'), # Need to write an algo for distinguishing C vs C++ headers
-            '.java': TreeSitterParser('java'),
-            '.rb': TreeSitterParser('ruby'),
-            '.java': TreeSitterParser('java'),
-            '.rb': TreeSitterParser('ruby'),
-            '.cs': TreeSitterParser('c_sharp'),
-            '.php': TreeSitterParser('php'),
-            '.kt': TreeSitterParser('kotlin'),
-            '.scala': TreeSitterParser('scala'),
-            '.sc': TreeSitterParser('scala'),
-            '.swift': TreeSitterParser('swift'),
-            '.hs': TreeSitterParser('haskell'),
-        }
+        self.parsers = ParserRegistry()
+        self.symbol_store = SymbolTableStore()
+        for name in self.WRITE_METHODS:
+            setattr(self, name, bumps_generation(getattr(self, name)))
         self.create_schema()
 
-    # A general schema creation based on common features across languages
     def create_schema(self):
-        """Create constraints and indexes in Neo4j."""
-        # When adding a new node type with a unique key, add its constraint here.
-        with self.driver.session() as session:
-            try:
-                session.run("CREATE CONSTRAINT repository_path IF NOT EXISTS FOR (r:Repository) REQUIRE r.path IS UNIQUE")
-                session.run("CREATE CONSTRAINT file_path IF NOT EXISTS FOR (f:File) REQUIRE f.path IS UNIQUE")
-                session.run("CREATE CONSTRAINT directory_path IF NOT EXISTS FOR (d:Directory) REQUIRE d.path IS UNIQUE")
-                session.run("CREATE CONSTRAINT function_unique IF NOT EXISTS FOR (f:Function) REQUIRE (f.name, f.file_path, f.line_number) IS UNIQUE")
-                session.run("CREATE CONSTRAINT class_unique IF NOT EXISTS FOR (c:Class) REQUIRE (c.name, c.file_path, c.line_number) IS UNIQUE")
-                session.run("CREATE CONSTRAINT trait_unique IF NOT EXISTS FOR (t:Trait) REQUIRE (t.name, t.file_path, t.line_number) IS UNIQUE") # Added trait constraint
-                session.run("CREATE CONSTRAINT interface_unique IF NOT EXISTS FOR (i:Interface) REQUIRE (i.name, i.file_path, i.line_number) IS UNIQUE")
-                session.run("CREATE CONSTRAINT macro_unique IF NOT EXISTS FOR (m:Macro) REQUIRE (m.name, m.file_path, m.line_number) IS UNIQUE")
-                session.run("CREATE CONSTRAINT variable_unique IF NOT EXISTS FOR (v:Variable) REQUIRE (v.name, v.file_path, v.line_number) IS UNIQUE")
-                session.run("CREATE CONSTRAINT module_name IF NOT EXISTS FOR (m:Module) REQUIRE m.name IS UNIQUE")
-                session.run("CREATE CONSTRAINT struct_cpp IF NOT EXISTS FOR (cstruct: Struct) REQUIRE (cstruct.name, cstruct.file_path, cstruct.line_number) IS UNIQUE")
-                session.run("CREATE CONSTRAINT enum_cpp IF NOT EXISTS FOR (cenum: Enum) REQUIRE (cenum.name, cenum.file_path, cenum.line_number) IS UNIQUE")
-                session.run("CREATE CONSTRAINT union_cpp IF NOT EXISTS FOR (cunion: Union) REQUIRE (cunion.name, cunion.file_path, cunion.line_number) IS UNIQUE")
-                session.run("CREATE CONSTRAINT annotation_unique IF NOT EXISTS FOR (a:Annotation) REQUIRE (a.name, a.file_path, a.line_number) IS UNIQUE")
-                session.run("CREATE CONSTRAINT record_unique IF NOT EXISTS FOR (r:Record) REQUIRE (r.name, r.file_path, r.line_number) IS UNIQUE")
-                session.run("CREATE CONSTRAINT property_unique IF NOT EXISTS FOR (p:Property) REQUIRE (p.name, p.file_path, p.line_number) IS UNIQUE")
-                
-                # Indexes for language attribute
-                session.run("CREATE INDEX function_lang IF NOT EXISTS FOR (f:Function) ON (f.lang)")
-                session.run("CREATE INDEX class_lang IF NOT EXISTS FOR (c:Class) ON (c.lang)")
-                session.run("CREATE INDEX annotation_lang IF NOT EXISTS FOR (a:Annotation) ON (a.lang)")
-                session.run("""
-                    CREATE FULLTEXT INDEX code_search_index IF NOT EXISTS 
-                    FOR (n:Function|Class|Variable) 
-                    ON EACH [n.name, coalesce(n.source, ''), coalesce(n.docstring, '')]
-                """ )
-                
-                info_logger("Database schema verified/created successfully")
-            except Exception as e:
-                warning_logger(f"Schema creation warning: {e}")
+        """
+        Brings the database schema (constraints, range and full-text indexes) up
+        to date. The graph records its schema version, so once it is current
+        this costs a single query (see core/graph_schema.py).
+        """
+        from ..core.graph_schema import ensure_schema
+
+        try:
+            ensure_schema(self.driver, self.db_manager.get_backend_type())
+        except Exception as e:
+            warning_logger(f"Schema creation warning: {e}")
 
 
-    def _pre_scan_for_imports(self, files: list[Path]) -> dict:
-        """Dispatches pre-scan to the correct language-specific implementation."""
-        imports_map = {}
+    def _pre_scan_for_imports(self, files: list[Path]) -> SymbolTable:
+        """Dispatches pre-scan to the correct language-specific implementation and merges the results into a SymbolTable."""
+        symbol_table = SymbolTable()
         
         # Group files by language/extension
         files_by_lang = {}
@@ -175,69 +214,118 @@ class GraphBuilder:
 
         if '.py' in files_by_lang:
             from .languages import python as python_lang_module
-            imports_map.update(python_lang_module.pre_scan_python(files_by_lang['.py'], self.parsers['.py']))
+            symbol_table.update(python_lang_module.pre_scan_python(files_by_lang['.py'], self.parsers['.py']))
         if '.ipynb' in files_by_lang:
             from .languages import python as python_lang_module
-            imports_map.update(python_lang_module.pre_scan_python(files_by_lang['.ipynb'], self.parsers['.ipynb']))
+            symbol_table.update(python_lang_module.pre_scan_python(files_by_lang['.ipynb'], self.parsers['.ipynb']))
         if '.js' in files_by_lang:
             from .languages import javascript as js_lang_module
-            imports_map.update(js_lang_module.pre_scan_javascript(files_by_lang['.js'], self.parsers['.js']))
+            symbol_table.update(js_lang_module.pre_scan_javascript(files_by_lang['.js'], self.parsers['.js']))
         if '.jsx' in files_by_lang:
             from .languages import javascript as js_lang_module
-            imports_map.update(js_lang_module.pre_scan_javascript(files_by_lang['.jsx'], self.parsers['.jsx']))
+            symbol_table.update(js_lang_module.pre_scan_javascript(files_by_lang['.jsx'], self.parsers['.jsx']))
         if '.mjs' in files_by_lang:
             from .languages import javascript as js_lang_module
-            imports_map.update(js_lang_module.pre_scan_javascript(files_by_lang['.mjs'], self.parsers['.mjs']))
+            symbol_table.update(js_lang_module.pre_scan_javascript(files_by_lang['.mjs'], self.parsers['.mjs']))
         if '.cjs' in files_by_lang:
             from .languages import javascript as js_lang_module
-            imports_map.update(js_lang_module.pre_scan_javascript(files_by_lang['.cjs'], self.parsers['.cjs']))
+            symbol_table.update(js_lang_module.pre_scan_javascript(files_by_lang['.cjs'], self.parsers['.cjs']))
         if '.go' in files_by_lang:
              from .languages import go as go_lang_module
-             imports_map.update(go_lang_module.pre_scan_go(files_by_lang['.go'], self.parsers['.go']))
+             symbol_table.update(go_lang_module.pre_scan_go(files_by_lang['.go'], self.parsers['.go']))
         if '.ts' in files_by_lang:
             from .languages import typescript as ts_lang_module
-            imports_map.update(ts_lang_module.pre_scan_typescript(files_by_lang['.ts'], self.parsers['.ts']))
+            symbol_table.update(ts_lang_module.pre_scan_typescript(files_by_lang['.ts'], self.parsers['.ts']))
         if '.tsx' in files_by_lang:
             from .languages import typescriptjsx as tsx_lang_module
-            imports_map.update(tsx_lang_module.pre_scan_typescript(files_by_lang['.tsx'], self.parsers['.tsx']))
+            symbol_table.update(tsx_lang_module.pre_scan_typescript(files_by_lang['.tsx'], self.parsers['.tsx']))
         if '.cpp' in files_by_lang:
             from .languages import cpp as cpp_lang_module
-            imports_map.update(cpp_lang_module.pre_scan_cpp(files_by_lang['.cpp'], self.parsers['.cpp']))
+            symbol_table.update(cpp_lang_module.pre_scan_cpp(files_by_lang['.cpp'], self.parsers['.cpp']))
         if '.h' in files_by_lang:
             from .languages import cpp as cpp_lang_module
-            imports_map.update(cpp_lang_module.pre_scan_cpp(files_by_lang['.h'], self.parsers['.h']))
+            symbol_table.update(cpp_lang_module.pre_scan_cpp(files_by_lang['.h'], self.parsers['.h']))
         if '.hpp' in files_by_lang:
             from .languages import cpp as cpp_lang_module
-            imports_map.update(cpp_lang_module.pre_scan_cpp(files_by_lang['.hpp'], self.parsers['.hpp']))
+            symbol_table.update(cpp_lang_module.pre_scan_cpp(files_by_lang['.hpp'], self.parsers['.hpp']))
         if '.rs' in files_by_lang:
             from .languages import rust as rust_lang_module
-            imports_map.update(rust_lang_module.pre_scan_rust(files_by_lang['.rs'], self.parsers['.rs']))
+            symbol_table.update(rust_lang_module.pre_scan_rust(files_by_lang['.rs'], self.parsers['.rs']))
         if '.c' in files_by_lang:
             from .languages import c as c_lang_module
-            imports_map.update(c_lang_module.pre_scan_c(files_by_lang['.c'], self.parsers['.c']))
+            symbol_table.update(c_lang_module.pre_scan_c(files_by_lang['.c'], self.parsers['.c']))
         elif '.java' in files_by_lang:
             from .languages import java as java_lang_module
-            imports_map.update(java_lang_module.pre_scan_java(files_by_lang['.java'], self.parsers['.java']))
+            symbol_table.update(java_lang_module.pre_scan_java(files_by_lang['.java'], self.parsers['.java']))
         elif '.rb' in files_by_lang:
             from .languages import ruby as ruby_lang_module
-            imports_map.update(ruby_lang_module.pre_scan_ruby(files_by_lang['.rb'], self.parsers['.rb']))
+            symbol_table.update(ruby_lang_module.pre_scan_ruby(files_by_lang['.rb'], self.parsers['.rb']))
         elif '.cs' in files_by_lang:
             from .languages import csharp as csharp_lang_module
-            imports_map.update(csharp_lang_module.pre_scan_csharp(files_by_lang['.cs'], self.parsers['.cs']))
+            symbol_table.update(csharp_lang_module.pre_scan_csharp(files_by_lang['.cs'], self.parsers['.cs']))
         if '.kt' in files_by_lang:
             from .languages import kotlin as kotlin_lang_module
-            imports_map.update(kotlin_lang_module.pre_scan_kotlin(files_by_lang['.kt'], self.parsers['.kt']))
+            symbol_table.update(kotlin_lang_module.pre_scan_kotlin(files_by_lang['.kt'], self.parsers['.kt']))
         if '.scala' in files_by_lang:
             from .languages import scala as scala_lang_module
-            imports_map.update(scala_lang_module.pre_scan_scala(files_by_lang['.scala'], self.parsers['.scala']))
+            symbol_table.update(scala_lang_module.pre_scan_scala(files_by_lang['.scala'], self.parsers['.scala']))
         if '.sc' in files_by_lang:
             from .languages import scala as scala_lang_module
-            imports_map.update(scala_lang_module.pre_scan_scala(files_by_lang['.sc'], self.parsers['.sc']))
+            symbol_table.update(scala_lang_module.pre_scan_scala(files_by_lang['.sc'], self.parsers['.sc']))
         if '.swift' in files_by_lang:
             from .languages import swift as swift_lang_module
-            imports_map.update(swift_lang_module.pre_scan_swift(files_by_lang['.swift'], self.parsers['.swift']))
+            symbol_table.update(swift_lang_module.pre_scan_swift(files_by_lang['.swift'], self.parsers['.swift']))
             
-        return imports_map
+        return symbol_table
+
+    def update_symbol_table(self, symbol_table: SymbolTable, files: list[Path]):
+        """
+        Re-scans the definitions in `files` and replaces their entries in `symbol_table`.
+        Missing files are dropped. References are kept; they only change when a file is parsed.
+        """
+        stamps = {}
+        existing = []
+        for file in files:
+            path_str = str(file.resolve())
+            try:
+                stat = file.stat()
+            except OSError:
+                symbol_table.remove_file(path_str)
+                continue
+            symbol_table.clear_definitions(path_str)
+            stamps[path_str] = (stat.st_mtime_ns, stat.st_size)
+            existing.append(file)
+        if existing:
+            symbol_table.update(self._pre_scan_for_imports(existing))
+        for path_str, stamp in stamps.items():
+            symbol_table.set_stamp(path_str, stamp)
+
+    def load_symbol_table(self, repo_path: Path, files: list[Path], symbol_table: Optional[SymbolTable] = None) -> SymbolTable:
+        """
+        Returns the symbol table for a repository, reusing the persisted copy
+        (or `symbol_table`, if the caller already loaded it).
+        Only files that were added or changed since it was saved are pre-scanned again.
+        """
+        if symbol_table is None:
+            symbol_table = self.symbol_store.load(repo_path) or SymbolTable()
+
+        current = {}
+        for file in files:
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            current[str(file.resolve())] = (file, (stat.st_mtime_ns, stat.st_size))
+
+        for path_str in symbol_table.scanned_files():
+            if path_str not in current:
+                symbol_table.remove_file(path_str)
+        stale = [file for path_str, (file, stamp) in current.items() if symbol_table.stamp(path_str) != stamp]
+        if stale:
+            debug_log(f"Pre-scanning {len(stale)} of {len(current)} files for {repo_path}")
+            self.update_symbol_table(symbol_table, stale)
+        self.symbol_store.save(repo_path, symbol_table)
+        return symbol_table
 
     # Language-agnostic method
     def add_repository_to_graph(self, repo_path: Path, is_dependency: bool = False):
@@ -256,7 +344,7 @@ class GraphBuilder:
             )
 
     # First pass to add file and its contents
-    def add_file_to_graph(self, file_data: Dict, repo_name: str, imports_map: dict):
+    def add_file_to_graph(self, file_data: Dict, repo_name: str, symbol_table: SymbolTable):
         info_logger("Executing add_file_to_graph with my change!")
         """Adds a file and its contents within a single, unified session."""
         file_path_str = str(Path(file_data['file_path']).resolve())
@@ -305,45 +393,9 @@ class GraphBuilder:
             """, parent_path=parent_path, file_path=file_path_str)
 
             # CONTAINS relationships for functions, classes, and variables
-            # To add a new language-specific node type (e.g., 'Trait' for Rust):
-            # 1. Ensure your language-specific parser returns a list under a unique key (e.g., 'traits': [...] ).
-            # 2. Add a new constraint for the new label in the `create_schema` method.
-            # 3. Add a new entry to the `item_mappings` list below (e.g., (file_data.get('traits', []), 'Trait') ).
-            item_mappings = [
-                (file_data.get('functions', []), 'Function'),
-                (file_data.get('classes', []), 'Class'),
-                (file_data.get('traits', []), 'Trait'), # <-- Added trait mapping
-                (file_data.get('variables', []), 'Variable'),
-                (file_data.get('interfaces', []), 'Interface'),
-                (file_data.get('macros', []), 'Macro'),
-                (file_data.get('structs',[]), 'Struct'),
-                (file_data.get('enums',[]), 'Enum'),
-                (file_data.get('unions',[]), 'Union'),
-                (file_data.get('records',[]), 'Record'),
-                (file_data.get('properties',[]), 'Property'),
-            ]
-            for item_data, label in item_mappings:
-                for item in item_data:
-                    # Ensure cyclomatic_complexity is set for functions
-                    if label == 'Function' and 'cyclomatic_complexity' not in item:
-                        item['cyclomatic_complexity'] = 1 # Default value
-
-                    query = f"""
-                        MATCH (f:File {{path: $file_path}})
-                        MERGE (n:{label} {{name: $name, file_path: $file_path, line_number: $line_number}})
-                        SET n += $props
-                        MERGE (f)-[:CONTAINS]->(n)
-                    """
-
-                    session.run(query, file_path=file_path_str, name=item['name'], line_number=item['line_number'], props=item)
-                    
-                    if label == 'Function':
-                        for arg_name in item.get('args', []):
-                            session.run("""
-                                MATCH (fn:Function {name: $func_name, file_path: $file_path, line_number: $line_number})
-                                MERGE (p:Parameter {name: $arg_name, file_path: $file_path, function_line_number: $line_number})
-                                MERGE (fn)-[:HAS_PARAMETER]->(p)
-                            """, func_name=item['name'], file_path=file_path_str, line_number=item['line_number'], arg_name=arg_name)
+            for key, label in SYMBOL_LABELS:
+                for item in file_data.get(key, []):
+                    self._write_symbol(session, file_path_str, label, item)
 
             # --- NEW: persist Ruby Modules ---
             for m in file_data.get('modules', []):
@@ -353,14 +405,9 @@ class GraphBuilder:
                     ON MATCH  SET mod.lang = coalesce(mod.lang, $lang)
                 """, name=m["name"], lang=file_data.get("lang"))
 
-            # Create CONTAINS relationships for nested functions
+            # Create CONTAINS relationships for nested functions and methods
             for item in file_data.get('functions', []):
-                if item.get("context_type") == "function_definition":
-                    session.run("""
-                        MATCH (outer:Function {name: $context, file_path: $file_path})
-                        MATCH (inner:Function {name: $name, file_path: $file_path, line_number: $line_number})
-                        MERGE (outer)-[:CONTAINS]->(inner)
-                    """, context=item["context"], file_path=file_path_str, name=item["name"], line_number=item["line_number"])
+                self._link_function_to_parent(session, file_path_str, item)
 
             # Handle imports and create IMPORTS relationships
             for imp in file_data.get('imports', []):
@@ -407,36 +454,62 @@ class GraphBuilder:
                     """, file_path=file_path_str, rel_props=rel_props, **imp)
 
 
-            # Handle CONTAINS relationship between class to their children like variables
-            for func in file_data.get('functions', []):
-                if func.get('class_context'):
-                    session.run("""
-                        MATCH (c:Class {name: $class_name, file_path: $file_path})
-                        MATCH (fn:Function {name: $func_name, file_path: $file_path, line_number: $func_line})
-                        MERGE (c)-[:CONTAINS]->(fn)
-                    """, 
-                    class_name=func['class_context'],
-                    file_path=file_path_str,
-                    func_name=func['name'],
-                    func_line=func['line_number'])
-
             # --- NEW: Class INCLUDES Module (Ruby mixins) ---
-            for inc in file_data.get('module_inclusions', []):
-                session.run("""
-                    MATCH (c:Class {name: $class_name, file_path: $file_path})
-                    MERGE (m:Module {name: $module_name})
-                    MERGE (c)-[:INCLUDES]->(m)
-                """,
-                class_name=inc["class"],
-                file_path=file_path_str,
-                module_name=inc["module"])
+            self._create_module_inclusions(session, file_path_str, file_data.get('module_inclusions', []))
 
             # Class inheritance is handled in a separate pass after all files are processed.
             # Function calls are also handled in a separate pass after all files are processed.
 
+    def _write_symbol(self, session, file_path_str: str, label: str, item: Dict):
+        """Merges one symbol node (and a function's parameters) under its File."""
+        props = item
+        # Ensure cyclomatic_complexity is set for functions
+        if label == 'Function' and 'cyclomatic_complexity' not in item:
+            props = {**item, 'cyclomatic_complexity': 1} # Default value
+
+        query = f"""
+            MATCH (f:File {{path: $file_path}})
+            MERGE (n:{label} {{name: $name, file_path: $file_path, line_number: $line_number}})
+            SET n += $props
+            MERGE (f)-[:CONTAINS]->(n)
+        """
+
+        session.run(query, file_path=file_path_str, name=item['name'], line_number=item['line_number'], props=props)
+
+        if label == 'Function':
+            for arg_name in item.get('args', []):
+                session.run("""
+                    MATCH (fn:Function {name: $func_name, file_path: $file_path, line_number: $line_number})
+                    MERGE (p:Parameter {name: $arg_name, file_path: $file_path, function_line_number: $line_number})
+                    MERGE (fn)-[:HAS_PARAMETER]->(p)
+                """, func_name=item['name'], file_path=file_path_str, line_number=item['line_number'], arg_name=arg_name)
+
+    def _link_function_to_parent(self, session, file_path_str: str, item: Dict):
+        """Creates the CONTAINS edge from an enclosing function or class to a function."""
+        if item.get("context_type") == "function_definition":
+            session.run("""
+                MATCH (outer:Function {name: $context, file_path: $file_path})
+                MATCH (inner:Function {name: $name, file_path: $file_path, line_number: $line_number})
+                MERGE (outer)-[:CONTAINS]->(inner)
+            """, context=item["context"], file_path=file_path_str, name=item["name"], line_number=item["line_number"])
+
+        if item.get('class_context'):
+            session.run("""
+                MATCH (c:Class {name: $class_name, file_path: $file_path})
+                MATCH (fn:Function {name: $func_name, file_path: $file_path, line_number: $func_line})
+                MERGE (c)-[:CONTAINS]->(fn)
+            """,
+            class_name=item['class_context'],
+            file_path=file_path_str,
+            func_name=item['name'],
+            func_line=item['line_number'])
+
     # Second pass to create relationships that depend on all files being present like call functions and class inheritance
-    def _create_function_calls(self, session, file_data: Dict, imports_map: dict):
-        """Create CALLS relationships with a unified, prioritized logic flow for all call types."""
+    def _resolve_function_calls(self, file_data: Dict, symbol_table: SymbolTable):
+        """
+        Yields each call in `file_data` with the path of the file its target
+        resolves to, using a unified, prioritized logic flow for all call types.
+        """
         caller_file_path = str(Path(file_data['file_path']).resolve())
         local_names = {f['name'] for f in file_data.get('functions', [])} | \
                       {c['name'] for c in file_data.get('classes', [])}
@@ -472,69 +545,39 @@ class GraphBuilder:
             
             # 2. Check inferred type if available
             elif call.get('inferred_obj_type'):
-                obj_type = call['inferred_obj_type']
-                possible_paths = imports_map.get(obj_type, [])
-                if len(possible_paths) > 0:
-                    resolved_path = possible_paths[0]
+                resolved_path = symbol_table.first(call['inferred_obj_type'])
             
-            # 3. Check imports map with validation against local imports
+            # 3. Check the symbol table with validation against local imports
             if not resolved_path:
-                possible_paths = imports_map.get(lookup_name, [])
-                if len(possible_paths) == 1:
-                    resolved_path = possible_paths[0]
-                elif len(possible_paths) > 1:
-                    if lookup_name in local_imports:
-                        full_import_name = local_imports[lookup_name]
-                        
-                        # Optimization: Check if the FQN is directly in imports_map (from pre-scan)
-                        if full_import_name in imports_map:
-                             direct_paths = imports_map[full_import_name]
-                             if direct_paths and len(direct_paths) == 1:
-                                 resolved_path = direct_paths[0]
-                        
-                        if not resolved_path:
-                            for path in possible_paths:
-                                if full_import_name.replace('.', '/') in path:
-                                    resolved_path = path
-                                    break
+                candidate_count = symbol_table.count(lookup_name)
+                if candidate_count == 1:
+                    resolved_path = symbol_table.first(lookup_name)
+                elif candidate_count > 1 and lookup_name in local_imports:
+                    full_import_name = local_imports[lookup_name]
+                    # The import may name the symbol itself, or the module that defines it.
+                    resolved_path = symbol_table.unique(full_import_name) or \
+                        symbol_table.resolve(lookup_name, full_import_name)
             
             if not resolved_path:
                  warning_logger(f"Could not resolve call {called_name} (lookup: {lookup_name}) in {caller_file_path}")
-            # else:
-            #      info_logger(f"Resolved call {called_name} -> {resolved_path}")
-            
-            # Legacy fallback block (was mis-indented)
-            if not resolved_path:
-                possible_paths = imports_map.get(lookup_name, [])
-                if len(possible_paths) > 0:
-                     # Final fallback: global candidate
-                     # Check if it was imported explicitly, otherwise risky
-                     if lookup_name in local_imports:
-                         # We already tried specific matching above, but if we are here
-                         # it means we had ambiguity without matching path?
-                         pass
-                     else:
-                        # Fallback to first available if not imported? Or skip?
-                        # Original logic: resolved_path = possible_paths[0]
-                        # But wait, original code logic was:
-                        pass
+
             if not resolved_path:
                 if called_name in local_names:
                     resolved_path = caller_file_path
-                elif called_name in imports_map and imports_map[called_name]:
-                    # Check if any path in imports_map for called_name matches current file's imports
-                    candidates = imports_map[called_name]
-                    for path in candidates:
-                        for imp_name in local_imports.values():
-                            if imp_name.replace('.', '/') in path:
-                                resolved_path = path
-                                break
-                        if resolved_path: break
-                    if not resolved_path:
-                        resolved_path = candidates[0]
+                elif called_name in symbol_table:
+                    # Prefer a definition in one of the modules this file imports
+                    resolved_path = symbol_table.resolve_any(called_name, local_imports.values()) or \
+                        symbol_table.first(called_name)
                 else:
                     resolved_path = caller_file_path
 
+            yield call, resolved_path
+
+    def _create_function_calls(self, session, file_data: Dict, symbol_table: SymbolTable):
+        """Create CALLS relationships for the calls in one file."""
+        caller_file_path = str(Path(file_data['file_path']).resolve())
+        for call, resolved_path in self._resolve_function_calls(file_data, symbol_table):
+            called_name = call['name']
             caller_context = call.get('context')
             if caller_context and len(caller_context) == 3 and caller_context[0] is not None:
                 caller_name, _, caller_line_number = caller_context
@@ -586,14 +629,41 @@ class GraphBuilder:
                 args=call.get('args', []),
                 full_call_name=call.get('full_name', called_name))
 
-    def _create_all_function_calls(self, all_file_data: list[Dict], imports_map: dict):
+    def _create_all_function_calls(self, all_file_data: list[Dict], symbol_table: SymbolTable):
         """Create CALLS relationships for all functions after all files have been processed."""
         with self.driver.session() as session:
             for file_data in all_file_data:
-                self._create_function_calls(session, file_data, imports_map)
+                self._create_function_calls(session, file_data, symbol_table)
+            paths = [str(Path(file_data['file_path']).resolve()) for file_data in all_file_data]
+            self._update_caller_counts(session, self._caller_count_scope(session, paths))
+
+    def _id_function(self) -> str:
+        return "elementId" if self.db_manager.get_backend_type() == 'neo4j' else "id"
+
+    def _caller_count_scope(self, session, file_paths: list[str]) -> set:
+        """
+        The ids of the functions whose caller counts a change to these files'
+        CALLS edges can affect: the functions they call, and their own.
+        """
+        id_function = self._id_function()
+        result = session.run(f"""
+            UNWIND $paths AS path MATCH (fn:Function {{file_path: path}}) RETURN {id_function}(fn) AS node_id
+            UNION UNWIND $paths AS path MATCH (:Function {{file_path: path}})-[:CALLS]->(fn:Function) RETURN {id_function}(fn) AS node_id
+            UNION UNWIND $paths AS path MATCH (:Class {{file_path: path}})-[:CALLS]->(fn:Function) RETURN {id_function}(fn) AS node_id
+            UNION UNWIND $paths AS path MATCH (:File {{path: path}})-[:CALLS]->(fn:Function) RETURN {id_function}(fn) AS node_id
+        """, paths=file_paths)
+        return {record["node_id"] for record in result}
+
+    def _update_caller_counts(self, session, function_ids: set):
+        """Recounts the callers of these functions (see graph_schema.SET_CALLER_COUNTS); deleted ones are skipped."""
+        if function_ids:
+            session.run(f"""
+                UNWIND $ids AS node_id
+                MATCH (fn:Function) WHERE {self._id_function()}(fn) = node_id
+            """ + SET_CALLER_COUNTS, ids=list(function_ids))
 
-    def _create_inheritance_links(self, session, file_data: Dict, imports_map: dict):
-        """Create INHERITS relationships with a more robust resolution logic."""
+    def _resolve_inheritance(self, file_data: Dict, symbol_table: SymbolTable):
+        """Yields (class, base class name, base class file) for each base class in `file_data` that resolves."""
         caller_file_path = str(Path(file_data['file_path']).resolve())
         local_class_names = {c['name'] for c in file_data.get('classes', [])}
         # Create a map of local import aliases/names to full import names
@@ -617,13 +687,8 @@ class GraphBuilder:
                     
                     # Case 1: The prefix is a known import
                     if lookup_name in local_imports:
-                        full_import_name = local_imports[lookup_name]
-                        possible_paths = imports_map.get(target_class_name, [])
-                        # Find the path that corresponds to the imported module
-                        for path in possible_paths:
-                            if full_import_name.replace('.', '/') in path:
-                                resolved_path = path
-                                break
+                        # Find the definition in the imported module
+                        resolved_path = symbol_table.resolve(target_class_name, local_imports[lookup_name])
                 # Handle simple names
                 else:
                     lookup_name = base_class_str
@@ -632,37 +697,33 @@ class GraphBuilder:
                         resolved_path = caller_file_path
                     # Case 3: The base class was imported directly (e.g., from module import Parent)
                     elif lookup_name in local_imports:
-                        full_import_name = local_imports[lookup_name]
-                        possible_paths = imports_map.get(target_class_name, [])
-                        for path in possible_paths:
-                            if full_import_name.replace('.', '/') in path:
-                                resolved_path = path
-                                break
+                        resolved_path = symbol_table.resolve(target_class_name, local_imports[lookup_name])
                     # Case 4: Fallback to global map (less reliable)
-                    elif lookup_name in imports_map:
-                        possible_paths = imports_map[lookup_name]
-                        if len(possible_paths) == 1:
-                            resolved_path = possible_paths[0]
+                    else:
+                        resolved_path = symbol_table.unique(lookup_name)
                 
-                # If a path was found, create the relationship
                 if resolved_path:
-                    session.run("""
-                        MATCH (child:Class {name: $child_name, file_path: $file_path})
-                        MATCH (parent:Class {name: $parent_name, file_path: $resolved_parent_file_path})
-                        MERGE (child)-[:INHERITS]->(parent)
-                    """,
-                    child_name=class_item['name'],
-                    file_path=caller_file_path,
-                    parent_name=target_class_name,
-                    resolved_parent_file_path=resolved_path)
+                    yield class_item, target_class_name, resolved_path
 
-
-    def _create_csharp_inheritance_and_interfaces(self, session, file_data: Dict, imports_map: dict):
-        """Create INHERITS and IMPLEMENTS relationships for C# types."""
+    def _create_inheritance_links(self, session, file_data: Dict, symbol_table: SymbolTable):
+        """Create INHERITS relationships with a more robust resolution logic."""
+        caller_file_path = str(Path(file_data['file_path']).resolve())
+        for class_item, target_class_name, resolved_path in self._resolve_inheritance(file_data, symbol_table):
+            session.run("""
+                MATCH (child:Class {name: $child_name, file_path: $file_path})
+                MATCH (parent:Class {name: $parent_name, file_path: $resolved_parent_file_path})
+                MERGE (child)-[:INHERITS]->(parent)
+            """,
+            child_name=class_item['name'],
+            file_path=caller_file_path,
+            parent_name=target_class_name,
+            resolved_parent_file_path=resolved_path)
+
+
+    def _resolve_csharp_bases(self, file_data: Dict, symbol_table: SymbolTable):
+        """Yields (type, base name, is_interface) for each base type of the C# types in `file_data`."""
         if file_data.get('lang') != 'c_sharp':
             return
-            
-        caller_file_path = str(Path(file_data['file_path']).resolve())
         
         # Collect all local type names
         local_type_names = set()
@@ -689,49 +750,75 @@ class GraphBuilder:
                             is_interface = True
                             break
                     
-                    # Check if base is in imports_map
-                    if base_name in imports_map:
-                        possible_paths = imports_map[base_name]
-                        if len(possible_paths) > 0:
-                            resolved_path = possible_paths[0]
+                    # Check if base is in the symbol table
+                    if base_name in symbol_table:
+                        resolved_path = symbol_table.first(base_name)
                     
                     # For C#, first base is usually the class (if any), rest are interfaces
                     base_index = type_item['bases'].index(base_str)
                     
                     # Try to determine if it's an interface
-                    if is_interface or (base_index > 0 and type_label == 'Class'):
-                        # This is an IMPLEMENTS relationship
-                        session.run("""
-                            MATCH (child {name: $child_name, file_path: $file_path})
-                            WHERE child:Class OR child:Struct OR child:Record
-                            MATCH (iface:Interface {name: $interface_name})
-                            MERGE (child)-[:IMPLEMENTS]->(iface)
-                        """,
-                        child_name=type_item['name'],
-                        file_path=caller_file_path,
-                        interface_name=base_name)
-                    else:
-                        # This is an INHERITS relationship
-                        session.run("""
-                            MATCH (child {name: $child_name, file_path: $file_path})
-                            WHERE child:Class OR child:Record OR child:Interface
-                            MATCH (parent {name: $parent_name})
-                            WHERE parent:Class OR parent:Record OR parent:Interface
-                            MERGE (child)-[:INHERITS]->(parent)
-                        """,
-                        child_name=type_item['name'],
-                        file_path=caller_file_path,
-                        parent_name=base_name)
-
-    def _create_all_inheritance_links(self, all_file_data: list[Dict], imports_map: dict):
+                    yield type_item, base_name, is_interface or (base_index > 0 and type_label == 'Class')
+
+    def _create_csharp_inheritance_and_interfaces(self, session, file_data: Dict, symbol_table: SymbolTable):
+        """Create INHERITS and IMPLEMENTS relationships for C# types."""
+        caller_file_path = str(Path(file_data['file_path']).resolve())
+        for type_item, base_name, implements in self._resolve_csharp_bases(file_data, symbol_table):
+            if implements:
+                # This is an IMPLEMENTS relationship
+                session.run("""
+                    MATCH (child {name: $child_name, file_path: $file_path})
+                    WHERE child:Class OR child:Struct OR child:Record
+                    MATCH (iface:Interface {name: $interface_name})
+                    MERGE (child)-[:IMPLEMENTS]->(iface)
+                """,
+                child_name=type_item['name'],
+                file_path=caller_file_path,
+                interface_name=base_name)
+            else:
+                # This is an INHERITS relationship
+                session.run("""
+                    MATCH (child {name: $child_name, file_path: $file_path})
+                    WHERE child:Class OR child:Record OR child:Interface
+                    MATCH (parent {name: $parent_name})
+                    WHERE parent:Class OR parent:Record OR parent:Interface
+                    MERGE (child)-[:INHERITS]->(parent)
+                """,
+                child_name=type_item['name'],
+                file_path=caller_file_path,
+                parent_name=base_name)
+
+    def relink_file(self, file_data: Dict, symbol_table: SymbolTable):
+        """
+        Re-resolves the outgoing CALLS, INHERITS and IMPLEMENTS edges of one file.
+        Existing edges are removed first, so edges to targets that no longer resolve disappear.
+        """
+        file_path_str = str(Path(file_data['file_path']).resolve())
+        with self.driver.session() as session:
+            # Functions that lose a caller need recounting as well as those that gain one
+            affected = self._caller_count_scope(session, [file_path_str])
+            session.run("""
+                MATCH (f:File {path: $path})-[:CONTAINS]->(n)-[r:CALLS|INHERITS|IMPLEMENTS]->()
+                DELETE r
+            """, path=file_path_str)
+            session.run("MATCH (f:File {path: $path})-[r:CALLS]->() DELETE r", path=file_path_str)
+
+            if file_data.get('lang') == 'c_sharp':
+                self._create_csharp_inheritance_and_interfaces(session, file_data, symbol_table)
+            else:
+                self._create_inheritance_links(session, file_data, symbol_table)
+            self._create_function_calls(session, file_data, symbol_table)
+            self._update_caller_counts(session, affected | self._caller_count_scope(session, [file_path_str]))
+
+    def _create_all_inheritance_links(self, all_file_data: list[Dict], symbol_table: SymbolTable):
         """Create INHERITS relationships for all classes after all files have been processed."""
         with self.driver.session() as session:
             for file_data in all_file_data:
                 # Handle C# separately
                 if file_data.get('lang') == 'c_sharp':
-                    self._create_csharp_inheritance_and_interfaces(session, file_data, imports_map)
+                    self._create_csharp_inheritance_and_interfaces(session, file_data, symbol_table)
                 else:
-                    self._create_inheritance_links(session, file_data, imports_map)
+                    self._create_inheritance_links(session, file_data, symbol_table)
                 
     def delete_file_from_graph(self, file_path: str):
         """Deletes a file and all its contained elements and relationships."""
@@ -742,6 +829,7 @@ class GraphBuilder:
                 RETURN d.path as path ORDER BY d.path DESC
             """, path=file_path_str)
             parent_paths = [record["path"] for record in parents_res]
+            affected = self._caller_count_scope(session, [file_path_str])
 
             session.run(
                 """
@@ -752,6 +840,7 @@ class GraphBuilder:
                 path=file_path_str,
             )
             info_logger(f"Deleted file and its elements from graph: {file_path_str}")
+            self._update_caller_counts(session, affected)
 
             for path in parent_paths:
                 session.run("""
@@ -770,24 +859,121 @@ class GraphBuilder:
                 warning_logger(f"Attempted to delete non-existent repository: {repo_path_str}")
                 return False
 
+            # Functions elsewhere (e.g. in shared dependencies) lose the callers deleted here
+            called = session.run(f"""
+                MATCH (r:Repository {{path: $path}})-[:CONTAINS*]->(n)-[:CALLS]->(fn:Function)
+                RETURN DISTINCT {self._id_function()}(fn) AS node_id
+            """, path=repo_path_str)
+            affected = {record["node_id"] for record in called}
             session.run("""MATCH (r:Repository {path: $path})
                           OPTIONAL MATCH (r)-[:CONTAINS*]->(e)
                           DETACH DELETE r, e""", path=repo_path_str)
+            self._update_caller_counts(session, affected)
+            self.symbol_store.delete(Path(repo_path_str))
             info_logger(f"Deleted repository and its contents from graph: {repo_path_str}")
             return True
 
-    def update_file_in_graph(self, file_path: Path, repo_path: Path, imports_map: dict):
-        """Updates a single file's nodes in the graph."""
+    def record_indexed_commit(self, repo_path: Path):
+        """
+        Stores the git commit the repository is indexed at, and the files that
+        had uncommitted changes, on its Repository node.
+        """
+        commit = git_changes.head_commit(repo_path)
+        if commit is None:
+            return
+        with self.driver.session() as session:
+            session.run("""
+                MATCH (r:Repository {path: $path})
+                SET r.indexed_commit = $commit, r.indexed_dirty_files = $dirty_files
+            """, path=str(repo_path.resolve()), commit=commit, dirty_files=git_changes.dirty_files(repo_path))
+
+    def get_indexed_commit(self, repo_path: Path) -> Tuple[Optional[str], list]:
+        """Returns the (commit, dirty files) recorded by `record_indexed_commit`, if any."""
+        with self.driver.session() as session:
+            record = session.run("""
+                MATCH (r:Repository {path: $path})
+                RETURN r.indexed_commit AS commit, r.indexed_dirty_files AS dirty_files
+            """, path=str(repo_path.resolve())).single()
+        if not record or not record["commit"]:
+            return None, []
+        return record["commit"], list(record["dirty_files"] or [])
+
+    def update_repository_from_git(self, repo_path: Path, since_commit: Optional[str] = None) -> Optional[Dict]:
+        """
+        Re-indexes only the files that git reports as changed since `since_commit`
+        (by default the commit recorded when the repository was last indexed),
+        then re-links them and the files that refer to symbols they define.
+
+        Returns a summary, or None if the changes cannot be determined this way
+        (not a git repository, unknown commit, no persisted symbol table) and a
+        full re-index is needed instead.
+        """
+        repo_path = repo_path.resolve()
+        recorded_commit, recorded_dirty = self.get_indexed_commit(repo_path)
+        since_commit = since_commit or recorded_commit
+        if not since_commit:
+            return None
+        changes = git_changes.changed_files_since(repo_path, since_commit)
+        if changes is None:
+            return None
+        # Files that were dirty when the index was built may differ from the commit.
+        for rel_path in recorded_dirty:
+            changes.setdefault(repo_path / rel_path, git_changes.MODIFIED)
+
+        symbol_table = self.symbol_store.load(repo_path)
+        if symbol_table is None:
+            return None
+
+        changed = sorted(self._filter_indexable_files(repo_path, list(changes)))
+        old_names = {f: symbol_table.names_in(str(f)) for f in changed}
+        self.update_symbol_table(symbol_table, changed)
+
+        # 1. Rewrite the nodes of every changed file.
+        parsed = {}
+        affected_names = set()
+        for file_path in changed:
+            affected_names |= old_names[file_path]
+            if not file_path.exists():
+                self.delete_file_from_graph(str(file_path))
+                continue
+            file_data = self.parse_file(repo_path, file_path)
+            if "error" in file_data:
+                error_logger(f"Skipping graph update for {file_path} due to parsing error: {file_data['error']}")
+                continue
+            self.update_file_in_graph(file_path, repo_path, symbol_table, file_data=file_data)
+            symbol_table.set_references(str(file_path), referenced_names(file_data))
+            affected_names |= symbol_table.names_in(str(file_path))
+            parsed[str(file_path)] = file_data
+
+        # 2. Re-link them, and every file that refers to a name they defined or define now.
+        for path_str in sorted({p for name in affected_names for p in symbol_table.referrers(name)} - parsed.keys()):
+            file_path = Path(path_str)
+            if file_path.exists():
+                file_data = self.parse_file(repo_path, file_path)
+                if "error" not in file_data:
+                    parsed[path_str] = file_data
+        for file_data in parsed.values():
+            self.relink_file(file_data, symbol_table)
+
+        self.symbol_store.save(repo_path, symbol_table)
+        self.record_indexed_commit(repo_path)
+        info_logger(f"Updated {len(changed)} changed file(s) since {since_commit[:12]} and re-linked {len(parsed)} file(s) in {repo_path}")
+        return {"since_commit": since_commit, "changed_files": len(changed), "relinked_files": len(parsed)}
+
+    def update_file_in_graph(self, file_path: Path, repo_path: Path, symbol_table: SymbolTable,
+                             file_data: Optional[Dict] = None):
+        """Updates a single file's nodes in the graph, parsing it unless `file_data` is given."""
         file_path_str = str(file_path.resolve())
         repo_name = repo_path.name
         
         self.delete_file_from_graph(file_path_str)
 
         if file_path.exists():
-            file_data = self.parse_file(repo_path, file_path)
+            if file_data is None:
+                file_data = self.parse_file(repo_path, file_path)
             
             if "error" not in file_data:
-                self.add_file_to_graph(file_data, repo_name, imports_map)
+                self.add_file_to_graph(file_data, repo_name, symbol_table)
                 return file_data
             else:
                 error_logger(f"Skipping graph add for {file_path_str} due to parsing error: {file_data['error']}")
@@ -795,36 +981,95 @@ class GraphBuilder:
         else:
             return {"deleted": True, "path": file_path_str}
 
+    def _create_module_inclusions(self, session, file_path_str: str, inclusions: list[Dict]):
+        """Links classes to the modules they include (Ruby mixins)."""
+        for inc in inclusions:
+            session.run("""
+                MATCH (c:Class {name: $class_name, file_path: $file_path})
+                MERGE (m:Module {name: $module_name})
+                MERGE (c)-[:INCLUDES]->(m)
+            """,
+            class_name=inc["class"],
+            file_path=file_path_str,
+            module_name=inc["module"])
+
+    def apply_symbol_diff(self, file_data: Dict, diff: FileSymbolDiff):
+        """Removes and re-adds the symbol nodes listed in `diff` for an already indexed file."""
+        file_path_str = str(Path(file_data['file_path']).resolve())
+        with self.driver.session() as session:
+            affected = self._caller_count_scope(session, [file_path_str])
+            for label, item in diff.removed:
+                session.run(f"""
+                    MATCH (n:{label} {{name: $name, file_path: $file_path, line_number: $line_number}})
+                    OPTIONAL MATCH (n)-[:HAS_PARAMETER]->(p:Parameter)
+                    DETACH DELETE n, p
+                """, name=item['name'], file_path=file_path_str, line_number=item['line_number'])
+
+            for label, item in diff.added:
+                self._write_symbol(session, file_path_str, label, item)
+
+            # Re-attach new functions, and unchanged functions whose enclosing
+            # class or function was just rewritten.
+            added_functions = {(item['name'], item['line_number']) for label, item in diff.added if label == 'Function'}
+            added_parents = {item['name'] for label, item in diff.added if label in ('Function', 'Class')}
+            for item in file_data.get('functions', []):
+                if ((item['name'], item['line_number']) in added_functions
+                        or item.get('class_context') in added_parents
+                        or item.get('context') in added_parents):
+                    self._link_function_to_parent(session, file_path_str, item)
+            # A re-added class has lost the modules it includes
+            added_classes = {item['name'] for label, item in diff.added if label == 'Class'}
+            self._create_module_inclusions(session, file_path_str, [
+                inc for inc in file_data.get('module_inclusions', []) if inc['class'] in added_classes])
+
+            if diff.file_calls_changed:
+                session.run("MATCH (f:File {path: $path})-[r:CALLS]->() DELETE r", path=file_path_str)
+            self._update_caller_counts(session, affected | self._caller_count_scope(session, [file_path_str]))
+
     def parse_file(self, repo_path: Path, file_path: Path, is_dependency: bool = False) -> Dict:
         """Parses a file with the appropriate language parser and extracts code elements."""
+        file_data, _ = self._parse_file(repo_path, file_path, is_dependency)
+        return file_data
+
+    def reparse_file(self, repo_path: Path, file_path: Path, previous: Optional[ParseSnapshot] = None) -> Tuple[Dict, Optional[ParseSnapshot]]:
+        """
+        Parses a file like `parse_file`, reusing the tree from `previous` if given.
+        Returns the file data and a snapshot that can be passed back in on the next change.
+        """
+        return self._parse_file(repo_path, file_path, track=True, previous=previous)
+
+    def _parse_file(self, repo_path: Path, file_path: Path, is_dependency: bool = False,
+                    track: bool = False, previous: Optional[ParseSnapshot] = None) -> Tuple[Dict, Optional[ParseSnapshot]]:
         parser = self.parsers.get(file_path.suffix)
         if not parser:
             warning_logger(f"No parser found for file extension {file_path.suffix}. Skipping {file_path}")
-            return {"file_path": str(file_path), "error": f"No parser for {file_path.suffix}"}
+            return {"file_path": str(file_path), "error": f"No parser for {file_path.suffix}"}, None
 
         debug_log(f"[parse_file] Starting parsing for: {file_path} with {parser.language_name} parser")
+        tracking = parser.parser.track(previous) if track else contextlib.nullcontext()
         try:
             index_source = (get_config_value("INDEX_SOURCE") or "false").lower() == "true"
-            if parser.language_name == 'python':
-                is_notebook = file_path.suffix == '.ipynb'
-                file_data = parser.parse(
-                    file_path,
-                    is_dependency,
-                    is_notebook=is_notebook,
-                    index_source=index_source
-                )
-            else:
-                file_data = parser.parse(
-                    file_path,
-                    is_dependency,
-                    index_source=index_source
-                )
+            with tracking as tracked:
+                if parser.language_name == 'python':
+                    is_notebook = file_path.suffix == '.ipynb'
+                    file_data = parser.parse(
+                        file_path,
+                        is_dependency,
+                        is_notebook=is_notebook,
+                        index_source=index_source
+                    )
+                else:
+                    file_data = parser.parse(
+                        file_path,
+                        is_dependency,
+                        index_source=index_source
+                    )
             file_data['repo_path'] = str(repo_path)
-            return file_data
+            return file_data, tracked.snapshot if tracked else None
         except Exception as e:
             error_logger(f"Error parsing {file_path} with {parser.language_name} parser: {e}")
             debug_log(f"[parse_file] Error parsing {file_path}: {e}")
-            return {"file_path": str(file_path), "error": str(e)}
+            return {"file_path": str(file_path), "error": str(e)}, None
 
     def estimate_processing_time(self, path: Path) -> Optional[Tuple[int, float]]:
         """Estimate processing time and file count"""
@@ -861,6 +1106,15 @@ class GraphBuilder:
             error_logger(f"Could not estimate processing time for {path}: {e}")
             return None
 
+    def _filter_indexable_files(self, path: Path, files: list[Path]) -> list[Path]:
+        """
+        Keeps the files with a supported extension that are not excluded by
+        IGNORE_DIRS or the nearest .cgcignore above `path`.
+        """
+        rules = IgnoreRules.for_path(path)
+        supported_extensions = self.parsers.keys()
+        return [f for f in files if f.suffix in supported_extensions and not rules.is_ignored(f)]
+
     async def build_graph_from_path_async(
         self, path: Path, is_dependency: bool = False, job_id: str = None
     ):
@@ -869,100 +1123,46 @@ class GraphBuilder:
             if job_id:
                 self.job_manager.update_job(job_id, status=JobStatus.RUNNING)
             
-            self.add_repository_to_graph(path, is_dependency)
-            repo_name = path.name
-
-            # Search for .cgcignore upwards
-            cgcignore_path = None
-            ignore_root = path.resolve()
-            
-            # Start search from path (or parent if path is file)
-            curr = path.resolve()
-            if not curr.is_dir():
-                curr = curr.parent
-
-            # Walk up looking for .cgcignore
-            while True:
-                candidate = curr / ".cgcignore"
-                if candidate.exists():
-                    cgcignore_path = candidate
-                    ignore_root = curr
-                    debug_log(f"Found .cgcignore at {ignore_root}")
-                    break
-                if curr.parent == curr: # Root hit
-                    break
-                curr = curr.parent
-
-            if cgcignore_path:
-                with open(cgcignore_path) as f:
-                    ignore_patterns = f.read().splitlines()
-                spec = pathspec.PathSpec.from_lines('gitwildmatch', ignore_patterns)
-            else:
-                spec = None
-
-            supported_extensions = self.parsers.keys()
-            all_files = path.rglob("*") if path.is_dir() else [path]
-            files = [f for f in all_files if f.is_file() and f.suffix in supported_extensions]
-
-            # Filter default ignored directories
-            ignore_dirs_str = get_config_value("IGNORE_DIRS") or ""
-            if ignore_dirs_str and path.is_dir():
-                ignore_dirs = {d.strip().lower() for d in ignore_dirs_str.split(',') if d.strip()}
-                if ignore_dirs:
-                    kept_files = []
-                    for f in files:
-                        try:
-                            # Check if any parent directory in the relative path is in ignore list
-                            parts = set(p.lower() for p in f.relative_to(path).parent.parts)
-                            if not parts.intersection(ignore_dirs):
-                                kept_files.append(f)
-                            else:
-                                # debug_log(f"Skipping default ignored file: {f}")
-                                pass
-                        except ValueError:
-                             kept_files.append(f)
-                    files = kept_files
-            
-            if spec:
-                filtered_files = []
-                for f in files:
-                    try:
-                        # Match relative to the directory containing .cgcignore
-                        rel_path = f.relative_to(ignore_root)
-                        if not spec.match_file(str(rel_path)):
-                            filtered_files.append(f)
-                        else:
-                            debug_log(f"Ignored file based on .cgcignore: {rel_path}")
-                    except ValueError:
-                        # Should not happen if ignore_root is a parent, but safety fallback
-                        filtered_files.append(f)
-                files = filtered_files
-            if job_id:
-                self.job_manager.update_job(job_id, total_files=len(files))
+            # Persistence is suspended while the graph is written, then snapshotted once.
+            with self.db_manager.bulk_load():
+                self.add_repository_to_graph(path, is_dependency)
+                repo_name = path.name
+
+                all_files = path.rglob("*") if path.is_dir() else [path]
+                files = self._filter_indexable_files(path, [f for f in all_files if f.is_file()])
+                if job_id:
+                    self.job_manager.update_job(job_id, total_files=len(files))
             
-            debug_log("Starting pre-scan to build imports map...")
-            imports_map = self._pre_scan_for_imports(files)
-            debug_log(f"Pre-scan complete. Found {len(imports_map)} definitions.")
-
-            all_file_data = []
-
-            processed_count = 0
-            for file in files:
-                if file.is_file():
-                    if job_id:
-                        self.job_manager.update_job(job_id, current_file=str(file))
-                    repo_path = path.resolve() if path.is_dir() else file.parent.resolve()
-                    file_data = self.parse_file(repo_path, file, is_dependency)
-                    if "error" not in file_data:
-                        self.add_file_to_graph(file_data, repo_name, imports_map)
-                        all_file_data.append(file_data)
-                    processed_count += 1
-                    if job_id:
-                        self.job_manager.update_job(job_id, processed_files=processed_count)
-                    await asyncio.sleep(0.01)
-
-            self._create_all_inheritance_links(all_file_data, imports_map)
-            self._create_all_function_calls(all_file_data, imports_map)
+                debug_log("Starting pre-scan to build the symbol table...")
+                if path.is_dir():
+                    symbol_table = self.load_symbol_table(path.resolve(), files)
+                else:
+                    symbol_table = self._pre_scan_for_imports(files)
+                debug_log(f"Pre-scan complete. Found {len(symbol_table)} definitions.")
+
+                all_file_data = []
+
+                processed_count = 0
+                for file in files:
+                    if file.is_file():
+                        if job_id:
+                            self.job_manager.update_job(job_id, current_file=str(file))
+                        repo_path = path.resolve() if path.is_dir() else file.parent.resolve()
+                        file_data = self.parse_file(repo_path, file, is_dependency)
+                        if "error" not in file_data:
+                            self.add_file_to_graph(file_data, repo_name, symbol_table)
+                            symbol_table.set_references(str(file.resolve()), referenced_names(file_data))
+                            all_file_data.append(file_data)
+                        processed_count += 1
+                        if job_id:
+                            self.job_manager.update_job(job_id, processed_files=processed_count)
+                        await asyncio.sleep(0.01)
+
+                self._create_all_inheritance_links(all_file_data, symbol_table)
+                self._create_all_function_calls(all_file_data, symbol_table)
+                if path.is_dir():
+                    self.symbol_store.save(path.resolve(), symbol_table)
+                    self.record_indexed_commit(path.resolve())
             
             if job_id:
                 self.job_manager.update_job(job_id, status=JobStatus.COMPLETED, end_time=datetime.now())
@@ -0,0 +1,190 @@
+# src/codegraphcontext/tools/graph_snapshot.py
+"""
+An in-memory snapshot of the code graph's structure, for analytics.
+
+Questions like "what is never called", "what reaches this function" or "how
+many callers does each function have" touch most of the graph, and answering
+each with its own Cypher query means re-walking it in the database every time.
+A `GraphSnapshot` loads the CALLS, INHERITS, IMPORTS and CONTAINS edges once
+into compressed sparse row (CSR) arrays: for each relationship type, the
+targets of node `i` are `targets[offsets[i]:offsets[i + 1]]`, and the reverse
+direction is stored the same way. Nodes are numbered 0..n-1; a table maps each
+number to the database id and the few properties analytics filter on.
+
+`CodeFinder.graph_snapshot` caches one per graph generation (see
+core/result_cache.py), so it is rebuilt only after the graph is written to.
+"""
+from array import array
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+SNAPSHOT_RELATIONSHIPS = ("CALLS", "INHERITS", "IMPORTS", "CONTAINS")
+
+
+def _build_csr(node_count: int, sources: array, targets: array) -> Tuple[array, array]:
+    """Counting sort of the (source, target) pairs into offsets and targets arrays."""
+    offsets = array('q', [0]) * (node_count + 1)
+    for source in sources:
+        offsets[source + 1] += 1
+    for i in range(node_count):
+        offsets[i + 1] += offsets[i]
+    cursor = array('q', offsets)
+    sorted_targets = array('l', [0]) * len(targets)
+    for source, target in zip(sources, targets):
+        sorted_targets[cursor[source]] = target
+        cursor[source] += 1
+    return offsets, sorted_targets
+
+
+class SnapshotBuilder:
+    """Collects nodes and edges by database id, then packs them into a `GraphSnapshot`."""
+
+    def __init__(self):
+        self.index: Dict[Hashable, int] = {}
+        self.node_ids: List[Hashable] = []
+        self.labels: List[str] = []
+        self.names: List[Optional[str]] = []
+        self.paths: List[Optional[str]] = []
+        self.lines = array('l')
+        self.dependency = bytearray()
+        self.decorators: Dict[int, Tuple[str, ...]] = {}
+        self._edges = {rel: (array('l'), array('l')) for rel in SNAPSHOT_RELATIONSHIPS}
+        self._label_names: Dict[str, str] = {}
+
+    def add_node(self, node_id: Hashable, label: str, name: Optional[str], path: Optional[str],
+                 line_number: Optional[int], is_dependency: bool, decorators: Optional[Sequence[str]] = None):
+        if node_id in self.index:
+            return
+        self.index[node_id] = len(self.node_ids)
+        self.node_ids.append(node_id)
+        self.labels.append(self._label_names.setdefault(label, label))
+        self.names.append(name)
+        self.paths.append(path)
+        self.lines.append(line_number or 0)
+        self.dependency.append(1 if is_dependency else 0)
+        if decorators:
+            self.decorators[len(self.node_ids) - 1] = tuple(decorators)
+
+    def add_edge(self, rel: str, source_id: Hashable, target_id: Hashable):
+        """Adds an edge between two added nodes; edges to nodes outside the snapshot are dropped."""
+        source, target = self.index.get(source_id), self.index.get(target_id)
+        if source is not None and target is not None and rel in self._edges:
+            sources, targets = self._edges[rel]
+            sources.append(source)
+            targets.append(target)
+
+    def build(self) -> "GraphSnapshot":
+        count = len(self.node_ids)
+        forward, backward = {}, {}
+        for rel, (sources, targets) in self._edges.items():
+            forward[rel] = _build_csr(count, sources, targets)
+            backward[rel] = _build_csr(count, targets, sources)
+        return GraphSnapshot(self, forward, backward)
+
+
+class GraphSnapshot:
+    """
+    The structure of the code graph in CSR form, with traversal primitives.
+    Nodes are referred to by their index; `index_of` and `node_ids` map
+    between indexes and database ids.
+    """
+
+    def __init__(self, builder: SnapshotBuilder, forward: Dict[str, Tuple[array, array]],
+                 backward: Dict[str, Tuple[array, array]]):
+        self.node_ids = builder.node_ids
+        self.index_of = builder.index
+        self.labels = builder.labels
+        self.names = builder.names
+        self.paths = builder.paths
+        self.lines = builder.lines
+        self.dependency = builder.dependency
+        self.decorators = builder.decorators
+        self._forward = forward
+        self._backward = backward
+        self._by_name: Optional[Dict[str, List[int]]] = None
+        self._degrees: Dict[Tuple, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(targets) for _, targets in self._forward.values())
+
+    def _csr(self, rel: str, direction: str) -> Tuple[array, array]:
+        return (self._forward if direction == "out" else self._backward)[rel]
+
+    def neighbors(self, node: int, rel: str, direction: str = "out") -> array:
+        """The nodes `node` has a `rel` edge to (`"out"`) or from (`"in"`), once per edge."""
+        offsets, targets = self._csr(rel, direction)
+        return targets[offsets[node]:offsets[node + 1]]
+
+    def degrees(self, rel: str, direction: str = "in", label: Optional[str] = None,
+                include_dependencies: bool = True) -> array:
+        """
+        The number of `rel` edges entering (or leaving) every node, by index.
+        With `label` or `include_dependencies=False`, only edges from (or to)
+        the matching nodes are counted, e.g. a function's callers in the project.
+        """
+        key = (rel, direction, label, include_dependencies)
+        if key not in self._degrees:
+            if label is None and include_dependencies:
+                offsets, _ = self._csr(rel, direction)
+                counts = array('l', map(int.__sub__, offsets[1:], offsets[:-1]))
+            else:
+                # Walk the edges from the other end, counting those whose far node matches
+                offsets, targets = self._csr(rel, "out" if direction == "in" else "in")
+                counts = array('l', [0]) * len(self.node_ids)
+                for node, node_label in enumerate(self.labels):
+                    if (label is None or node_label == label) and (include_dependencies or not self.dependency[node]):
+                        for target in targets[offsets[node]:offsets[node + 1]]:
+                            counts[target] += 1
+            self._degrees[key] = counts
+        return self._degrees[key]
+
+    def find(self, name: str, label: Optional[str] = None, path: Optional[str] = None) -> List[int]:
+        """The nodes called `name`, optionally with `label` and in file `path`."""
+        if self._by_name is None:
+            by_name: Dict[str, List[int]] = {}
+            for node, node_name in enumerate(self.names):
+                by_name.setdefault(node_name, []).append(node)
+            self._by_name = by_name
+        return [node for node in self._by_name.get(name, ())
+                if (label is None or self.labels[node] == label) and (path is None or self.paths[node] == path)]
+
+    def bfs_levels(self, sources: Iterable[int], rel: str, direction: str = "out",
+                   max_depth: Optional[int] = None, label: Optional[str] = None) -> Iterator[List[int]]:
+        """
+        Level-synchronous BFS from `sources`, yielding the nodes first reached
+        at each depth (1, 2, ...). Only nodes with `label` (if given) are
+        reached. A source is reached again only if a cycle leads back to it.
+        The caller may trim a level in place to limit what is expanded next.
+        """
+        offsets, targets = self._csr(rel, direction)
+        labels = self.labels
+        seen = bytearray(len(self.node_ids))
+        frontier = list(dict.fromkeys(sources))
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            level = []
+            for node in frontier:
+                for target in targets[offsets[node]:offsets[node + 1]]:
+                    if not seen[target] and (label is None or labels[target] == label):
+                        seen[target] = 1
+                        level.append(target)
+            yield level
+            frontier = level
+
+    def reachable(self, sources: Iterable[int], rel: str, direction: str = "out",
+                  max_depth: Optional[int] = None, label: Optional[str] = None) -> bytearray:
+        """A mask over all nodes of those reachable from `sources`."""
+        mask = bytearray(len(self.node_ids))
+        for level in self.bfs_levels(sources, rel, direction, max_depth, label):
+            for node in level:
+                mask[node] = 1
+        return mask
+
+    def location(self, node: int) -> Tuple[bool, str, int]:
+        """The sort key CodeFinder orders results by: dependencies last, then file and line."""
+        return bool(self.dependency[node]), self.paths[node] or "", self.lines[node]
+
@@ -5,9 +5,11 @@ from ...utils.debug_log import debug_log
 def find_dead_code(code_finder: CodeFinder, **args) -> Dict[str, Any]:
     """Tool to find potentially dead code across the entire project."""
     exclude_decorated_with = args.get("exclude_decorated_with", [])
+    limit = args.get("limit", 50)
+    cursor = args.get("cursor")
     try:
         debug_log("Finding dead code.")
-        results = code_finder.find_dead_code(exclude_decorated_with=exclude_decorated_with)
+        results = code_finder.find_dead_code(exclude_decorated_with=exclude_decorated_with, limit=limit, cursor=cursor)
         
         return {
             "success": True,
@@ -60,6 +62,9 @@ def analyze_code_relationships(code_finder: CodeFinder, **args) -> Dict[str, Any
     query_type = args.get("query_type")
     target = args.get("target")
     context = args.get("context")
+    max_depth = args.get("max_depth")
+    limit = args.get("limit")
+    cursor = args.get("cursor")
 
     if not query_type or not target:
         return {
@@ -73,7 +78,7 @@ def analyze_code_relationships(code_finder: CodeFinder, **args) -> Dict[str, Any
     
     try:
         debug_log(f"Analyzing relationships: {query_type} for {target}")
-        results = code_finder.analyze_code_relationships(query_type, target, context)
+        results = code_finder.analyze_code_relationships(query_type, target, context, max_depth, limit, cursor)
         
         return {
             "success": True, "query_type": query_type, "target": target,
@@ -92,6 +97,8 @@ def find_code(code_finder: CodeFinder, **args) -> Dict[str, Any]:
     
     fuzzy_search = args.get("fuzzy_search", DEFAULT_FUZZY_SEARCH)
     edit_distance = args.get("edit_distance", DEFAULT_EDIT_DISTANCE)
+    limit = args.get("limit", 20)
+    cursor = args.get("cursor")
 
     if fuzzy_search:
         # Assuming minimal normalization is fine here if not method available
@@ -99,7 +106,7 @@ def find_code(code_finder: CodeFinder, **args) -> Dict[str, Any]:
         
     try:
         debug_log(f"Finding code for query: {query} with fuzzy_search={fuzzy_search}, edit_distance={edit_distance}")
-        results = code_finder.find_related_code(query, fuzzy_search, edit_distance)
+        results = code_finder.find_related_code(query, fuzzy_search, edit_distance, limit, cursor)
 
         return {"success": True, "query": query, "results": results}
     
@@ -3,11 +3,19 @@ import json
 import urllib.parse
 from pathlib import Path
 import os
+import sys
 from datetime import datetime
 from typing import Any, Dict
-from neo4j.exceptions import CypherSyntaxError
 from ...utils.debug_log import debug_log
 
+def _is_cypher_syntax_error(error: Exception) -> bool:
+    """
+    Checks for a Neo4j CypherSyntaxError without importing the neo4j driver.
+    If the driver was never loaded (e.g. FalkorDB backend), the error can't be one.
+    """
+    neo4j_exceptions = sys.modules.get("neo4j.exceptions")
+    return neo4j_exceptions is not None and isinstance(error, neo4j_exceptions.CypherSyntaxError)
+
 def execute_cypher_query(db_manager, **args) -> Dict[str, Any]:
     """
     Tool implementation for executing a read-only Cypher query.
@@ -50,14 +58,14 @@ def execute_cypher_query(db_manager, **args) -> Dict[str, Any]:
                 "results": records
             }
     
-    except CypherSyntaxError as e:
-        debug_log(f"Cypher syntax error: {str(e)}")
-        return {
-            "error": "Cypher syntax error.",
-            "details": str(e),
-            "query": cypher_query
-        }
     except Exception as e:
+        if _is_cypher_syntax_error(e):
+            debug_log(f"Cypher syntax error: {str(e)}")
+            return {
+                "error": "Cypher syntax error.",
+                "details": str(e),
+                "query": cypher_query
+            }
         debug_log(f"Error executing Cypher query: {str(e)}")
         return {
             "error": "An unexpected error occurred while executing the query.",
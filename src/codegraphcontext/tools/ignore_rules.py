@@ -0,0 +1,107 @@
+# src/codegraphcontext/tools/ignore_rules.py
+"""
+The rules that decide which files under a path are indexed: directory names
+listed in IGNORE_DIRS, and the patterns of the nearest `.cgcignore` at or above
+the path. Both indexing and the watcher use them, so a file that would not be
+indexed is never watched either.
+"""
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import pathspec
+
+from ..cli.config_manager import get_config_value
+from ..utils.debug_log import debug_log
+
+
+def find_cgcignore(path: Path) -> Optional[Path]:
+    """The nearest .cgcignore in `path` (or its parent, for a file) or any directory above it."""
+    curr = path.resolve()
+    if not curr.is_dir():
+        curr = curr.parent
+    while True:
+        candidate = curr / ".cgcignore"
+        if candidate.exists():
+            return candidate
+        if curr.parent == curr:  # Root hit
+            return None
+        curr = curr.parent
+
+
+class IgnoreRules:
+    """Answers whether a file or directory under `root` is excluded from indexing."""
+
+    def __init__(self, root: Path, ignore_dirs: Iterable[str] = (),
+                 spec: Optional[pathspec.PathSpec] = None, spec_root: Optional[Path] = None):
+        self.root = Path(root)
+        self.ignore_dirs = {d.lower() for d in ignore_dirs}
+        self.spec = spec
+        self.spec_root = spec_root
+
+    @classmethod
+    def for_path(cls, path: Path) -> "IgnoreRules":
+        """Builds the rules for indexing `path` from the config and the nearest .cgcignore."""
+        ignore_dirs = set()
+        # IGNORE_DIRS only applies below a directory that is indexed as a whole.
+        if path.is_dir():
+            ignore_dirs_str = get_config_value("IGNORE_DIRS") or ""
+            ignore_dirs = {d.strip() for d in ignore_dirs_str.split(',') if d.strip()}
+
+        spec = spec_root = None
+        cgcignore_path = find_cgcignore(path)
+        if cgcignore_path:
+            spec_root = cgcignore_path.parent
+            debug_log(f"Found .cgcignore at {spec_root}")
+            with open(cgcignore_path) as f:
+                spec = pathspec.PathSpec.from_lines('gitwildmatch', f.read().splitlines())
+        return cls(path, ignore_dirs, spec, spec_root)
+
+    def _spec_matches(self, path: Path, is_dir: bool) -> bool:
+        if self.spec is None:
+            return False
+        try:
+            # Match relative to the directory containing .cgcignore
+            rel_path = path.relative_to(self.spec_root)
+        except ValueError:
+            return False
+        return self.spec.match_file(str(rel_path) + ("/" if is_dir else ""))
+
+    def is_ignored(self, path: Path) -> bool:
+        """Whether the file at `path` is excluded."""
+        if self.ignore_dirs:
+            try:
+                parts = {p.lower() for p in path.relative_to(self.root).parent.parts}
+            except ValueError:
+                parts = set()
+            if parts & self.ignore_dirs:
+                return True
+        return self._spec_matches(path, is_dir=False)
+
+    def is_ignored_dir(self, path: Path) -> bool:
+        """Whether the directory at `path` is excluded itself (not just because of a parent)."""
+        if path.name.lower() in self.ignore_dirs and path != self.root:
+            return True
+        return self._spec_matches(path, is_dir=True)
+
+    def is_ignored_tree(self, path: Path) -> bool:
+        """Whether the directory at `path`, or any directory between it and the root, is excluded."""
+        try:
+            rel_parts = path.relative_to(self.root).parts
+        except ValueError:
+            return False
+        return any(self.is_ignored_dir(self.root.joinpath(*rel_parts[:i])) for i in range(1, len(rel_parts) + 1))
+
+    def iter_files(self, suffixes: Iterable[str], start: Optional[Path] = None) -> Iterator[Path]:
+        """
+        Yields the non-ignored files under `start` (default: the root) with one
+        of `suffixes`, never entering ignored directories.
+        """
+        suffixes = set(suffixes)
+        for dirpath, dirnames, filenames in os.walk(start or self.root):
+            directory = Path(dirpath)
+            dirnames[:] = [d for d in dirnames if not self.is_ignored_dir(directory / d)]
+            for name in filenames:
+                file_path = directory / name
+                if file_path.suffix in suffixes and not self._spec_matches(file_path, is_dir=False):
+                    yield file_path
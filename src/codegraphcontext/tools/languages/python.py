@@ -1,7 +1,5 @@
 import os
 import tempfile
-import nbformat
-from nbconvert import PythonExporter
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 import ast
@@ -121,6 +119,9 @@ class PythonTreeSitterParser:
         try:
             if is_notebook:
                 info_logger(f"Converting notebook {file_path} to temporary Python file.")
+                # nbformat/nbconvert are slow to import, so only load them for notebooks.
+                import nbformat
+                from nbconvert import PythonExporter
                 with open(file_path, 'r', encoding='utf-8') as f:
                     notebook_node = nbformat.read(f, as_version=4)
                 
@@ -548,6 +549,8 @@ def pre_scan_python(files: list[Path], parser_wrapper) -> dict:
         try:
             source_to_parse = ""
             if file_path.suffix == '.ipynb':
+                import nbformat
+                from nbconvert import PythonExporter
                 with open(file_path, 'r', encoding='utf-8') as f:
                     notebook_node = nbformat.read(f, as_version=4)
                 exporter = PythonExporter()
@@ -1,12 +1,16 @@
 # src/codegraphcontext/tools/package_resolver.py
 import importlib
-import stdlibs
 from pathlib import Path
 import subprocess
 from typing import Optional
 
 from ..utils.debug_log import debug_log
 
+def _is_stdlib_module(package_name: str) -> bool:
+    """Checks the (large) stdlibs table, importing it only when a package is resolved."""
+    import stdlibs
+    return package_name in stdlibs.module_names
+
 def _get_python_package_path(package_name: str) -> Optional[str]:
     """
     Finds the local installation path of a Python package.
@@ -18,7 +22,7 @@ def _get_python_package_path(package_name: str) -> Optional[str]:
             module_file = Path(module.__file__)
             if module_file.name == '__init__.py':
                 return str(module_file.parent)
-            elif package_name in stdlibs.module_names:
+            elif _is_stdlib_module(package_name):
                 return str(module_file)
             else:
                 return str(module_file.parent)
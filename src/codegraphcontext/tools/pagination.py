@@ -0,0 +1,127 @@
+# src/codegraphcontext/tools/pagination.py
+"""
+Opaque cursors for paginated CodeFinder results.
+
+Pages are fetched by keyset pagination: results are ordered by indexed sort
+keys, and the cursor handed back with a page records the keys of its last
+row. The next page then starts with a `keys > cursor` condition rather than
+skipping rows with SKIP, so every page costs the same however deep it is.
+Callers treat cursors as opaque strings and pass them back unchanged.
+
+Paginated CodeFinder methods return a `Page`: the list of rows they always
+returned, with the cursor of the following page in `next_cursor`. Their Cypher
+queries compute each row's keys as a `sort_keys` list, filter on
+`keyset_condition` and order by `keyset_order`; `keyset_page` then turns the
+rows into a page.
+"""
+import base64
+import binascii
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class InvalidCursorError(ValueError):
+    """Raised for a cursor that was not produced by `encode_cursor` for this query."""
+
+
+def encode_cursor(keys: Sequence[Any]) -> str:
+    """The cursor resuming after a row with these sort keys."""
+    data = json.dumps(list(keys), separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], key_count: int) -> Optional[List[Any]]:
+    """The sort keys recorded in `cursor`, or None to start from the first page."""
+    if not cursor:
+        return None
+    try:
+        keys = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(keys, list) or len(keys) != key_count:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    return keys
+
+
+def check_limit(limit: int) -> None:
+    """Raises ValueError unless `limit` is a usable page size (at least 1)."""
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ValueError(f"limit must be a positive integer, got {limit!r}")
+
+
+def next_cursor(rows: List[Any], limit: int, keys) -> Optional[str]:
+    """
+    Trims `rows`, fetched with a limit of `limit + 1`, to one page, and returns
+    the cursor of the following page (None if this is the last). `keys` gives
+    a row's sort keys.
+    """
+    check_limit(limit)
+    if len(rows) <= limit:
+        return None
+    del rows[limit:]
+    return encode_cursor(keys(rows[-1]))
+
+
+class Page(list):
+    """One page of results: a list of rows, and the cursor of the next page (None on the last)."""
+
+    def __init__(self, rows: Iterable[Any] = (), next_cursor: Optional[str] = None):
+        super().__init__(rows)
+        self.next_cursor = next_cursor
+
+
+def keyset_condition(key_count: int) -> str:
+    """
+    The Cypher condition keeping the rows whose `sort_keys` list comes after
+    the `$after` parameter (every row when it is null). Cypher has no row
+    value comparison, so the lexicographic order is spelled out.
+    """
+    condition = f"sort_keys[{key_count - 1}] > $after[{key_count - 1}]"
+    for i in range(key_count - 2, -1, -1):
+        condition = f"sort_keys[{i}] > $after[{i}] OR (sort_keys[{i}] = $after[{i}] AND ({condition}))"
+    return f"($after IS NULL OR {condition})"
+
+
+def keyset_order(key_count: int) -> str:
+    """The ORDER BY expressions matching `keyset_condition`."""
+    return ", ".join(f"sort_keys[{i}]" for i in range(key_count))
+
+
+def keyset_page(rows: List[Dict[str, Any]], limit: int) -> Page:
+    """
+    The Page of `rows`, fetched with a limit of `limit + 1` and carrying their
+    keys in a `sort_keys` column, which is removed.
+    """
+    check_limit(limit)
+    keys = [row.pop("sort_keys") for row in rows]
+    cursor = encode_cursor(keys[limit - 1]) if len(rows) > limit else None
+    return Page(rows[:limit], cursor)
+
+
+def page_of(rows: Iterable[Any], keys: Callable[[Any], List[Any]], limit: int, cursor: Optional[str],
+            key_count: int) -> Page:
+    """
+    The page after `cursor` of rows computed in full, for backends that
+    cannot filter on the keys as they read. `keys` gives a row's sort keys.
+    """
+    check_limit(limit)
+    after = decode_cursor(cursor, key_count)
+    ordered = sorted(rows, key=keys)
+    if after is not None:
+        ordered = [row for row in ordered if keys(row) > after]
+    ordered = ordered[:limit + 1]
+    return Page(ordered, next_cursor(ordered, limit, keys))
+
+
+def combined_pages(fetchers: Sequence[Callable[[Optional[str]], Page]],
+                   cursor: Optional[str]) -> Tuple[List[Page], Optional[str]]:
+    """
+    One page from each of several paginated sources listed together (e.g. the
+    name and content searches of find_code). The combined cursor holds each
+    source's own cursor; a source whose last page has been fetched is skipped.
+    """
+    cursors = decode_cursor(cursor, len(fetchers))
+    pages = [fetch(sub_cursor) if cursors is None or sub_cursor else Page()
+             for fetch, sub_cursor in zip(fetchers, cursors or [None] * len(fetchers))]
+    next_cursors = [page.next_cursor for page in pages]
+    return pages, encode_cursor(next_cursors) if any(next_cursors) else None
@@ -0,0 +1,900 @@
+# src/codegraphcontext/tools/sqlite_graph.py
+"""
+GraphBuilder and CodeFinder for the embedded SQLite backend.
+
+The SQLite store does not run Cypher, so these subclasses replace the Cypher
+queries with the store's operations. Parsing, call and inheritance resolution
+and the incremental update logic are inherited unchanged; only the reads and
+writes differ. Each method returns the same shape as the method it overrides.
+"""
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..core.database_sqlite import FULLTEXT_LABELS, Node, node_key, node_ref, node_sort_keys
+from ..utils.debug_log import info_logger, warning_logger
+from . import git_changes
+from .call_chains import call_detail, shortest_call_chains
+from .code_finder import (DEAD_CODE_EXCLUDED_NAMES, DEAD_CODE_NOTE, DEAD_CODE_PAGE_SIZE, DEFAULT_TRAVERSAL_DEPTH,
+                          PAGE_SIZE, CodeFinder, _dead_code_keys)
+from .graph_builder import GraphBuilder
+from .graph_snapshot import SNAPSHOT_RELATIONSHIPS, GraphSnapshot, SnapshotBuilder
+from .pagination import Page, check_limit, decode_cursor, next_cursor, page_of
+from .symbol_diff import CONSTRUCTOR_NAMES, SYMBOL_LABELS, FileSymbolDiff
+from .symbol_table import SymbolTable
+
+# The length of `node_sort_keys`, which cursors over the store's node listings hold
+NODE_KEY_COUNT = 5
+
+
+class SQLiteGraphBuilder(GraphBuilder):
+    """Builds the code graph in the embedded SQLite store."""
+
+    @property
+    def store(self):
+        return self.db_manager.store
+
+    def create_schema(self):
+        """The store creates its tables and indexes when it opens the database."""
+
+    def add_repository_to_graph(self, repo_path: Path, is_dependency: bool = False):
+        """Adds a repository node using its absolute path as the unique key."""
+        self.store.upsert_nodes("Repository", [{
+            "path": str(repo_path.resolve()),
+            "name": repo_path.name,
+            "is_dependency": is_dependency,
+        }])
+
+    def add_file_to_graph(self, file_data: Dict, repo_name: str, symbol_table: SymbolTable):
+        """Adds a file and its contents in one transaction."""
+        file_path_str = str(Path(file_data['file_path']).resolve())
+        file_path_obj = Path(file_path_str)
+        is_dependency = file_data.get('is_dependency', False)
+
+        repo = self.store.get_node("Repository", str(Path(file_data['repo_path']).resolve()))
+        repo_path_obj = Path(repo.props['path']) if repo else file_path_obj.parent
+        try:
+            relative_path = file_path_obj.relative_to(repo_path_obj)
+        except ValueError:
+            relative_path = Path(file_path_obj.name)
+        file_ref = ("File", file_path_str)
+
+        with self.store.transaction():
+            self.store.upsert_nodes("File", [{
+                "path": file_path_str, "name": file_path_obj.name,
+                "relative_path": str(relative_path), "is_dependency": is_dependency,
+            }])
+
+            directories = []
+            contains = []
+            parent_ref = ("Repository", str(repo_path_obj))
+            current_path = repo_path_obj
+            for part in relative_path.parts[:-1]:
+                current_path = current_path / part
+                directories.append({"path": str(current_path), "name": part})
+                contains.append((parent_ref, ("Directory", str(current_path)), {}))
+                parent_ref = ("Directory", str(current_path))
+            contains.append((parent_ref, file_ref, {}))
+            self.store.upsert_nodes("Directory", directories)
+
+            for key, label in SYMBOL_LABELS:
+                items = file_data.get(key, [])
+                self._write_symbols(file_path_str, label, items)
+
+            self.store.upsert_nodes("Module", [
+                {"name": m["name"], "lang": file_data.get("lang")} for m in file_data.get('modules', [])
+            ])
+
+            for item in file_data.get('functions', []):
+                contains.extend(self._parent_links(file_path_str, item))
+            self.store.upsert_edges("CONTAINS", contains)
+
+            modules = []
+            imports = []
+            for imp in file_data.get('imports', []):
+                if file_data.get('lang') == 'javascript':
+                    module_name = imp.get('source')
+                    if not module_name:
+                        continue
+                    rel_props = {'imported_name': imp.get('name', '*')}
+                    modules.append({"name": module_name})
+                else:
+                    module_name = imp['name']
+                    rel_props = {}
+                    module = {"name": module_name, "alias": imp.get('alias')}
+                    if 'full_import_name' in imp:
+                        module["full_import_name"] = imp['full_import_name']
+                    modules.append(module)
+                if imp.get('alias'):
+                    rel_props['alias'] = imp.get('alias')
+                if imp.get('line_number'):
+                    rel_props['line_number'] = imp.get('line_number')
+                imports.append((file_ref, ("Module", module_name), rel_props))
+            self.store.upsert_nodes("Module", modules)
+            self.store.upsert_edges("IMPORTS", imports)
+            self._create_module_inclusions(None, file_path_str, file_data.get('module_inclusions', []))
+
+    def _create_module_inclusions(self, session, file_path_str: str, inclusions: List[Dict]):
+        """Links classes to the modules they include (Ruby mixins)."""
+        includes = []
+        for inc in inclusions:
+            self.store.upsert_nodes("Module", [{"name": inc["module"]}])
+            includes.extend(
+                (node_ref("Class", cls.props), ("Module", inc["module"]), {})
+                for cls in self.store.find_nodes(["Class"], name=inc["class"], file_path=file_path_str))
+        self.store.upsert_edges("INCLUDES", includes)
+
+    def _write_symbols(self, file_path_str: str, label: str, items: List[Dict]):
+        """Upserts symbol nodes (and the parameters of functions) under their File."""
+        if not items:
+            return
+        nodes = []
+        parameters = []
+        has_parameter = []
+        for item in items:
+            props = {**item, 'file_path': file_path_str}
+            if label == 'Function':
+                props.setdefault('cyclomatic_complexity', 1)
+                for arg_name in item.get('args', []):
+                    parameter = {"name": arg_name, "file_path": file_path_str,
+                                 "function_line_number": item['line_number']}
+                    parameters.append(parameter)
+                    has_parameter.append((node_ref(label, props), node_ref("Parameter", parameter), {}))
+            nodes.append(props)
+        self.store.upsert_nodes(label, nodes)
+        self.store.upsert_nodes("Parameter", parameters)
+        self.store.upsert_edges("CONTAINS", [(("File", file_path_str), node_ref(label, props), {}) for props in nodes])
+        self.store.upsert_edges("HAS_PARAMETER", has_parameter)
+
+    def _parent_links(self, file_path_str: str, item: Dict) -> List[Tuple]:
+        """The CONTAINS edges from an enclosing function or class to a function."""
+        inner = node_ref("Function", {**item, 'file_path': file_path_str})
+        parents = []
+        if item.get("context_type") == "function_definition":
+            parents += self.store.find_nodes(["Function"], name=item["context"], file_path=file_path_str)
+        if item.get('class_context'):
+            parents += self.store.find_nodes(["Class"], name=item['class_context'], file_path=file_path_str)
+        return [(node_ref(parent.label, parent.props), inner, {}) for parent in parents]
+
+    def _call_targets(self, called_name: str, called_file_path: str, memo: Dict) -> List[Node]:
+        """
+        The functions and classes named `called_name` in `called_file_path`;
+        a class is replaced by its constructor, if it has one.
+        """
+        key = (called_name, called_file_path)
+        if key not in memo:
+            targets = []
+            for node in self.store.find_nodes(["Function", "Class"], name=called_name, file_path=called_file_path):
+                constructors = []
+                if node.label == "Class":
+                    members = self.store.neighbors([node.id], "CONTAINS")
+                    constructors = [n for n in self.store.get_nodes(e.dst for e in members).values()
+                                    if n.label == "Function" and n.props.get("name") in CONSTRUCTOR_NAMES]
+                targets.extend(constructors or [node])
+            memo[key] = targets
+        return memo[key]
+
+    def _create_function_calls(self, session, file_data: Dict, symbol_table: SymbolTable, memo: Optional[Dict] = None):
+        """Create CALLS relationships for the calls in one file."""
+        memo = {} if memo is None else memo
+        caller_file_path = str(Path(file_data['file_path']).resolve())
+        edges = []
+        for call, resolved_path in self._resolve_function_calls(file_data, symbol_table):
+            called_name = call['name']
+            caller_context = call.get('context')
+            if caller_context and len(caller_context) == 3 and caller_context[0] is not None:
+                caller_name, _, caller_line_number = caller_context
+                callers = [node_ref(n.label, n.props) for n in self.store.find_nodes(
+                    ["Function", "Class"], name=caller_name, file_path=caller_file_path, line_number=caller_line_number)]
+            else:
+                callers = [("File", caller_file_path)]
+            props = {"line_number": call['line_number'], "args": call.get('args', []),
+                     "full_call_name": call.get('full_name', called_name)}
+            for target in self._call_targets(called_name, resolved_path, memo):
+                edges.extend((caller, node_ref(target.label, target.props), props) for caller in callers)
+        self.store.upsert_edges("CALLS", edges, keyed=True)
+
+    def _create_all_function_calls(self, all_file_data: list[Dict], symbol_table: SymbolTable):
+        """Create CALLS relationships for all functions after all files have been processed."""
+        memo = {}
+        with self.store.transaction():
+            for file_data in all_file_data:
+                self._create_function_calls(None, file_data, symbol_table, memo)
+            paths = [str(Path(file_data['file_path']).resolve()) for file_data in all_file_data]
+            self.store.update_caller_counts(self._caller_count_scope(None, paths))
+
+    def _caller_count_scope(self, session, file_paths: list[str]) -> set:
+        """
+        The ids of the functions whose caller counts a change to these files'
+        CALLS edges can affect: the functions they call, and their own.
+        """
+        scope = set()
+        for file_path_str in file_paths:
+            nodes = self.store.find_nodes([label for _, label in SYMBOL_LABELS], file_path=file_path_str)
+            file_node = self.store.get_node("File", file_path_str)
+            sources = [n.id for n in nodes] + ([file_node.id] if file_node else [])
+            scope.update(n.id for n in nodes if n.label == "Function")
+            scope.update(e.dst for e in self.store.neighbors(sources, "CALLS"))
+        return scope
+
+    def _create_inheritance_links(self, session, file_data: Dict, symbol_table: SymbolTable):
+        """Create INHERITS relationships with a more robust resolution logic."""
+        caller_file_path = str(Path(file_data['file_path']).resolve())
+        edges = []
+        for class_item, target_class_name, resolved_path in self._resolve_inheritance(file_data, symbol_table):
+            children = self.store.find_nodes(["Class"], name=class_item['name'], file_path=caller_file_path)
+            parents = self.store.find_nodes(["Class"], name=target_class_name, file_path=resolved_path)
+            edges.extend((node_ref("Class", c.props), node_ref("Class", p.props), {})
+                         for c in children for p in parents)
+        self.store.upsert_edges("INHERITS", edges)
+
+    def _create_csharp_inheritance_and_interfaces(self, session, file_data: Dict, symbol_table: SymbolTable):
+        """Create INHERITS and IMPLEMENTS relationships for C# types."""
+        caller_file_path = str(Path(file_data['file_path']).resolve())
+        for type_item, base_name, implements in self._resolve_csharp_bases(file_data, symbol_table):
+            if implements:
+                edge_type = "IMPLEMENTS"
+                children = self.store.find_nodes(["Class", "Struct", "Record"], name=type_item['name'], file_path=caller_file_path)
+                parents = self.store.find_nodes(["Interface"], name=base_name)
+            else:
+                edge_type = "INHERITS"
+                children = self.store.find_nodes(["Class", "Record", "Interface"], name=type_item['name'], file_path=caller_file_path)
+                parents = self.store.find_nodes(["Class", "Record", "Interface"], name=base_name)
+            self.store.upsert_edges(edge_type, [(node_ref(c.label, c.props), node_ref(p.label, p.props), {})
+                                                for c in children for p in parents])
+
+    def _create_all_inheritance_links(self, all_file_data: list[Dict], symbol_table: SymbolTable):
+        """Create INHERITS relationships for all classes after all files have been processed."""
+        with self.store.transaction():
+            for file_data in all_file_data:
+                if file_data.get('lang') == 'c_sharp':
+                    self._create_csharp_inheritance_and_interfaces(None, file_data, symbol_table)
+                else:
+                    self._create_inheritance_links(None, file_data, symbol_table)
+
+    def relink_file(self, file_data: Dict, symbol_table: SymbolTable):
+        """
+        Re-resolves the outgoing CALLS, INHERITS and IMPLEMENTS edges of one file.
+        Existing edges are removed first, so edges to targets that no longer resolve disappear.
+        """
+        file_path_str = str(Path(file_data['file_path']).resolve())
+        with self.store.transaction():
+            affected = self._caller_count_scope(None, [file_path_str])
+            sources = [n.id for n in self.store.find_nodes([label for _, label in SYMBOL_LABELS], file_path=file_path_str)]
+            file_node = self.store.get_node("File", file_path_str)
+            self.store.delete_edges(sources, ("CALLS", "INHERITS", "IMPLEMENTS"))
+            if file_node:
+                self.store.delete_edges([file_node.id], ("CALLS",))
+
+            if file_data.get('lang') == 'c_sharp':
+                self._create_csharp_inheritance_and_interfaces(None, file_data, symbol_table)
+            else:
+                self._create_inheritance_links(None, file_data, symbol_table)
+            self._create_function_calls(None, file_data, symbol_table)
+            self.store.update_caller_counts(affected | self._caller_count_scope(None, [file_path_str]))
+
+    def delete_file_from_graph(self, file_path: str):
+        """Deletes a file and all its contained elements and relationships."""
+        file_path_str = str(Path(file_path).resolve())
+        with self.store.transaction():
+            file_node = self.store.get_node("File", file_path_str)
+            if file_node is None:
+                return
+            parents = sorted(self.store.get_nodes(self.store.traverse([file_node.id], "CONTAINS", "in")).values(),
+                             key=lambda n: n.props.get("path", ""), reverse=True)
+            elements = self.store.find_nodes([label for _, label in SYMBOL_LABELS] + ["Parameter"], file_path=file_path_str)
+            affected = self._caller_count_scope(None, [file_path_str])
+            self.store.delete_nodes([file_node.id] + [n.id for n in elements])
+            self.store.update_caller_counts(affected)
+            info_logger(f"Deleted file and its elements from graph: {file_path_str}")
+
+            # Deepest first, so a directory emptied by removing its child goes too
+            for parent in parents:
+                if parent.label == "Directory" and not self.store.neighbors([parent.id], "CONTAINS"):
+                    self.store.delete_nodes([parent.id])
+
+    def delete_repository_from_graph(self, repo_path: str) -> bool:
+        """Deletes a repository and all its contents from the graph. Returns True if deleted, False if not found."""
+        repo_path_str = str(Path(repo_path).resolve())
+        with self.store.transaction():
+            repo = self.store.get_node("Repository", repo_path_str)
+            if repo is None:
+                warning_logger(f"Attempted to delete non-existent repository: {repo_path_str}")
+                return False
+            contents = set(self.store.traverse([repo.id], "CONTAINS"))
+            parameters = {e.dst for e in self.store.neighbors(contents, "HAS_PARAMETER")}
+            # Functions elsewhere (e.g. in shared dependencies) lose the callers deleted here
+            affected = {e.dst for e in self.store.neighbors(contents, "CALLS")}
+            self.store.delete_nodes({repo.id} | contents | parameters)
+            self.store.update_caller_counts(affected)
+        self.symbol_store.delete(Path(repo_path_str))
+        info_logger(f"Deleted repository and its contents from graph: {repo_path_str}")
+        return True
+
+    def record_indexed_commit(self, repo_path: Path):
+        """
+        Stores the git commit the repository is indexed at, and the files that
+        had uncommitted changes, on its Repository node.
+        """
+        commit = git_changes.head_commit(repo_path)
+        if commit is None:
+            return
+        self.store.update_node("Repository", str(repo_path.resolve()), {
+            "indexed_commit": commit, "indexed_dirty_files": git_changes.dirty_files(repo_path),
+        })
+
+    def get_indexed_commit(self, repo_path: Path) -> Tuple[Optional[str], list]:
+        """Returns the (commit, dirty files) recorded by `record_indexed_commit`, if any."""
+        repo = self.store.get_node("Repository", str(repo_path.resolve()))
+        if not repo or not repo.props.get("indexed_commit"):
+            return None, []
+        return repo.props["indexed_commit"], list(repo.props.get("indexed_dirty_files") or [])
+
+    def apply_symbol_diff(self, file_data: Dict, diff: FileSymbolDiff):
+        """Removes and re-adds the symbol nodes listed in `diff` for an already indexed file."""
+        file_path_str = str(Path(file_data['file_path']).resolve())
+        with self.store.transaction():
+            affected = self._caller_count_scope(None, [file_path_str])
+            for label, item in diff.removed:
+                node = self.store.get_node(label, node_key(label, {**item, 'file_path': file_path_str}))
+                if node:
+                    parameters = [e.dst for e in self.store.neighbors([node.id], "HAS_PARAMETER")]
+                    self.store.delete_nodes([node.id] + parameters)
+
+            for label, item in diff.added:
+                self._write_symbols(file_path_str, label, [item])
+
+            # Re-attach new functions, and unchanged functions whose enclosing
+            # class or function was just rewritten.
+            added_functions = {(item['name'], item['line_number']) for label, item in diff.added if label == 'Function'}
+            added_parents = {item['name'] for label, item in diff.added if label in ('Function', 'Class')}
+            links = []
+            for item in file_data.get('functions', []):
+                if ((item['name'], item['line_number']) in added_functions
+                        or item.get('class_context') in added_parents
+                        or item.get('context') in added_parents):
+                    links.extend(self._parent_links(file_path_str, item))
+            self.store.upsert_edges("CONTAINS", links)
+            # A re-added class has lost the modules it includes
+            added_classes = {item['name'] for label, item in diff.added if label == 'Class'}
+            self._create_module_inclusions(None, file_path_str, [
+                inc for inc in file_data.get('module_inclusions', []) if inc['class'] in added_classes])
+            self.store.update_caller_counts(affected | self._caller_count_scope(None, [file_path_str]))
+
+
+def _search_row(node: Node, with_type: bool = False) -> Dict[str, Any]:
+    """The columns CodeFinder's name and content searches return for a node."""
+    props = node.props
+    row = {"type": node.label.lower()} if with_type else {}
+    row.update({
+        "name": props.get("name"), "file_path": props.get("file_path"), "line_number": props.get("line_number"),
+        "source": props.get("source"), "docstring": props.get("docstring"), "is_dependency": props.get("is_dependency", False),
+    })
+    return row
+
+
+def _function_row(node: Node, prefix: str) -> Dict[str, Any]:
+    """The `<prefix>_name`, `_file_path`, `_line_number` and `_is_dependency` columns of a function."""
+    props = node.props
+    return {
+        f"{prefix}_name": props.get("name"),
+        f"{prefix}_file_path": props.get("file_path"),
+        f"{prefix}_line_number": props.get("line_number"),
+        f"{prefix}_is_dependency": props.get("is_dependency", False),
+    }
+
+
+def _location(node: Node) -> Tuple:
+    props = node.props
+    return bool(props.get("is_dependency")), props.get("file_path") or "", props.get("line_number") or 0
+
+
+def _keys(row: Dict[str, Any], *columns: str) -> List[Any]:
+    """
+    A row's sort keys, the given columns like the Cypher queries coalesce
+    them: booleans as 0/1, missing line numbers as 0 and other missing values as ''.
+    """
+    keys = []
+    for column in columns:
+        value = row.get(column)
+        if value is None:
+            value = 0 if column.endswith("line_number") else ""
+        keys.append(int(value) if isinstance(value, bool) else value)
+    return keys
+
+
+def _node_page(nodes: List[Node], limit: int, to_row: Callable[[Node], Dict[str, Any]],
+               order_by: str = "location") -> Page:
+    """The page of rows for `nodes`, found in `order_by` order with a limit of `limit + 1`."""
+    cursor = next_cursor(nodes, limit, lambda node: node_sort_keys(node, order_by))
+    return Page(map(to_row, nodes), cursor)
+
+
+def _scope(container: Optional[Node], module_name: str) -> Tuple[str, str]:
+    """The scope type and name a variable gets from the node containing it, `module_name` for files."""
+    if container is not None and container.label in ("Function", "Class"):
+        return container.label.lower(), container.props.get("name")
+    return "module", module_name
+
+
+def _distinct(rows: Iterable[Dict]) -> List[Dict]:
+    seen = set()
+    unique = []
+    for row in rows:
+        marker = repr(sorted(row.items()))
+        if marker not in seen:
+            seen.add(marker)
+            unique.append(row)
+    return unique
+
+
+class SQLiteCodeFinder(CodeFinder):
+    """Finds code in the embedded SQLite store."""
+
+    @property
+    def store(self):
+        return self.db_manager.store
+
+    def _find_by_name(self, label: str, search_term: str, fuzzy_search: bool, limit: int,
+                      cursor: Optional[str]) -> Page:
+        if not fuzzy_search:
+            nodes = self.store.find_nodes([label], name=search_term, after=decode_cursor(cursor, NODE_KEY_COUNT),
+                                          limit=limit + 1)
+            return _node_page(nodes, limit, _search_row)
+        return self._search_page(f"name:{search_term}", [label], False, limit, cursor)
+
+    def _search_page(self, query: str, labels, with_type: bool, limit: int, cursor: Optional[str]) -> Page:
+        hits = self.store.search_text(query, labels, limit=limit + 1, after=decode_cursor(cursor, 2))
+        cursor = next_cursor(hits, limit, lambda hit: [hit[1], hit[0].id])
+        return Page([_search_row(n, with_type) for n, _ in hits], cursor)
+
+    def find_by_variable_name(self, search_term: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+        """Find variables by name matching"""
+        nodes = self.store.find_nodes(["Variable"], name_contains=search_term, order_by="name",
+                                      after=decode_cursor(cursor, NODE_KEY_COUNT), limit=limit + 1)
+        return _node_page(nodes, limit, lambda n: {
+            "name": n.props.get("name"), "file_path": n.props.get("file_path"), "line_number": n.props.get("line_number"),
+            "value": n.props.get("value"), "context": n.props.get("context"), "is_dependency": n.props.get("is_dependency", False),
+        }, order_by="name")
+
+    def find_by_content(self, search_term: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+        """Find code by content matching in source or docstrings using the full-text index."""
+        return self._search_page(search_term, FULLTEXT_LABELS, True, limit, cursor)
+
+    def find_by_module_name(self, search_term: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+        """Find modules by name matching"""
+        nodes = self.store.find_nodes(["Module"], name_contains=search_term, order_by="name",
+                                      after=decode_cursor(cursor, NODE_KEY_COUNT), limit=limit + 1)
+        return _node_page(nodes, limit, lambda n: {"name": n.props.get("name"), "lang": n.props.get("lang")},
+                          order_by="name")
+
+    def find_imports(self, search_term: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+        """Find imported symbols (aliases or original names)."""
+        edges = self.store.find_edges("IMPORTS", alias=search_term) + \
+            self.store.find_edges("IMPORTS", imported_name=search_term)
+        nodes = self.store.get_nodes({e.src for e in edges} | {e.dst for e in edges})
+        rows = _distinct({
+            "alias": e.props.get("alias"),
+            "imported_name": e.props.get("imported_name"),
+            "module_name": nodes[e.dst].props.get("name"),
+            "file_path": nodes[e.src].props.get("path"),
+            "line_number": e.props.get("line_number"),
+        } for e in edges)
+        return page_of(rows, lambda row: _keys(row, "file_path", "line_number", "module_name", "imported_name", "alias"),
+                       limit, cursor, 5)
+
+    def find_functions_by_argument(self, argument_name: str, file_path: str = None, limit: int = PAGE_SIZE,
+                                   cursor: Optional[str] = None) -> Page:
+        """Find functions that take a specific argument name."""
+        parameters = self.store.find_nodes(["Parameter"], name=argument_name, file_path=file_path)
+        edges = self.store.neighbors([p.id for p in parameters], "HAS_PARAMETER", "in")
+        rows = [{
+            "function_name": f.props.get("name"), "file_path": f.props.get("file_path"), "line_number": f.props.get("line_number"),
+            "docstring": f.props.get("docstring"), "is_dependency": f.props.get("is_dependency", False),
+        } for f in self.store.get_nodes(e.src for e in edges).values()]
+        return page_of(rows, lambda row: _keys(row, "is_dependency", "file_path", "line_number", "function_name"),
+                       limit, cursor, 4)
+
+    def find_functions_by_decorator(self, decorator_name: str, file_path: str = None, limit: int = PAGE_SIZE,
+                                    cursor: Optional[str] = None) -> Page:
+        """Find functions that have a specific decorator applied to them."""
+        functions = self.store.find_nodes(["Function"], file_path=file_path, list_contains=("decorators", decorator_name),
+                                          after=decode_cursor(cursor, NODE_KEY_COUNT), limit=limit + 1)
+        return _node_page(functions, limit, lambda f: {
+            "function_name": f.props.get("name"), "file_path": f.props.get("file_path"), "line_number": f.props.get("line_number"),
+            "docstring": f.props.get("docstring"), "is_dependency": f.props.get("is_dependency", False),
+            "decorators": f.props.get("decorators"),
+        })
+
+    def who_calls_function(self, function_name: str, file_path: str = None, limit: int = PAGE_SIZE,
+                           cursor: Optional[str] = None) -> Page:
+        """Find what functions call a specific function using CALLS relationships"""
+        targets = []
+        if file_path:
+            targets = self.store.find_nodes(["Function"], name=function_name, file_path=file_path)
+        if not targets or not self.store.neighbors([t.id for t in targets], "CALLS", "in"):
+            targets = self.store.find_nodes(["Function"], name=function_name)
+        targets = {t.id: t for t in targets}
+
+        edges = self.store.neighbors(targets, "CALLS", "in")
+        callers = self.store.get_nodes(e.src for e in edges)
+        rows = []
+        for edge in edges:
+            caller = callers[edge.src]
+            if caller.label != "Function":
+                continue
+            rows.append({
+                "caller_function": caller.props.get("name"),
+                "caller_file_path": caller.props.get("file_path"),
+                "caller_line_number": caller.props.get("line_number"),
+                "caller_docstring": caller.props.get("docstring"),
+                "caller_is_dependency": caller.props.get("is_dependency", False),
+                "call_line_number": edge.props.get("line_number"),
+                "call_args": edge.props.get("args"),
+                "full_call_name": edge.props.get("full_call_name"),
+                "target_file_path": targets[edge.dst].props.get("file_path"),
+            })
+        return page_of(_distinct(rows), lambda row: _keys(
+            row, "caller_is_dependency", "caller_file_path", "caller_line_number", "caller_function",
+            "call_line_number", "full_call_name", "target_file_path"), limit, cursor, 7)
+
+    def what_does_function_call(self, function_name: str, file_path: str = None, limit: int = PAGE_SIZE,
+                                cursor: Optional[str] = None) -> Page:
+        """Find what functions a specific function calls using CALLS relationships"""
+        absolute_file_path = str(Path(file_path).resolve()) if file_path else None
+        callers = self.store.find_nodes(["Function"], name=function_name, file_path=absolute_file_path)
+        edges = self.store.neighbors([c.id for c in callers], "CALLS")
+        called = self.store.get_nodes(e.dst for e in edges)
+        rows = []
+        for edge in edges:
+            node = called[edge.dst]
+            if node.label != "Function":
+                continue
+            rows.append({
+                "called_function": node.props.get("name"),
+                "called_file_path": node.props.get("file_path"),
+                "called_line_number": node.props.get("line_number"),
+                "called_docstring": node.props.get("docstring"),
+                "called_is_dependency": node.props.get("is_dependency", False),
+                "call_line_number": edge.props.get("line_number"),
+                "call_args": edge.props.get("args"),
+                "full_call_name": edge.props.get("full_call_name"),
+            })
+        return page_of(_distinct(rows), lambda row: _keys(
+            row, "called_is_dependency", "called_function", "called_file_path", "called_line_number",
+            "call_line_number", "full_call_name"), limit, cursor, 6)
+
+    def _repository_names(self, file_ids: Iterable[int]) -> Dict[int, str]:
+        """The name of the repository directly containing each of the given files, by file id."""
+        edges = self.store.neighbors(file_ids, "CONTAINS", "in")
+        parents = self.store.get_nodes(e.src for e in edges)
+        return {e.dst: parents[e.src].props.get("name") for e in edges if parents[e.src].label == "Repository"}
+
+    def who_imports_module(self, module_name: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+        """Find what files import a specific module using IMPORTS relationships"""
+        modules = {m.id: m for m in self.store.find_nodes(["Module"])
+                   if m.props.get("name") == module_name or module_name in (m.props.get("full_import_name") or "")}
+        edges = self.store.neighbors(modules, "IMPORTS", "in")
+        files = self.store.get_nodes(e.src for e in edges)
+        repositories = self._repository_names(files)
+        imports: Dict[int, List[Dict]] = {}
+        for edge in edges:
+            module = modules[edge.dst].props
+            imports.setdefault(edge.src, []).append({
+                "imported_module": module.get("name"),
+                "import_alias": module.get("alias"),
+                "full_import_name": module.get("full_import_name"),
+            })
+        rows = [{
+            "file_name": files[file_id].props.get("name"),
+            "file_path": files[file_id].props.get("path"),
+            "file_relative_path": files[file_id].props.get("relative_path"),
+            "file_is_dependency": files[file_id].props.get("is_dependency", False),
+            "repository_name": repositories.get(file_id),
+            "imports": _distinct(file_imports),
+        } for file_id, file_imports in imports.items()]
+        return page_of(rows, lambda row: _keys(row, "file_is_dependency", "file_path"), limit, cursor, 2)
+
+    def who_modifies_variable(self, variable_name: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+        """Find what functions contain or modify a specific variable"""
+        variables = {v.id: v for v in self.store.find_nodes(["Variable"], name=variable_name)}
+        edges = self.store.neighbors(variables, "CONTAINS", "in")
+        containers = self.store.get_nodes(e.src for e in edges)
+        rows = []
+        for edge in edges:
+            container = containers[edge.src]
+            if container.label not in ("Function", "Class", "File"):
+                continue
+            var = variables[edge.dst].props
+            scope_type, scope_name = _scope(container, "file_level")
+            rows.append({
+                "container_name": scope_name,
+                "container_type": "file" if scope_type == "module" else scope_type,
+                "file_path": container.props.get("file_path") or container.props.get("path"),
+                "container_line_number": container.props.get("line_number"),
+                "variable_line_number": var.get("line_number"),
+                "variable_value": var.get("value"),
+                "variable_context": var.get("context"),
+                "is_dependency": container.props.get("is_dependency", False),
+                "variable_file_path": var.get("file_path"),
+            })
+        page = page_of(_distinct(rows), lambda row: _keys(
+            row, "is_dependency", "file_path", "variable_line_number", "variable_file_path",
+            "container_type", "container_name"), limit, cursor, 6)
+        for row in page:
+            del row["variable_file_path"]
+        return page
+
+    def find_class_hierarchy(self, class_name: str, file_path: str = None) -> Dict[str, Any]:
+        """Find class inheritance relationships using INHERITS relationships"""
+        classes = [c.id for c in self.store.find_nodes(["Class"], name=class_name, file_path=file_path)]
+
+        def related(edge_type: str, direction: str, label: str) -> List[Node]:
+            edges = self.store.neighbors(classes, edge_type, direction)
+            nodes = self.store.get_nodes(e.dst if direction == "out" else e.src for e in edges)
+            return [n for n in nodes.values() if n.label == label]
+
+        def class_row(node: Node, prefix: str) -> Dict[str, Any]:
+            props = node.props
+            return {
+                f"{prefix}_class": props.get("name"),
+                f"{prefix}_file_path": props.get("file_path"),
+                f"{prefix}_line_number": props.get("line_number"),
+                f"{prefix}_docstring": props.get("docstring"),
+                f"{prefix}_is_dependency": props.get("is_dependency", False),
+            }
+
+        parents = _distinct(class_row(n, "parent") for n in related("INHERITS", "out", "Class"))
+        children = _distinct(class_row(n, "child") for n in related("INHERITS", "in", "Class"))
+        methods = _distinct({
+            "method_name": n.props.get("name"),
+            "method_file_path": n.props.get("file_path"),
+            "method_line_number": n.props.get("line_number"),
+            "method_args": n.props.get("args"),
+            "method_docstring": n.props.get("docstring"),
+            "method_is_dependency": n.props.get("is_dependency", False),
+        } for n in related("CONTAINS", "out", "Function"))
+        return {
+            "class_name": class_name,
+            "parent_classes": sorted(parents, key=lambda row: _keys(row, "parent_is_dependency", "parent_class")),
+            "child_classes": sorted(children, key=lambda row: _keys(row, "child_is_dependency", "child_class")),
+            "methods": sorted(methods, key=lambda row: _keys(row, "method_is_dependency", "method_line_number")),
+        }
+
+    def find_function_overrides(self, function_name: str, limit: int = PAGE_SIZE,
+                                cursor: Optional[str] = None) -> Page:
+        """Find all implementations of a function across different classes"""
+        functions = {f.id: f for f in self.store.find_nodes(["Function"], name=function_name)}
+        edges = self.store.neighbors(functions, "CONTAINS", "in")
+        classes = self.store.get_nodes(e.src for e in edges)
+        rows = []
+        for edge in edges:
+            cls = classes[edge.src]
+            if cls.label != "Class":
+                continue
+            func = functions[edge.dst].props
+            rows.append({
+                "class_name": cls.props.get("name"),
+                "class_file_path": cls.props.get("file_path"),
+                "function_name": func.get("name"),
+                "function_line_number": func.get("line_number"),
+                "function_args": func.get("args"),
+                "function_docstring": func.get("docstring"),
+                "is_dependency": func.get("is_dependency", False),
+                "file_name": Path(cls.props["file_path"]).name if cls.props.get("file_path") else None,
+            })
+        return page_of(_distinct(rows), lambda row: _keys(
+            row, "is_dependency", "class_name", "class_file_path", "function_line_number"), limit, cursor, 4)
+
+    def find_dead_code(self, exclude_decorated_with: List[str] = None, limit: int = DEAD_CODE_PAGE_SIZE,
+                       cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Find potentially unused functions (not called by other functions in the project), optionally excluding those with specific decorators.
+        Results are paged in (file, line) order: pass the returned `next_cursor` back to fetch the next page.
+        """
+        excluded = list(dict.fromkeys(exclude_decorated_with or []))
+        check_limit(limit)
+        after = decode_cursor(cursor, 3)
+        if self.use_snapshot:
+            return self._snapshot_dead_code(excluded, limit, after)
+        unused = self.store.find_unused_functions(DEAD_CODE_EXCLUDED_NAMES, excluded, after, limit + 1)
+        rows = self._dead_code_rows([f.id for f in unused])
+        return {
+            "potentially_unused_functions": rows,
+            "next_cursor": next_cursor(rows, limit, _dead_code_keys),
+            "note": DEAD_CODE_NOTE
+        }
+
+    def _dead_code_rows(self, node_ids: List[Any]) -> List[Dict]:
+        functions = self.store.get_nodes(node_ids)
+        unused = [functions[node_id] for node_id in node_ids if node_id in functions]
+        files = self.store.get_nodes(e.src for e in self.store.neighbors([f.id for f in unused], "CONTAINS", "in"))
+        return [{
+            "function_name": f.props.get("name"),
+            "file_path": f.props.get("file_path"),
+            "line_number": f.props.get("line_number"),
+            "docstring": f.props.get("docstring"),
+            "context": f.props.get("context"),
+            "caller_count": f.props.get("caller_count"),
+            "file_name": next((n.props.get("name") for n in files.values()
+                               if n.label == "File" and n.props.get("path") == f.props.get("file_path")), None),
+        } for f in unused]
+
+    def _load_snapshot(self) -> GraphSnapshot:
+        builder = SnapshotBuilder()
+        for node_id, label, name, path, line_number, is_dependency, decorators in self.store.scan_nodes():
+            builder.add_node(node_id, label, name, path, line_number, is_dependency,
+                             json.loads(decorators) if decorators else None)
+        for source, rel, target in self.store.scan_edges(SNAPSHOT_RELATIONSHIPS):
+            builder.add_edge(rel, source, target)
+        return builder.build()
+
+    def find_all_callers(self, function_name: str, file_path: str = None,
+                         max_depth: int = DEFAULT_TRAVERSAL_DEPTH, limit: int = 50) -> List[Dict]:
+        """Find the direct and indirect callers of a function, nearest first, at most `max_depth` calls away."""
+        return self._transitive_calls(function_name, file_path, "in", "caller", max_depth, limit)
+
+    def find_all_callees(self, function_name: str, file_path: str = None,
+                         max_depth: int = DEFAULT_TRAVERSAL_DEPTH, limit: int = 50) -> List[Dict]:
+        """Find the direct and indirect callees of a function, nearest first, at most `max_depth` calls away."""
+        return self._transitive_calls(function_name, file_path, "out", "callee", max_depth, limit)
+
+    def _transitive_calls(self, function_name: str, file_path: Optional[str], direction: str,
+                          prefix: str, max_depth: int, limit: int) -> List[Dict]:
+        if self.use_snapshot:
+            return self._snapshot_transitive_calls(function_name, file_path, direction, prefix, max_depth, limit)
+        frontier = [s.id for s in self.store.find_nodes(["Function"], name=function_name, file_path=file_path)]
+        seen = set()
+        results = []
+        depth = 0
+        while frontier and depth < max_depth and len(results) < limit:
+            depth += 1
+            edges = self.store.neighbors(frontier, "CALLS", direction)
+            reached = {edge.dst if direction == "out" else edge.src for edge in edges} - seen
+            functions = [n for n in self.store.get_nodes(reached).values() if n.label == "Function"]
+            functions = sorted(functions, key=_location)[:limit - len(results)]
+            frontier = [f.id for f in functions]
+            seen.update(frontier)
+            results.extend({**_function_row(f, prefix), "depth": depth} for f in functions)
+        return results
+
+    def find_function_call_chain(self, start_function: str, end_function: str, max_depth: int = 5, start_file: str = None, end_file: str = None) -> List[Dict]:
+        """Find the shortest call chains (at most 20) between two functions, by a bidirectional BFS."""
+        starts = [n.id for n in self.store.find_nodes(["Function"], name=start_function, file_path=start_file)]
+        ends = [n.id for n in self.store.find_nodes(["Function"], name=end_function, file_path=end_file)]
+        chains = shortest_call_chains(starts, ends, lambda ids, direction: self.store.neighbors(ids, "CALLS", direction),
+                                      max_depth, limit=20)
+
+        nodes = self.store.get_nodes({node_id for path, _ in chains for node_id in path})
+        return [{
+            "function_chain": [{
+                "name": nodes[node_id].props.get("name"),
+                "file_path": nodes[node_id].props.get("file_path"),
+                "line_number": nodes[node_id].props.get("line_number"),
+                "is_dependency": nodes[node_id].props.get("is_dependency", False),
+            } for node_id in path],
+            "call_details": [call_detail(props) for props in calls],
+            "chain_length": len(calls),
+        } for path, calls in chains]
+
+    def find_by_type(self, element_type: str, limit: int = 50, cursor: Optional[str] = None) -> Page:
+        """Find all elements of a specific type (Function, Class, File, Module)."""
+        type_map = {
+            "function": "Function",
+            "class": "Class",
+            "file": "File",
+            "module": "Module"
+        }
+        label = type_map.get(element_type.lower())
+        if not label:
+            return Page()
+
+        order_by = "location" if label == "File" else "name"
+        nodes = self.store.find_nodes([label], order_by=order_by, after=decode_cursor(cursor, NODE_KEY_COUNT),
+                                      limit=limit + 1)
+        if label == "File":
+            return _node_page(nodes, limit, lambda n: {"name": n.props.get("name"), "file_path": n.props.get("path"),
+                                                       "is_dependency": n.props.get("is_dependency", False)})
+        if label == "Module":
+            return _node_page(nodes, limit, lambda n: {"name": n.props.get("name"), "file_path": n.props.get("name"),
+                                                       "is_dependency": False}, order_by)
+        return _node_page(nodes, limit, lambda n: {
+            "name": n.props.get("name"), "file_path": n.props.get("file_path"), "line_number": n.props.get("line_number"),
+            "is_dependency": n.props.get("is_dependency", False)}, order_by)
+
+    def find_files_by_name(self, name: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+        """Find files by exact file name."""
+        files = self.store.find_nodes(["File"], name=name, after=decode_cursor(cursor, NODE_KEY_COUNT), limit=limit + 1)
+        return _node_page(files, limit, lambda n: {"name": n.props.get("name"), "file_path": n.props.get("path"),
+                                                   "is_dependency": n.props.get("is_dependency", False)})
+
+    def find_by_name_pattern(self, pattern: str, case_sensitive: bool = False, limit: int = 50,
+                             cursor: Optional[str] = None) -> Page:
+        """Find functions, classes, modules and variables whose name contains `pattern`."""
+        nodes = self.store.find_nodes(["Function", "Class", "Module", "Variable"], name_contains=pattern,
+                                      case_sensitive=case_sensitive, order_by="name",
+                                      after=decode_cursor(cursor, NODE_KEY_COUNT), limit=limit + 1)
+        return _node_page(nodes, limit, lambda n: {
+            "type": n.label, "name": n.props.get("name"), "file_path": n.props.get("file_path"),
+            "line_number": n.props.get("line_number"), "is_dependency": n.props.get("is_dependency", False),
+        }, order_by="name")
+
+    def find_module_dependencies(self, module_name: str) -> Dict[str, Any]:
+        """Find all dependencies and dependents of a module"""
+        targets = {m.id for m in self.store.find_nodes(["Module"], name=module_name)}
+        edges = self.store.neighbors(targets, "IMPORTS", "in")
+        files = self.store.get_nodes(e.src for e in edges)
+        repositories = self._repository_names(files)
+        importers = _distinct({
+            "importer_file_path": files[e.src].props.get("path"),
+            "import_line_number": e.props.get("line_number"),
+            "file_is_dependency": files[e.src].props.get("is_dependency", False),
+            "repository_name": repositories.get(e.src),
+        } for e in edges)
+
+        # Modules imported alongside the target, to show what it is typically used with
+        other_edges = [e for e in self.store.neighbors(files, "IMPORTS") if e.dst not in targets]
+        others = self.store.get_nodes(e.dst for e in other_edges)
+        imports = _distinct({
+            "imported_module": others[e.dst].props.get("name"),
+            "import_alias": e.props.get("alias"),
+        } for e in other_edges)
+        return {
+            "module_name": module_name,
+            "importers": sorted(importers, key=lambda row: _keys(row, "file_is_dependency", "importer_file_path"))[:50],
+            "imports": sorted(imports, key=lambda row: _keys(row, "imported_module"))[:50],
+        }
+
+    def find_variable_usage_scope(self, variable_name: str, file_path: str = None) -> Dict[str, Any]:
+        """Find the scope and usage patterns of a variable, optional file path filtering"""
+        variables = {v.id: v for v in self.store.find_nodes(["Variable"], name=variable_name)
+                     if not file_path or (v.props.get("file_path") or "").endswith(file_path)}
+        edges = self.store.neighbors(variables, "CONTAINS", "in")
+        containers = self.store.get_nodes(e.src for e in edges)
+        scopes: Dict[int, List[Node]] = {}
+        for edge in edges:
+            if containers[edge.src].label in ("Function", "Class", "File"):
+                scopes.setdefault(edge.dst, []).append(containers[edge.src])
+        instances = []
+        for var_id, var in variables.items():
+            files = [c for c in scopes.get(var_id, []) if c.label == "File"]
+            for container in scopes.get(var_id) or [None]:
+                scope_type, scope_name = _scope(container, "module_level")
+                instances.append({
+                    "variable_name": var.props.get("name"),
+                    "variable_value": var.props.get("value"),
+                    "line_number": var.props.get("line_number"),
+                    "context": var.props.get("context"),
+                    "file_path": var.props.get("file_path") or (files[0].props.get("path") if files else None),
+                    "scope_type": scope_type,
+                    "scope_name": scope_name,
+                    "is_dependency": var.props.get("is_dependency", False),
+                })
+        return {
+            "variable_name": variable_name,
+            "instances": sorted(_distinct(instances),
+                                key=lambda row: _keys(row, "is_dependency", "file_path", "line_number")),
+        }
+
+    def get_cyclomatic_complexity(self, function_name: str, file_path: str = None) -> Optional[Dict]:
+        """Get the cyclomatic complexity of a function."""
+        for f in self.store.find_nodes(["Function"], name=function_name):
+            path = f.props.get("file_path") or ""
+            if file_path is None or path == file_path or path.endswith(file_path):
+                return {"function_name": f.props.get("name"), "complexity": f.props.get("cyclomatic_complexity"),
+                        "file_path": path, "line_number": f.props.get("line_number")}
+        return None
+
+    def find_most_complex_functions(self, limit: int = 10) -> List[Dict]:
+        """Find the most complex functions based on cyclomatic complexity."""
+        functions = [f for f in self.store.find_nodes(["Function"], is_dependency=False)
+                     if f.props.get("cyclomatic_complexity") is not None]
+        functions.sort(key=lambda f: f.props["cyclomatic_complexity"], reverse=True)
+        return [{"function_name": f.props.get("name"), "file_path": f.props.get("file_path"),
+                 "complexity": f.props.get("cyclomatic_complexity"), "line_number": f.props.get("line_number")}
+                for f in functions[:limit]]
+
+    def list_indexed_repositories(self) -> List[Dict]:
+        """List all indexed repositories."""
+        return [{"name": r.props.get("name"), "path": r.props.get("path"), "is_dependency": r.props.get("is_dependency", False)}
+                for r in self.store.find_nodes(["Repository"], order_by="name")]
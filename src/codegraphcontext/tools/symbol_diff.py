@@ -0,0 +1,149 @@
+# src/codegraphcontext/tools/symbol_diff.py
+"""
+Symbol-level diffing of two parses of the same file.
+
+The watcher uses this to turn an incremental reparse into the smallest set of
+node writes: symbols that disappeared or changed are removed, symbols that
+appeared or changed are written back, and everything else is left alone.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+# File data keys that become symbol nodes contained by their File, with their labels.
+# To add a new language-specific node type (e.g., 'Trait' for Rust):
+# 1. Ensure your language-specific parser returns a list under a unique key (e.g., 'traits': [...] ).
+# 2. Add a migration creating the new label's constraint and indexes in `core/graph_schema.py`.
+# 3. Add a new entry to this list (e.g., ('traits', 'Trait')).
+SYMBOL_LABELS = [
+    ('functions', 'Function'),
+    ('classes', 'Class'),
+    ('traits', 'Trait'),
+    ('variables', 'Variable'),
+    ('interfaces', 'Interface'),
+    ('macros', 'Macro'),
+    ('structs', 'Struct'),
+    ('enums', 'Enum'),
+    ('unions', 'Union'),
+    ('records', 'Record'),
+    ('properties', 'Property'),
+]
+
+# File-level parts of the parse that are not tracked symbol-by-symbol. If any
+# of these change the whole file is rewritten instead.
+FILE_LEVEL_KEYS = ('lang', 'is_dependency', 'imports', 'modules', 'module_inclusions')
+
+SymbolKey = Tuple[str, str, int]  # (label, name, line_number)
+
+# Functions a call to a class is linked to, instead of the class itself
+CONSTRUCTOR_NAMES = ('__init__', 'constructor')
+
+
+@dataclass
+class FileSymbolDiff:
+    """The symbol nodes that must be removed from and written to the graph for one file."""
+    removed: List[Tuple[str, Dict]] = field(default_factory=list)
+    added: List[Tuple[str, Dict]] = field(default_factory=list)
+    file_calls_changed: bool = False
+    requires_full_update: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.removed or self.added or self.file_calls_changed or self.requires_full_update)
+
+    def rewritten_names(self) -> Set[str]:
+        """
+        The names other files may refer to the removed and added symbols by.
+        Callers of a constructor name its class, so a rewritten constructor
+        adds the name of its class.
+        """
+        names = set()
+        for label, item in self.removed + self.added:
+            names.add(item['name'])
+            if label == 'Function' and item['name'] in CONSTRUCTOR_NAMES and item.get('class_context'):
+                names.add(item['class_context'])
+        return names
+
+
+def _symbols_by_key(file_data: Dict) -> Dict[SymbolKey, Dict]:
+    symbols = {}
+    for key, label in SYMBOL_LABELS:
+        for item in file_data.get(key, []):
+            symbols[(label, item['name'], item['line_number'])] = item
+    return symbols
+
+
+def _calls_by_caller(file_data: Dict) -> Dict[Optional[Tuple[str, int]], List[Dict]]:
+    """Groups calls by the (name, line_number) of their enclosing symbol; None for file-level calls."""
+    calls = {}
+    for call in file_data.get('function_calls', []):
+        context = call.get('context')
+        if context and len(context) == 3 and context[0] is not None:
+            caller = (context[0], context[2])
+        else:
+            caller = None
+        calls.setdefault(caller, []).append(call)
+    return calls
+
+
+def _rows_overlap(start: int, end: int, spans: List[Tuple[int, int]]) -> bool:
+    return any(start <= span_end and span_start <= end for span_start, span_end in spans)
+
+
+def _span(item: Dict) -> Tuple[int, int]:
+    # Parsers report 1-based lines, tree-sitter rows are 0-based.
+    start = item['line_number'] - 1
+    return start, max(start, item.get('end_line', item['line_number']) - 1)
+
+
+def diff_file_symbols(
+    old_data: Dict,
+    new_data: Dict,
+    affected_rows: Optional[List[Tuple[int, int]]] = None,
+) -> FileSymbolDiff:
+    """
+    Compares two parses of a file and returns the symbols to remove and add.
+
+    Symbols are identified by (label, name, line_number), matching the graph's
+    uniqueness constraints. A changed symbol is removed and re-added.
+
+    `affected_rows` (from `ParseSnapshot`) limits which surviving symbols are
+    compared field by field: only those overlapping an edited row, or nested in
+    a symbol that does, can have changed. None compares every symbol.
+    """
+    diff = FileSymbolDiff()
+    if any(old_data.get(key) != new_data.get(key) for key in FILE_LEVEL_KEYS):
+        diff.requires_full_update = True
+        return diff
+
+    old_symbols = _symbols_by_key(old_data)
+    new_symbols = _symbols_by_key(new_data)
+    old_calls = _calls_by_caller(old_data)
+    new_calls = _calls_by_caller(new_data)
+
+    dirty_spans = None
+    if affected_rows is not None:
+        # Widen the edited rows to every symbol they touch, so children whose
+        # context (e.g. class_context) comes from an edited parent are compared too.
+        dirty_spans = list(affected_rows)
+        dirty_spans.extend(
+            _span(item) for item in new_symbols.values()
+            if _rows_overlap(*_span(item), affected_rows)
+        )
+
+    for key, item in old_symbols.items():
+        if key not in new_symbols:
+            diff.removed.append((key[0], item))
+
+    for key, item in new_symbols.items():
+        old_item = old_symbols.get(key)
+        if old_item is None:
+            diff.added.append((key[0], item))
+            continue
+        if dirty_spans is not None and not _rows_overlap(*_span(item), dirty_spans):
+            continue
+        caller = (key[1], key[2])
+        if old_item != item or old_calls.get(caller) != new_calls.get(caller):
+            diff.removed.append((key[0], old_item))
+            diff.added.append((key[0], item))
+
+    diff.file_calls_changed = old_calls.get(None) != new_calls.get(None)
+    return diff
@@ -0,0 +1,342 @@
+# src/codegraphcontext/tools/symbol_table.py
+"""
+A global table of where every symbol in the indexed code is defined.
+
+This replaces the plain `{name: [path, ...]}` dicts returned by the language
+pre-scans. Paths are interned to integer IDs, and a trie over module path
+components answers "which files belong to module `a.b`" without substring
+scans over candidate paths. Lookups by (module, name) are memoized, so call
+and inheritance resolution is effectively O(1) per call site, even for names
+like `get` or `__init__` with thousands of definitions.
+"""
+import hashlib
+import json
+import os
+import re
+import sys
+from bisect import bisect_left, insort
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..utils.debug_log import debug_log, warning_logger
+
+# How many trailing path components (directories plus the module itself) are
+# indexed for module lookups. Longer dotted names are matched on their tail.
+MAX_MODULE_DEPTH = 8
+
+# Bump when the on-disk format or the pre-scan output changes, so stale sidecar
+# files are rebuilt instead of being trusted.
+FORMAT_VERSION = 2
+
+_MODULE_SEPARATORS = re.compile(r"[./\\:]+")
+
+
+def _module_parts(module: str) -> List[str]:
+    """Splits a dotted (or path-like) module name into its components."""
+    return [part for part in _MODULE_SEPARATORS.split(module) if part]
+
+
+class _ModuleNode:
+    __slots__ = ("children", "files")
+
+    def __init__(self):
+        self.children: Dict[str, "_ModuleNode"] = {}
+        self.files: Set[int] = set()
+
+
+class SymbolTable(Mapping):
+    """
+    Maps symbol names to the files that define them.
+
+    It is also a read-only Mapping of name -> list of absolute paths, so it can
+    be used wherever the old pre-scan dicts were.
+    """
+
+    def __init__(self):
+        self._paths: List[str] = []
+        self._path_ids: Dict[str, int] = {}
+        self._file_names: List[Set[str]] = []
+        self._definitions: Dict[str, List[int]] = {}  # name -> sorted path IDs
+        self._stamps: Dict[int, Tuple[int, int]] = {}  # path ID -> (mtime_ns, size) when scanned
+        # Reverse index: which files reference (call, inherit from, ...) a name.
+        self._file_refs: Dict[int, Set[str]] = {}
+        self._referrers: Dict[str, Set[int]] = {}
+        # Trie keyed by path components read from the end, so walking `b`, `a`
+        # reaches every file under (or named) `.../a/b`.
+        self._modules = _ModuleNode()
+        self._resolved: Dict[tuple, Optional[int]] = {}
+
+    # --- Building ---
+
+    def intern_path(self, path: str) -> int:
+        """Returns the ID for an absolute path, adding it to the table if needed."""
+        path_id = self._path_ids.get(path)
+        if path_id is not None:
+            return path_id
+        path_id = len(self._paths)
+        self._paths.append(sys.intern(path))
+        self._path_ids[path] = path_id
+        self._file_names.append(set())
+        self._index_module_path(path_id, path)
+        return path_id
+
+    def _index_module_path(self, path_id: int, path: str):
+        p = Path(path)
+        parts = list(p.parent.parts[1:]) + [p.name.split(".", 1)[0]]
+        parts = parts[-MAX_MODULE_DEPTH:]
+        # Index every directory prefix as well as the module itself, so that a
+        # package name matches the files inside it.
+        for end in range(len(parts), 0, -1):
+            node = self._modules
+            for part in reversed(parts[:end]):
+                node = node.children.setdefault(part, _ModuleNode())
+                node.files.add(path_id)
+
+    def add(self, name: str, path: str):
+        """Records that `name` is defined in the file at `path`."""
+        path_id = self.intern_path(path)
+        names = self._file_names[path_id]
+        if name in names:
+            return
+        names.add(sys.intern(name))
+        insort(self._definitions.setdefault(name, []), path_id)
+        self._resolved.clear()
+
+    def update(self, definitions: Mapping):
+        """Merges a pre-scan result of the form {name: [path, ...]}."""
+        for name, paths in definitions.items():
+            for path in paths:
+                self.add(name, path)
+
+    def remove_file(self, path: str):
+        """Forgets everything recorded for `path`, including its references."""
+        self.clear_definitions(path)
+        self.set_references(path, ())
+
+    def clear_definitions(self, path: str):
+        """Forgets the definitions recorded for `path`, keeping its references."""
+        path_id = self._path_ids.get(path)
+        if path_id is None:
+            return
+        for name in self._file_names[path_id]:
+            ids = self._definitions.get(name)
+            if ids is None:
+                continue
+            index = bisect_left(ids, path_id)
+            if index < len(ids) and ids[index] == path_id:
+                del ids[index]
+            if not ids:
+                del self._definitions[name]
+        self._file_names[path_id] = set()
+        self._stamps.pop(path_id, None)
+        self._resolved.clear()
+
+    def set_references(self, path: str, names: Iterable[str]):
+        """Replaces the set of names that the file at `path` refers to."""
+        path_id = self.intern_path(path)
+        for name in self._file_refs.pop(path_id, ()):
+            referrers = self._referrers.get(name)
+            if referrers is not None:
+                referrers.discard(path_id)
+                if not referrers:
+                    del self._referrers[name]
+        names = {sys.intern(name) for name in names}
+        if names:
+            self._file_refs[path_id] = names
+            for name in names:
+                self._referrers.setdefault(name, set()).add(path_id)
+
+    def set_stamp(self, path: str, stamp: Tuple[int, int]):
+        """Records the (mtime_ns, size) of `path` when it was scanned."""
+        self._stamps[self.intern_path(path)] = tuple(stamp)
+
+    def stamp(self, path: str) -> Optional[Tuple[int, int]]:
+        path_id = self._path_ids.get(path)
+        return self._stamps.get(path_id) if path_id is not None else None
+
+    def scanned_files(self) -> List[str]:
+        """Paths of every file the table has a scan stamp for."""
+        return [self._paths[path_id] for path_id in self._stamps]
+
+    # --- Lookups ---
+
+    def count(self, name: str) -> int:
+        """Number of files that define `name`."""
+        return len(self._definitions.get(name, ()))
+
+    def first(self, name: str) -> Optional[str]:
+        """The first-indexed file that defines `name`, if any."""
+        ids = self._definitions.get(name)
+        return self._paths[ids[0]] if ids else None
+
+    def unique(self, name: str) -> Optional[str]:
+        """The file that defines `name`, if exactly one does."""
+        ids = self._definitions.get(name)
+        return self._paths[ids[0]] if ids and len(ids) == 1 else None
+
+    def names_in(self, path: str) -> Set[str]:
+        """The names defined in the file at `path`."""
+        path_id = self._path_ids.get(path)
+        return set(self._file_names[path_id]) if path_id is not None else set()
+
+    def referrers(self, name: str) -> List[str]:
+        """Paths of the files that refer to `name`."""
+        return [self._paths[path_id] for path_id in self._referrers.get(name, ())]
+
+    def _module_files(self, module: str) -> Set[int]:
+        node = self._modules
+        for part in reversed(_module_parts(module)[-MAX_MODULE_DEPTH:]):
+            node = node.children.get(part)
+            if node is None:
+                return set()
+        return node.files
+
+    def _resolve_id(self, name: str, module: str) -> Optional[int]:
+        key = (module, name)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        ids = self._definitions.get(name)
+        result = None
+        if ids:
+            module_files = self._module_files(module)
+            if len(module_files) < len(ids):
+                matches = [path_id for path_id in module_files if name in self._file_names[path_id]]
+                result = min(matches) if matches else None
+            else:
+                result = next((path_id for path_id in ids if path_id in module_files), None)
+        self._resolved[key] = result
+        return result
+
+    def resolve(self, name: str, module: str) -> Optional[str]:
+        """
+        The first file defining `name` that belongs to `module`.
+
+        `module` is a dotted name such as `pkg.mod`. A file belongs to it if its
+        path contains those components in order, e.g. `.../pkg/mod.py` or
+        `.../pkg/mod/__init__.py`.
+        """
+        path_id = self._resolve_id(name, module)
+        return self._paths[path_id] if path_id is not None else None
+
+    def resolve_any(self, name: str, modules: Iterable[str]) -> Optional[str]:
+        """Like `resolve`, for the first file matching any of several modules."""
+        found = [path_id for path_id in (self._resolve_id(name, m) for m in modules) if path_id is not None]
+        return self._paths[min(found)] if found else None
+
+    # --- Serialization ---
+
+    def to_dict(self) -> Dict:
+        files = {}
+        for path_id, path in enumerate(self._paths):
+            stamp = self._stamps.get(path_id)
+            refs = self._file_refs.get(path_id)
+            if stamp is not None or refs or self._file_names[path_id]:
+                files[path] = {
+                    "stamp": stamp,
+                    "names": sorted(self._file_names[path_id]),
+                    "refs": sorted(refs or ()),
+                }
+        return {"version": FORMAT_VERSION, "files": files}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SymbolTable":
+        table = cls()
+        for path, entry in data.get("files", {}).items():
+            for name in entry.get("names", []):
+                table.add(name, path)
+            if entry.get("stamp") is not None:
+                table.set_stamp(path, entry["stamp"])
+            if entry.get("refs"):
+                table.set_references(path, entry["refs"])
+        return table
+
+    # --- Mapping interface (name -> list of paths) ---
+
+    def __getitem__(self, name: str) -> List[str]:
+        return [self._paths[path_id] for path_id in self._definitions[name]]
+
+    def __contains__(self, name) -> bool:
+        return name in self._definitions
+
+    def __iter__(self):
+        return iter(self._definitions)
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+
+def referenced_names(file_data: Dict) -> Set[str]:
+    """
+    The names a parsed file refers to when its calls and base types are resolved.
+    Mirrors the lookup names used by GraphBuilder's linking passes.
+    """
+    names = set()
+    for call in file_data.get('function_calls', []):
+        names.add(call['name'])
+        full_name = call.get('full_name') or call['name']
+        names.add(full_name.split('.')[0])
+        if call.get('inferred_obj_type'):
+            names.add(call['inferred_obj_type'])
+    for key in ('classes', 'structs', 'records', 'interfaces'):
+        for item in file_data.get(key, []):
+            for base in item.get('bases') or []:
+                base = base.split('<')[0].strip()
+                names.add(base.split('.')[0])
+                names.add(base.split('.')[-1])
+    return names
+
+
+class SymbolTableStore:
+    """
+    Persists one SymbolTable per repository as a JSON sidecar file.
+
+    Files live under ~/.codegraphcontext/symbols, named after a hash of the
+    repository path, and record FORMAT_VERSION so incompatible files are ignored.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        if directory is None:
+            from ..cli.config_manager import CONFIG_DIR
+            directory = CONFIG_DIR / "symbols"
+        self.directory = Path(directory)
+
+    def path_for(self, repo_path: Path) -> Path:
+        repo_key = hashlib.sha1(str(Path(repo_path).resolve()).encode("utf-8")).hexdigest()[:16]
+        return self.directory / f"{repo_key}.json"
+
+    def load(self, repo_path: Path) -> Optional[SymbolTable]:
+        """Returns the saved table for a repository, or None if there is no usable one."""
+        sidecar = self.path_for(repo_path)
+        if not sidecar.exists():
+            return None
+        try:
+            with open(sidecar, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            warning_logger(f"Ignoring unreadable symbol table {sidecar}: {e}")
+            return None
+        if data.get("version") != FORMAT_VERSION or data.get("repo_path") != str(Path(repo_path).resolve()):
+            debug_log(f"Ignoring outdated symbol table {sidecar}")
+            return None
+        return SymbolTable.from_dict(data)
+
+    def save(self, repo_path: Path, table: SymbolTable):
+        sidecar = self.path_for(repo_path)
+        data = table.to_dict()
+        data["repo_path"] = str(Path(repo_path).resolve())
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = sidecar.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, sidecar)
+        except OSError as e:
+            warning_logger(f"Could not save symbol table for {repo_path}: {e}")
+
+    def delete(self, repo_path: Path):
+        try:
+            self.path_for(repo_path).unlink()
+        except FileNotFoundError:
+            pass
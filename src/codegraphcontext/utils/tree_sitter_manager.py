@@ -11,10 +11,12 @@ Key design principles:
 4. Support optional tree-sitter dependency
 """
 
-from typing import Dict, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 import threading
 
-from tree_sitter import Language, Parser
+from tree_sitter import Language, Parser, Tree
 from tree_sitter_language_pack import get_language
 
 
@@ -191,6 +193,148 @@ class TreeSitterManager:
         return sorted(set(LANGUAGE_ALIASES.values()))
 
 
+@dataclass
+class ParseSnapshot:
+    """
+    The source bytes and tree produced by one parse of a file.
+
+    Kept by long-lived callers (the file watcher) so the next parse of the same
+    file can be incremental.
+
+    `affected_rows` lists the 0-based, inclusive row spans that differ from the
+    previous snapshot: None means there was no previous tree (everything is new),
+    an empty list means the source was byte-for-byte identical.
+    """
+    source: bytes
+    tree: Tree
+    affected_rows: Optional[List[Tuple[int, int]]] = None
+
+
+def _point_at(source: bytes, offset: int) -> Tuple[int, int]:
+    """Returns the tree-sitter (row, byte column) point for a byte offset."""
+    row = source.count(b"\n", 0, offset)
+    line_start = source.rfind(b"\n", 0, offset) + 1
+    return row, offset - line_start
+
+
+def _common_prefix_length(a: bytes, b: bytes) -> int:
+    # Binary search on slice equality keeps the comparisons in C (memcmp),
+    # which matters for multi-thousand-line files.
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_length(a: bytes, b: bytes, limit: int) -> int:
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def compute_edit(old_source: bytes, new_source: bytes) -> Optional[Dict[str, object]]:
+    """
+    Describes the change from `old_source` to `new_source` as a single edit.
+
+    The edit spans from the first differing byte to the last one, which is what
+    an editor save usually looks like. Returns keyword arguments for
+    `Tree.edit()`, or None if the sources are identical.
+    """
+    if old_source == new_source:
+        return None
+    start = _common_prefix_length(old_source, new_source)
+    suffix = _common_suffix_length(
+        old_source, new_source, min(len(old_source), len(new_source)) - start
+    )
+    old_end = len(old_source) - suffix
+    new_end = len(new_source) - suffix
+    return {
+        "start_byte": start,
+        "old_end_byte": old_end,
+        "new_end_byte": new_end,
+        "start_point": _point_at(old_source, start),
+        "old_end_point": _point_at(old_source, old_end),
+        "new_end_point": _point_at(new_source, new_end),
+    }
+
+
+class _TrackedParse:
+    def __init__(self, previous: Optional[ParseSnapshot]):
+        self.previous = previous
+        self.snapshot: Optional[ParseSnapshot] = None
+
+
+class IncrementalParser:
+    """
+    A `Parser` wrapper that can reparse a file against its previous tree.
+
+    Language parsers keep calling `parser.parse(source)` as usual. Inside a
+    `track(previous)` block, the first parse call edits a copy of the previous
+    tree, reparses incrementally and records a `ParseSnapshot` whose
+    `affected_rows` combine the edited span with `Tree.changed_ranges()`.
+    The edited span is needed as well because changed_ranges only reports
+    structural changes, not e.g. an identifier being renamed in place.
+
+    Outside of `track()` it behaves exactly like the wrapped parser.
+    """
+
+    def __init__(self, parser: Parser):
+        self._parser = parser
+        self._local = threading.local()
+
+    def __getattr__(self, name):
+        return getattr(self._parser, name)
+
+    @contextmanager
+    def track(self, previous: Optional[ParseSnapshot] = None):
+        """Records the next parse on this thread, reusing `previous` if given."""
+        tracked = _TrackedParse(previous)
+        self._local.tracked = tracked
+        try:
+            yield tracked
+        finally:
+            self._local.tracked = None
+
+    def parse(self, source, old_tree: Optional[Tree] = None, **kwargs):
+        tracked = getattr(self._local, "tracked", None)
+        if old_tree is not None:
+            return self._parser.parse(source, old_tree, **kwargs)
+        if tracked is None or tracked.snapshot is not None:
+            return self._parser.parse(source, **kwargs)
+
+        source = bytes(source)
+        previous = tracked.previous
+        if previous is None:
+            tree = self._parser.parse(source, **kwargs)
+            tracked.snapshot = ParseSnapshot(source, tree)
+            return tree
+
+        edit = compute_edit(previous.source, source)
+        if edit is None:
+            tracked.snapshot = ParseSnapshot(source, previous.tree, [])
+            return previous.tree
+
+        # Edit a copy so the cached tree stays valid if this parse is abandoned.
+        old_tree = previous.tree.copy()
+        old_tree.edit(**edit)
+        tree = self._parser.parse(source, old_tree, **kwargs)
+        affected_rows = [(edit["start_point"][0], edit["new_end_point"][0])]
+        affected_rows.extend(
+            (r.start_point[0], r.end_point[0]) for r in old_tree.changed_ranges(tree)
+        )
+        tracked.snapshot = ParseSnapshot(source, tree, affected_rows)
+        return tree
+
+
 # Global singleton instance
 _manager_instance: Optional[TreeSitterManager] = None
 _instance_lock = threading.Lock()
@@ -44,5 +44,19 @@ class TestCLICommands:
         # Output might be empty in some test envs, checking exit code is enough integration test
         # assert "No such command" in result.stdout
 
-
-
+    @patch('codegraphcontext.cli.main._load_credentials')
+    @patch('codegraphcontext.cli.main._initialize_services')
+    def test_invalid_cursor_is_reported(self, mock_services, mock_credentials):
+        """Test that a bad --cursor exits with an error message rather than a traceback."""
+        from codegraphcontext.tools.pagination import InvalidCursorError
+
+        db_manager, code_finder = MagicMock(), MagicMock()
+        code_finder.find_by_type.side_effect = InvalidCursorError("Invalid cursor: 'stale'")
+        code_finder.find_dead_code.side_effect = InvalidCursorError("Invalid cursor: 'stale'")
+        mock_services.return_value = (db_manager, MagicMock(), code_finder)
+
+        for args in (["find", "type", "function", "--cursor", "stale"], ["analyze", "dead-code", "--cursor", "stale"]):
+            result = runner.invoke(app, args)
+            assert result.exit_code == 1
+            assert isinstance(result.exception, SystemExit)
+        assert db_manager.close_driver.call_count == 2
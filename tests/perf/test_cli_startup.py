@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cold `cgc --help` import budget (cumulative microseconds reported by -X importtime).
+# Override with CGC_STARTUP_BUDGET_MS on slow CI machines.
+STARTUP_BUDGET_US = int(os.getenv("CGC_STARTUP_BUDGET_MS", "300")) * 1000
+
+# Modules that must only be loaded by the commands that actually need them.
+HEAVY_MODULES = [
+    "neo4j",
+    "falkordb",
+    "redislite",
+    "nbformat",
+    "nbconvert",
+    "stdlibs",
+    "InquirerPy",
+    "tree_sitter_language_pack",
+    "codegraphcontext.server",
+    "codegraphcontext.tools.graph_builder",
+    "codegraphcontext.tools.languages.python",
+]
+
+HELP_SNIPPET = (
+    "import sys; sys.argv = ['cgc', '--help']; "
+    "from codegraphcontext.cli.main import app; app()"
+)
+
+
+def _run_with_importtime():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", HELP_SNIPPET],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        timings[name.strip()] = int(cumulative)
+    return result, timings
+
+
+@pytest.fixture(scope="module")
+def importtime():
+    return _run_with_importtime()
+
+
+class TestCLIStartup:
+    """
+    Regression tests for cold start of the `cgc` entry point.
+    Agents spawn `cgc mcp start` per session, so import time is user-visible latency.
+    """
+
+    def test_help_exits_cleanly(self, importtime):
+        result, _ = importtime
+        assert result.returncode == 0, result.stderr[-2000:]
+
+    @pytest.mark.parametrize("module", HEAVY_MODULES)
+    def test_heavy_module_not_imported(self, importtime, module):
+        _, timings = importtime
+        assert module not in timings, f"'{module}' is imported eagerly by 'cgc --help'"
+
+    def test_import_budget(self, importtime):
+        _, timings = importtime
+        total = timings.get("codegraphcontext.cli.main")
+        assert total is not None, "codegraphcontext.cli.main was not imported by 'cgc --help'"
+        assert total < STARTUP_BUDGET_US, (
+            f"Cold 'cgc --help' import took {total / 1000:.1f}ms "
+            f"(budget {STARTUP_BUDGET_US / 1000:.0f}ms)"
+        )
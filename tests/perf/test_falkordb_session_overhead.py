@@ -0,0 +1,45 @@
+import os
+import time
+
+from codegraphcontext.core.database_falkordb import FalkorDBSessionWrapper
+
+# Per-call overhead budget for FalkorDBSessionWrapper.run on top of the graph
+# query itself, in microseconds. Override with CGC_SESSION_OVERHEAD_US on slow CI machines.
+OVERHEAD_BUDGET_US = float(os.getenv("CGC_SESSION_OVERHEAD_US", "20"))
+
+CALLS = 20000
+
+WRITE_QUERY = """
+    MATCH (f:File {path: $file_path})
+    MERGE (n:Function {name: $name, file_path: $file_path, line_number: $line_number})
+    SET n += $props
+    MERGE (f)-[:CONTAINS]->(n)
+"""
+
+
+class _NullGraph:
+    def query(self, query, params=None):
+        return None
+
+
+class TestFalkorDBSessionOverhead:
+    """
+    Measures the time FalkorDBSessionWrapper.run adds per query, using a graph that does nothing.
+    """
+
+    def _per_call_us(self, query):
+        session = FalkorDBSessionWrapper(_NullGraph())
+        start = time.perf_counter()
+        for i in range(CALLS):
+            session.run(query, file_path="/repo/a.py", name="f", line_number=i, props={})
+        return (time.perf_counter() - start) / CALLS * 1e6
+
+    def test_write_query_overhead(self):
+        per_call = self._per_call_us(WRITE_QUERY)
+        print(f"FalkorDBSessionWrapper.run overhead (write query): {per_call:.2f}us/call")
+        assert per_call < OVERHEAD_BUDGET_US
+
+    def test_schema_query_overhead(self):
+        per_call = self._per_call_us("CREATE CONSTRAINT file_path IF NOT EXISTS FOR (f:File) REQUIRE f.path IS UNIQUE")
+        print(f"FalkorDBSessionWrapper.run overhead (schema query): {per_call:.2f}us/call")
+        assert per_call < OVERHEAD_BUDGET_US
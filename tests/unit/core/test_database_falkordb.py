@@ -0,0 +1,148 @@
+import pytest
+from unittest.mock import MagicMock, call
+from codegraphcontext.core.database_falkordb import (
+    FalkorDBDriverWrapper, FalkorDBManager, FalkorDBResultWrapper, FalkorDBSessionWrapper, translate_schema_query,
+)
+
+
+class TestFalkorDBSessionWrapper:
+    """
+    Unit tests for the Neo4j-compatible session wrapper around FalkorDB graphs.
+    Uses a mock graph, so no FalkorDB server is needed.
+    """
+
+    @pytest.fixture
+    def graph(self):
+        return MagicMock()
+
+    def test_constraint_translation(self):
+        assert translate_schema_query(
+            "CREATE CONSTRAINT file_path IF NOT EXISTS FOR (f:File) REQUIRE f.path IS UNIQUE"
+        ) == "CREATE CONSTRAINT ON (f:File) ASSERT f.path IS UNIQUE"
+        assert translate_schema_query(
+            "CREATE CONSTRAINT function_unique IF NOT EXISTS FOR (f:Function) REQUIRE (f.name, f.file_path) IS UNIQUE"
+        ) == "CREATE INDEX FOR (f:Function) ON (f.name, f.file_path)"
+        assert translate_schema_query(
+            "CREATE INDEX function_lang IF NOT EXISTS FOR (f:Function) ON (f.lang)"
+        ) == "CREATE INDEX FOR (f:Function) ON (f.lang)"
+
+    def test_schema_queries_are_translated(self, graph):
+        FalkorDBSessionWrapper(graph).run("\n  CREATE FULLTEXT INDEX code_search IF NOT EXISTS FOR (n:Function) ON EACH [n.name]")
+        assert graph.query.call_args.args[0] == "RETURN 1"
+
+    def test_data_queries_pass_through(self, graph):
+        query = "MERGE (f:File {path: $path}) SET f.note = 'create index later'"
+        FalkorDBSessionWrapper(graph).run(query, path="/a.py")
+        assert graph.query.call_args.args == (query, {"path": "/a.py"})
+
+    def test_translation_is_cached(self, graph):
+        translate_schema_query.cache_clear()
+        session = FalkorDBSessionWrapper(graph)
+        for _ in range(3):
+            session.run("CREATE INDEX class_lang IF NOT EXISTS FOR (c:Class) ON (c.lang)")
+        info = translate_schema_query.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_reads_and_writes_are_routed(self, graph):
+        read_graph = MagicMock()
+        session = FalkorDBSessionWrapper(graph, read_graph)
+        session.run("MATCH (f:Function {name: $name}) RETURN f", name="run")
+        session.run("MATCH (f:File {path: $path}) DETACH DELETE f", path="/a.py")
+        session.run("CALL db.idx.fulltext.createNodeIndex('Function', 'name')")
+        assert read_graph.ro_query.call_args.args == ("MATCH (f:Function {name: $name}) RETURN f", {"name": "run"})
+        assert [c.args[0][:5] for c in graph.query.call_args_list] == ["MATCH", "CALL "]
+        read_graph.query.assert_not_called()
+
+    def test_misclassified_write_is_retried(self, graph):
+        read_graph = MagicMock()
+        read_graph.ro_query.side_effect = Exception("graph.RO_QUERY is to be executed only on read-only queries")
+        FalkorDBSessionWrapper(graph, read_graph).run("CALL custom.write()")
+        graph.query.assert_called_once()
+
+    def test_driver_sessions_use_both_pools(self):
+        write_pool, read_pool = MagicMock(), MagicMock()
+        driver = FalkorDBDriverWrapper(write_pool=write_pool, read_pool=read_pool)
+        session = driver.session()
+        assert session.graph is write_pool.graph.return_value
+        assert session.read_graph is read_pool.graph.return_value
+        driver.close()
+        write_pool.close.assert_called_once()
+        read_pool.close.assert_called_once()
+
+
+class _CountingRows:
+    """A result set that records how many rows were read from it."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.read = 0
+
+    def __iter__(self):
+        for row in self.rows:
+            self.read += 1
+            yield row
+
+
+class TestFalkorDBResultWrapper:
+    """
+    Unit tests for lazily converting FalkorDB query results into Neo4j-like records.
+    """
+
+    def _result(self, rows, header=((1, b"name"), (1, b"line"))):
+        return MagicMock(header=list(header), result_set=rows)
+
+    def test_records(self):
+        wrapper = FalkorDBResultWrapper(self._result([["a", 1], ["b", 2]]))
+        assert wrapper.keys() == ["name", "line"]
+        assert [record.data() for record in wrapper] == [{"name": "a", "line": 1}, {"name": "b", "line": 2}]
+        # Results can be walked more than once.
+        assert wrapper.data() == [{"name": "a", "line": 1}, {"name": "b", "line": 2}]
+
+    def test_single_reads_one_row(self):
+        rows = _CountingRows([["row%d" % i, i] for i in range(1000)])
+        record = FalkorDBResultWrapper(self._result(rows)).single()
+        assert record["name"] == "row0"
+        assert rows.read == 1
+
+    def test_raw_tuples(self):
+        wrapper = FalkorDBResultWrapper(self._result([("a", 1)]))
+        assert list(wrapper.tuples()) == [("a", 1)]
+
+    def test_no_header_and_no_result(self):
+        assert FalkorDBResultWrapper(MagicMock(header=None, result_set=[[5]])).data() == [{"value": 5}]
+        assert FalkorDBResultWrapper(None).single() is None
+
+
+class TestFalkorDBBulkLoad:
+    """
+    Unit tests for suspending FalkorDB persistence during bulk loads.
+    Uses a mock redis client in place of the worker.
+    """
+
+    @pytest.fixture
+    def manager(self):
+        manager = FalkorDBManager()
+        redis = MagicMock()
+        redis.config_get.side_effect = lambda name: {"save": {"save": "3600 1"}, "appendonly": {"appendonly": "yes"}}[name]
+        manager._driver = MagicMock()
+        manager._driver.write_pool.redis = redis
+        manager.bulk_load_enabled = True
+        yield manager
+        manager._driver = None
+
+    def test_snapshot_once_after_success(self, manager):
+        redis = manager._driver.write_pool.redis
+        with manager.bulk_load():
+            with manager.bulk_load():
+                assert call("save", "") in redis.config_set.call_args_list
+        redis.save.assert_called_once()
+        assert redis.config_set.call_args_list == [
+            call("save", ""), call("appendonly", "no"), call("save", "3600 1"), call("appendonly", "yes")]
+
+    def test_restore_without_snapshot_on_failure(self, manager):
+        redis = manager._driver.write_pool.redis
+        with pytest.raises(RuntimeError):
+            with manager.bulk_load():
+                raise RuntimeError("parse failed")
+        redis.save.assert_not_called()
+        assert redis.config_set.call_args_list[-2:] == [call("save", "3600 1"), call("appendonly", "yes")]
@@ -0,0 +1,217 @@
+import asyncio
+import textwrap
+
+import pytest
+
+from codegraphcontext.core import get_database_manager
+from codegraphcontext.core.database_sqlite import SQLiteManager, to_fts5_query
+from codegraphcontext.tools.sqlite_graph import SQLiteCodeFinder, SQLiteGraphBuilder
+from codegraphcontext.tools.symbol_diff import diff_file_symbols
+from codegraphcontext.tools.symbol_table import SymbolTableStore
+
+
+@pytest.fixture
+def manager(temp_test_dir):
+    manager = SQLiteManager()
+    saved_path = manager.db_path
+    manager.close_driver()
+    manager.db_path = str(temp_test_dir / "graph.sqlite")
+    yield manager
+    manager.close_driver()
+    manager.db_path = saved_path
+
+
+@pytest.fixture
+def indexed(manager, temp_test_dir):
+    repo = temp_test_dir / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "pkg" / "models.py").write_text(textwrap.dedent('''
+        class Base:
+            pass
+
+        class User(Base):
+            """A user account."""
+            def __init__(self):
+                pass
+
+            def save(self):
+                return persist(self)
+
+        def persist(obj):
+            return obj
+    '''))
+    (repo / "app.py").write_text(textwrap.dedent('''
+        from pkg.models import User
+
+        def main():
+            handle()
+
+        def handle():
+            user = User()
+            user.save()
+    '''))
+    builder = SQLiteGraphBuilder(manager, None, None)
+    builder.symbol_store = SymbolTableStore(temp_test_dir / "symbols")
+    asyncio.run(builder.build_graph_from_path_async(repo))
+    return repo, builder, SQLiteCodeFinder(manager)
+
+
+class TestSQLiteBackend:
+    """
+    Tests for the embedded SQLite graph backend, indexing a small project and querying it.
+    """
+
+    def test_selected_explicitly(self, monkeypatch):
+        monkeypatch.setenv("CGC_RUNTIME_DB_TYPE", "sqlite")
+        assert get_database_manager().get_backend_type() == "sqlite"
+
+    def test_in_memory_path_is_rejected(self, temp_test_dir):
+        assert SQLiteManager.validate_config(":memory:")[0] is False
+        assert SQLiteManager.validate_config(str(temp_test_dir / "graph.sqlite")) == (True, None)
+
+    def test_fts5_query_translation(self):
+        assert to_fts5_query("name:parse~2") == 'name : "parse"*'
+        assert to_fts5_query('load config-file') == '"load" OR "config-file"'
+        assert to_fts5_query("path:x") == '"path:x"'
+
+    def test_index_and_find(self, indexed):
+        repo, builder, finder = indexed
+        assert [r["path"] for r in finder.list_indexed_repositories()] == [str(repo.resolve())]
+        assert [f["line_number"] for f in finder.find_by_function_name("persist", fuzzy_search=False)] == [13]
+        assert [c["name"] for c in finder.find_by_class_name("Use~1", fuzzy_search=True)] == ["User"]
+        assert [(r["type"], r["name"]) for r in finder.find_by_content("persist")] == [("function", "persist")]
+        assert finder.find_functions_by_argument("obj")[0]["function_name"] == "persist"
+
+    def test_call_graph(self, indexed):
+        repo, builder, finder = indexed
+        # Calling a class links to its constructor
+        assert {c["called_function"] for c in finder.what_does_function_call("handle")} == {"__init__", "save"}
+        assert [c["caller_function"] for c in finder.who_calls_function("persist")] == ["save"]
+        assert [(c["caller_name"], c["depth"]) for c in finder.find_all_callers("persist")] == [
+            ("save", 1), ("handle", 2), ("main", 3)]
+        assert [c["caller_name"] for c in finder.find_all_callers("persist", max_depth=2)] == ["save", "handle"]
+        chains = finder.find_function_call_chain("main", "persist")
+        assert [[f["name"] for f in c["function_chain"]] for c in chains] == [["main", "handle", "save", "persist"]]
+        assert chains[0]["chain_length"] == 3
+
+    def test_structure_queries(self, indexed):
+        repo, builder, finder = indexed
+        importers = finder.who_imports_module("pkg.models")
+        assert [(f["file_name"], f["repository_name"]) for f in importers] == [("app.py", "repo")]
+        assert importers[0]["imports"][0]["full_import_name"] == "pkg.models.User"
+        hierarchy = finder.find_class_hierarchy("User")
+        assert [c["parent_class"] for c in hierarchy["parent_classes"]] == ["Base"]
+        assert [m["method_name"] for m in hierarchy["methods"]] == ["__init__", "save"]
+        assert [c["child_class"] for c in finder.find_class_hierarchy("Base")["child_classes"]] == ["User"]
+        assert [(f["class_name"], f["file_name"]) for f in finder.find_function_overrides("save")] == [("User", "models.py")]
+        assert [(v["container_type"], v["variable_line_number"]) for v in finder.who_modifies_variable("user")] == [("file", 8)]
+        scope = finder.find_variable_usage_scope("user", "app.py")["instances"]
+        assert [(v["scope_type"], v["file_path"]) for v in scope] == [("module", str((repo / "app.py").resolve()))]
+        dependencies = finder.analyze_code_relationships("module_deps", "User")
+        assert [f["importer_file_path"] for f in dependencies["results"]["importers"]] == [str((repo / "app.py").resolve())]
+
+    def test_file_and_pattern_lookups(self, indexed):
+        repo, builder, finder = indexed
+        assert [f["file_path"] for f in finder.find_files_by_name("app.py")] == [str((repo / "app.py").resolve())]
+        first = finder.find_by_name_pattern("us", limit=2)
+        assert [(m["type"], m["name"]) for m in first] == [("Module", "User"), ("Class", "User")]
+        rest = finder.find_by_name_pattern("us", limit=2, cursor=first.next_cursor)
+        assert [(m["type"], m["name"]) for m in rest] == [("Variable", "user")] and rest.next_cursor is None
+        assert [m["type"] for m in finder.find_by_name_pattern("us", case_sensitive=True)] == ["Variable"]
+
+    def test_rewritten_class_keeps_its_mixins(self, indexed, manager):
+        repo, builder, finder = indexed
+        source = repo / "greeter.rb"
+        source.write_text("module Greeting\nend\n\nclass Greeter\n  include Greeting\n  def hi\n  end\nend\n")
+        asyncio.run(builder.build_graph_from_path_async(repo))
+        old_data = builder.parse_file(repo, source)
+        source.write_text("module Greeting\nend\n\nclass Greeter\n  include Greeting\n  def hi\n  end\n\n  def bye\n  end\nend\n")
+        new_data = builder.parse_file(repo, source)
+        diff = diff_file_symbols(old_data, new_data)
+        assert ("Class", "Greeter") in [(label, item["name"]) for label, item in diff.added]
+
+        builder.apply_symbol_diff(new_data, diff)
+        store = manager.store
+        classes = {c.id for c in store.find_nodes(["Class"], name="Greeter")}
+        modules = store.get_nodes(e.dst for e in store.neighbors(classes, "INCLUDES"))
+        assert [m.props["name"] for m in modules.values()] == ["Greeting"]
+
+    def test_delete_file_and_repository(self, indexed):
+        repo, builder, finder = indexed
+        builder.delete_file_from_graph(str(repo / "pkg" / "models.py"))
+        assert finder.find_by_function_name("persist", fuzzy_search=False) == []
+        assert finder.find_by_content("persist") == []
+        assert builder.store.get_node("Directory", str((repo / "pkg").resolve())) is None
+
+        assert builder.delete_repository_from_graph(str(repo))
+        assert finder.list_indexed_repositories() == []
+        assert builder.store.find_nodes(["Function", "File", "Parameter"]) == []
+
+    def test_snapshot_answers_match_queries(self, indexed, manager):
+        repo, builder, finder = indexed
+        snapshot_finder = SQLiteCodeFinder(manager, long_running=True)
+        assert snapshot_finder.use_snapshot and not finder.use_snapshot
+        for name in ("persist", "save", "main"):
+            assert snapshot_finder.find_all_callers(name) == finder.find_all_callers(name)
+            assert snapshot_finder.find_all_callees(name) == finder.find_all_callees(name)
+        assert snapshot_finder.find_dead_code() == finder.find_dead_code()
+        assert [f["function_name"] for f in finder.find_dead_code()["potentially_unused_functions"]] == []
+
+        snapshot = snapshot_finder.graph_snapshot()
+        assert snapshot_finder.graph_snapshot() is snapshot
+        builder.delete_file_from_graph(str(repo / "app.py"))
+        assert snapshot_finder.graph_snapshot() is not snapshot
+        assert [f["function_name"] for f in snapshot_finder.find_dead_code()["potentially_unused_functions"]] == ["save"]
+
+    def test_caller_counts_and_dead_code_pages(self, indexed, manager):
+        repo, builder, finder = indexed
+        persist = builder.store.find_nodes(["Function"], name="persist")[0]
+        assert (persist.props["caller_count"], persist.props["internal_caller_count"]) == (1, 1)
+
+        (repo / "extra.py").write_text("def a():\n    pass\n\ndef b():\n    a()\n\ndef c():\n    pass\n\ndef d():\n    pass\n")
+        asyncio.run(builder.build_graph_from_path_async(repo))
+        snapshot_finder = SQLiteCodeFinder(manager, long_running=True)
+        for code_finder in (finder, snapshot_finder):
+            names, cursor = [], None
+            while True:
+                page = code_finder.find_dead_code(limit=2, cursor=cursor)
+                assert len(page["potentially_unused_functions"]) <= 2
+                names += [f["function_name"] for f in page["potentially_unused_functions"]]
+                cursor = page["next_cursor"]
+                if not cursor:
+                    break
+            assert names == ["b", "c", "d"]
+
+        # Relinking b without its call leaves a with no callers
+        (repo / "extra.py").write_text("def a():\n    pass\n\ndef b():\n    pass\n\ndef c():\n    pass\n\ndef d():\n    pass\n")
+        builder.update_file_in_graph(repo / "extra.py", repo, builder.symbol_store.load(repo.resolve()))
+        builder.relink_file(builder.parse_file(repo, repo / "extra.py"), builder.symbol_store.load(repo.resolve()))
+        assert [f["function_name"] for f in finder.find_dead_code()["potentially_unused_functions"]] == ["a", "b", "c", "d"]
+
+    def test_find_and_relationship_pages(self, indexed):
+        repo, builder, finder = indexed
+        (repo / "extra.py").write_text("".join(f"def relay_{name}():\n    handle()\n\n" for name in "abc"))
+        asyncio.run(builder.build_graph_from_path_async(repo))
+
+        def every_page(fetch):
+            rows, cursor = [], None
+            while True:
+                page = fetch(cursor)
+                assert len(page) <= 2
+                rows += page
+                cursor = page.next_cursor
+                if not cursor:
+                    return rows
+
+        functions = every_page(lambda cursor: finder.find_by_type("function", limit=2, cursor=cursor))
+        assert [f["name"] for f in functions] == [f["name"] for f in finder.find_by_type("function", limit=100)]
+        assert len(functions) == len(set((f["file_path"], f["line_number"]) for f in functions)) == 8
+        callers = every_page(lambda cursor: finder.who_calls_function("handle", limit=2, cursor=cursor))
+        assert [c["caller_function"] for c in callers] == ["main", "relay_a", "relay_b", "relay_c"]
+        matches = every_page(lambda cursor: finder.find_by_content("relay", limit=2, cursor=cursor))
+        assert sorted(m["name"] for m in matches) == ["relay_a", "relay_b", "relay_c"]
+
+        related = finder.find_related_code("relay", False, 0, limit=2)
+        assert related["functions_by_name"] == [] and len(related["content_matches"]) == 2
+        following = finder.find_related_code("relay", False, 0, limit=2, cursor=related["next_cursor"])
+        assert len(following["content_matches"]) == 1 and following["next_cursor"] is None
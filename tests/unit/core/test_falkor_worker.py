@@ -0,0 +1,69 @@
+import importlib.util
+import os
+import time
+
+import pytest
+
+from codegraphcontext.cli.config_manager import validate_config_value
+from codegraphcontext.core.database_falkordb import WORKER_START_TIMEOUT, FalkorDBManager
+from codegraphcontext.core.falkor_worker import module_args, module_settings, persistence_config, signal_ready
+
+
+class TestFalkorWorkerSettings:
+    """
+    Unit tests for turning the configuration into FalkorDB module and redis settings.
+    """
+
+    def test_module_settings(self):
+        config = {
+            "FALKORDB_THREAD_COUNT": "4",
+            "FALKORDB_CACHE_SIZE": "default",
+            "FALKORDB_TIMEOUT_MAX": "",
+            "FALKORDB_QUERY_MEM_CAPACITY": "268435456",
+            "DEBUG_LOGS": "true",
+        }
+        settings = module_settings(config)
+        assert settings == {"THREAD_COUNT": "4", "QUERY_MEM_CAPACITY": "268435456"}
+        assert module_args(settings) == ["THREAD_COUNT", "4", "QUERY_MEM_CAPACITY", "268435456"]
+
+    def test_persistence_policies(self):
+        assert persistence_config("rdb") == {"appendonly": "no"}
+        assert persistence_config("AOF") == {"save": '""', "appendonly": "yes"}
+        assert persistence_config(None) == persistence_config("rdb")
+        assert persistence_config("bogus") == persistence_config("rdb")
+
+    def test_validation(self):
+        assert validate_config_value("FALKORDB_TIMEOUT_DEFAULT", "30000") == (True, None)
+        assert validate_config_value("FALKORDB_THREAD_COUNT", "default") == (True, None)
+        assert not validate_config_value("FALKORDB_CACHE_SIZE", "lots")[0]
+        assert not validate_config_value("FALKORDB_PERSISTENCE", "sometimes")[0]
+
+
+class TestReadinessHandshake:
+    """
+    Tests for the worker reporting readiness (or failure) on a pipe.
+    """
+
+    def test_signal_ready_reports_once(self, monkeypatch):
+        read_fd, write_fd = os.pipe()
+        monkeypatch.setenv("FALKORDB_READY_FD", str(write_fd))
+        signal_ready("READY")
+        signal_ready("ERROR too late")
+        with os.fdopen(read_fd, "rb") as ready:
+            assert ready.read() == b"READY\n"
+
+    @pytest.mark.skipif(importlib.util.find_spec("redislite") is not None,
+                        reason="needs an environment without falkordblite")
+    def test_failed_start_is_reported_without_polling(self, temp_test_dir):
+        manager = FalkorDBManager()
+        saved_paths = (manager.db_path, manager.socket_path)
+        manager.db_path = str(temp_test_dir / "falkordb.db")
+        manager.socket_path = str(temp_test_dir / "falkordb.sock")
+        try:
+            start = time.monotonic()
+            with pytest.raises(RuntimeError, match="falkordblite is not installed"):
+                manager._start_worker()
+            assert time.monotonic() - start < WORKER_START_TIMEOUT
+        finally:
+            manager.db_path, manager.socket_path = saved_paths
+            manager._process = None
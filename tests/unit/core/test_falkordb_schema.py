@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+from codegraphcontext.core.falkordb_schema import RANGE_INDEXES, schema_statements, to_fulltext_query
+from codegraphcontext.tools.code_finder import CodeFinder
+from codegraphcontext.tools.graph_builder import GraphBuilder
+
+
+def _falkordb_manager():
+    db_manager = MagicMock()
+    db_manager.get_backend_type.return_value = "falkordb"
+    return db_manager
+
+
+class TestFalkorDBSchema:
+    """
+    Unit tests for the FalkorDB range and full-text indexes and the queries that use them.
+    """
+
+    def test_schema_statements(self):
+        statements = schema_statements()
+        assert "CREATE INDEX FOR (n:Function) ON (n.file_path)" in statements
+        assert "CALL db.idx.fulltext.createNodeIndex('Class', 'name', 'source', 'docstring')" in statements
+        assert len(statements) == sum(len(props) for props in RANGE_INDEXES.values()) + 3
+
+    def test_fulltext_query_translation(self):
+        assert to_fulltext_query("name:parse~2") == "@name:%%parse%%"
+        assert to_fulltext_query("load~ config~1") == "%%load%% %config%"
+        assert to_fulltext_query("error 503") == "error 503"
+        assert to_fulltext_query("name:x~9") == "@name:%%%x%%%"
+
+    def test_schema_creation_continues_after_a_failure(self):
+        db_manager = _falkordb_manager()
+        session = db_manager.get_driver.return_value.session.return_value.__enter__.return_value
+        unversioned = MagicMock(single=MagicMock(return_value=None))
+        session.run.side_effect = [unversioned, Exception("boom")] + [MagicMock()] * (len(schema_statements()) - 1)
+        GraphBuilder(db_manager, MagicMock(), None)
+        # The version check, then every statement; the failed migration is not recorded
+        assert session.run.call_count == 1 + len(schema_statements())
+
+    def test_content_search_merges_labels_by_score(self):
+        db_manager = _falkordb_manager()
+        session = db_manager.get_driver.return_value.session.return_value.__enter__.return_value
+        hits = {
+            "Function": [{"type": "function", "name": "f", "sort_keys": [-0.5, "", 0, "f", "function"]}],
+            "Class": [{"type": "class", "name": "C", "sort_keys": [-0.9, "", 0, "C", "class"]}],
+            "Variable": [],
+        }
+        session.run.side_effect = lambda query, **params: MagicMock(
+            data=MagicMock(return_value=[dict(h) for label, rows in hits.items() if f"'{label}'" in query for h in rows]))
+
+        results = CodeFinder(db_manager).find_by_content("parse~1")
+        assert [(r["type"], r["name"]) for r in results] == [("class", "C"), ("function", "f")]
+        assert session.run.call_args.kwargs == {"search_term": "%parse%", "after": None, "page_size": 21}
+        assert results.next_cursor is None
@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+
+from codegraphcontext.core.graph_schema import FALKORDB_MIGRATIONS, NEO4J_MIGRATIONS, ensure_schema
+
+
+class _Session:
+    """A session over a graph that stores only the schema version."""
+
+    def __init__(self, version=None, errors=None):
+        self.version = version
+        self.errors = errors or {}
+        self.statements = []
+
+    def run(self, query, **params):
+        if query.startswith("MATCH (s:SchemaVersion"):
+            record = None if self.version is None else {"version": self.version}
+            return MagicMock(single=MagicMock(return_value=record))
+        if query.startswith("MERGE (s:SchemaVersion"):
+            self.version = params["version"]
+            return MagicMock()
+        self.statements.append(query)
+        if query in self.errors:
+            raise Exception(self.errors[query])
+        return MagicMock()
+
+
+def _driver(session):
+    driver = MagicMock()
+    driver.session.return_value.__enter__.return_value = session
+    return driver
+
+
+class TestGraphSchema:
+    """
+    Unit tests for the versioned schema bootstrap.
+    """
+
+    def test_fresh_graph_is_migrated_and_recorded(self):
+        session = _Session()
+        assert ensure_schema(_driver(session), "neo4j") == len(NEO4J_MIGRATIONS)
+        assert session.statements == [s for migration in NEO4J_MIGRATIONS for s in migration]
+        assert session.version == len(NEO4J_MIGRATIONS)
+
+    def test_current_graph_runs_no_ddl(self):
+        session = _Session(version=len(FALKORDB_MIGRATIONS))
+        assert ensure_schema(_driver(session), "falkordb") == len(FALKORDB_MIGRATIONS)
+        assert session.statements == []
+
+    def test_existing_indexes_do_not_block_the_migration(self):
+        first = FALKORDB_MIGRATIONS[0][0]
+        session = _Session(errors={first: "Attribute 'path' is already indexed"})
+        assert ensure_schema(_driver(session), "falkordb") == len(FALKORDB_MIGRATIONS)
+
+    def test_failed_migration_is_retried(self):
+        first = FALKORDB_MIGRATIONS[0][0]
+        session = _Session(errors={first: "connection reset"})
+        assert ensure_schema(_driver(session), "falkordb") == 0
+        assert session.version is None
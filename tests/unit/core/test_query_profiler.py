@@ -0,0 +1,84 @@
+import json
+import threading
+from unittest.mock import MagicMock
+
+from codegraphcontext.core.query_profiler import (
+    InstrumentedDriver, QueryProfiler, is_write_query, load_stats, normalize_query, top_statements,
+)
+
+
+def _driver(rows):
+    driver = MagicMock()
+    session = driver.session.return_value
+    session.run.side_effect = lambda query, *args, **kwargs: MagicMock(
+        data=MagicMock(return_value=list(rows)), __iter__=lambda self: iter(list(rows)))
+    return driver, session
+
+
+class TestQueryProfiler:
+    """
+    Unit tests for the per-statement query statistics and the slow-query log.
+    """
+
+    def test_normalize_query(self):
+        assert normalize_query("MATCH (n {name: 'foo'})\n  RETURN n LIMIT 25") == "MATCH (n {name: ?}) RETURN n LIMIT ?"
+        assert normalize_query("MATCH (n) WHERE n.x = $x2 RETURN n") == "MATCH (n) WHERE n.x = $x2 RETURN n"
+
+    def test_write_detection(self):
+        assert is_write_query("UNWIND $rows AS r MERGE (n:Function {name: r.name})")
+        assert is_write_query("match (n) set n.x = 1")
+        assert not is_write_query("MATCH (n:Function) WHERE n.name CONTAINS 'created' RETURN n.name")
+        assert not is_write_query("MATCH (n) RETURN n.offset AS settings")
+        assert not is_write_query("CALL db.idx.fulltext.queryNodes('Function', $term) YIELD node RETURN node")
+
+    def test_session_records_rows_per_statement(self):
+        profiler = QueryProfiler(slow_query_ms=10_000)
+        driver, _ = _driver([{"a": 1}, {"a": 2}])
+        with InstrumentedDriver(driver, profiler).session() as session:
+            assert len(session.run("MATCH (n) RETURN n LIMIT 5").data()) == 2
+            assert len(list(session.run("MATCH (n) RETURN n LIMIT 7"))) == 2
+            session.run("MATCH (n) DELETE n")  # never read, recorded when the session ends
+
+        assert set(profiler.stats) == {"MATCH (n) RETURN n LIMIT ?", "MATCH (n) DELETE n"}
+        read = profiler.stats["MATCH (n) RETURN n LIMIT ?"]
+        assert (read.count, read.rows, read.slow) == (2, 4, 0)
+        assert profiler.stats["MATCH (n) DELETE n"].count == 1
+
+    def test_slow_queries_are_logged_and_profiled_once(self, temp_test_dir):
+        log_path = temp_test_dir / "slow.log"
+        explain = MagicMock(return_value="plan")
+        profiler = QueryProfiler(slow_query_ms=0, log_path=str(log_path), capture_plans=True)
+        for _ in range(2):
+            profiler.record("MATCH (f:Function {name: 'x'}) RETURN f", {}, 12.5, 1, "site:1", explain)
+
+        explain.assert_called_once()
+        entries = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert [e["plan"] for e in entries] == ["plan", None]
+        assert entries[0]["query"] == "MATCH (f:Function {name: ?}) RETURN f"
+        assert profiler.stats[entries[0]["query"]].plan == "plan"
+
+    def test_flush_merges_with_saved_stats(self, temp_test_dir):
+        stats_path = temp_test_dir / "query_stats.json"
+        for elapsed in (5.0, 20.0):
+            profiler = QueryProfiler(slow_query_ms=10, stats_path=stats_path)
+            profiler.record("MATCH (n) RETURN n", {}, elapsed, 3, "a.py:1")
+            profiler.record("RETURN 1", {}, 1.0, 1, "b.py:2")
+            profiler.flush()
+
+        stats = load_stats(stats_path)
+        top_query, top = top_statements(stats, limit=1)[0]
+        assert top_query == "MATCH (n) RETURN n"
+        assert (top.count, top.total_ms, top.max_ms, top.rows, top.slow) == (2, 25.0, 20.0, 6, 1)
+        assert top.call_sites["a.py:1"] == 2
+
+    def test_concurrent_flushes_keep_every_count(self, temp_test_dir):
+        stats_path = temp_test_dir / "query_stats.json"
+        profilers = [QueryProfiler(stats_path=stats_path) for _ in range(8)]
+        for profiler in profilers:
+            profiler.record("RETURN 1", {}, 1.0, 1, "a.py:1")
+        threads = [threading.Thread(target=profiler.flush) for profiler in profilers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert load_stats(stats_path)["RETURN ?"].count == 8
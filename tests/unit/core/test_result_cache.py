@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock, patch
+
+from codegraphcontext.core.result_cache import ResultCache, bump_generation, bumps_generation, graph_generation
+from codegraphcontext.tools.code_finder import CodeFinder
+
+
+class TestResultCache:
+    """
+    Unit tests for the generation-keyed query result cache.
+    """
+
+    def test_repeat_calls_are_served_from_memory(self):
+        method = MagicMock(side_effect=lambda name: [{"name": name}])
+        cached = ResultCache().wrap("find", method)
+        assert cached("parse") == cached("parse") == [{"name": "parse"}]
+        assert cached("load") == [{"name": "load"}]
+        assert method.call_count == 2
+
+    def test_results_are_copied(self):
+        cached = ResultCache().wrap("find", lambda: [{"name": "parse"}])
+        cached()[0]["name"] = "edited"
+        assert cached() == [{"name": "parse"}]
+
+    def test_writes_invalidate(self):
+        method = MagicMock(return_value=[])
+        cached = ResultCache().wrap("find", method)
+        write = bumps_generation(lambda: None)
+        generation = graph_generation()
+        cached()
+        write()
+        cached()
+        assert graph_generation() == generation + 1
+        assert method.call_count == 2
+
+    def test_expiry_errors_and_bounds(self):
+        cache = ResultCache(max_entries=2, ttl=10)
+        method = MagicMock(side_effect=lambda x: {"error": "down"} if x == "bad" else [x])
+        cached = cache.wrap("find", method)
+        cached("bad"); cached("bad")
+        assert method.call_count == 2
+        cached("a"); cached("b"); cached("c")
+        assert len(cache) == 2
+        with patch("codegraphcontext.core.result_cache.time.monotonic", return_value=float("inf")):
+            cached("c")
+        assert method.call_count == 6
+
+    def test_code_finder_methods_are_cached(self):
+        db_manager = MagicMock()
+        db_manager.get_backend_type.return_value = "neo4j"
+        session = db_manager.get_driver.return_value.session.return_value.__enter__.return_value
+        session.run.return_value.data.side_effect = lambda: [{"name": "parse", "sort_keys": ["parse"]}]
+        finder = CodeFinder(db_manager)
+
+        assert finder.find_by_module_name("json") == finder.find_by_module_name("json")
+        assert session.run.call_count == 1
+        bump_generation()
+        finder.find_by_module_name("json")
+        assert session.run.call_count == 2
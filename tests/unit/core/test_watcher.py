@@ -0,0 +1,230 @@
+import os
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+from codegraphcontext.core.watcher import (
+    CREATED, DELETED, MODIFIED, ChangeBatcher, CodeWatcher, RepositoryEventHandler, WatchStateStore,
+    coalesce_change, plan_watches,
+)
+from codegraphcontext.tools.ignore_rules import IgnoreRules
+from codegraphcontext.tools.graph_builder import GraphBuilder
+from codegraphcontext.tools.symbol_table import SymbolTableStore
+
+
+class TestChangeBatching:
+    """
+    Unit tests for coalescing watched file events into batches.
+    """
+
+    def test_coalesce_change(self):
+        assert coalesce_change(None, MODIFIED) == MODIFIED
+        assert coalesce_change(CREATED, MODIFIED) == CREATED
+        assert coalesce_change(CREATED, DELETED) is None
+        assert coalesce_change(DELETED, CREATED) == MODIFIED
+        assert coalesce_change(MODIFIED, DELETED) == DELETED
+
+    def test_events_are_processed_as_one_batch(self):
+        batches = []
+        done = threading.Event()
+
+        def process(batch):
+            batches.append(batch)
+            done.set()
+
+        batcher = ChangeBatcher(process, quiet_period=0.2)
+        try:
+            for i in range(100):
+                batcher.add(f"/repo/f{i}.py", MODIFIED)
+            batcher.add("/repo/new.py", CREATED)
+            batcher.add("/repo/new.py", DELETED)
+            batcher.add("/repo/f0.py", DELETED)
+            assert done.wait(5)
+        finally:
+            batcher.stop(timeout=5)
+
+        assert len(batches) == 1
+        assert len(batches[0]) == 100
+        assert batches[0]["/repo/f0.py"] == DELETED
+        assert "/repo/new.py" not in batches[0]
+
+    def test_batch_is_relinked_once(self, temp_test_dir):
+        repo = temp_test_dir / "repo"
+        repo.mkdir()
+        (repo / "a.py").write_text("def alpha():\n    pass\n")
+        (repo / "b.py").write_text("def beta():\n    pass\n")
+        (repo / "user.py").write_text("from a import alpha\nfrom b import beta\n\ndef run():\n    alpha()\n    beta()\n")
+        repo = repo.resolve()
+
+        builder = GraphBuilder(MagicMock(), MagicMock(), None)
+        builder.symbol_store = SymbolTableStore(temp_test_dir / "symbols")
+        handler = RepositoryEventHandler(builder, repo)
+        try:
+            (repo / "a.py").write_text("def alpha2():\n    pass\n")
+            (repo / "b.py").write_text("def beta2():\n    pass\n")
+            with patch.object(builder, "relink_file") as relink:
+                handler._process_changes({str(repo / "a.py"): MODIFIED, str(repo / "b.py"): MODIFIED})
+        finally:
+            handler.stop()
+
+        relinked = [call.args[0]["file_path"] for call in relink.call_args_list]
+        assert sorted(relinked) == sorted(str(repo / name) for name in ("a.py", "b.py", "user.py"))
+
+    def test_constructor_rewrite_relinks_callers_of_its_class(self, temp_test_dir):
+        repo = temp_test_dir / "repo"
+        repo.mkdir()
+        (repo / "models.py").write_text("class User:\n    def __init__(self):\n        self.name = load()\n")
+        (repo / "app.py").write_text("from models import User\n\ndef handle():\n    User()\n")
+        repo = repo.resolve()
+
+        builder = GraphBuilder(MagicMock(), MagicMock(), None)
+        builder.symbol_store = SymbolTableStore(temp_test_dir / "symbols")
+        handler = RepositoryEventHandler(builder, repo)
+        try:
+            # Only the constructor's node is rewritten; its callers name the class
+            (repo / "models.py").write_text("class User:\n    def __init__(self):\n        self.name = fetch()\n")
+            with patch.object(builder, "relink_file") as relink:
+                handler._process_changes({str(repo / "models.py"): MODIFIED})
+        finally:
+            handler.stop()
+
+        relinked = [call.args[0]["file_path"] for call in relink.call_args_list]
+        assert sorted(relinked) == sorted(str(repo / name) for name in ("app.py", "models.py"))
+
+    def test_file_gone_before_it_is_read_is_deleted(self, temp_test_dir):
+        repo = temp_test_dir / "repo"
+        repo.mkdir()
+        (repo / "a.py").write_text("def alpha():\n    pass\n")
+        repo = repo.resolve()
+
+        builder = GraphBuilder(MagicMock(), MagicMock(), None)
+        builder.symbol_store = SymbolTableStore(temp_test_dir / "symbols")
+        handler = RepositoryEventHandler(builder, repo)
+        try:
+            # Renamed away after the event, as editors that save via a temporary file do
+            with patch("codegraphcontext.core.watcher._file_digest", side_effect=FileNotFoundError), \
+                    patch.object(builder, "delete_file_from_graph") as delete:
+                handler._process_changes({str(repo / "a.py"): MODIFIED})
+        finally:
+            handler.stop()
+
+        delete.assert_called_once_with(str(repo / "a.py"))
+
+
+class TestWatcherCatchUp:
+    """
+    Tests for persisting watcher state and catching up on changes after a restart.
+    """
+
+    def _builder(self, temp_test_dir):
+        builder = GraphBuilder(MagicMock(), MagicMock(), None)
+        builder.symbol_store = SymbolTableStore(temp_test_dir / "symbols")
+        return builder
+
+    def test_catch_up_queues_only_changed_files(self, temp_test_dir):
+        repo = temp_test_dir / "repo"
+        repo.mkdir()
+        for name in ("same.py", "touched.py", "edited.py", "gone.py"):
+            (repo / name).write_text(f"def {name[:-3]}():\n    pass\n")
+        repo = repo.resolve()
+        builder = self._builder(temp_test_dir)
+        store = WatchStateStore(temp_test_dir / "watch")
+
+        RepositoryEventHandler(builder, repo, state_store=store).stop()
+
+        # Changes made while nobody was watching.
+        stat = (repo / "touched.py").stat()
+        os.utime(repo / "touched.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        (repo / "edited.py").write_text("def edited():\n    return 1\n")
+        (repo / "gone.py").unlink()
+        (repo / "new.py").write_text("def new():\n    pass\n")
+
+        handler = RepositoryEventHandler(builder, repo, perform_initial_scan=False, state_store=store)
+        try:
+            with patch.object(handler.batcher, "add") as add:
+                assert handler.catch_up() == 3
+        finally:
+            handler.stop()
+        queued = {os.path.basename(call.args[0]): call.args[1] for call in add.call_args_list}
+        assert queued == {"edited.py": MODIFIED, "gone.py": DELETED, "new.py": CREATED}
+
+    def test_watched_paths_are_restored(self, temp_test_dir):
+        repo = temp_test_dir / "repo"
+        repo.mkdir()
+        (repo / "a.py").write_text("def a():\n    pass\n")
+        builder = self._builder(temp_test_dir)
+        store = WatchStateStore(temp_test_dir / "watch")
+
+        watcher = CodeWatcher(builder, None, state_store=store)
+        watcher.watch_directory(str(repo), perform_initial_scan=False)
+        watcher.stop()
+
+        restarted = CodeWatcher(builder, None, state_store=store)
+        try:
+            assert restarted.restore() == [str(repo.resolve())]
+            assert restarted.list_watched_paths() == [str(repo.resolve())]
+        finally:
+            restarted.stop()
+
+        restarted.unwatch_directory(str(repo))
+        assert store.load_paths() == []
+
+
+class TestIgnoredDirectories:
+    """
+    Tests that ignored directories get no OS-level watches and their events are dropped.
+    """
+
+    @pytest.fixture
+    def repo(self, temp_test_dir):
+        repo = (temp_test_dir / "repo").resolve()
+        for d in ("src", "node_modules/lib", "pkg/a/node_modules", "pkg/b"):
+            (repo / d).mkdir(parents=True)
+        (repo / "src" / "app.js").write_text("function app() {}\n")
+        (repo / "node_modules" / "lib" / "dep.js").write_text("function dep() {}\n")
+        (repo / "pkg" / "b" / "generated.py").write_text("x = 1\n")
+        (repo / ".cgcignore").write_text("generated.py\n")
+        return repo
+
+    def test_plan_skips_ignored_subtrees(self, repo):
+        rules = IgnoreRules(repo, ["node_modules"])
+        assert plan_watches(repo, rules) == [
+            (repo, False), (repo / "pkg", False), (repo / "pkg" / "a", False),
+            (repo / "pkg" / "b", True), (repo / "src", True),
+        ]
+
+    def test_ignored_events_are_rejected(self, repo, temp_test_dir):
+        builder = GraphBuilder(MagicMock(), MagicMock(), None)
+        builder.symbol_store = SymbolTableStore(temp_test_dir / "symbols")
+        with patch("codegraphcontext.tools.ignore_rules.get_config_value", return_value="node_modules"):
+            handler = RepositoryEventHandler(builder, repo, perform_initial_scan=False)
+        try:
+            assert handler.is_relevant(repo / "src" / "app.js")
+            assert not handler.is_relevant(repo / "node_modules" / "lib" / "dep.js")
+            assert not handler.is_relevant(repo / "pkg" / "b" / "generated.py")
+            assert [f.name for f in handler._list_files()] == ["app.js"]
+            with patch.object(handler.batcher, "add") as add:
+                handler._enqueue(str(repo / "node_modules" / "lib" / "dep.js"), MODIFIED)
+            add.assert_not_called()
+        finally:
+            handler.stop()
+
+    def test_new_ignored_directory_splits_watch(self, repo, temp_test_dir):
+        builder = GraphBuilder(MagicMock(), MagicMock(), None)
+        builder.symbol_store = SymbolTableStore(temp_test_dir / "symbols")
+        watcher = CodeWatcher(builder, None)
+        try:
+            with patch("codegraphcontext.tools.ignore_rules.get_config_value", return_value="node_modules"):
+                watcher.watch_directory(str(repo), perform_initial_scan=False)
+            handler = watcher.handlers[str(repo)]
+
+            (repo / "src" / "node_modules").mkdir()
+            handler.on_new_directory(repo / "src" / "node_modules")
+            watches = {(w.path, w.is_recursive) for w in watcher.watches[str(repo)]}
+            assert (str(repo / "src"), False) in watches
+            assert (str(repo / "src"), True) not in watches
+
+            (repo / "docs").mkdir()
+            handler.on_new_directory(repo / "docs")
+            assert (str(repo / "docs"), True) in {(w.path, w.is_recursive) for w in watcher.watches[str(repo)]}
+        finally:
+            watcher.stop()
@@ -0,0 +1,100 @@
+import pytest
+from codegraphcontext.tools.graph_builder import TreeSitterParser
+from codegraphcontext.tools.symbol_diff import diff_file_symbols
+from codegraphcontext.utils.tree_sitter_manager import compute_edit
+
+SOURCE = """\
+class Greeter:
+    def greet(self, name):
+        return helper(name)
+
+def helper(name):
+    return name.upper()
+
+def untouched():
+    pass
+"""
+
+
+class TestIncrementalParse:
+    """
+    Tests for incremental reparsing and symbol diffing used by the watcher.
+    """
+
+    @pytest.fixture(scope="class")
+    def parser(self):
+        return TreeSitterParser("python")
+
+    def _parse(self, parser, path, previous=None):
+        with parser.parser.track(previous) as tracked:
+            file_data = parser.parse(path)
+        return file_data, tracked.snapshot
+
+    def test_compute_edit(self):
+        edit = compute_edit(b"a = 1\nb = 2\n", b"a = 1\nb = 22\n")
+        assert edit["start_byte"] == 11
+        assert edit["old_end_byte"] == 11
+        assert edit["new_end_byte"] == 12
+        assert edit["start_point"] == (1, 5)
+        assert compute_edit(b"same", b"same") is None
+
+    def test_identical_source_reuses_tree(self, parser, temp_test_dir):
+        f = temp_test_dir / "mod.py"
+        f.write_text(SOURCE)
+        old_data, old_snapshot = self._parse(parser, f)
+        new_data, new_snapshot = self._parse(parser, f, old_snapshot)
+
+        assert new_snapshot.tree is old_snapshot.tree
+        assert new_snapshot.affected_rows == []
+        assert not diff_file_symbols(old_data, new_data, new_snapshot.affected_rows)
+
+    def test_in_place_edit_only_rewrites_changed_symbol(self, parser, temp_test_dir):
+        f = temp_test_dir / "mod.py"
+        f.write_text(SOURCE)
+        old_data, old_snapshot = self._parse(parser, f)
+
+        f.write_text(SOURCE.replace("name.upper()", "name.lower()"))
+        new_data, new_snapshot = self._parse(parser, f, old_snapshot)
+
+        assert new_snapshot.affected_rows
+        # The cached tree must not have been edited in place.
+        assert old_snapshot.tree.root_node.text == SOURCE.encode()
+
+        diff = diff_file_symbols(old_data, new_data, new_snapshot.affected_rows)
+        assert not diff.requires_full_update
+        assert [(label, item["name"]) for label, item in diff.added] == [("Function", "helper")]
+        assert [(label, item["name"]) for label, item in diff.removed] == [("Function", "helper")]
+
+    def test_added_call_marks_caller_changed(self, parser, temp_test_dir):
+        f = temp_test_dir / "mod.py"
+        f.write_text(SOURCE)
+        old_data, old_snapshot = self._parse(parser, f)
+
+        f.write_text(SOURCE.replace("    pass", "    helper('x')"))
+        new_data, new_snapshot = self._parse(parser, f, old_snapshot)
+
+        diff = diff_file_symbols(old_data, new_data, new_snapshot.affected_rows)
+        assert ("untouched", "Function") in {(item["name"], label) for label, item in diff.added}
+
+    def test_renamed_class_rewrites_methods(self, parser, temp_test_dir):
+        f = temp_test_dir / "mod.py"
+        f.write_text(SOURCE)
+        old_data, old_snapshot = self._parse(parser, f)
+
+        f.write_text(SOURCE.replace("class Greeter", "class Welcomer"))
+        new_data, new_snapshot = self._parse(parser, f, old_snapshot)
+
+        diff = diff_file_symbols(old_data, new_data, new_snapshot.affected_rows)
+        added = {item["name"] for _, item in diff.added}
+        assert {"Welcomer", "greet"} <= added
+        assert "untouched" not in added
+
+    def test_changed_imports_require_full_update(self, parser, temp_test_dir):
+        f = temp_test_dir / "mod.py"
+        f.write_text(SOURCE)
+        old_data, old_snapshot = self._parse(parser, f)
+
+        f.write_text("import os\n" + SOURCE)
+        new_data, new_snapshot = self._parse(parser, f, old_snapshot)
+
+        assert diff_file_symbols(old_data, new_data, new_snapshot.affected_rows).requires_full_update
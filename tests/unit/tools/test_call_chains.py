@@ -0,0 +1,65 @@
+import random
+
+from codegraphcontext.tools.call_chains import shortest_call_chains
+
+
+def _fetcher(calls, log=None):
+    def fetch_edges(ids, direction):
+        if log is not None:
+            log.append((direction, list(ids)))
+        if direction == "out":
+            return [(i, callee, {"line_number": n}) for i in ids for n, callee in enumerate(calls.get(i, []))]
+        return [(caller, i, {}) for i in ids for caller, callees in calls.items() for callee in callees if callee == i]
+    return fetch_edges
+
+
+def _all_chains(calls, starts, ends, max_depth):
+    found = []
+
+    def walk(path):
+        if len(path) > 1 and path[-1] in ends:
+            found.append(path)
+        if len(path) <= max_depth:
+            for callee in calls.get(path[-1], []):
+                if callee not in path:
+                    walk(path + [callee])
+    for start in starts:
+        walk([start])
+    return found
+
+
+class TestCallChains:
+    """
+    Unit tests for the bidirectional call chain search.
+    """
+
+    def test_shortest_chains_first(self):
+        calls = {"main": ["a", "b"], "a": ["c"], "b": ["c", "end"], "c": ["end", "main"]}
+        chains = shortest_call_chains(["main"], ["end"], _fetcher(calls), max_depth=5)
+        assert [nodes for nodes, _ in chains] == [["main", "b", "end"], ["main", "a", "c", "end"], ["main", "b", "c", "end"]]
+        assert chains[0][1] == [{"line_number": 1}, {"line_number": 1}]
+
+    def test_limit_and_depth(self):
+        calls = {"s": ["x1", "x2", "x3"], "x1": ["e"], "x2": ["e"], "x3": ["y"], "y": ["e"]}
+        assert len(shortest_call_chains(["s"], ["e"], _fetcher(calls), max_depth=5, limit=2)) == 2
+        assert len(shortest_call_chains(["s"], ["e"], _fetcher(calls), max_depth=2)) == 2
+
+    def test_unreachable_end_stops_early(self):
+        # A long cycle that never reaches the end: the backward side is exhausted after two lookups
+        calls = {f"f{i}": [f"f{(i + 1) % 50}"] for i in range(50)}
+        calls["lonely"] = ["end"]
+        log = []
+        assert shortest_call_chains(["f0"], ["end"], _fetcher(calls, log), max_depth=15) == []
+        assert len(log) <= 4
+
+    def test_matches_exhaustive_search(self):
+        rng = random.Random(7)
+        for _ in range(30):
+            nodes = list(range(12))
+            calls = {n: rng.sample(nodes, rng.randint(0, 3)) for n in nodes}
+            starts, ends = rng.sample(nodes, 2), rng.sample(nodes, 2)
+            expected = sorted(len(path) - 1 for path in _all_chains(calls, starts, ends, 6))
+            chains = shortest_call_chains(starts, ends, _fetcher(calls), max_depth=6, limit=5)
+            assert [len(calls_) for _, calls_ in chains] == expected[:5]
+            for nodes_, _ in chains:
+                assert nodes_[0] in starts and nodes_[-1] in ends and len(set(nodes_)) == len(nodes_)
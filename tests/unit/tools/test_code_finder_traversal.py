@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+
+from codegraphcontext.tools.code_finder import CodeFinder
+
+# a -> b -> c -> a is a cycle, and c also calls d
+CALLS = {"a": ["b"], "b": ["c"], "c": ["a", "d"], "d": []}
+
+
+class _CallGraphSession:
+    """Answers CodeFinder's BFS queries from CALLS, recording each level's parameters."""
+
+    def __init__(self):
+        self.levels = []
+
+    def run(self, query, **params):
+        if "UNWIND $frontier" not in query:
+            return MagicMock(data=MagicMock(return_value=[{"node_id": params["function_name"]}]))
+        self.levels.append(params)
+        if "(f:Function)-[:CALLS]->(n)" in query:
+            reached = {f for f, callees in CALLS.items() for n in params["frontier"] if n in callees}
+        else:
+            reached = {f for n in params["frontier"] for f in CALLS[n]}
+        rows = [{"node_id": f, "callee_name": f, "caller_name": f}
+                for f in sorted(reached - set(params["seen"]))][:params["remaining"]]
+        return MagicMock(data=MagicMock(return_value=rows))
+
+
+def _finder():
+    db_manager = MagicMock()
+    db_manager.get_backend_type.return_value = "falkordb"
+    session = _CallGraphSession()
+    db_manager.get_driver.return_value.session.return_value.__enter__.return_value = session
+    finder = CodeFinder(db_manager)
+    finder.result_cache.max_entries = 0
+    return finder, session
+
+
+class TestTransitiveCalls:
+    """
+    Unit tests for the level-synchronous BFS behind find_all_callers/find_all_callees.
+    """
+
+    def test_cycles_are_expanded_once(self):
+        finder, session = _finder()
+        rows = finder.find_all_callees("a")
+        assert [(r["callee_name"], r["depth"]) for r in rows] == [("b", 1), ("c", 2), ("a", 3), ("d", 3)]
+        assert len(session.levels) == 4  # the fourth level finds nothing new
+
+    def test_max_depth_and_limit(self):
+        finder, session = _finder()
+        assert [r["caller_name"] for r in finder.find_all_callers("a", max_depth=2)] == ["c", "b"]
+        finder, session = _finder()
+        assert [r["callee_name"] for r in finder.find_all_callees("a", limit=2)] == ["b", "c"]
+        assert [level["remaining"] for level in session.levels] == [2, 1]
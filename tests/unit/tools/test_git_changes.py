@@ -0,0 +1,81 @@
+import subprocess
+import pytest
+from unittest.mock import MagicMock, patch
+from codegraphcontext.tools import git_changes
+from codegraphcontext.tools.graph_builder import GraphBuilder
+from codegraphcontext.tools.symbol_table import SymbolTableStore, referenced_names
+
+
+def _git(repo, *args):
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_repo(temp_test_dir):
+    repo = (temp_test_dir / "repo")
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "dev@example.com")
+    _git(repo, "config", "user.name", "dev")
+    (repo / "lib.py").write_text("def alpha():\n    pass\n")
+    (repo / "user.py").write_text("from lib import alpha\n\ndef run():\n    alpha()\n")
+    (repo / "other.py").write_text("def beta():\n    pass\n")
+    (repo / "old.py").write_text("def gone():\n    pass\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "initial")
+    return repo.resolve()
+
+
+class TestGitChanges:
+    """
+    Tests for detecting changed files from git instead of filesystem events.
+    """
+
+    def test_changed_files_since(self, git_repo):
+        base = git_changes.head_commit(git_repo)
+        (git_repo / "lib.py").write_text("def alpha2():\n    pass\n")
+        _git(git_repo, "commit", "-q", "-am", "rename alpha")
+        (git_repo / "other.py").write_text("def beta():\n    return 1\n")  # uncommitted
+        _git(git_repo, "mv", "old.py", "moved.py")
+        (git_repo / "new.py").write_text("x = 1\n")  # untracked
+
+        changes = git_changes.changed_files_since(git_repo, base)
+        assert {path.name: kind for path, kind in changes.items()} == {
+            "lib.py": git_changes.MODIFIED,
+            "other.py": git_changes.MODIFIED,
+            "old.py": git_changes.DELETED,
+            "moved.py": git_changes.ADDED,
+            "new.py": git_changes.ADDED,
+        }
+        assert git_changes.dirty_files(git_repo) == ["moved.py", "new.py", "old.py", "other.py"]
+
+    def test_unknown_commit(self, git_repo, temp_test_dir):
+        assert git_changes.changed_files_since(git_repo, "0" * 40) is None
+        assert git_changes.head_commit(temp_test_dir) is None
+
+    def test_update_only_reparses_changed_files(self, git_repo, temp_test_dir):
+        builder = GraphBuilder(MagicMock(), MagicMock(), None)
+        builder.symbol_store = SymbolTableStore(temp_test_dir / "symbols")
+        files = sorted(git_repo.glob("*.py"))
+        table = builder.load_symbol_table(git_repo, files)
+        for f in files:
+            table.set_references(str(f), referenced_names(builder.parse_file(git_repo, f)))
+        builder.symbol_store.save(git_repo, table)
+        base = git_changes.head_commit(git_repo)
+
+        (git_repo / "lib.py").write_text("def alpha2():\n    pass\n")
+        _git(git_repo, "commit", "-q", "-am", "rename alpha")
+
+        with patch.object(builder, "get_indexed_commit", return_value=(base, [])), \
+             patch.object(builder, "parse_file", wraps=builder.parse_file) as parse, \
+             patch.object(builder, "relink_file") as relink, \
+             patch.object(builder, "update_file_in_graph"), \
+             patch.object(builder, "record_indexed_commit") as record:
+            summary = builder.update_repository_from_git(git_repo)
+
+        assert summary["changed_files"] == 1
+        assert sorted(call.args[1].name for call in parse.call_args_list) == ["lib.py", "user.py"]
+        assert sorted(call.args[0]["file_path"] for call in relink.call_args_list) == [
+            str(git_repo / "lib.py"), str(git_repo / "user.py")]
+        record.assert_called_once_with(git_repo)
+        assert builder.symbol_store.load(git_repo).unique("alpha2") == str(git_repo / "lib.py")
@@ -0,0 +1,46 @@
+from codegraphcontext.tools.graph_snapshot import SnapshotBuilder
+
+
+def _snapshot():
+    # main -> run -> helper <-> loop, and lib.wrap (a dependency) also calls helper
+    builder = SnapshotBuilder()
+    builder.add_node("file", "File", "app.py", "/repo/app.py", None, False)
+    for node_id, line in (("main", 1), ("run", 5), ("helper", 9), ("loop", 13)):
+        builder.add_node(node_id, "Function", node_id, "/repo/app.py", line, False,
+                         ["cli.command"] if node_id == "main" else None)
+    builder.add_node("wrap", "Function", "wrap", "/site-packages/lib.py", 3, True)
+    for src, dst in (("main", "run"), ("run", "helper"), ("helper", "loop"), ("loop", "helper"), ("wrap", "helper")):
+        builder.add_edge("CALLS", src, dst)
+    for node_id in ("main", "run", "helper", "loop"):
+        builder.add_edge("CONTAINS", "file", node_id)
+    builder.add_edge("CALLS", "main", "missing")  # dropped: not in the snapshot
+    return builder.build()
+
+
+class TestGraphSnapshot:
+    """
+    Unit tests for the CSR snapshot of the code graph.
+    """
+
+    def test_csr_neighbors_and_degrees(self):
+        snapshot = _snapshot()
+        index = snapshot.index_of
+        assert len(snapshot) == 6 and snapshot.edge_count == 9
+        assert list(snapshot.neighbors(index["helper"], "CALLS")) == [index["loop"]]
+        assert sorted(snapshot.neighbors(index["helper"], "CALLS", "in")) == sorted(
+            [index["run"], index["loop"], index["wrap"]])
+        assert snapshot.degrees("CALLS")[index["helper"]] == 3
+        assert snapshot.degrees("CALLS", include_dependencies=False)[index["helper"]] == 2
+        assert snapshot.degrees("CONTAINS", "out")[index["file"]] == 4
+        assert snapshot.degrees("CALLS", "in") is snapshot.degrees("CALLS", "in")
+        assert snapshot.decorators == {index["main"]: ("cli.command",)}
+
+    def test_bfs_levels(self):
+        snapshot = _snapshot()
+        names = snapshot.names
+        levels = snapshot.bfs_levels(snapshot.find("main", "Function"), "CALLS")
+        assert [[names[n] for n in level] for level in levels] == [["run"], ["helper"], ["loop"], []]
+        levels = snapshot.bfs_levels(snapshot.find("helper"), "CALLS", "in", max_depth=1)
+        assert sorted(names[n] for level in levels for n in level) == ["loop", "run", "wrap"]
+        mask = snapshot.reachable(snapshot.find("helper", path="/repo/app.py"), "CALLS")
+        assert [names[n] for n in range(len(snapshot)) if mask[n]] == ["helper", "loop"]
@@ -0,0 +1,61 @@
+import pytest
+
+from codegraphcontext.tools.pagination import (InvalidCursorError, Page, combined_pages, decode_cursor, encode_cursor,
+                                               keyset_condition, keyset_page, next_cursor, page_of)
+
+
+class TestPagination:
+    """
+    Unit tests for the opaque keyset cursors of paginated results.
+    """
+
+    def test_cursor_round_trip(self):
+        cursor = encode_cursor(["/repo/app.py", 12, "handle"])
+        assert decode_cursor(cursor, 3) == ["/repo/app.py", 12, "handle"]
+        assert decode_cursor(None, 3) is None
+        for bad in ("not a cursor!", encode_cursor(["/repo/app.py", 12])):
+            with pytest.raises(InvalidCursorError):
+                decode_cursor(bad, 3)
+
+    def test_next_cursor_trims_the_extra_row(self):
+        rows = [{"n": n} for n in range(4)]
+        cursor = next_cursor(rows, 3, lambda row: [row["n"]])
+        assert rows == [{"n": 0}, {"n": 1}, {"n": 2}] and decode_cursor(cursor, 1) == [2]
+        assert next_cursor(rows, 3, lambda row: [row["n"]]) is None
+
+    def test_limits_below_one_are_rejected(self):
+        for limit in (0, -1):
+            with pytest.raises(ValueError):
+                next_cursor([{"n": 0}], limit, lambda row: [row["n"]])
+            with pytest.raises(ValueError):
+                keyset_page([{"n": 0, "sort_keys": [0]}], limit)
+            with pytest.raises(ValueError):
+                page_of([{"n": 0}], lambda row: [row["n"]], limit, None, 1)
+
+    def test_keyset_condition_is_lexicographic(self):
+        assert keyset_condition(1) == "($after IS NULL OR sort_keys[0] > $after[0])"
+        assert keyset_condition(2) == (
+            "($after IS NULL OR sort_keys[0] > $after[0] OR (sort_keys[0] = $after[0] AND (sort_keys[1] > $after[1])))")
+
+    def test_pages(self):
+        page = keyset_page([{"n": n, "sort_keys": [n]} for n in range(3)], 2)
+        assert page == [{"n": 0}, {"n": 1}] and decode_cursor(page.next_cursor, 1) == [1]
+        rows = [{"n": n} for n in (3, 1, 2, 0)]
+        page = page_of(rows, lambda row: [row["n"]], 2, page.next_cursor, 1)
+        assert page == [{"n": 2}, {"n": 3}] and page.next_cursor is None
+
+    def test_combined_pages_skip_finished_sources(self):
+        calls = []
+
+        def source(name, last_page):
+            def fetch(cursor):
+                calls.append((name, cursor))
+                return Page([name], None if cursor or last_page else encode_cursor([name]))
+            return fetch
+
+        fetchers = [source("a", last_page=True), source("b", last_page=False)]
+        pages, cursor = combined_pages(fetchers, None)
+        assert pages == [["a"], ["b"]] and cursor
+        pages, cursor = combined_pages(fetchers, cursor)
+        assert pages == [[], ["b"]] and cursor is None
+        assert calls == [("a", None), ("b", None), ("b", encode_cursor(["b"]))]
@@ -0,0 +1,176 @@
+import json
+from pathlib import Path
+import pytest
+from unittest.mock import MagicMock, patch
+from codegraphcontext.tools.graph_builder import GraphBuilder
+from codegraphcontext.core.watcher import RepositoryEventHandler
+from codegraphcontext.tools.symbol_table import SymbolTable, SymbolTableStore, referenced_names
+
+
+class TestSymbolTable:
+    """
+    Unit tests for the global symbol table used to resolve calls and inheritance.
+    """
+
+    @pytest.fixture
+    def table(self):
+        table = SymbolTable()
+        table.update({
+            "get": ["/repo/pkg/http.py", "/repo/pkg/cache/__init__.py", "/repo/other/store.py"],
+            "Base": ["/repo/pkg/models.py"],
+            "run": ["/repo/pkg/mod.py", "/repo/pkg/module.py"],
+        })
+        return table
+
+    def test_mapping_interface(self, table):
+        assert "get" in table
+        assert table["Base"] == ["/repo/pkg/models.py"]
+        assert table.get("missing", []) == []
+        assert len(table) == 3
+
+    def test_paths_are_interned(self, table):
+        assert table.intern_path("/repo/pkg/http.py") == table.intern_path("/repo/pkg/http.py")
+
+    def test_count_first_unique(self, table):
+        assert table.count("get") == 3
+        assert table.first("get") == "/repo/pkg/http.py"
+        assert table.unique("Base") == "/repo/pkg/models.py"
+        assert table.unique("get") is None
+
+    def test_resolve_by_module(self, table):
+        assert table.resolve("get", "pkg.cache") == "/repo/pkg/cache/__init__.py"
+        assert table.resolve("get", "other.store") == "/repo/other/store.py"
+        # A package name matches the files inside it.
+        assert table.resolve("get", "other") == "/repo/other/store.py"
+        assert table.resolve("get", "nowhere") is None
+
+    def test_resolve_matches_whole_components(self, table):
+        # 'pkg/mod' is a substring of 'pkg/module.py', but not the same module.
+        table.remove_file("/repo/pkg/mod.py")
+        assert table.resolve("run", "pkg.mod") is None
+        assert table.resolve("run", "pkg.module") == "/repo/pkg/module.py"
+
+    def test_resolve_any(self, table):
+        assert table.resolve_any("get", ["os", "other.store", "pkg.cache"]) == "/repo/pkg/cache/__init__.py"
+
+    def test_remove_file(self, table):
+        table.remove_file("/repo/pkg/models.py")
+        assert "Base" not in table
+        assert table.resolve("Base", "pkg.models") is None
+        table.add("Base", "/repo/pkg/models.py")
+        assert table.resolve("Base", "pkg.models") == "/repo/pkg/models.py"
+
+    def test_referrers(self, table):
+        table.set_references("/repo/app.py", {"get", "Base"})
+        table.set_references("/repo/cli.py", {"get"})
+        assert sorted(table.referrers("get")) == ["/repo/app.py", "/repo/cli.py"]
+
+        table.set_references("/repo/app.py", {"Base"})
+        assert table.referrers("get") == ["/repo/cli.py"]
+        # Redefining a file keeps what it refers to; removing it does not.
+        table.clear_definitions("/repo/app.py")
+        assert table.referrers("Base") == ["/repo/app.py"]
+        table.remove_file("/repo/app.py")
+        assert table.referrers("Base") == []
+
+    def test_referenced_names(self):
+        file_data = {
+            "function_calls": [{"name": "save", "full_name": "store.save", "inferred_obj_type": "Store"}],
+            "classes": [{"name": "Child", "bases": ["models.Base", "Generic<T>"]}],
+        }
+        assert referenced_names(file_data) == {"save", "store", "Store", "models", "Base", "Generic"}
+
+
+class TestSymbolTablePersistence:
+    """
+    Tests for saving symbol tables per repository and reloading them incrementally.
+    """
+
+    def test_round_trip(self, temp_test_dir):
+        store = SymbolTableStore(temp_test_dir / "symbols")
+        table = SymbolTable()
+        table.add("Base", "/repo/pkg/models.py")
+        table.set_stamp("/repo/pkg/models.py", (123, 45))
+        store.save(temp_test_dir, table)
+
+        loaded = store.load(temp_test_dir)
+        assert loaded.resolve("Base", "pkg.models") == "/repo/pkg/models.py"
+        assert loaded.stamp("/repo/pkg/models.py") == (123, 45)
+        # Tables are per repository.
+        assert store.load(temp_test_dir / "other") is None
+
+    def test_outdated_version_is_ignored(self, temp_test_dir):
+        store = SymbolTableStore(temp_test_dir / "symbols")
+        store.save(temp_test_dir, SymbolTable())
+        sidecar = store.path_for(temp_test_dir)
+        data = json.loads(sidecar.read_text())
+        data["version"] = -1
+        sidecar.write_text(json.dumps(data))
+        assert store.load(temp_test_dir) is None
+
+    def test_load_only_rescans_changed_files(self, temp_test_dir):
+        repo = temp_test_dir / "repo"
+        repo.mkdir()
+        (repo / "a.py").write_text("def alpha():\n    pass\n")
+        (repo / "b.py").write_text("def beta():\n    pass\n")
+        files = sorted(repo.glob("*.py"))
+
+        builder = GraphBuilder(MagicMock(), MagicMock(), None)
+        builder.symbol_store = SymbolTableStore(temp_test_dir / "symbols")
+        table = builder.load_symbol_table(repo, files)
+        assert table.unique("alpha") and table.unique("beta")
+
+        (repo / "b.py").write_text("def gamma():\n    pass\n\n")
+        with patch.object(builder, "_pre_scan_for_imports", wraps=builder._pre_scan_for_imports) as pre_scan:
+            table = builder.load_symbol_table(repo, files)
+        assert [f.name for f in pre_scan.call_args.args[0]] == ["b.py"]
+        assert "beta" not in table
+        assert table.unique("gamma") == str((repo / "b.py").resolve())
+
+    def test_references_survive_round_trip(self, temp_test_dir):
+        store = SymbolTableStore(temp_test_dir / "symbols")
+        table = SymbolTable()
+        table.set_references("/repo/app.py", {"Base"})
+        store.save(temp_test_dir, table)
+        assert store.load(temp_test_dir).referrers("Base") == ["/repo/app.py"]
+
+
+class TestWatcherRelinking:
+    """
+    Tests that a watched change only re-links the files that refer to what changed.
+    """
+
+    def test_only_referrers_are_relinked(self, temp_test_dir):
+        repo = (temp_test_dir / "repo")
+        repo.mkdir()
+        (repo / "lib.py").write_text("def alpha():\n    pass\n")
+        (repo / "user.py").write_text("from lib import alpha\n\ndef run():\n    alpha()\n")
+        (repo / "other.py").write_text("def beta():\n    pass\n")
+        repo = repo.resolve()
+
+        builder = GraphBuilder(MagicMock(), MagicMock(), None)
+        builder.symbol_store = SymbolTableStore(temp_test_dir / "symbols")
+        handler = RepositoryEventHandler(builder, repo)
+
+        (repo / "lib.py").write_text("def alpha2():\n    pass\n")
+        with patch.object(builder, "relink_file") as relink:
+            handler._handle_modification(str(repo / "lib.py"))
+        relinked = sorted(Path(call.args[0]["file_path"]).name for call in relink.call_args_list)
+        assert relinked == ["lib.py", "user.py"]
+        assert handler.symbol_table.unique("alpha2") == str(repo / "lib.py")
+        assert "alpha" not in handler.symbol_table
+
+    def test_unchanged_symbols_do_not_relink(self, temp_test_dir):
+        repo = (temp_test_dir / "repo")
+        repo.mkdir()
+        (repo / "lib.py").write_text("def alpha():\n    pass\n")
+        repo = repo.resolve()
+
+        builder = GraphBuilder(MagicMock(), MagicMock(), None)
+        builder.symbol_store = SymbolTableStore(temp_test_dir / "symbols")
+        handler = RepositoryEventHandler(builder, repo)
+
+        (repo / "lib.py").write_text("def alpha():\n    pass\n")
+        with patch.object(builder, "relink_file") as relink:
+            handler._handle_modification(str(repo / "lib.py"))
+        relink.assert_not_called()